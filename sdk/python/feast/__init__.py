@@ -1,23 +1,15 @@
+import importlib
 from importlib.metadata import PackageNotFoundError
 from importlib.metadata import version as _version
+from typing import TYPE_CHECKING, Any
 
-from feast.infra.offline_stores.bigquery_source import BigQuerySource
-from feast.infra.offline_stores.contrib.athena_offline_store.athena_source import (
-    AthenaSource,
-)
-from feast.infra.offline_stores.contrib.spark_offline_store.spark_source import (
-    SparkSource,
-)
 from feast.infra.offline_stores.file_source import FileSource
-from feast.infra.offline_stores.redshift_source import RedshiftSource
-from feast.infra.offline_stores.snowflake_source import SnowflakeSource
 
 from .batch_feature_view import BatchFeatureView
 from .data_source import KafkaSource, KinesisSource, PushSource, RequestSource
 from .entity import Entity
 from .feature import Feature
 from .feature_service import FeatureService
-from .feature_store import FeatureStore
 from .feature_view import FeatureView
 from .field import Field
 from .on_demand_feature_view import OnDemandFeatureView
@@ -25,6 +17,46 @@ from .repo_config import RepoConfig
 from .stream_feature_view import StreamFeatureView
 from .value_type import ValueType
 
+if TYPE_CHECKING:
+    from feast.infra.offline_stores.bigquery_source import BigQuerySource
+    from feast.infra.offline_stores.contrib.athena_offline_store.athena_source import (
+        AthenaSource,
+    )
+    from feast.infra.offline_stores.contrib.spark_offline_store.spark_source import (
+        SparkSource,
+    )
+    from feast.infra.offline_stores.redshift_source import RedshiftSource
+    from feast.infra.offline_stores.snowflake_source import SnowflakeSource
+
+    from .feature_store import FeatureStore
+
+# Attributes whose modules pull in heavyweight dependencies are only imported on first access (PEP 562)
+_LAZY_ATTRIBUTES = {
+    "BigQuerySource": "feast.infra.offline_stores.bigquery_source",
+    "AthenaSource": "feast.infra.offline_stores.contrib.athena_offline_store.athena_source",
+    "SparkSource": "feast.infra.offline_stores.contrib.spark_offline_store.spark_source",
+    "RedshiftSource": "feast.infra.offline_stores.redshift_source",
+    "SnowflakeSource": "feast.infra.offline_stores.snowflake_source",
+    "FeatureStore": "feast.feature_store",
+}
+
+
+if not TYPE_CHECKING:
+    # Hidden from type checkers, which would otherwise resolve every unknown `feast.*` name through it
+
+    def __getattr__(name: str) -> Any:
+        module_name = _LAZY_ATTRIBUTES.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name), name)
+        globals()[name] = value
+        return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
 try:
     __version__ = _version("feast")
 except PackageNotFoundError:
@@ -6,11 +6,19 @@ from typeguard import typechecked
 
 from feast.protos.feast.core.Aggregation_pb2 import Aggregation as AggregationProto
 
+SUPPORTED_FUNCTIONS = {"sum", "count", "min", "max", "mean"}
+
 
 @typechecked
 class Aggregation:
     """
-    NOTE: Feast-handled aggregations are not yet supported. This class provides a way to register user-defined aggregations.
+    An aggregation over a sliding window of a stream feature view's column.
+
+    When the stream processor is configured with `native_aggregation`, aggregations with one of the
+    SUPPORTED_FUNCTIONS are computed by Feast's stream aggregator (see
+    `feast.infra.contrib.stream_aggregator.StreamAggregator`), which writes their results to the feature named
+    `feature_name`, which the view's schema must declare. Other aggregations are computed by a user-defined
+    transformation.
 
     Attributes:
         column: str  # Column name of the feature we are aggregating.
@@ -39,6 +47,15 @@ class Aggregation:
         else:
             self.slide_interval = slide_interval
 
+    @property
+    def feature_name(self) -> str:
+        """
+        The name of the feature holding the result of this aggregation, e.g. `trips_sum_1h`.
+        """
+        if not self.time_window:
+            return f"{self.column}_{self.function}"
+        return f"{self.column}_{self.function}_{_format_window(self.time_window)}"
+
     def to_proto(self) -> AggregationProto:
         window_duration = None
         if self.time_window is not None:
@@ -91,3 +108,11 @@ class Aggregation:
             return False
 
         return True
+
+
+def _format_window(window: timedelta) -> str:
+    seconds = int(window.total_seconds())
+    for unit, unit_seconds in (("d", 86400), ("h", 3600), ("m", 60)):
+        if seconds % unit_seconds == 0:
+            return f"{seconds // unit_seconds}{unit}"
+    return f"{seconds}s"
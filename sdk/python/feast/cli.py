@@ -471,8 +471,14 @@ def on_demand_feature_view_list(ctx: click.Context, tags: list[str]):
     is_flag=True,
     help="Don't validate the data sources by checking for that the tables exist.",
 )
+@click.option(
+    "--changed-only",
+    is_flag=True,
+    help="Only parse the repo files that changed since the last `apply --changed-only`, and only plan the objects "
+    "they define or no longer define.",
+)
 @click.pass_context
-def plan_command(ctx: click.Context, skip_source_validation: bool):
+def plan_command(ctx: click.Context, skip_source_validation: bool, changed_only: bool):
     """
     Create or update a feature store deployment
     """
@@ -481,7 +487,7 @@ def plan_command(ctx: click.Context, skip_source_validation: bool):
     cli_check_repo(repo, fs_yaml_file)
     repo_config = load_repo_config(repo, fs_yaml_file)
     try:
-        plan(repo_config, repo, skip_source_validation)
+        plan(repo_config, repo, skip_source_validation, changed_only)
     except FeastProviderLoginError as e:
         print(str(e))
 
@@ -492,8 +498,16 @@ def plan_command(ctx: click.Context, skip_source_validation: bool):
     is_flag=True,
     help="Don't validate the data sources by checking for that the tables exist.",
 )
+@click.option(
+    "--changed-only",
+    is_flag=True,
+    help="Only parse the repo files that changed since the last `apply --changed-only`, and only apply the objects "
+    "they define or no longer define.",
+)
 @click.pass_context
-def apply_total_command(ctx: click.Context, skip_source_validation: bool):
+def apply_total_command(
+    ctx: click.Context, skip_source_validation: bool, changed_only: bool
+):
     """
     Create or update a feature store deployment
     """
@@ -503,7 +517,7 @@ def apply_total_command(ctx: click.Context, skip_source_validation: bool):
 
     repo_config = load_repo_config(repo, fs_yaml_file)
     try:
-        apply_total(repo_config, repo, skip_source_validation)
+        apply_total(repo_config, repo, skip_source_validation, changed_only)
     except FeastProviderLoginError as e:
         print(str(e))
 
@@ -384,6 +384,14 @@ class PushSourceNotFoundException(Exception):
         super().__init__(f"Unable to find push source '{push_source_name}'.")
 
 
+class RegistryConflictException(Exception):
+    def __init__(self):
+        super().__init__(
+            "The registry was changed by another writer while changes were being applied to it. "
+            "None of the changes were committed, please apply them again."
+        )
+
+
 class ReadOnlyRegistryException(Exception):
     def __init__(self):
         super().__init__("Registry implementation is read-only.")
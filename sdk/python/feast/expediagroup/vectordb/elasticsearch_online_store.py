@@ -1,10 +1,13 @@
 import base64
 import json
 import logging
+import threading
+import time
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Tuple
 
-from elasticsearch import Elasticsearch, helpers
+from elasticsearch import ConnectionError as ElasticsearchConnectionError
+from elasticsearch import ConnectionTimeout, Elasticsearch, helpers
 
 from feast import Entity, FeatureView, RepoConfig
 from feast.infra.online_stores.online_store import OnlineStore
@@ -29,13 +32,14 @@ from feast.types import (
     Float64,
     Int32,
     Int64,
-    PrimitiveFeastType,
     String,
     UnixTimestamp,
 )
 
 logger = logging.getLogger(__name__)
 
+MGET_BATCH_SIZE = 1_000
+
 TYPE_MAPPING = {
     Bytes: "binary",
     Int32: "integer",
@@ -71,26 +75,85 @@ class ElasticsearchOnlineStoreConfig(FeastConfigBaseModel):
     password: str
     """ password to connect to Elasticsearch """
 
+    knn_num_candidates: Optional[int] = None
+    """ number of nearest neighbor candidates considered per shard by retrieve_online_documents, defaults to 10 x top_k """
+
 
 class ElasticsearchConnectionManager:
+    """
+    Context manager that provides an Elasticsearch client for the configured endpoint and credentials.
+
+    Clients are pooled per process: each distinct endpoint and user gets one long-lived client whose HTTP
+    connection pool is shared by all callers. The client is pinged at most every HEALTH_CHECK_INTERVAL_SECONDS,
+    and a client that fails the ping or raises a connection error is closed and recreated on next use. Call
+    `close` to release the client explicitly.
+    """
+
+    HEALTH_CHECK_INTERVAL_SECONDS = 30.0
+
+    _lock = threading.Lock()
+    # (endpoint, username, password) -> (client, time of the last successful health check)
+    _clients: Dict[Tuple[str, str, str], Tuple[Elasticsearch, float]] = {}
+
     def __init__(self, online_config: RepoConfig):
         self.online_config = online_config
 
     def __enter__(self):
-        # Connecting to Elasticsearch
-        logger.info(
-            f"Connecting to Elasticsearch with endpoint {self.online_config.endpoint}"
-        )
-        self.client = Elasticsearch(
-            self.online_config.endpoint,
-            basic_auth=(self.online_config.username, self.online_config.password),
-        )
+        self.client = self.get_client(self.online_config)
         return self.client
 
     def __exit__(self, exc_type, exc_value, traceback):
-        # Disconnecting from Elasticsearch
-        logger.info("Closing the connection to Elasticsearch")
-        self.client.transport.close()
+        if isinstance(exc_value, (ElasticsearchConnectionError, ConnectionTimeout)):
+            # Recreate the client on next use rather than keep handing out a broken one
+            logger.error(f"Elasticsearch connection failed: {exc_value}")
+            self.close(self.online_config)
+
+    @classmethod
+    def get_client(cls, online_config: ElasticsearchOnlineStoreConfig) -> Elasticsearch:
+        key = cls._key(online_config)
+        with cls._lock:
+            pooled = cls._clients.get(key)
+            if pooled is not None:
+                client, last_checked = pooled
+                if cls._is_healthy(key, client, last_checked):
+                    return client
+                client.close()
+                del cls._clients[key]
+
+            logger.info(
+                f"Connecting to Elasticsearch with endpoint {online_config.endpoint}"
+            )
+            client = Elasticsearch(
+                online_config.endpoint,
+                basic_auth=(online_config.username, online_config.password),
+            )
+            cls._clients[key] = (client, time.monotonic())
+            return client
+
+    @classmethod
+    def close(cls, online_config: ElasticsearchOnlineStoreConfig):
+        with cls._lock:
+            pooled = cls._clients.pop(cls._key(online_config), None)
+        if pooled is not None:
+            logger.info("Closing the connection to Elasticsearch")
+            pooled[0].close()
+
+    @classmethod
+    def _is_healthy(
+        cls, key: Tuple[str, str, str], client: Elasticsearch, last_checked: float
+    ) -> bool:
+        now = time.monotonic()
+        if now - last_checked < cls.HEALTH_CHECK_INTERVAL_SECONDS:
+            return True
+        if not client.ping():
+            logger.warning(f"Elasticsearch client for {key[0]} failed its health check")
+            return False
+        cls._clients[key] = (client, now)
+        return True
+
+    @staticmethod
+    def _key(online_config: ElasticsearchOnlineStoreConfig) -> Tuple[str, str, str]:
+        return (online_config.endpoint, online_config.username, online_config.password)
 
 
 class ElasticsearchOnlineStore(OnlineStore):
@@ -130,49 +193,98 @@ class ElasticsearchOnlineStore(OnlineStore):
         requested_features: Optional[List[str]] = None,
     ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
         with ElasticsearchConnectionManager(config.online_store) as es:
-            id_list = []
-            for entity in entity_keys:
-                for val in entity.entity_values:
-                    id_list.append(self._get_value_from_value_proto(val))
-
             if requested_features is None:
                 requested_features = [f.name for f in table.schema]
+            value_types = self._get_value_types(table, requested_features)
 
-            hits = es.search(
-                index=table.name,
-                source=False,
-                fields=requested_features,
-                query={"ids": {"values": id_list}},
-            )["hits"]
-            if len(hits) > 0 and "hits" in hits:
-                hits = hits["hits"]
-            else:
-                return []
+            ids = [
+                self._get_value_from_value_proto(entity_key.entity_values[0])
+                for entity_key in entity_keys
+            ]
 
             results: List[
                 Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]
             ] = []
-            prefix = "valuetype."
-            for hit in hits:
-                result_row = {}
-                doc = hit["fields"]
-                for feature in doc:
-                    feast_type = next(
-                        f.dtype for f in table.schema if f.name == feature
-                    )
-                    value = (
-                        doc[feature][0]
-                        if isinstance(feast_type, PrimitiveFeastType)
-                        else doc[feature]
-                    )
-                    value_type_method = f"{feast_type.to_value_type()}_val".lower()
-                    if value_type_method.startswith(prefix):
-                        value_type_method = value_type_method[len(prefix) :]
-                    value_proto = self._create_value_proto(value, value_type_method)
-                    result_row[feature] = value_proto
-                results.append((None, result_row))
+            # mget returns one document per requested id, in request order, so results line up with entity_keys
+            for start in range(0, len(ids), MGET_BATCH_SIZE):
+                docs = es.mget(
+                    index=table.name,
+                    ids=ids[start : start + MGET_BATCH_SIZE],
+                    source_includes=requested_features,
+                )["docs"]
+                for doc in docs:
+                    if not doc.get("found"):
+                        results.append((None, None))
+                        continue
+                    source = doc["_source"]
+                    result_row = {
+                        feature: self._create_value_proto(source[feature], value_type)
+                        for feature, value_type in value_types.items()
+                        if feature in source
+                    }
+                    results.append((None, result_row))
             return results
 
+    def retrieve_online_documents(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        requested_feature: str,
+        embedding: List[float],
+        top_k: int,
+        distance_metric: Optional[str] = None,
+    ) -> List[
+        Tuple[
+            Optional[datetime],
+            Optional[ValueProto],
+            Optional[ValueProto],
+            Optional[ValueProto],
+        ]
+    ]:
+        """
+        Runs an approximate kNN search for the top k documents closest to the embedding on the requested
+        dense_vector field. The similarity is fixed by the index mapping, so distance_metric is not supported, and the
+        score returned as distance is the Elasticsearch similarity score, where higher means closer.
+        """
+        if distance_metric is not None:
+            logger.warning(
+                "distance_metric is ignored, Elasticsearch uses the similarity defined in the index mapping"
+            )
+
+        with ElasticsearchConnectionManager(config.online_store) as es:
+            num_candidates = config.online_store.knn_num_candidates or 10 * top_k
+            hits = es.search(
+                index=table.name,
+                knn={
+                    "field": requested_feature,
+                    "query_vector": embedding,
+                    "k": top_k,
+                    "num_candidates": min(max(num_candidates, top_k), 10_000),
+                },
+                source_includes=[requested_feature],
+                size=top_k,
+            )["hits"]["hits"]
+
+            value_type = self._get_value_types(table, [requested_feature])[
+                requested_feature
+            ]
+            result: List[
+                Tuple[
+                    Optional[datetime],
+                    Optional[ValueProto],
+                    Optional[ValueProto],
+                    Optional[ValueProto],
+                ]
+            ] = []
+            for hit in hits:
+                vector = self._create_value_proto(
+                    hit["_source"][requested_feature], value_type
+                )
+                result.append(
+                    (None, vector, vector, ValueProto(float_val=hit["_score"]))
+                )
+            return result
+
     def update(
         self,
         config: RepoConfig,
@@ -198,7 +310,7 @@ class ElasticsearchOnlineStore(OnlineStore):
         tables: Sequence[FeatureView],
         entities: Sequence[Entity],
     ):
-        pass
+        ElasticsearchConnectionManager.close(config.online_store)
 
     def _create_index(self, es, fv):
         index_mapping = {"properties": {}}
@@ -232,6 +344,22 @@ class ElasticsearchOnlineStore(OnlineStore):
     def _get_data_type(self, t: FeastType) -> str:
         return TYPE_MAPPING.get(t, "text")
 
+    def _get_value_types(self, fv: FeatureView, features: List[str]) -> Dict[str, str]:
+        """
+        Maps each requested feature to the ValueProto field its values are stored in, e.g. int64_val or float_list_val.
+        """
+        dtypes = {field.name: field.dtype for field in fv.schema}
+        value_types = {}
+        prefix = "valuetype."
+        for feature in features:
+            if feature not in dtypes:
+                continue
+            value_type = f"{dtypes[feature].to_value_type()}_val".lower()
+            if value_type.startswith(prefix):
+                value_type = value_type[len(prefix) :]
+            value_types[feature] = value_type
+        return value_types
+
     def _get_value_from_value_proto(self, proto: ValueProto):
         """
         Get the raw value from a value proto.
@@ -267,6 +395,9 @@ class ElasticsearchOnlineStore(OnlineStore):
         Returns:
         val_proto (ValueProto): Constructed result that Feast can understand.
         """
+        if feature_val is None:
+            # Null features are read back as an empty Value, as written
+            return ValueProto()
         if value_type == "bytes_list_val":
             val_proto = ValueProto(
                 bytes_list_val=BytesList(val=[base64.b64decode(f) for f in feature_val])
@@ -286,19 +417,24 @@ class ElasticsearchOnlineStore(OnlineStore):
         elif value_type == "bool_list_val":
             val_proto = ValueProto(bool_list_val=BoolList(val=feature_val))
         elif value_type == "unix_timestamp_list_val":
-            nanos_list = [
-                int(datetime.strptime(f, "%Y-%m-%dT%H:%M:%S.%fZ").timestamp() * 1000)
-                for f in feature_val
-            ]
+            nanos_list = [self._parse_timestamp(f) for f in feature_val]
             val_proto = ValueProto(unix_timestamp_list_val=Int64List(val=nanos_list))
         elif value_type == "unix_timestamp_val":
-            nanos = (
-                datetime.strptime(feature_val, "%Y-%m-%dT%H:%M:%S.%fZ").timestamp()
-                * 1000
+            val_proto = ValueProto(
+                unix_timestamp_val=self._parse_timestamp(feature_val)
             )
-            val_proto = ValueProto(unix_timestamp_val=int(nanos))
         else:
             val_proto = ValueProto()
             setattr(val_proto, value_type, feature_val)
 
         return val_proto
+
+    def _parse_timestamp(self, value: Any) -> int:
+        """
+        Timestamps are returned as written (epoch milliseconds) from _source, and as date strings from the fields API.
+        """
+        if isinstance(value, str):
+            return int(
+                datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%fZ").timestamp() * 1000
+            )
+        return int(value)
@@ -1,10 +1,12 @@
 import json
 import logging
+import threading
+import time
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Tuple
 
+import grpc
 import numpy as np
-import pandas as pd
 from bidict import bidict
 from pymilvus import (
     Collection,
@@ -15,6 +17,10 @@ from pymilvus import (
     utility,
 )
 from pymilvus.client.types import LoadState
+from pymilvus.exceptions import (
+    ConnectionNotExistException,
+    MilvusUnavailableException,
+)
 
 from feast import Entity, FeatureView, RepoConfig
 from feast.infra.online_stores.online_store import OnlineStore
@@ -74,40 +80,116 @@ class MilvusOnlineStoreConfig(FeastConfigBaseModel):
     port: int = 19530
     """ the port to connect to a Milvus instance. Should be the one used for GRPC (default: 19530) """
 
+    search_params: Dict[str, Any] = {}
+    """ default ANN search parameters, e.g. {"nprobe": 16} for IVF indexes or {"ef": 64} for HNSW indexes """
+
+    flush_on_write: bool = True
+    """ whether every online_write_batch call flushes the collection and waits for it to be loaded. If False, writes
+    only insert (or upsert) and the collection is flushed once materialization of the feature view completes, and
+    flush_interval_seconds after a write otherwise """
+
+    flush_interval_seconds: Optional[float] = 10.0
+    """ when flush_on_write is False, flush in the background this many seconds after a write that was not flushed,
+    e.g. for push and stream writes. None only flushes once materialization completes """
+
+    upsert: bool = False
+    """ whether to upsert rather than insert, so that rewriting an entity replaces its previous row """
+
 
 class MilvusConnectionManager:
+    """
+    Context manager that provides a Milvus connection for the configured alias.
+
+    Connections are pooled per process: the first use of an alias connects to Milvus and later uses reuse that
+    connection, checking its health at most every HEALTH_CHECK_INTERVAL_SECONDS. A connection that fails
+    a health check or raises a connection error is dropped and re-established on next use. Call `close` to
+    disconnect explicitly.
+    """
+
+    HEALTH_CHECK_INTERVAL_SECONDS = 30.0
+
+    _lock = threading.Lock()
+    # alias -> (connection settings, time of the last successful health check)
+    _connections: Dict[str, Tuple[Tuple[str, int, str, str], float]] = {}
+
     def __init__(self, online_config: RepoConfig):
         self.online_config = online_config
 
     def __enter__(self):
-        # Connecting to Milvus
-        logger.info(
-            f"Connecting to Milvus with alias {self.online_config.alias} and host {self.online_config.host} and port {self.online_config.port}."
-        )
-        print(
-            f"Connecting to Milvus with alias {self.online_config.alias} and host {self.online_config.host} and port {self.online_config.port}."
-        )
-        connections.connect(
-            alias=self.online_config.alias,
-            host=self.online_config.host,
-            port=self.online_config.port,
-            user=self.online_config.username,
-            password=self.online_config.password,
-            use_secure=True,
-        )
+        self.connect(self.online_config)
 
     def __exit__(self, exc_type, exc_value, traceback):
-        # Disconnecting from Milvus
-        logger.info("Closing the connection to Milvus")
-        print("Closing the connection to Milvus")
-        connections.disconnect(self.online_config.alias)
-        logger.info("Connection Closed")
         if exc_type is not None:
             logger.error(f"An exception of type {exc_type} occurred: {exc_value}")
-            print(f"An exception of type {exc_type} occurred: {exc_value}")
+            if _is_connection_error(exc_value):
+                # Reconnect on next use rather than keep handing out a broken connection
+                self.close(self.online_config)
+
+    @classmethod
+    def connect(cls, online_config: MilvusOnlineStoreConfig):
+        settings = (
+            online_config.host,
+            online_config.port,
+            online_config.username,
+            online_config.password,
+        )
+        with cls._lock:
+            pooled = cls._connections.get(online_config.alias)
+            if pooled is not None:
+                pooled_settings, last_checked = pooled
+                if pooled_settings == settings and cls._is_healthy(
+                    online_config.alias, last_checked
+                ):
+                    return
+                connections.disconnect(online_config.alias)
+                del cls._connections[online_config.alias]
+
+            logger.info(
+                f"Connecting to Milvus with alias {online_config.alias} and host {online_config.host} and port {online_config.port}."
+            )
+            connections.connect(
+                alias=online_config.alias,
+                host=online_config.host,
+                port=online_config.port,
+                user=online_config.username,
+                password=online_config.password,
+                use_secure=True,
+            )
+            cls._connections[online_config.alias] = (settings, time.monotonic())
+
+    @classmethod
+    def close(cls, online_config: MilvusOnlineStoreConfig):
+        with cls._lock:
+            if cls._connections.pop(online_config.alias, None) is not None:
+                logger.info("Closing the connection to Milvus")
+                connections.disconnect(online_config.alias)
+
+    @classmethod
+    def _is_healthy(cls, alias: str, last_checked: float) -> bool:
+        now = time.monotonic()
+        if now - last_checked < cls.HEALTH_CHECK_INTERVAL_SECONDS:
+            return True
+        try:
+            utility.get_server_version(using=alias)
+        except Exception as e:
+            logger.warning(f"Milvus connection {alias} failed its health check: {e}")
+            return False
+        cls._connections[alias] = (cls._connections[alias][0], now)
+        return True
+
+
+def _is_connection_error(error: BaseException) -> bool:
+    return isinstance(
+        error, (ConnectionNotExistException, MilvusUnavailableException, grpc.RpcError)
+    )
 
 
 class MilvusOnlineStore(OnlineStore):
+    def __init__(self):
+        # collection name -> timer flushing the writes made since the last flush, see flush_interval_seconds
+        self._flush_timers: Dict[str, threading.Timer] = {}
+        self._flush_timers_lock = threading.Lock()
+
     def online_write_batch(
         self,
         config: RepoConfig,
@@ -119,18 +201,31 @@ class MilvusOnlineStore(OnlineStore):
     ) -> None:
         with MilvusConnectionManager(config.online_store):
             self._create_collection_if_not_exists(table)
-            print("Starting the process to batch write data into Milvus.")
             collection_to_load_data = Collection(table.name)
-            rows = self._format_data_for_milvus(data, collection_to_load_data)
-            collection_to_load_data.insert(rows)
-            #  The flush call will seal any remaining segments and send them for indexing
-            collection_to_load_data.flush()
-            collection_to_load_data.load()
-            logger.info("loading data into memory")
-            print("loading data into memory")
-            utility.wait_for_loading_complete(table.name)
-            logger.info("loading data into memory complete")
-            print("loading data into memory complete")
+            columns = self._format_data_for_milvus(data, collection_to_load_data)
+            if config.online_store.upsert:
+                collection_to_load_data.upsert(columns)
+            else:
+                collection_to_load_data.insert(columns)
+
+            if config.online_store.flush_on_write:
+                self._flush_and_load(collection_to_load_data)
+            else:
+                self._schedule_flush(config, table.name)
+
+    def flush(self, config: RepoConfig, table: FeatureView) -> None:
+        """
+        Seals pending writes to the feature view's collection and loads it, see MilvusOnlineStoreConfig.flush_on_write.
+        """
+        if config.online_store.flush_on_write:
+            return
+        with self._flush_timers_lock:
+            timer = self._flush_timers.pop(table.name, None)
+        if timer is not None:
+            timer.cancel()
+        with MilvusConnectionManager(config.online_store):
+            if utility.has_collection(table.name):
+                self._flush_and_load(Collection(table.name))
 
     def online_read(
         self,
@@ -142,10 +237,7 @@ class MilvusOnlineStore(OnlineStore):
         with MilvusConnectionManager(config.online_store):
             quer_expr = self._construct_milvus_query(entity_keys)
             use_iter_search = len(entity_keys) > MAX_SEARCH_SIZE
-            collection = Collection(table.name)
-            if utility.load_state(table.name) is LoadState.NotLoad:
-                collection.load()
-                utility.wait_for_loading_complete(table.name)
+            collection = self._get_loaded_collection(table.name)
 
             query_result = []
             if use_iter_search:
@@ -170,6 +262,145 @@ class MilvusOnlineStore(OnlineStore):
             # results do not have timestamps
             return [(None, row) for row in results]
 
+    def retrieve_online_documents(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        requested_feature: str,
+        embedding: List[float],
+        top_k: int,
+        distance_metric: Optional[str] = None,
+        *,
+        search_params: Optional[Dict[str, Any]] = None,
+        expr: Optional[str] = None,
+        partition_names: Optional[List[str]] = None,
+    ) -> List[
+        Tuple[
+            Optional[datetime],
+            Optional[ValueProto],
+            Optional[ValueProto],
+            Optional[ValueProto],
+        ]
+    ]:
+        """
+        Runs an ANN search for the top k rows closest to the embedding, using the index on the requested vector field.
+
+        Parameters:
+        config (RepoConfig): the config for the current feature store.
+        table (FeatureView): the feature view whose collection should be searched.
+        requested_feature (str): the name of the vector field to search.
+        embedding (List[float]): the query embedding.
+        top_k (int): the number of rows to return.
+        distance_metric (Optional[str]): the metric to use, defaults to the metric the field's index was built with.
+        search_params (Optional[Dict]): index specific parameters such as nprobe or ef, see `search_documents`.
+        expr (Optional[str]): a boolean Milvus expression the returned rows must match.
+        partition_names (Optional[List[str]]): restricts the search to these partitions.
+
+        Returns:
+        List[Tuple]: one (event timestamp, feature value, vector value, distance) tuple per row, closest first.
+        """
+        return self.search_documents(
+            config,
+            table,
+            requested_feature,
+            [embedding],
+            top_k,
+            distance_metric,
+            search_params=search_params,
+            expr=expr,
+            partition_names=partition_names,
+        )[0]
+
+    def search_documents(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        requested_feature: str,
+        embeddings: List[List[float]],
+        top_k: int,
+        distance_metric: Optional[str] = None,
+        *,
+        search_params: Optional[Dict[str, Any]] = None,
+        expr: Optional[str] = None,
+        partition_names: Optional[List[str]] = None,
+    ) -> List[
+        List[
+            Tuple[
+                Optional[datetime],
+                Optional[ValueProto],
+                Optional[ValueProto],
+                Optional[ValueProto],
+            ]
+        ]
+    ]:
+        """
+        Runs one batched ANN search for several query embeddings. Search parameters are taken from the search_params
+        argument, then from the "search_params" tag of the vector field, then from the online store config.
+
+        Parameters:
+        embeddings (List[List[float]]): the query embeddings.
+        See `retrieve_online_documents` for the other parameters.
+
+        Returns:
+        List[List[Tuple]]: the results of `retrieve_online_documents` for each embedding, in the same order.
+        """
+        if not embeddings:
+            return []
+
+        with MilvusConnectionManager(config.online_store):
+            collection = self._get_loaded_collection(table.name)
+            param = {
+                "metric_type": (
+                    distance_metric.upper()
+                    if distance_metric
+                    else self._get_index_metric_type(collection, requested_feature)
+                ),
+                "params": self._get_search_params(
+                    config, table, requested_feature, search_params
+                ),
+            }
+            search_result = collection.search(
+                data=embeddings,
+                anns_field=requested_feature,
+                param=param,
+                limit=top_k,
+                expr=expr,
+                partition_names=partition_names,
+                output_fields=[requested_feature],
+            )
+
+            results: List[
+                List[
+                    Tuple[
+                        Optional[datetime],
+                        Optional[ValueProto],
+                        Optional[ValueProto],
+                        Optional[ValueProto],
+                    ]
+                ]
+            ] = []
+            for hits in search_result:
+                vectors = self._convert_milvus_result_to_feast_type(
+                    [
+                        {requested_feature: hit.entity.get(requested_feature)}
+                        for hit in hits
+                    ],
+                    collection,
+                    [requested_feature],
+                )
+                results.append(
+                    [
+                        (
+                            None,
+                            vector[requested_feature],
+                            vector[requested_feature],
+                            ValueProto(float_val=hit.distance),
+                        )
+                        for hit, vector in zip(hits, vectors)
+                    ]
+                )
+            return results
+
     def update(
         self,
         config: RepoConfig,
@@ -210,6 +441,47 @@ class MilvusOnlineStore(OnlineStore):
                 if utility.has_collection(collection_name):
                     logger.info(f"Dropping collection: {collection_name}")
                     utility.drop_collection(collection_name)
+        MilvusConnectionManager.close(config.online_store)
+
+    def _get_loaded_collection(self, collection_name: str) -> Collection:
+        """
+        Returns the collection, loading it into memory first if it is not loaded yet.
+        """
+        collection = Collection(collection_name)
+        if utility.load_state(collection_name) is LoadState.NotLoad:
+            collection.load()
+            utility.wait_for_loading_complete(collection_name)
+        return collection
+
+    def _get_index_metric_type(self, collection: Collection, field_name: str) -> str:
+        """
+        Returns the metric type the index on the given field was built with, L2 if the field is not indexed.
+        """
+        for index in collection.indexes:
+            if index.field_name == field_name:
+                return index.params.get("metric_type", "L2")
+        return "L2"
+
+    def _get_search_params(
+        self,
+        config: RepoConfig,
+        feature_view: FeatureView,
+        field_name: str,
+        search_params: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Resolves the ANN search parameters for a vector field.
+        """
+        if search_params is not None:
+            return search_params
+        for field in feature_view.schema:
+            if (
+                field.name == field_name
+                and field.tags
+                and "search_params" in field.tags
+            ):
+                return json.loads(field.tags["search_params"])
+        return config.online_store.search_params
 
     def _create_collection_if_not_exists(self, feature_view: FeatureView):
         """
@@ -347,7 +619,48 @@ class MilvusOnlineStore(OnlineStore):
 
         return False
 
-    def _format_data_for_milvus(self, feast_data, collection: Collection):
+    def _schedule_flush(self, config: RepoConfig, collection_name: str):
+        """
+        Flushes the collection flush_interval_seconds from now, unless a flush is already scheduled. Writes that are
+        not followed by a call to flush, e.g. push and stream writes, are then still sealed and loaded.
+        """
+        interval = config.online_store.flush_interval_seconds
+        if interval is None:
+            return
+        with self._flush_timers_lock:
+            if collection_name in self._flush_timers:
+                return
+            timer = threading.Timer(
+                interval, self._run_scheduled_flush, args=(config, collection_name)
+            )
+            timer.daemon = True
+            self._flush_timers[collection_name] = timer
+        timer.start()
+
+    def _run_scheduled_flush(self, config: RepoConfig, collection_name: str):
+        with self._flush_timers_lock:
+            self._flush_timers.pop(collection_name, None)
+        try:
+            with MilvusConnectionManager(config.online_store):
+                self._flush_and_load(Collection(collection_name))
+        except Exception as e:
+            logger.warning(
+                f"Scheduled flush of collection {collection_name} failed: {e}"
+            )
+
+    def _flush_and_load(self, collection: Collection):
+        """
+        Flushes the collection, which seals growing segments and sends them for indexing, then loads it into memory.
+        """
+        collection.flush()
+        collection.load()
+        logger.info(f"loading collection {collection.name} into memory")
+        utility.wait_for_loading_complete(collection.name)
+        logger.info(f"loading collection {collection.name} into memory complete")
+
+    def _format_data_for_milvus(
+        self, feast_data, collection: Collection
+    ) -> List[List[Any]]:
         """
         Format Feast input for Milvus: Data stored into Milvus takes the grouped representation approach where each feature value is grouped together:
         [[1,2], [1,3]], [John, Lucy], [3,4]]
@@ -358,28 +671,51 @@ class MilvusOnlineStore(OnlineStore):
         collection: target collection
 
         Returns:
-        pd.DataFrame: transformed_data: Data that can be directly written into Milvus
-        """
-        # get the order of columns so that return data frame has the correct order. Milvus does need the correct order
-        # and does not use the column names when a data frame is passed.
-        schema = collection.schema
-        field_names = [field.name for field in schema.fields]
-
-        data = []
-        feature_names = None
-        for entity_key, values, timestamp, created_ts in feast_data:
-            feature_names = [entity_key.join_keys[0]]
-            feature = [self._get_value_from_value_proto(entity_key.entity_values[0])]
-            for feature_name, val in values.items():
-                value = self._get_value_from_value_proto(val)
-                feature.append(value)
-                feature_names.append(feature_name)
-            data.append(feature)
-
-        df = pd.DataFrame(data, columns=feature_names)
-        transformed_data = df.reindex(field_names, axis=1)
-
-        return transformed_data
+        List[List[Any]]: one column per field of the collection, in schema order, that can be directly written into Milvus
+        """
+        # Milvus matches columns to fields by position, so columns are built in the order of the collection schema
+        field_names = [field.name for field in collection.schema.fields]
+        if not feast_data:
+            return [[] for _ in field_names]
+
+        join_key = feast_data[0][0].join_keys[0]
+        columns = []
+        for name in field_names:
+            if name == join_key:
+                protos = [entity_key.entity_values[0] for entity_key, *_ in feast_data]
+            else:
+                protos = [values.get(name) for _, values, *_ in feast_data]
+            columns.append(self._get_column_values(protos))
+        return columns
+
+    def _get_column_values(self, protos: List[Optional[ValueProto]]) -> List[Any]:
+        """
+        Get the raw values of a column of value protos, with vectors as plain lists as Milvus expects them in columnar
+        inserts. The type of the column is taken from its first value, and missing values are None.
+        """
+        val_type = next(
+            (
+                proto.WhichOneof("val")
+                for proto in protos
+                if proto is not None and proto.WhichOneof("val")
+            ),
+            None,
+        )
+        if val_type is None:
+            return [None] * len(protos)
+        if val_type.endswith("_list_val"):
+            return [
+                list(getattr(proto, val_type).val)
+                if proto is not None and proto.HasField(val_type)
+                else None
+                for proto in protos
+            ]
+        return [
+            getattr(proto, val_type)
+            if proto is not None and proto.HasField(val_type)
+            else None
+            for proto in protos
+        ]
 
     def _get_value_from_value_proto(self, proto: ValueProto):
         """
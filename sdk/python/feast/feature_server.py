@@ -18,6 +18,8 @@ from feast import proto_json, utils
 from feast.constants import DEFAULT_FEATURE_SERVER_REGISTRY_TTL
 from feast.data_source import PushMode
 from feast.errors import PushSourceNotFoundException
+from feast.feature_service import FeatureService
+from feast.infra.feature_servers.feature_logger import FeatureLogger
 
 
 # TODO: deprecate this in favor of push features
@@ -71,11 +73,20 @@ def get_app(
         active_timer = threading.Timer(registry_ttl_sec, async_refresh)
         active_timer.start()
 
+    feature_logger: Optional[FeatureLogger] = None
+    logging_options = getattr(store.config.feature_server, "feature_logging", None)
+    if logging_options and logging_options.enabled:
+        feature_logger = FeatureLogger(store, logging_options)
+
     @asynccontextmanager
     async def lifespan(app: FastAPI):
         async_refresh()
+        if feature_logger:
+            feature_logger.start()
         yield
         stop_refresh()
+        if feature_logger:
+            feature_logger.stop()
 
     app = FastAPI(lifespan=lifespan)
 
@@ -102,6 +113,11 @@ def get_app(
                 full_feature_names=full_feature_names,
             ).proto
 
+            if feature_logger and isinstance(features, FeatureService):
+                feature_logger.log(
+                    features, body["entities"], response_proto, full_feature_names
+                )
+
             # Convert the Protobuf object to JSON and return it
             return MessageToDict(
                 response_proto, preserving_proto_field_name=True, float_precision=18
@@ -37,7 +37,7 @@ from colorama import Fore, Style
 from google.protobuf.timestamp_pb2 import Timestamp
 from tqdm import tqdm
 
-from feast import feature_server, flags_helper, ui_server, utils
+from feast import flags_helper, utils
 from feast.base_feature_view import BaseFeatureView
 from feast.batch_feature_view import BatchFeatureView
 from feast.data_source import (
@@ -62,15 +62,14 @@ from feast.feast_object import FeastObject
 from feast.feature_service import FeatureService
 from feast.feature_view import DUMMY_ENTITY, DUMMY_ENTITY_NAME, FeatureView
 from feast.inference import (
+    SchemaCache,
     update_data_sources_with_inferred_event_timestamp_col,
     update_feature_views_with_inferred_features_and_entities,
 )
 from feast.infra.infra_object import Infra
 from feast.infra.provider import Provider, RetrievalJob, get_provider
 from feast.infra.registry.base_registry import BaseRegistry
-from feast.infra.registry.http import HttpRegistry
 from feast.infra.registry.registry import Registry
-from feast.infra.registry.sql import SqlRegistry
 from feast.on_demand_feature_view import OnDemandFeatureView
 from feast.online_response import OnlineResponse
 from feast.protos.feast.core.InfraObject_pb2 import Infra as InfraProto
@@ -146,8 +145,12 @@ class FeatureStore:
 
         registry_config = self.config.registry
         if registry_config.registry_type == "sql":
+            from feast.infra.registry.sql import SqlRegistry
+
             self._registry = SqlRegistry(registry_config, self.config.project, None)
         elif registry_config.registry_type == "http":
+            from feast.infra.registry.http import HttpRegistry
+
             self._registry = HttpRegistry(registry_config, self.config.project, None)
         elif registry_config.registry_type == "snowflake.registry":
             from feast.infra.registry.snowflake import SnowflakeRegistry
@@ -611,26 +614,30 @@ class FeatureStore:
         feature_services_to_update: List[FeatureService],
     ):
         """Makes inferences for entities, feature views, odfvs, and feature services."""
-        update_data_sources_with_inferred_event_timestamp_col(
-            data_sources_to_update, self.config
-        )
-
-        update_data_sources_with_inferred_event_timestamp_col(
-            [view.batch_source for view in views_to_update], self.config
-        )
-
-        update_data_sources_with_inferred_event_timestamp_col(
-            [view.batch_source for view in sfvs_to_update], self.config
-        )
+        # All schemas are looked up through one cache, so that each table is read at most once, and
+        # the lookups of all sources run concurrently.
+        with SchemaCache(self.config) as schema_cache:
+            update_data_sources_with_inferred_event_timestamp_col(
+                [
+                    *data_sources_to_update,
+                    *[view.batch_source for view in views_to_update],
+                    *[view.batch_source for view in sfvs_to_update],
+                ],
+                self.config,
+                schema_cache,
+            )
 
-        # New feature views may reference previously applied entities.
-        entities = self._list_entities()
-        update_feature_views_with_inferred_features_and_entities(
-            views_to_update, entities + entities_to_update, self.config
-        )
-        update_feature_views_with_inferred_features_and_entities(
-            sfvs_to_update, entities + entities_to_update, self.config
-        )
+            # New feature views may reference previously applied entities.
+            entities = self._list_entities()
+            update_feature_views_with_inferred_features_and_entities(
+                views_to_update,
+                entities + entities_to_update,
+                self.config,
+                schema_cache,
+            )
+            update_feature_views_with_inferred_features_and_entities(
+                sfvs_to_update, entities + entities_to_update, self.config, schema_cache
+            )
         # TODO(kevjumba): Update schema inferrence
         for sfv in sfvs_to_update:
             if not sfv.schema:
@@ -782,11 +789,12 @@ class FeatureStore:
             new_infra: The desired infra.
         """
         infra_diff.update()
-        apply_diff_to_registry(
-            self._registry, registry_diff, self.project, commit=False
-        )
+        with self._registry.transaction(self.project):
+            apply_diff_to_registry(
+                self._registry, registry_diff, self.project, commit=False
+            )
 
-        self._registry.update_infra(new_infra, self.project, commit=True)
+            self._registry.update_infra(new_infra, self.project, commit=True)
 
     def apply(
         self,
@@ -911,97 +919,108 @@ class FeatureStore:
         )
 
         # Add all objects to the registry and update the provider's infrastructure.
-        for ds in data_sources_to_update:
-            self._registry.apply_data_source(ds, project=self.project, commit=False)
-        for view in itertools.chain(views_to_update, odfvs_to_update, sfvs_to_update):
-            self._registry.apply_feature_view(view, project=self.project, commit=False)
-        for ent in entities_to_update:
-            self._registry.apply_entity(ent, project=self.project, commit=False)
-        for feature_service in services_to_update:
-            self._registry.apply_feature_service(
-                feature_service, project=self.project, commit=False
-            )
-        for validation_references in validation_references_to_update:
-            self._registry.apply_validation_reference(
-                validation_references, project=self.project, commit=False
-            )
-
-        entities_to_delete = []
-        views_to_delete = []
-        sfvs_to_delete = []
-        if not partial:
-            # Delete all registry objects that should not exist.
-            entities_to_delete = [
-                ob for ob in objects_to_delete if isinstance(ob, Entity)
-            ]
-            views_to_delete = [
-                ob
-                for ob in objects_to_delete
-                if (
-                    (isinstance(ob, FeatureView) or isinstance(ob, BatchFeatureView))
-                    and not isinstance(ob, StreamFeatureView)
-                )
-            ]
-            odfvs_to_delete = [
-                ob for ob in objects_to_delete if isinstance(ob, OnDemandFeatureView)
-            ]
-            sfvs_to_delete = [
-                ob for ob in objects_to_delete if isinstance(ob, StreamFeatureView)
-            ]
-            services_to_delete = [
-                ob for ob in objects_to_delete if isinstance(ob, FeatureService)
-            ]
-            data_sources_to_delete = [
-                ob for ob in objects_to_delete if isinstance(ob, DataSource)
-            ]
-            validation_references_to_delete = [
-                ob for ob in objects_to_delete if isinstance(ob, ValidationReference)
-            ]
-
-            for data_source in data_sources_to_delete:
-                self._registry.delete_data_source(
-                    data_source.name, project=self.project, commit=False
-                )
-            for entity in entities_to_delete:
-                self._registry.delete_entity(
-                    entity.name, project=self.project, commit=False
-                )
-            for view in views_to_delete:
-                self._registry.delete_feature_view(
-                    view.name, project=self.project, commit=False
-                )
-            for odfv in odfvs_to_delete:
-                self._registry.delete_feature_view(
-                    odfv.name, project=self.project, commit=False
-                )
-            for sfv in sfvs_to_delete:
-                self._registry.delete_feature_view(
-                    sfv.name, project=self.project, commit=False
+        # All changes are committed to the registry at once, after the infrastructure was updated.
+        with self._registry.transaction(self.project):
+            for ds in data_sources_to_update:
+                self._registry.apply_data_source(ds, project=self.project, commit=False)
+            for view in itertools.chain(
+                views_to_update, odfvs_to_update, sfvs_to_update
+            ):
+                self._registry.apply_feature_view(
+                    view, project=self.project, commit=False
                 )
-            for service in services_to_delete:
-                self._registry.delete_feature_service(
-                    service.name, project=self.project, commit=False
+            for ent in entities_to_update:
+                self._registry.apply_entity(ent, project=self.project, commit=False)
+            for feature_service in services_to_update:
+                self._registry.apply_feature_service(
+                    feature_service, project=self.project, commit=False
                 )
-            for validation_references in validation_references_to_delete:
-                self._registry.delete_validation_reference(
-                    validation_references.name, project=self.project, commit=False
+            for validation_references in validation_references_to_update:
+                self._registry.apply_validation_reference(
+                    validation_references, project=self.project, commit=False
                 )
 
-        tables_to_delete: List[FeatureView] = (
-            views_to_delete + sfvs_to_delete if not partial else []  # type: ignore
-        )
-        tables_to_keep: List[FeatureView] = views_to_update + sfvs_to_update  # type: ignore
+            entities_to_delete = []
+            views_to_delete = []
+            sfvs_to_delete = []
+            if not partial:
+                # Delete all registry objects that should not exist.
+                entities_to_delete = [
+                    ob for ob in objects_to_delete if isinstance(ob, Entity)
+                ]
+                views_to_delete = [
+                    ob
+                    for ob in objects_to_delete
+                    if (
+                        (
+                            isinstance(ob, FeatureView)
+                            or isinstance(ob, BatchFeatureView)
+                        )
+                        and not isinstance(ob, StreamFeatureView)
+                    )
+                ]
+                odfvs_to_delete = [
+                    ob
+                    for ob in objects_to_delete
+                    if isinstance(ob, OnDemandFeatureView)
+                ]
+                sfvs_to_delete = [
+                    ob for ob in objects_to_delete if isinstance(ob, StreamFeatureView)
+                ]
+                services_to_delete = [
+                    ob for ob in objects_to_delete if isinstance(ob, FeatureService)
+                ]
+                data_sources_to_delete = [
+                    ob for ob in objects_to_delete if isinstance(ob, DataSource)
+                ]
+                validation_references_to_delete = [
+                    ob
+                    for ob in objects_to_delete
+                    if isinstance(ob, ValidationReference)
+                ]
+
+                for data_source in data_sources_to_delete:
+                    self._registry.delete_data_source(
+                        data_source.name, project=self.project, commit=False
+                    )
+                for entity in entities_to_delete:
+                    self._registry.delete_entity(
+                        entity.name, project=self.project, commit=False
+                    )
+                for view in views_to_delete:
+                    self._registry.delete_feature_view(
+                        view.name, project=self.project, commit=False
+                    )
+                for odfv in odfvs_to_delete:
+                    self._registry.delete_feature_view(
+                        odfv.name, project=self.project, commit=False
+                    )
+                for sfv in sfvs_to_delete:
+                    self._registry.delete_feature_view(
+                        sfv.name, project=self.project, commit=False
+                    )
+                for service in services_to_delete:
+                    self._registry.delete_feature_service(
+                        service.name, project=self.project, commit=False
+                    )
+                for validation_references in validation_references_to_delete:
+                    self._registry.delete_validation_reference(
+                        validation_references.name, project=self.project, commit=False
+                    )
 
-        self._get_provider().update_infra(
-            project=self.project,
-            tables_to_delete=tables_to_delete,
-            tables_to_keep=tables_to_keep,
-            entities_to_delete=entities_to_delete if not partial else [],
-            entities_to_keep=entities_to_update,
-            partial=partial,
-        )
+            tables_to_delete: List[FeatureView] = (
+                views_to_delete + sfvs_to_delete if not partial else []  # type: ignore
+            )
+            tables_to_keep: List[FeatureView] = views_to_update + sfvs_to_update  # type: ignore
 
-        self._registry.commit()
+            self._get_provider().update_infra(
+                project=self.project,
+                tables_to_delete=tables_to_delete,
+                tables_to_keep=tables_to_keep,
+                entities_to_delete=entities_to_delete if not partial else [],
+                entities_to_keep=entities_to_update,
+                partial=partial,
+            )
 
     def teardown(self):
         """Tears down all local and cloud resources for the feature store."""
@@ -1763,6 +1782,8 @@ class FeatureStore:
             raise ValueError(
                 f"Python server only supports 'http'. Got '{type_}' instead."
             )
+        from feast import feature_server
+
         # Start the python server
         feature_server.start_server(
             self,
@@ -1796,6 +1817,8 @@ class FeatureStore:
                 "We do not guarantee that future changes will maintain backward compatibility.",
                 RuntimeWarning,
             )
+        from feast import ui_server
+
         ui_server.start_server(
             self,
             host=host,
@@ -1,102 +1,266 @@
+import hashlib
+import json
+import logging
+import os
 import re
-from typing import List, Optional, Set, Union
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from feast.data_source import DataSource, PushSource, RequestSource
 from feast.entity import Entity
 from feast.errors import RegistryInferenceFailure
 from feast.feature_view import DUMMY_ENTITY_ID, DUMMY_ENTITY_NAME, FeatureView
 from feast.field import Field, from_value_type
-from feast.infra.offline_stores.bigquery_source import BigQuerySource
-from feast.infra.offline_stores.contrib.mssql_offline_store.mssqlserver_source import (
-    MsSqlServerSource,
-)
 from feast.infra.offline_stores.file_source import FileSource
-from feast.infra.offline_stores.redshift_source import RedshiftSource
-from feast.infra.offline_stores.snowflake_source import SnowflakeSource
 from feast.repo_config import RepoConfig
 from feast.stream_feature_view import StreamFeatureView
 from feast.types import String
 from feast.value_type import ValueType
 
+logger = logging.getLogger(__name__)
+
+# Fields of a data source that do not change the table it reads from, and so are left out of schema cache keys
+_SCHEMA_INDEPENDENT_FIELDS = [
+    "name",
+    "project",
+    "description",
+    "tags",
+    "owner",
+    "field_mapping",
+    "timestamp_field",
+    "date_partition_column",
+    "created_timestamp_column",
+    "meta",
+]
+
+
+class SchemaCache:
+    """
+    Looks up the columns of data sources for inference, at most once per table.
+
+    Data sources are keyed by the table they read from, so sources that only differ in their name or timestamp
+    fields share a lookup. `prefetch` starts the lookups of many sources at once, in a pool of
+    `schema_inference.max_workers` threads; errors are raised when the columns of the failed source are read.
+    If `schema_inference.cache_ttl_seconds` is set, schemas are also cached on disk for that long, and reused by
+    later caches of the same repo. Use the cache as a context manager, so that the pool is shut down and the disk
+    cache written when inference ends.
+    """
+
+    def __init__(self, config: RepoConfig):
+        self.config = config
+        self._max_workers = config.schema_inference.max_workers
+        self._ttl_seconds = config.schema_inference.cache_ttl_seconds
+        self._path: Optional[Path] = None
+        if self._ttl_seconds > 0:
+            path = Path(config.schema_inference.cache_path)
+            if not path.is_absolute() and config.repo_path is not None:
+                path = config.repo_path / path
+            self._path = path
+        # schema key -> columns cached on disk, with the time they were looked up
+        self._cached: Dict[str, Dict[str, Any]] = self._read_cache()
+        self._lookups: Dict[str, Future] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def __enter__(self) -> "SchemaCache":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def prefetch(self, data_sources: Iterable[DataSource]):
+        for data_source in data_sources:
+            self._lookup(data_source)
+
+    def get_table_column_names_and_types(
+        self, data_source: DataSource
+    ) -> List[Tuple[str, str]]:
+        return self._lookup(data_source).result()
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._write_cache()
+
+    def _lookup(self, data_source: DataSource) -> Future:
+        key = _schema_key(data_source, self.config)
+        if key not in self._lookups:
+            cached = self._cached.get(key)
+            if cached is not None and time.time() - cached["time"] < self._ttl_seconds:
+                future: Future = Future()
+                future.set_result([tuple(column) for column in cached["columns"]])
+                self._lookups[key] = future
+            else:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self._max_workers,
+                        thread_name_prefix="feast-schema-inference",
+                    )
+                self._lookups[key] = self._executor.submit(
+                    _get_table_column_names_and_types, data_source, self.config
+                )
+        return self._lookups[key]
+
+    def _read_cache(self) -> Dict[str, Dict[str, Any]]:
+        if self._path is None or not self._path.exists():
+            return {}
+        try:
+            return json.loads(self._path.read_text())
+        except (OSError, ValueError):
+            logger.warning(f"Ignoring unreadable schema cache {self._path}")
+            return {}
+
+    def _write_cache(self):
+        if self._path is None:
+            return
+        now = time.time()
+        cache = {
+            key: cached
+            for key, cached in self._cached.items()
+            if now - cached["time"] < self._ttl_seconds
+        }
+        for key, lookup in self._lookups.items():
+            if key not in cache and lookup.done() and lookup.exception() is None:
+                cache[key] = {"time": now, "columns": lookup.result()}
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        # Written to a temporary file first, so that concurrent runs never read a partial cache
+        tmp_path = self._path.with_name(f"{self._path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(cache))
+        os.replace(tmp_path, self._path)
+
+
+def _schema_key(data_source: DataSource, config: RepoConfig) -> str:
+    data_source_proto = data_source.to_proto()
+    for field_name in _SCHEMA_INDEPENDENT_FIELDS:
+        data_source_proto.ClearField(field_name)  # type: ignore[arg-type]
+    key = hashlib.sha256()
+    key.update(
+        f"{data_source.__class__.__module__}.{data_source.__class__.__name__}".encode()
+    )
+    key.update(data_source_proto.SerializeToString(deterministic=True))
+    # The same table definition can point to different tables for other repos or offline stores
+    key.update(str(config.repo_path).encode())
+    key.update(json.dumps(config.offline_config, sort_keys=True, default=str).encode())
+    return key.hexdigest()
+
+
+def _get_table_column_names_and_types(
+    data_source: DataSource, config: RepoConfig
+) -> List[Tuple[str, str]]:
+    return [
+        (col_name, col_datatype)
+        for col_name, col_datatype in data_source.get_table_column_names_and_types(
+            config
+        )
+    ]
+
 
 def update_data_sources_with_inferred_event_timestamp_col(
-    data_sources: List[DataSource], config: RepoConfig
+    data_sources: List[DataSource],
+    config: RepoConfig,
+    schema_cache: Optional[SchemaCache] = None,
 ) -> None:
+    # Imported here so that `import feast` does not pull in every warehouse source.
+    from feast.infra.offline_stores.bigquery_source import BigQuerySource
+    from feast.infra.offline_stores.contrib.mssql_offline_store.mssqlserver_source import (
+        MsSqlServerSource,
+    )
+    from feast.infra.offline_stores.redshift_source import RedshiftSource
+    from feast.infra.offline_stores.snowflake_source import SnowflakeSource
+
+    if schema_cache is None:
+        with SchemaCache(config) as schema_cache:
+            update_data_sources_with_inferred_event_timestamp_col(
+                data_sources, config, schema_cache
+            )
+        return
+
     ERROR_MSG_PREFIX = "Unable to infer DataSource timestamp_field"
+    data_sources_to_infer = []
     for data_source in data_sources:
         if isinstance(data_source, RequestSource):
             continue
         if isinstance(data_source, PushSource):
             data_source = data_source.batch_source
         if data_source.timestamp_field is None or data_source.timestamp_field == "":
-            # prepare right match pattern for data source
-            ts_column_type_regex_pattern: str
-            # TODO(adchia): Move Spark source inference out of this logic
-            if (
-                isinstance(data_source, FileSource)
-                or "SparkSource" == data_source.__class__.__name__
-            ):
-                ts_column_type_regex_pattern = r"^timestamp"
-            elif isinstance(data_source, BigQuerySource):
-                ts_column_type_regex_pattern = "TIMESTAMP|DATETIME"
-            elif isinstance(data_source, RedshiftSource):
-                ts_column_type_regex_pattern = "TIMESTAMP[A-Z]*"
-            elif isinstance(data_source, SnowflakeSource):
-                ts_column_type_regex_pattern = "TIMESTAMP_[A-Z]*"
-            elif isinstance(data_source, MsSqlServerSource):
-                ts_column_type_regex_pattern = "TIMESTAMP|DATETIME"
-            else:
-                raise RegistryInferenceFailure(
-                    "DataSource",
-                    f"""
-                    DataSource inferencing of timestamp_field is currently only supported
-                    for FileSource, SparkSource, BigQuerySource, RedshiftSource, SnowflakeSource, MsSqlSource.
-                    Attempting to infer from {data_source}.
-                    """,
-                )
-            #  for informing the type checker
-            assert (
-                isinstance(data_source, FileSource)
-                or isinstance(data_source, BigQuerySource)
-                or isinstance(data_source, RedshiftSource)
-                or isinstance(data_source, SnowflakeSource)
-                or isinstance(data_source, MsSqlServerSource)
-                or "SparkSource" == data_source.__class__.__name__
+            data_sources_to_infer.append(data_source)
+    schema_cache.prefetch(data_sources_to_infer)
+
+    for data_source in data_sources_to_infer:
+        # A source listed more than once only needs to be inferred the first time
+        if data_source.timestamp_field:
+            continue
+        # prepare right match pattern for data source
+        ts_column_type_regex_pattern: str
+        # TODO(adchia): Move Spark source inference out of this logic
+        if (
+            isinstance(data_source, FileSource)
+            or "SparkSource" == data_source.__class__.__name__
+        ):
+            ts_column_type_regex_pattern = r"^timestamp"
+        elif isinstance(data_source, BigQuerySource):
+            ts_column_type_regex_pattern = "TIMESTAMP|DATETIME"
+        elif isinstance(data_source, RedshiftSource):
+            ts_column_type_regex_pattern = "TIMESTAMP[A-Z]*"
+        elif isinstance(data_source, SnowflakeSource):
+            ts_column_type_regex_pattern = "TIMESTAMP_[A-Z]*"
+        elif isinstance(data_source, MsSqlServerSource):
+            ts_column_type_regex_pattern = "TIMESTAMP|DATETIME"
+        else:
+            raise RegistryInferenceFailure(
+                "DataSource",
+                f"""
+                DataSource inferencing of timestamp_field is currently only supported
+                for FileSource, SparkSource, BigQuerySource, RedshiftSource, SnowflakeSource, MsSqlSource.
+                Attempting to infer from {data_source}.
+                """,
             )
+        #  for informing the type checker
+        assert (
+            isinstance(data_source, FileSource)
+            or isinstance(data_source, BigQuerySource)
+            or isinstance(data_source, RedshiftSource)
+            or isinstance(data_source, SnowflakeSource)
+            or isinstance(data_source, MsSqlServerSource)
+            or "SparkSource" == data_source.__class__.__name__
+        )
 
-            # loop through table columns to find singular match
-            timestamp_fields = []
-            for (
-                col_name,
-                col_datatype,
-            ) in data_source.get_table_column_names_and_types(config):
-                if re.match(ts_column_type_regex_pattern, col_datatype):
-                    timestamp_fields.append(col_name)
-
-            if len(timestamp_fields) > 1:
-                raise RegistryInferenceFailure(
-                    "DataSource",
-                    f"""{ERROR_MSG_PREFIX}; found multiple possible columns of timestamp type.
-                    Data source type: {data_source.__class__.__name__},
-                    Timestamp regex: `{ts_column_type_regex_pattern}`, columns: {timestamp_fields}""",
-                )
-            elif len(timestamp_fields) == 1:
-                data_source.timestamp_field = timestamp_fields[0]
-            else:
-                raise RegistryInferenceFailure(
-                    "DataSource",
-                    f"""
-                    {ERROR_MSG_PREFIX}; Found no columns of timestamp type.
-                    Data source type: {data_source.__class__.__name__},
-                    Timestamp regex: `{ts_column_type_regex_pattern}`.
-                    """,
-                )
+        # loop through table columns to find singular match
+        timestamp_fields = []
+        for (
+            col_name,
+            col_datatype,
+        ) in schema_cache.get_table_column_names_and_types(data_source):
+            if re.match(ts_column_type_regex_pattern, col_datatype):
+                timestamp_fields.append(col_name)
+
+        if len(timestamp_fields) > 1:
+            raise RegistryInferenceFailure(
+                "DataSource",
+                f"""{ERROR_MSG_PREFIX}; found multiple possible columns of timestamp type.
+                Data source type: {data_source.__class__.__name__},
+                Timestamp regex: `{ts_column_type_regex_pattern}`, columns: {timestamp_fields}""",
+            )
+        elif len(timestamp_fields) == 1:
+            data_source.timestamp_field = timestamp_fields[0]
+        else:
+            raise RegistryInferenceFailure(
+                "DataSource",
+                f"""
+                {ERROR_MSG_PREFIX}; Found no columns of timestamp type.
+                Data source type: {data_source.__class__.__name__},
+                Timestamp regex: `{ts_column_type_regex_pattern}`.
+                """,
+            )
 
 
 def update_feature_views_with_inferred_features_and_entities(
     fvs: Union[List[FeatureView], List[StreamFeatureView]],
     entities: List[Entity],
     config: RepoConfig,
+    schema_cache: Optional[SchemaCache] = None,
 ) -> None:
     """
     Infers the features and entities associated with each feature view and updates it in place.
@@ -113,10 +277,20 @@ def update_feature_views_with_inferred_features_and_entities(
         fvs: The feature views to be updated.
         entities: A list containing entities associated with the feature views.
         config: The config for the current feature store.
+        schema_cache: The cache used to look up the schemas of batch sources. If not provided, a new one is
+            created for the feature views.
     """
+    if schema_cache is None:
+        with SchemaCache(config) as schema_cache:
+            update_feature_views_with_inferred_features_and_entities(
+                fvs, entities, config, schema_cache
+            )
+        return
+
     entity_name_to_entity_map = {e.name: e for e in entities}
     entity_name_to_join_key_map = {e.name: e.join_key for e in entities}
 
+    fvs_to_infer = []
     for fv in fvs:
         join_keys = set(
             [
@@ -171,18 +345,25 @@ def update_feature_views_with_inferred_features_and_entities(
         run_inference_for_features = len(fv.features) == 0
 
         if run_inference_for_entities or run_inference_for_features:
-            _infer_features_and_entities(
-                fv,
-                join_keys,
-                run_inference_for_features,
-                config,
-            )
+            fvs_to_infer.append((fv, join_keys, run_inference_for_features))
 
-            if not fv.features:
-                raise RegistryInferenceFailure(
-                    "FeatureView",
-                    f"Could not infer Features for the FeatureView named {fv.name}.",
-                )
+    # Starts the schema lookups of all batch sources before waiting on any of them
+    schema_cache.prefetch(fv.batch_source for fv, _, _ in fvs_to_infer)
+
+    for fv, join_keys, run_inference_for_features in fvs_to_infer:
+        _infer_features_and_entities(
+            fv,
+            join_keys,
+            run_inference_for_features,
+            config,
+            schema_cache,
+        )
+
+        if not fv.features:
+            raise RegistryInferenceFailure(
+                "FeatureView",
+                f"Could not infer Features for the FeatureView named {fv.name}.",
+            )
 
 
 def _infer_features_and_entities(
@@ -190,6 +371,7 @@ def _infer_features_and_entities(
     join_keys: Set[Optional[str]],
     run_inference_for_features,
     config,
+    schema_cache: SchemaCache,
 ) -> None:
     """
     Updates the specific feature in place with inferred features and entities.
@@ -199,6 +381,7 @@ def _infer_features_and_entities(
         join_keys: The set of join keys for the feature view's entities.
         run_inference_for_features: Whether to run inference for features.
         config: The config for the current feature store.
+        schema_cache: The cache used to look up the schema of the batch source.
     """
     columns_to_exclude = {
         fv.batch_source.timestamp_field,
@@ -209,8 +392,8 @@ def _infer_features_and_entities(
             columns_to_exclude.remove(mapped_col)
             columns_to_exclude.add(original_col)
 
-    table_column_names_and_types = fv.batch_source.get_table_column_names_and_types(
-        config
+    table_column_names_and_types = schema_cache.get_table_column_names_and_types(
+        fv.batch_source
     )
 
     for col_name, col_datatype in table_column_names_and_types:
@@ -0,0 +1,154 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import MethodType
+from typing import Iterable, Iterator, List, Optional
+
+import pandas as pd
+import pyarrow as pa
+from pydantic import StrictInt, StrictStr
+
+from feast.data_source import PushMode
+from feast.feature_store import FeatureStore
+from feast.feature_view import FeatureView
+from feast.infra.contrib.stream_aggregator import (
+    StreamAggregator,
+    get_stream_aggregator,
+)
+from feast.infra.contrib.stream_processor import ProcessorConfig, StreamProcessor
+from feast.stream_feature_view import StreamFeatureView
+from feast.utils import _convert_arrow_to_proto, _run_pyarrow_field_mapping
+
+
+class PythonProcessorConfig(ProcessorConfig):
+    """
+    Configuration of the in-process stream processor.
+
+    batches is the stream itself: any iterable of pandas DataFrames, e.g. a list in tests or a generator
+    that polls a Kafka consumer and decodes each poll into a DataFrame.
+    """
+
+    mode: StrictStr = "python"
+    source: StrictStr = "memory"
+    batches: Iterable[pd.DataFrame]
+    write_batch_size: StrictInt = 1000
+    """ Number of rows passed to each online_write_batch call. """
+    max_concurrent_writes: StrictInt = 4
+    """ Number of online_write_batch calls running at the same time. """
+
+
+class PythonStreamProcessor(StreamProcessor):
+    """
+    Ingests a stream feature view in the current process, without Spark.
+
+    Each batch is reduced to the latest row per entity (or to the updated aggregates, when `native_aggregation`
+    is set and the stream feature view has aggregations Feast can compute) and written to the online store in chunks of `write_batch_size`
+    rows, with up to `max_concurrent_writes` chunks in flight. The next batch is transformed while the previous
+    one is written, but its writes only start once the previous batch is fully written: this bounds how far
+    ingestion runs ahead of the online store, and keeps the writes of each entity in order.
+
+    Transformations must work on pandas DataFrames, so stream feature views with a udf need `mode="pandas"`.
+    """
+
+    def __init__(
+        self,
+        *,
+        fs: FeatureStore,
+        sfv: FeatureView,
+        config: ProcessorConfig,
+        preprocess_fn: Optional[MethodType] = None,
+    ):
+        if not isinstance(config, PythonProcessorConfig):
+            raise ValueError("config is not python processor config")
+        if isinstance(sfv, StreamFeatureView) and sfv.udf and sfv.mode != "pandas":
+            raise ValueError(
+                f"Stream feature view {sfv.name} has mode {sfv.mode}, but the python stream processor "
+                f"can only apply pandas transformations"
+            )
+
+        self.batches = config.batches
+        self.write_batch_size = config.write_batch_size
+        self.max_concurrent_writes = config.max_concurrent_writes
+        self.preprocess_fn = preprocess_fn
+        self.join_keys = [fs.get_entity(entity).join_key for entity in sfv.entities]
+        if isinstance(sfv, StreamFeatureView):
+            self.timestamp_field = sfv.timestamp_field
+        else:
+            self.timestamp_field = sfv.stream_source.timestamp_field  # type: ignore
+        self.aggregator: Optional[StreamAggregator] = get_stream_aggregator(
+            sfv, self.join_keys, config.native_aggregation
+        )
+        self.provider = fs._get_provider()
+        super().__init__(fs=fs, sfv=sfv, data_source=sfv.stream_source)  # type: ignore
+
+    def ingest_stream_feature_view(self, to: PushMode = PushMode.ONLINE) -> int:
+        """
+        Ingests the stream until it is exhausted and returns the number of rows written.
+        """
+        batches = self._ingest_stream_data()
+        transformed = self._construct_transformation_plan(batches)
+        return self._write_stream_data(transformed, to)
+
+    def _ingest_stream_data(self) -> Iterator[pd.DataFrame]:
+        return iter(self.batches)
+
+    def _construct_transformation_plan(
+        self, batches: Iterator[pd.DataFrame]
+    ) -> Iterator[pd.DataFrame]:
+        for batch in batches:
+            if isinstance(self.sfv, StreamFeatureView) and self.sfv.udf:
+                batch = self.sfv.udf(batch)
+            if self.aggregator is not None:
+                batch = self.aggregator.update(batch)
+            else:
+                batch = (
+                    batch.sort_values(self.timestamp_field, kind="stable")
+                    .drop_duplicates(self.join_keys, keep="last")
+                    .reset_index(drop=True)
+                )
+            if self.preprocess_fn:
+                batch = self.preprocess_fn(batch)
+            yield batch
+
+    def _write_stream_data(self, batches: Iterator[pd.DataFrame], to: PushMode) -> int:
+        rows_written = 0
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_writes) as executor:
+            in_flight: List[Future] = []
+            for rows in batches:
+                # Waiting here, after the batch was read and transformed, is what applies backpressure
+                for future in in_flight:
+                    future.result()
+                in_flight = []
+                if rows.empty:
+                    continue
+
+                if to == PushMode.ONLINE or to == PushMode.ONLINE_AND_OFFLINE:
+                    for start in range(0, len(rows), self.write_batch_size):
+                        chunk = rows.iloc[start : start + self.write_batch_size]
+                        in_flight.append(executor.submit(self._write_online, chunk))
+                if to == PushMode.OFFLINE or to == PushMode.ONLINE_AND_OFFLINE:
+                    in_flight.append(
+                        executor.submit(
+                            self.fs.write_to_offline_store, self.sfv.name, rows
+                        )
+                    )
+                rows_written += len(rows)
+
+            for future in in_flight:
+                future.result()
+        return rows_written
+
+    def _write_online(self, rows: pd.DataFrame):
+        table = pa.Table.from_pandas(rows, preserve_index=False)
+        if self.sfv.batch_source.field_mapping is not None:
+            table = _run_pyarrow_field_mapping(
+                table, self.sfv.batch_source.field_mapping
+            )
+        join_key_to_value_type = {
+            entity.name: entity.dtype.to_value_type()
+            for entity in self.sfv.entity_columns
+        }
+        self.provider.online_write_batch(
+            self.fs.config,
+            self.sfv,
+            _convert_arrow_to_proto(table, self.sfv, join_key_to_value_type),
+            progress=None,
+        )
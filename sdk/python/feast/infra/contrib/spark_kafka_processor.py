@@ -14,6 +14,10 @@ from feast import FeatureView
 from feast.data_format import AvroFormat, ConfluentAvroFormat, JsonFormat, StreamFormat
 from feast.data_source import KafkaSource, PushMode
 from feast.feature_store import FeatureStore
+from feast.infra.contrib.stream_aggregator import (
+    StreamAggregator,
+    get_stream_aggregator,
+)
 from feast.infra.contrib.stream_processor import (
     ProcessorConfig,
     StreamProcessor,
@@ -106,6 +110,11 @@ class SparkKafkaProcessor(StreamProcessor):
             else "/tmp/checkpoint/"
         )
         self.join_keys = [fs.get_entity(entity).join_key for entity in sfv.entities]
+        # With native_aggregation, aggregations are computed on the driver and kept across micro-batches.
+        # Otherwise, or if Feast can't compute them, the transformation is expected to compute them.
+        self.aggregator: Optional[StreamAggregator] = get_stream_aggregator(
+            sfv, self.join_keys, config.native_aggregation
+        )
         self.spark_serialized_artifacts = _SparkSerializedArtifacts.serialize(
             feature_view=sfv, repo_config=fs.config
         )
@@ -335,24 +344,28 @@ class SparkKafkaProcessor(StreamProcessor):
         def batch_write(row: DataFrame, batch_id: int):
             rows: pd.DataFrame = row.toPandas()
 
-            # Extract the latest feature values for each unique entity row (i.e. the join keys).
-            # Also add a 'created' column.
+            # Extract the latest feature values for each unique entity row (i.e. the join keys),
+            # or the updated aggregates if Feast computes the view's aggregations.
             if isinstance(self.sfv, StreamFeatureView):
                 ts_field = self.sfv.timestamp_field
             else:
                 ts_field = self.sfv.stream_source.timestamp_field  # type: ignore
-            rows = (
-                rows.sort_values(by=[*self.join_keys, ts_field], ascending=False)
-                .groupby(self.join_keys)
-                .nth(0)
-            )
-            # Created column is not used anywhere in the code, but it is added to the dataframe.
-            # Expedia provider drops the unused columns from dataframe
-            # Commenting this out as it is not used anywhere in the code
-            # rows["created"] = pd.to_datetime("now", utc=True)
+            if self.aggregator is not None:
+                # Only entities whose aggregates changed in this batch are returned.
+                rows = self.aggregator.update(rows)
+            else:
+                rows = (
+                    rows.sort_values(by=[*self.join_keys, ts_field], ascending=False)
+                    .groupby(self.join_keys)
+                    .nth(0)
+                )
+                # Created column is not used anywhere in the code, but it is added to the dataframe.
+                # Expedia provider drops the unused columns from dataframe
+                # Commenting this out as it is not used anywhere in the code
+                # rows["created"] = pd.to_datetime("now", utc=True)
 
-            # Reset indices to ensure the dataframe has all the required columns.
-            rows = rows.reset_index()
+                # Reset indices to ensure the dataframe has all the required columns.
+                rows = rows.reset_index()
 
             # Optionally execute preprocessor before writing to the online store.
             if self.preprocess_fn:
@@ -0,0 +1,302 @@
+import logging
+import math
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import pandas as pd
+
+from feast.aggregation import SUPPORTED_FUNCTIONS, Aggregation
+from feast.feature_view import FeatureView
+from feast.stream_feature_view import StreamFeatureView
+from feast.utils import _utc_now
+
+logger = logging.getLogger(__name__)
+
+# Partial aggregate of one tile: [sum, count, min, max]
+_Partial = List[Any]
+
+
+class _TiledColumn:
+    """
+    Partial aggregates of one column, per entity and per tile of `tile_ns` nanoseconds. A tile size of 0 keeps a
+    single, unbounded tile per entity.
+    """
+
+    def __init__(self, column: str, tile_ns: int, retained_tiles: int):
+        self.column = column
+        self.tile_ns = tile_ns
+        self.retained_tiles = retained_tiles
+        # entity key -> tile index -> partial aggregate
+        self.tiles: Dict[Tuple, Dict[int, _Partial]] = defaultdict(dict)
+
+    def current_tile(self, clock_ns: int) -> int:
+        return clock_ns // self.tile_ns if self.tile_ns else 0
+
+    def update(
+        self,
+        df: pd.DataFrame,
+        join_keys: List[str],
+        ts_ns: pd.Series,
+        current_tile: int,
+    ):
+        events = df[join_keys + [self.column]].copy()
+        events["__tile"] = ts_ns // self.tile_ns if self.tile_ns else 0
+        partials = events.groupby(join_keys + ["__tile"], sort=False)[self.column].agg(
+            ["sum", "count", "min", "max"]
+        )
+
+        for index, (total, count, minimum, maximum) in zip(
+            partials.index, partials.itertuples(index=False)
+        ):
+            *key_values, tile = index
+            if self.tile_ns and tile <= current_tile - self.retained_tiles:
+                # Too late to fall into any window that can still be emitted
+                continue
+
+            entity_tiles = self.tiles[tuple(key_values)]
+            partial = entity_tiles.get(tile)
+            if partial is None:
+                entity_tiles[tile] = [total, count, minimum, maximum]
+            else:
+                partial[0] += total
+                partial[1] += count
+                partial[2] = min(partial[2], minimum)
+                partial[3] = max(partial[3], maximum)
+
+    def expiring(
+        self, previous_tile: int, current_tile: int, window_tiles: int
+    ) -> Set[Tuple]:
+        """
+        Returns the entities with a tile that left the window of `window_tiles` tiles as the clock moved from
+        `previous_tile` to `current_tile`.
+        """
+        if not self.tile_ns or current_tile <= previous_tile:
+            return set()
+        low, high = previous_tile - window_tiles, current_tile - window_tiles
+        return {
+            key
+            for key, entity_tiles in self.tiles.items()
+            if any(low < tile <= high for tile in entity_tiles)
+        }
+
+    def evict(self, current_tile: int):
+        if not self.tile_ns:
+            return
+        for key in list(self.tiles):
+            entity_tiles = self.tiles[key]
+            for tile in [
+                t for t in entity_tiles if t <= current_tile - self.retained_tiles
+            ]:
+                del entity_tiles[tile]
+            if not entity_tiles:
+                del self.tiles[key]
+
+    def aggregate(
+        self, key: Tuple, function: str, window_tiles: int, current_tile: int
+    ) -> Any:
+        merged: Optional[_Partial] = None
+        for tile, partial in self.tiles.get(key, {}).items():
+            if self.tile_ns and tile <= current_tile - window_tiles:
+                continue
+            if merged is None:
+                merged = list(partial)
+            else:
+                merged[0] += partial[0]
+                merged[1] += partial[1]
+                merged[2] = min(merged[2], partial[2])
+                merged[3] = max(merged[3], partial[3])
+
+        if function == "count":
+            return 0 if merged is None else merged[1]
+        if merged is None or merged[1] == 0:
+            return None
+        if function == "sum":
+            return merged[0]
+        if function == "mean":
+            return merged[0] / merged[1]
+        if function == "min":
+            return merged[2]
+        return merged[3]
+
+
+class StreamAggregator:
+    """
+    Incrementally computes the aggregations of a stream feature view over micro-batches of events.
+
+    Events are pre-aggregated into tiles whose size divides both the time window and the slide interval of each
+    aggregation (the slide interval itself when it divides the window). Each tile keeps a partial sum, count, min
+    and max per entity, and aggregations over the same column with the same tile size share those tiles.
+
+    Windows end with the tile of the aggregator's clock, which is the processing time, or the latest event seen
+    if that is later, and never goes back. The same window applies to every entity, so the aggregates of an
+    entity that stops receiving events still expire. `update` returns one row for every entity that received
+    events, and for every entity whose aggregates changed because tiles left their window as the clock moved;
+    other entities are not returned, so only changed aggregates are written to the online store. Tiles that can
+    no longer fall in any window are dropped, which bounds memory by the number of active entities and the
+    window lengths.
+
+    Aggregations without a time window are computed over all events seen so far.
+
+    The tiles are only kept in memory. After a restart, windows only cover the events received since, even
+    when the stream itself resumes from a checkpoint, so aggregates are under-counted until a full window has
+    passed.
+    """
+
+    def __init__(
+        self,
+        sfv: StreamFeatureView,
+        join_keys: List[str],
+        clock: Optional[Callable[[], datetime]] = None,
+    ):
+        for aggregation in sfv.aggregations:
+            if aggregation.function not in SUPPORTED_FUNCTIONS:
+                raise ValueError(
+                    f"Aggregation function {aggregation.function} of stream feature view {sfv.name} is not "
+                    f"supported, expected one of {sorted(SUPPORTED_FUNCTIONS)}"
+                )
+
+        self.join_keys = join_keys
+        self.timestamp_field = sfv.timestamp_field
+        self.clock = clock
+        self._clock_ns: Optional[int] = None
+        # Each aggregation is computed from a tiled column and the number of tiles its window spans
+        self._aggregations: List[Tuple[Aggregation, _TiledColumn, int]] = []
+
+        tile_sizes = {
+            aggregation.feature_name: _tile_ns(aggregation)
+            for aggregation in sfv.aggregations
+        }
+        retained: Dict[Tuple[str, int], int] = defaultdict(lambda: 1)
+        for aggregation in sfv.aggregations:
+            tile_ns = tile_sizes[aggregation.feature_name]
+            key = (aggregation.column, tile_ns)
+            retained[key] = max(retained[key], _window_tiles(aggregation, tile_ns))
+
+        columns = {
+            key: _TiledColumn(key[0], key[1], retained_tiles)
+            for key, retained_tiles in retained.items()
+        }
+        for aggregation in sfv.aggregations:
+            tile_ns = tile_sizes[aggregation.feature_name]
+            self._aggregations.append(
+                (
+                    aggregation,
+                    columns[(aggregation.column, tile_ns)],
+                    _window_tiles(aggregation, tile_ns),
+                )
+            )
+        self._columns = list(columns.values())
+
+    def update(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Adds a batch of events, advances the clock and returns the updated aggregates.
+
+        The result has the join keys, the timestamp field and one column per aggregation, named after
+        `Aggregation.feature_name`. The timestamp is the time of the entity's latest event in the batch, or the
+        clock for entities returned only because their aggregates expired. The batch may be empty.
+        """
+        output_columns = (
+            self.join_keys
+            + [self.timestamp_field]
+            + [aggregation.feature_name for aggregation, _, _ in self._aggregations]
+        )
+
+        clock_ns = pd.Timestamp((self.clock or _utc_now)()).value
+        if not df.empty:
+            timestamps = pd.to_datetime(df[self.timestamp_field], utc=True)
+            ts_ns = timestamps.astype("int64")
+            clock_ns = max(clock_ns, int(ts_ns.max()))
+        previous_clock_ns = self._clock_ns
+        if previous_clock_ns is not None:
+            clock_ns = max(clock_ns, previous_clock_ns)
+        self._clock_ns = clock_ns
+
+        latest_events = pd.Series(dtype="datetime64[ns, UTC]")
+        if not df.empty:
+            for column in self._columns:
+                column.update(df, self.join_keys, ts_ns, column.current_tile(clock_ns))
+            latest_events = (
+                pd.DataFrame({**{k: df[k] for k in self.join_keys}, "__ts": timestamps})
+                .groupby(self.join_keys, sort=False)["__ts"]
+                .max()
+            )
+
+        updated: Dict[Tuple, Any] = {
+            index if isinstance(index, tuple) else (index,): timestamp
+            for index, timestamp in latest_events.items()
+        }
+        if previous_clock_ns is not None:
+            clock_time = pd.Timestamp(clock_ns, tz="UTC")
+            for _, column, window_tiles in self._aggregations:
+                for key in column.expiring(
+                    column.current_tile(previous_clock_ns),
+                    column.current_tile(clock_ns),
+                    window_tiles,
+                ):
+                    updated.setdefault(key, clock_time)
+
+        rows = []
+        for key, timestamp in updated.items():
+            row = list(key) + [timestamp]
+            for aggregation, column, window_tiles in self._aggregations:
+                row.append(
+                    column.aggregate(
+                        key,
+                        aggregation.function,
+                        window_tiles,
+                        column.current_tile(clock_ns),
+                    )
+                )
+            rows.append(row)
+
+        for column in self._columns:
+            column.evict(column.current_tile(clock_ns))
+
+        return pd.DataFrame(rows, columns=output_columns)
+
+
+def _tile_ns(aggregation: Aggregation) -> int:
+    if not aggregation.time_window:
+        return 0
+    window_ns = int(aggregation.time_window.total_seconds() * 1e9)
+    slide = aggregation.slide_interval or aggregation.time_window
+    slide_ns = int(slide.total_seconds() * 1e9)
+    return math.gcd(window_ns, slide_ns)
+
+
+def _window_tiles(aggregation: Aggregation, tile_ns: int) -> int:
+    if not tile_ns:
+        return 1
+    assert aggregation.time_window is not None
+    return int(aggregation.time_window.total_seconds() * 1e9) // tile_ns
+
+
+def get_stream_aggregator(
+    sfv: FeatureView, join_keys: List[str], native_aggregation: bool
+) -> Optional[StreamAggregator]:
+    """
+    Returns the aggregator computing the aggregations of a stream feature view, or None if the stream
+    processor should write the rows returned by its transformation as they are: when native aggregation is
+    off, when the view has no aggregations, or when Feast can't compute them into features of the view.
+    """
+    if (
+        not native_aggregation
+        or not isinstance(sfv, StreamFeatureView)
+        or not sfv.aggregations
+    ):
+        return None
+    feature_names = {feature.name for feature in sfv.features}
+    unsupported = [
+        aggregation.feature_name
+        for aggregation in sfv.aggregations
+        if aggregation.function not in SUPPORTED_FUNCTIONS
+        or aggregation.feature_name not in feature_names
+    ]
+    if unsupported:
+        logger.warning(
+            f"Not aggregating stream feature view {sfv.name}, as its schema has no feature for, or Feast "
+            f"can't compute, the aggregations {unsupported}"
+        )
+        return None
+    return StreamAggregator(sfv, join_keys)
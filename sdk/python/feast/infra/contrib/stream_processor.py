@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 from types import MethodType
 from typing import TYPE_CHECKING, Any, Optional
 
-from pyspark.sql import DataFrame
+from pydantic import StrictBool
 from typing_extensions import TypeAlias
 
 from feast.data_source import DataSource, PushMode
@@ -15,10 +15,14 @@ if TYPE_CHECKING:
 
 STREAM_PROCESSOR_CLASS_FOR_TYPE = {
     ("spark", "kafka"): "feast.infra.contrib.spark_kafka_processor.SparkKafkaProcessor",
+    (
+        "python",
+        "memory",
+    ): "feast.infra.contrib.python_stream_processor.PythonStreamProcessor",
 }
 
-# TODO: support more types other than just Spark.
-StreamTable: TypeAlias = DataFrame
+# The table a stream processor works on, e.g. a Spark DataFrame or an iterator of pandas DataFrames.
+StreamTable: TypeAlias = Any
 
 
 class ProcessorConfig(FeastConfigBaseModel):
@@ -26,6 +30,10 @@ class ProcessorConfig(FeastConfigBaseModel):
     mode: str
     # Ingestion source (kafka, kinesis, etc)
     source: str
+    # Whether Feast computes the aggregations of stream feature views itself, see StreamAggregator. Off by
+    # default, as transformations may already aggregate. The window state is only kept in memory: after a
+    # restart, windows only count the events received since, even if the stream resumes from a checkpoint.
+    native_aggregation: StrictBool = False
 
 
 class StreamProcessor(ABC):
@@ -97,10 +105,12 @@ def get_stream_processor_object(
     transformation, and then writes it to the online store. It will also preprocess the data
     if a preprocessor method is defined.
     """
-    if config.mode == "spark" and config.source == "kafka":
-        stream_processor = STREAM_PROCESSOR_CLASS_FOR_TYPE[("spark", "kafka")]
-        module_name, class_name = stream_processor.rsplit(".", 1)
-        cls = import_class(module_name, class_name, "StreamProcessor")
-        return cls(fs=fs, sfv=sfv, config=config, preprocess_fn=preprocess_fn)
-    else:
-        raise ValueError("other processors besides spark-kafka not supported")
+    stream_processor = STREAM_PROCESSOR_CLASS_FOR_TYPE.get((config.mode, config.source))
+    if stream_processor is None:
+        raise ValueError(
+            f"Stream processor with mode {config.mode} and source {config.source} is not supported, "
+            f"expected one of {list(STREAM_PROCESSOR_CLASS_FOR_TYPE)}"
+        )
+    module_name, class_name = stream_processor.rsplit(".", 1)
+    cls = import_class(module_name, class_name, "StreamProcessor")
+    return cls(fs=fs, sfv=sfv, config=config, preprocess_fn=preprocess_fn)
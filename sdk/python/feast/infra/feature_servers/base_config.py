@@ -23,6 +23,10 @@ class FeatureLoggingConfig(FeastConfigBaseModel):
     emit_timeout_micro_secs: StrictInt = 10000
     """Timeout for adding new log item to the queue."""
 
+    flush_max_rows: StrictInt = 100000
+    """Number of buffered log rows of a feature service that triggers a flush before
+    flush_interval_secs has passed. Only used by the Python feature server."""
+
 
 class BaseFeatureServerConfig(FeastConfigBaseModel):
     """Base Feature Server config that should be extended"""
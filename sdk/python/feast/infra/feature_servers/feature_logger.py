@@ -0,0 +1,215 @@
+import logging
+import queue
+import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+import pyarrow as pa
+from pytz import UTC
+
+from feast.feature_logging import (
+    LOG_DATE_FIELD,
+    LOG_TIMESTAMP_FIELD,
+    REQUEST_ID_FIELD,
+    FeatureServiceLoggingSource,
+)
+from feast.infra.feature_servers.base_config import FeatureLoggingConfig
+from feast.protos.feast.serving.ServingService_pb2 import GetOnlineFeaturesResponse
+from feast.type_map import feast_value_type_to_python_type
+
+if TYPE_CHECKING:
+    from feast.feature_service import FeatureService
+    from feast.feature_store import FeatureStore
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _LogRecord:
+    feature_service: "FeatureService"
+    entities: Dict[str, List[Any]]
+    response: GetOnlineFeaturesResponse
+    full_feature_names: bool
+    log_timestamp: datetime
+    request_id: str
+
+
+@dataclass
+class _Buffer:
+    feature_service: "FeatureService"
+    schema: pa.Schema
+    batches: List[pa.RecordBatch] = field(default_factory=list)
+    num_rows: int = 0
+
+
+# Queued by `FeatureLogger.stop` to make the background thread flush and exit
+_STOP: Any = object()
+
+
+class FeatureLogger:
+    """
+    Captures features served by the Python feature server for feature services with a logging config.
+
+    `log` only samples the request and queues references to it, so it adds next to nothing to the request path.
+    A background thread converts queued requests into Arrow record batches, buffers them per feature service,
+    and writes the buffer through `FeatureStore.write_logged_features` once it holds `flush_max_rows` rows
+    or `flush_interval_secs` have passed. Requests are dropped (and counted) if the queue stays full
+    for longer than `emit_timeout_micro_secs`.
+    """
+
+    def __init__(self, store: "FeatureStore", config: FeatureLoggingConfig):
+        self._store = store
+        self._config = config
+        self._queue: "queue.Queue[_LogRecord]" = queue.Queue(
+            maxsize=config.queue_capacity
+        )
+        # feature service name -> logs buffered for it
+        self._buffers: Dict[str, _Buffer] = {}
+        self._thread: Optional[threading.Thread] = None
+        self.dropped_records = 0
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="feast-feature-logger", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self):
+        """Stops the background thread after writing everything that was logged so far."""
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join()
+            self._thread = None
+
+    def log(
+        self,
+        feature_service: "FeatureService",
+        entities: Dict[str, List[Any]],
+        response: GetOnlineFeaturesResponse,
+        full_feature_names: bool = False,
+    ):
+        logging_config = feature_service.logging_config
+        if logging_config is None or random.random() >= logging_config.sample_rate:
+            return
+
+        record = _LogRecord(
+            feature_service=feature_service,
+            entities=entities,
+            response=response,
+            full_feature_names=full_feature_names,
+            log_timestamp=datetime.now(tz=UTC),
+            request_id=str(uuid.uuid4()),
+        )
+        try:
+            self._queue.put(
+                record, timeout=self._config.emit_timeout_micro_secs / 1_000_000
+            )
+        except queue.Full:
+            self.dropped_records += 1
+
+    def _run(self):
+        last_flush = time.monotonic()
+        while True:
+            timeout = last_flush + self._config.flush_interval_secs - time.monotonic()
+            try:
+                record = self._queue.get(timeout=max(0.0, timeout))
+            except queue.Empty:
+                record = None
+            else:
+                if record is _STOP:
+                    self._flush()
+                    return
+
+            if record is not None:
+                try:
+                    self._buffer(record)
+                except Exception:
+                    logger.exception(
+                        f"Failed to convert logs of feature service {record.feature_service.name}"
+                    )
+
+            if time.monotonic() - last_flush >= self._config.flush_interval_secs:
+                self._flush()
+                last_flush = time.monotonic()
+
+    def _buffer(self, record: _LogRecord):
+        name = record.feature_service.name
+        if name not in self._buffers:
+            schema = FeatureServiceLoggingSource(
+                record.feature_service, self._store.project
+            ).get_schema(self._store.registry)
+            self._buffers[name] = _Buffer(record.feature_service, schema)
+
+        buffer = self._buffers[name]
+        batch = _to_record_batch(record, buffer.schema)
+        buffer.batches.append(batch)
+        buffer.num_rows += batch.num_rows
+        if buffer.num_rows >= self._config.flush_max_rows:
+            self._flush(name)
+
+    def _flush(self, name: Optional[str] = None):
+        names = [name] if name is not None else list(self._buffers)
+        for name in names:
+            buffer = self._buffers.pop(name)
+            try:
+                self._store.write_logged_features(
+                    logs=pa.Table.from_batches(buffer.batches, schema=buffer.schema),
+                    source=buffer.feature_service,
+                )
+            except Exception:
+                logger.exception(f"Failed to write logs of feature service {name}")
+
+
+def _to_record_batch(record: _LogRecord, schema: pa.Schema) -> pa.RecordBatch:
+    response = record.response
+    vectors = dict(zip(response.metadata.feature_names.val, response.results))
+    num_rows = len(response.results[0].values) if response.results else 0
+
+    columns: Dict[str, pa.Array] = {}
+    for projection in record.feature_service.feature_view_projections:
+        for feature in projection.features:
+            full_name = f"{projection.name_to_use()}__{feature.name}"
+            vector = vectors.get(
+                full_name if record.full_feature_names else feature.name
+            )
+            if vector is None:
+                continue
+            columns[full_name] = pa.array(
+                [feast_value_type_to_python_type(v) for v in vector.values],
+                type=schema.field(full_name).type,
+            )
+            columns[f"{full_name}__timestamp"] = pa.array(
+                [ts.seconds for ts in vector.event_timestamps],
+                type=pa.int64(),
+            ).cast(schema.field(f"{full_name}__timestamp").type)
+            columns[f"{full_name}__status"] = pa.array(
+                list(vector.statuses), type=pa.int32()
+            )
+
+    columns[LOG_TIMESTAMP_FIELD] = pa.array(
+        [record.log_timestamp] * num_rows, type=schema.field(LOG_TIMESTAMP_FIELD).type
+    )
+    columns[LOG_DATE_FIELD] = pa.array(
+        [record.log_timestamp.date()] * num_rows, type=pa.date32()
+    )
+    columns[REQUEST_ID_FIELD] = pa.array(
+        [record.request_id] * num_rows, type=pa.string()
+    )
+
+    arrays = []
+    for schema_field in schema:
+        if schema_field.name in columns:
+            arrays.append(columns[schema_field.name])
+        elif schema_field.name in record.entities:
+            # Entity join keys and request data come from the request itself
+            arrays.append(
+                pa.array(record.entities[schema_field.name], type=schema_field.type)
+            )
+        else:
+            arrays.append(pa.nulls(num_rows, type=schema_field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
@@ -0,0 +1,123 @@
+import hashlib
+import json
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from feast.feature_view import FeatureView
+from feast.repo_config import RepoConfig
+
+
+def get_materialization_shards(
+    start_date: datetime, end_date: datetime, shard_interval: timedelta
+) -> List[Tuple[datetime, datetime]]:
+    """
+    Splits [start_date, end_date) into consecutive time ranges of at most `shard_interval`, in chronological order.
+    A zero interval returns the whole range as a single shard.
+    """
+    if not shard_interval or start_date >= end_date:
+        return [(start_date, end_date)]
+
+    shards = []
+    shard_start = start_date
+    while shard_start < end_date:
+        shard_end = min(shard_start + shard_interval, end_date)
+        shards.append((shard_start, shard_end))
+        shard_start = shard_end
+    return shards
+
+
+class MaterializationCheckpoints:
+    """
+    Records how far the sharded materialization of each feature view got, so that a failed materialization
+    resumes after the last shard it completed.
+
+    A checkpoint is kept per feature view and hash of its definition, with the start of the materialized range
+    and the end of the last completed shard. It applies to a later materialization of the same definition of
+    the feature view starting at or after the recorded start, such as a rerun of `materialize_incremental`,
+    whose start date moves forward with the clock when the feature view has a ttl. Checkpoints are stored as a
+    JSON file, and cleared once every shard of the range was materialized.
+    """
+
+    def __init__(self, config: RepoConfig):
+        path = Path(config.materialization.checkpoint_path)
+        if not path.is_absolute() and config.repo_path is not None:
+            path = config.repo_path / path
+        self._path = path
+        self._project = config.project
+
+    def get_completed_until(
+        self, feature_view: FeatureView, start_date: datetime
+    ) -> Optional[datetime]:
+        """
+        Returns the end of the last shard completed by a materialization of the feature view that started at or
+        before start_date.
+        """
+        checkpoint = self._read().get(self._key(feature_view))
+        if (
+            checkpoint is None
+            or datetime.fromisoformat(checkpoint["start_date"]) > start_date
+        ):
+            return None
+        return datetime.fromisoformat(checkpoint["completed_until"])
+
+    def set_completed_until(
+        self,
+        feature_view: FeatureView,
+        start_date: datetime,
+        completed_until: datetime,
+    ):
+        checkpoints = self._read()
+        key = self._key(feature_view)
+        checkpoint = checkpoints.get(key)
+        if checkpoint is not None and datetime.fromisoformat(
+            checkpoint["start_date"]
+        ) <= start_date <= datetime.fromisoformat(checkpoint["completed_until"]):
+            # The materialization resumed from this checkpoint, so the range is completed from its start
+            start_date = datetime.fromisoformat(checkpoint["start_date"])
+        self._clear(checkpoints, feature_view)
+        checkpoints[key] = {
+            "start_date": start_date.isoformat(),
+            "completed_until": completed_until.isoformat(),
+        }
+        self._write(checkpoints)
+
+    def clear(self, feature_view: FeatureView):
+        checkpoints = self._read()
+        if self._clear(checkpoints, feature_view):
+            self._write(checkpoints)
+
+    def _clear(
+        self, checkpoints: Dict[str, Dict[str, Any]], feature_view: FeatureView
+    ) -> bool:
+        """Removes the checkpoints of every definition of the feature view, returning whether there were any."""
+        prefix = f"{self._project}/{feature_view.name}/"
+        keys = [key for key in checkpoints if key.startswith(prefix)]
+        for key in keys:
+            del checkpoints[key]
+        return bool(keys)
+
+    def _key(self, feature_view: FeatureView) -> str:
+        return (
+            f"{self._project}/{feature_view.name}/{_feature_view_version(feature_view)}"
+        )
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        if not self._path.exists():
+            return {}
+        return json.loads(self._path.read_text())
+
+    def _write(self, checkpoints: Dict[str, Dict[str, Any]]):
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        # Written to a temporary file first, so that an interrupted write never loses the previous checkpoints
+        tmp_path = self._path.with_name(f"{self._path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(checkpoints))
+        os.replace(tmp_path, self._path)
+
+
+def _feature_view_version(feature_view: FeatureView) -> str:
+    # Shards materialized with another definition of the feature view must be materialized again
+    return hashlib.sha256(
+        feature_view.to_proto().spec.SerializeToString(deterministic=True)
+    ).hexdigest()
@@ -1,12 +1,17 @@
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Callable, List, Literal, Optional, Sequence, Union
+from typing import Dict, List, Literal, Optional, Sequence, Set, Tuple, Union
 
-from tqdm import tqdm
+import pyarrow as pa
+from pydantic import StrictInt
 
 from feast.batch_feature_view import BatchFeatureView
 from feast.entity import Entity
 from feast.feature_view import FeatureView
+from feast.infra.materialization.online_write_hashes import (
+    OnlineWriteHashes,
+    expires_keys,
+)
 from feast.infra.offline_stores.offline_store import OfflineStore
 from feast.infra.online_stores.online_store import OnlineStore
 from feast.infra.registry.base_registry import BaseRegistry
@@ -34,6 +39,11 @@ class LocalMaterializationEngineConfig(FeastConfigBaseModel):
     type: Literal["local"] = "local"
     """ Type selector"""
 
+    max_concurrent_tasks: StrictInt = 1
+    """ Number of tasks whose offline data is read at the same time. Tasks are still written to the online
+    store one at a time, in the order they were submitted. Only raise it for offline stores that serve
+    concurrent reads, such as the warehouse-backed ones; the file offline store does not. """
+
 
 @dataclass
 class LocalMaterializationJob(MaterializationJob):
@@ -77,8 +87,9 @@ class LocalMaterializationEngine(BatchMaterializationEngine):
         entities_to_delete: Sequence[Entity],
         entities_to_keep: Sequence[Entity],
     ):
-        # Nothing to set up.
-        pass
+        # Rows of recreated feature views have to be written again
+        with OnlineWriteHashes(self.repo_config) as online_write_hashes:
+            online_write_hashes.clear(views_to_delete)
 
     def teardown_infra(
         self,
@@ -86,8 +97,8 @@ class LocalMaterializationEngine(BatchMaterializationEngine):
         fvs: Sequence[Union[BatchFeatureView, StreamFeatureView, FeatureView]],
         entities: Sequence[Entity],
     ):
-        # Nothing to tear down.
-        pass
+        with OnlineWriteHashes(self.repo_config) as online_write_hashes:
+            online_write_hashes.clear(fvs)
 
     def __init__(
         self,
@@ -107,75 +118,120 @@ class LocalMaterializationEngine(BatchMaterializationEngine):
     def materialize(
         self, registry, tasks: List[MaterializationTask]
     ) -> List[MaterializationJob]:
-        return [
-            self._materialize_one(
-                registry,
-                task.feature_view,
-                task.start_time,
-                task.end_time,
-                task.project,
-                task.tqdm_builder,
-            )
-            for task in tasks
-        ]
+        online_write_hashes = None
+        if self.repo_config.materialization.online_write_diff:
+            if expires_keys(self.repo_config):
+                # Rows that expired would never be written again while their values stay the same
+                raise ValueError(
+                    "materialization.online_write_diff can't be used with an online store that expires keys"
+                )
+            online_write_hashes = OnlineWriteHashes(self.repo_config)
+        try:
+            return self._materialize_all(registry, tasks, online_write_hashes)
+        finally:
+            if online_write_hashes is not None:
+                online_write_hashes.close()
 
-    def _materialize_one(
+    def _materialize_all(
         self,
         registry: BaseRegistry,
-        feature_view: Union[BatchFeatureView, StreamFeatureView, FeatureView],
-        start_date: datetime,
-        end_date: datetime,
-        project: str,
-        tqdm_builder: Callable[[int], tqdm],
-    ):
-        entities = []
-        for entity_name in feature_view.entities:
-            entities.append(registry.get_entity(entity_name, project))
+        tasks: List[MaterializationTask],
+        online_write_hashes: Optional[OnlineWriteHashes],
+    ) -> List[MaterializationJob]:
+        max_concurrent_tasks = self.repo_config.batch_engine.max_concurrent_tasks
+        # Once a task of a feature view failed, its later tasks are cancelled: the time shards of a feature view
+        # are only materialized in order, so that a rerun can resume after the last one that succeeded.
+        failed_feature_views: Set[Tuple[str, str]] = set()
+        jobs: List[MaterializationJob] = []
+        if len(tasks) == 1 or max_concurrent_tasks == 1:
+            for task in tasks:
+                if _feature_view_key(task) in failed_feature_views:
+                    jobs.append(_cancelled_job(task))
+                    continue
+                job = self._materialize_one(registry, task, online_write_hashes)
+                if job.status() == MaterializationJobStatus.ERROR:
+                    failed_feature_views.add(_feature_view_key(task))
+                jobs.append(job)
+            return jobs
 
-        (
-            join_key_columns,
-            feature_name_columns,
-            timestamp_field,
-            created_timestamp_column,
-        ) = _get_column_names(feature_view, entities)
+        # The offline data of the next tasks is read while a task is written, but writes follow the order of
+        # the tasks, so that the time shards of a feature view never overwrite newer rows with older ones.
+        with ThreadPoolExecutor(max_workers=max_concurrent_tasks) as executor:
+            reads: Dict[int, Future] = {}
+            next_read = 0
+            for i, task in enumerate(tasks):
+                # Reading at most max_concurrent_tasks tasks ahead bounds the data held in memory
+                while len(reads) < max_concurrent_tasks and next_read < len(tasks):
+                    if _feature_view_key(tasks[next_read]) not in failed_feature_views:
+                        reads[next_read] = executor.submit(
+                            self._read_one, registry, tasks[next_read]
+                        )
+                    next_read += 1
+                if _feature_view_key(task) in failed_feature_views:
+                    jobs.append(_cancelled_job(task))
+                    continue
+                job = self._materialize_one(
+                    registry, task, online_write_hashes, reads.pop(i)
+                )
+                if job.status() == MaterializationJobStatus.ERROR:
+                    failed_feature_views.add(_feature_view_key(task))
+                    for j in [
+                        j
+                        for j in reads
+                        if _feature_view_key(tasks[j]) == _feature_view_key(task)
+                    ]:
+                        reads.pop(j).cancel()
+                jobs.append(job)
+        return jobs
 
-        job_id = f"{feature_view.name}-{start_date}-{end_date}"
+    def _materialize_one(
+        self,
+        registry: BaseRegistry,
+        task: MaterializationTask,
+        online_write_hashes: Optional[OnlineWriteHashes] = None,
+        read: Optional[Future] = None,
+    ):
+        feature_view = task.feature_view
+        job_id = _job_id(task)
 
         try:
-            offline_job = self.offline_store.pull_latest_from_table_or_query(
-                config=self.repo_config,
-                data_source=feature_view.batch_source,
-                join_key_columns=join_key_columns,
-                feature_name_columns=feature_name_columns,
-                timestamp_field=timestamp_field,
-                created_timestamp_column=created_timestamp_column,
-                start_date=start_date,
-                end_date=end_date,
-            )
-
-            table = offline_job.to_arrow()
-
-            if feature_view.batch_source.field_mapping is not None:
-                table = _run_pyarrow_field_mapping(
-                    table, feature_view.batch_source.field_mapping
-                )
+            if read is None:
+                table = self._read_one(registry, task)
+            else:
+                table = read.result()
 
             join_key_to_value_type = {
                 entity.name: entity.dtype.to_value_type()
                 for entity in feature_view.entity_columns
             }
 
-            with tqdm_builder(table.num_rows) as pbar:
+            with task.tqdm_builder(table.num_rows) as pbar:
                 for batch in table.to_batches(DEFAULT_BATCH_SIZE):
                     rows_to_write = _convert_arrow_to_proto(
                         batch, feature_view, join_key_to_value_type
                     )
-                    self.online_store.online_write_batch(
-                        self.repo_config,
-                        feature_view,
-                        rows_to_write,
-                        lambda x: pbar.update(x),
+                    if online_write_hashes is None:
+                        self.online_store.online_write_batch(
+                            self.repo_config,
+                            feature_view,
+                            rows_to_write,
+                            lambda x: pbar.update(x),
+                        )
+                        continue
+
+                    changed_rows, value_hashes = online_write_hashes.get_changed_rows(
+                        feature_view, rows_to_write
                     )
+                    pbar.update(len(rows_to_write) - len(changed_rows))
+                    if changed_rows:
+                        self.online_store.online_write_batch(
+                            self.repo_config,
+                            feature_view,
+                            changed_rows,
+                            lambda x: pbar.update(x),
+                        )
+                        # Only recorded once written, so that failed writes are retried
+                        online_write_hashes.set_value_hashes(feature_view, value_hashes)
             return LocalMaterializationJob(
                 job_id=job_id, status=MaterializationJobStatus.SUCCEEDED
             )
@@ -183,3 +239,49 @@ class LocalMaterializationEngine(BatchMaterializationEngine):
             return LocalMaterializationJob(
                 job_id=job_id, status=MaterializationJobStatus.ERROR, error=e
             )
+
+    def _read_one(self, registry: BaseRegistry, task: MaterializationTask) -> pa.Table:
+        feature_view = task.feature_view
+        entities = []
+        for entity_name in feature_view.entities:
+            entities.append(registry.get_entity(entity_name, task.project))
+
+        (
+            join_key_columns,
+            feature_name_columns,
+            timestamp_field,
+            created_timestamp_column,
+        ) = _get_column_names(feature_view, entities)
+
+        offline_job = self.offline_store.pull_latest_from_table_or_query(
+            config=self.repo_config,
+            data_source=feature_view.batch_source,
+            join_key_columns=join_key_columns,
+            feature_name_columns=feature_name_columns,
+            timestamp_field=timestamp_field,
+            created_timestamp_column=created_timestamp_column,
+            start_date=task.start_time,
+            end_date=task.end_time,
+        )
+
+        table = offline_job.to_arrow()
+
+        if feature_view.batch_source.field_mapping is not None:
+            table = _run_pyarrow_field_mapping(
+                table, feature_view.batch_source.field_mapping
+            )
+        return table
+
+
+def _job_id(task: MaterializationTask) -> str:
+    return f"{task.feature_view.name}-{task.start_time}-{task.end_time}"
+
+
+def _feature_view_key(task: MaterializationTask) -> Tuple[str, str]:
+    return task.project, task.feature_view.name
+
+
+def _cancelled_job(task: MaterializationTask) -> LocalMaterializationJob:
+    return LocalMaterializationJob(
+        job_id=_job_id(task), status=MaterializationJobStatus.CANCELLED
+    )
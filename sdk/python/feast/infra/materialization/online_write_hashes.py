@@ -0,0 +1,149 @@
+import hashlib
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from feast.feature_view import FeatureView
+from feast.infra.key_encoding_utils import serialize_entity_key
+from feast.infra.materialization.checkpoints import _feature_view_version
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.repo_config import RepoConfig
+
+OnlineRow = Tuple[EntityKeyProto, Dict[str, ValueProto], datetime, Optional[datetime]]
+
+# Stays below the default limit on the number of parameters of a SQLite statement
+_MAX_QUERY_PARAMETERS = 500
+
+
+class OnlineWriteHashes:
+    """
+    Keeps a hash of the feature values last written to the online store for each entity of a feature view, so
+    that materialization only writes the rows whose values changed.
+
+    The hashes are stored in a local SQLite file, per online store configuration, so that the rows are written
+    in full to an online store they were not written to yet. They also cover the definition of the feature
+    view, so that every row is written again after it changed, and are dropped along with the feature view.
+    They can't tell whether the online store still holds a row, so they must not be used with online stores
+    that expire keys.
+    """
+
+    def __init__(self, config: RepoConfig):
+        path = Path(config.materialization.online_write_hashes_path)
+        if not path.is_absolute() and config.repo_path is not None:
+            path = config.repo_path / path
+        self._path = path
+        self._project = config.project
+        self._online_store = _online_store_id(config)
+        self._entity_key_serialization_version = config.entity_key_serialization_version
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def __enter__(self) -> "OnlineWriteHashes":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def get_changed_rows(
+        self, feature_view: FeatureView, rows: List[OnlineRow]
+    ) -> Tuple[List[OnlineRow], List[Tuple[bytes, bytes]]]:
+        """
+        Returns the rows whose values differ from the ones last written for their entity, together with the
+        hashes to record with `set_value_hashes` once they were written.
+        """
+        version = _feature_view_version(feature_view).encode()
+        keys: List[bytes] = []
+        value_hashes: List[bytes] = []
+        for entity_key, values, _, _ in rows:
+            keys.append(
+                serialize_entity_key(entity_key, self._entity_key_serialization_version)
+            )
+            hasher = hashlib.blake2b(version, digest_size=16)
+            for name in sorted(values):
+                hasher.update(name.encode())
+                hasher.update(values[name].SerializeToString(deterministic=True))
+            value_hashes.append(hasher.digest())
+
+        written = self._get_value_hashes(feature_view, keys)
+        changed_rows = []
+        changed_hashes = []
+        for row, key, value_hash in zip(rows, keys, value_hashes):
+            if written.get(key) != value_hash:
+                changed_rows.append(row)
+                changed_hashes.append((key, value_hash))
+        return changed_rows, changed_hashes
+
+    def set_value_hashes(
+        self, feature_view: FeatureView, value_hashes: List[Tuple[bytes, bytes]]
+    ):
+        conn = self._get_conn()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO online_write_hashes (online_store, feature_view, entity_key, value_hash) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (self._online_store, self._key(feature_view), key, value_hash)
+                    for key, value_hash in value_hashes
+                ],
+            )
+
+    def clear(self, feature_views: Sequence[FeatureView]):
+        """Drops the hashes of the feature views, for every online store they were written to."""
+        if not feature_views or not self._path.exists():
+            return
+        conn = self._get_conn()
+        with conn:
+            conn.executemany(
+                "DELETE FROM online_write_hashes WHERE feature_view = ?",
+                [(self._key(feature_view),) for feature_view in feature_views],
+            )
+
+    def _get_value_hashes(
+        self, feature_view: FeatureView, keys: List[bytes]
+    ) -> Dict[bytes, bytes]:
+        conn = self._get_conn()
+        value_hashes: Dict[bytes, bytes] = {}
+        for i in range(0, len(keys), _MAX_QUERY_PARAMETERS):
+            chunk = keys[i : i + _MAX_QUERY_PARAMETERS]
+            cursor = conn.execute(
+                "SELECT entity_key, value_hash FROM online_write_hashes "
+                "WHERE online_store = ? AND feature_view = ? "
+                f"AND entity_key IN ({', '.join('?' * len(chunk))})",
+                [self._online_store, self._key(feature_view), *chunk],
+            )
+            value_hashes.update(cursor.fetchall())
+        return value_hashes
+
+    def _key(self, feature_view: FeatureView) -> str:
+        return f"{self._project}/{feature_view.name}"
+
+    def _get_conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self._path)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS online_write_hashes (online_store TEXT, feature_view TEXT, "
+                "entity_key BLOB, value_hash BLOB, PRIMARY KEY (online_store, feature_view, entity_key))"
+            )
+        return self._conn
+
+
+def expires_keys(config: RepoConfig) -> bool:
+    """Returns whether the online store drops rows on its own after some time, e.g. with a Redis key ttl."""
+    return bool(getattr(config.online_store, "key_ttl_seconds", None))
+
+
+def _online_store_id(config: RepoConfig) -> str:
+    # Covers the type of the online store and where it is, e.g. its path or connection string, which may hold
+    # credentials and is therefore hashed
+    online_store_config = json.dumps(
+        config.online_store.model_dump(), sort_keys=True, default=str
+    )
+    return hashlib.sha256(online_store_config.encode()).hexdigest()
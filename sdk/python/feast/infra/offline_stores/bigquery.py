@@ -175,6 +175,35 @@ class BigQueryOfflineStore(OfflineStore):
             full_feature_names=False,
         )
 
+    @staticmethod
+    def get_event_timestamp_range(
+        config: RepoConfig,
+        data_source: DataSource,
+        timestamp_field: str,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> Optional[Tuple[datetime, datetime]]:
+        assert isinstance(config.offline_store, BigQueryOfflineStoreConfig)
+        assert isinstance(data_source, BigQuerySource)
+        from_expression = data_source.get_table_query_string()
+        project_id = (
+            config.offline_store.billing_project_id or config.offline_store.project_id
+        )
+        client = _get_bigquery_client(
+            project=project_id,
+            location=config.offline_store.location,
+        )
+        # Same time range as pull_latest_from_table_or_query, so that partitioned tables only scan those partitions
+        query = f"""
+            SELECT MIN({timestamp_field}) AS min_timestamp, MAX({timestamp_field}) AS max_timestamp
+            FROM {from_expression}
+            WHERE {timestamp_field} BETWEEN TIMESTAMP('{start_date}') AND TIMESTAMP('{end_date}')
+            """
+        row = next(iter(client.query(query).result()))
+        if row.min_timestamp is None:
+            return None
+        return row.min_timestamp, row.max_timestamp
+
     @staticmethod
     def pull_all_from_table_or_query(
         config: RepoConfig,
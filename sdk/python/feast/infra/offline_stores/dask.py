@@ -8,10 +8,13 @@ import dask
 import dask.dataframe as dd
 import pandas as pd
 import pyarrow
+import pyarrow.compute
 import pyarrow.dataset
 import pyarrow.parquet
 import pytz
+from pydantic import StrictBool
 
+from feast.data_format import ParquetFormat
 from feast.data_source import DataSource
 from feast.errors import (
     FeastJoinKeysDuringMaterialization,
@@ -31,7 +34,9 @@ from feast.infra.offline_stores.offline_store import (
 )
 from feast.infra.offline_stores.offline_utils import (
     DEFAULT_ENTITY_DF_EVENT_TIMESTAMP_COL,
+    get_parquet_dataset_root,
     get_pyarrow_schema_from_batch_source,
+    write_parquet_dataset_part,
 )
 from feast.infra.registry.base_registry import BaseRegistry
 from feast.on_demand_feature_view import OnDemandFeatureView
@@ -51,6 +56,9 @@ class DaskOfflineStoreConfig(FeastConfigBaseModel):
     type: Union[Literal["dask"], Literal["file"]] = "dask"
     """ Offline store type selector"""
 
+    offline_write_partition_by_event_date: StrictBool = False
+    """ If True, offline_write_batch on directory sources writes one subdirectory per event date. """
+
 
 class DaskRetrievalJob(RetrievalJob):
     def __init__(
@@ -402,6 +410,51 @@ class DaskOfflineStore(OfflineStore):
             end_date=end_date,
         )
 
+    @staticmethod
+    def get_event_timestamp_range(
+        config: RepoConfig,
+        data_source: DataSource,
+        timestamp_field: str,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> Optional[Tuple[datetime, datetime]]:
+        assert isinstance(config.offline_store, DaskOfflineStoreConfig)
+        assert isinstance(data_source, FileSource)
+        if data_source.file_format is not None and not isinstance(
+            data_source.file_format, ParquetFormat
+        ):
+            raise NotImplementedError
+
+        filesystem, path = FileSource.create_filesystem_and_path(
+            data_source.path, data_source.file_options.s3_endpoint_override
+        )
+        dataset = pyarrow.dataset.dataset(
+            path, filesystem=filesystem, format="parquet", partitioning="hive"
+        )
+        timestamp_type = dataset.schema.field(timestamp_field).type
+        if not pyarrow.types.is_timestamp(timestamp_type):
+            raise NotImplementedError
+
+        if timestamp_type.tz is None:
+            # Naive timestamps are in UTC, as in _normalize_timestamp
+            start_date = start_date.astimezone(pytz.utc).replace(tzinfo=None)
+            end_date = end_date.astimezone(pytz.utc).replace(tzinfo=None)
+        timestamp_column = pyarrow.dataset.field(timestamp_field)
+        # Only the timestamp column is read, and row groups whose statistics are outside of the range are skipped
+        timestamps = dataset.to_table(
+            columns=[timestamp_field],
+            filter=(timestamp_column >= start_date) & (timestamp_column < end_date),
+        ).column(timestamp_field)
+        if timestamps.null_count == len(timestamps):
+            return None
+
+        min_max = pyarrow.compute.min_max(timestamps)
+        min_timestamp, max_timestamp = min_max["min"].as_py(), min_max["max"].as_py()
+        if timestamp_type.tz is None:
+            min_timestamp = pytz.utc.localize(min_timestamp)
+            max_timestamp = pytz.utc.localize(max_timestamp)
+        return min_timestamp, max_timestamp
+
     @staticmethod
     def write_logged_features(
         config: RepoConfig,
@@ -457,6 +510,19 @@ class DaskOfflineStore(OfflineStore):
         filesystem, path = FileSource.create_filesystem_and_path(
             file_options.uri, file_options.s3_endpoint_override
         )
+        dataset_root = get_parquet_dataset_root(path, filesystem)
+        if dataset_root is not None:
+            # Directory sources are appended to with new part files, without reading existing data
+            write_parquet_dataset_part(
+                table,
+                dataset_root,
+                filesystem,
+                partition_by_event_date=feature_view.batch_source.timestamp_field
+                if config.offline_store.offline_write_partition_by_event_date
+                else None,
+            )
+            return
+
         prev_table = pyarrow.parquet.read_table(
             path, filesystem=filesystem, memory_map=True
         )
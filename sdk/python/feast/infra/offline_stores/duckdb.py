@@ -1,3 +1,4 @@
+import functools
 import os
 from datetime import datetime
 from pathlib import Path
@@ -7,7 +8,7 @@ import ibis
 import pandas as pd
 import pyarrow
 from ibis.expr.types import Table
-from pydantic import StrictStr
+from pydantic import StrictBool, StrictStr
 
 from feast.data_format import DeltaFormat, ParquetFormat
 from feast.data_source import DataSource
@@ -23,6 +24,10 @@ from feast.infra.offline_stores.ibis import (
     write_logged_features_ibis,
 )
 from feast.infra.offline_stores.offline_store import OfflineStore, RetrievalJob
+from feast.infra.offline_stores.offline_utils import (
+    get_parquet_dataset_root,
+    write_parquet_dataset_part,
+)
 from feast.infra.registry.base_registry import BaseRegistry
 from feast.repo_config import FeastConfigBaseModel, RepoConfig
 
@@ -45,6 +50,7 @@ def _write_data_source(
     data_source: DataSource,
     mode: str = "append",
     allow_overwrite: bool = False,
+    partition_by_event_date: bool = False,
 ):
     assert isinstance(data_source, FileSource)
 
@@ -70,6 +76,23 @@ def _write_data_source(
                 )
         elif mode == "append":
             table = table.to_pyarrow()
+            filesystem, path = FileSource.create_filesystem_and_path(
+                file_options.uri,
+                file_options.s3_endpoint_override,
+            )
+            dataset_root = get_parquet_dataset_root(path, filesystem)
+            if dataset_root is not None:
+                # Directory (or glob) sources are appended to with new part files, without reading existing data
+                write_parquet_dataset_part(
+                    table,
+                    dataset_root,
+                    filesystem,
+                    partition_by_event_date=data_source.timestamp_field
+                    if partition_by_event_date
+                    else None,
+                )
+                return
+
             prev_table = ibis.read_parquet(file_options.uri).to_pyarrow()
             if table.schema != prev_table.schema:
                 table = table.cast(prev_table.schema)
@@ -110,6 +133,9 @@ class DuckDBOfflineStoreConfig(FeastConfigBaseModel):
 
     staging_location_endpoint_override: Optional[str] = None
 
+    offline_write_partition_by_event_date: StrictBool = False
+    """ If True, offline_write_batch on directory sources writes one subdirectory per event date. """
+
 
 class DuckDBOfflineStore(OfflineStore):
     @staticmethod
@@ -198,7 +224,10 @@ class DuckDBOfflineStore(OfflineStore):
             feature_view=feature_view,
             table=table,
             progress=progress,
-            data_source_writer=_write_data_source,
+            data_source_writer=functools.partial(
+                _write_data_source,
+                partition_by_event_date=config.offline_store.offline_write_partition_by_event_date,
+            ),
         )
 
     @staticmethod
@@ -160,6 +160,13 @@ class FileSource(DataSource):
 
         # TODO why None check necessary
         if self.file_format is None or isinstance(self.file_format, ParquetFormat):
+            if any(char in path for char in "*?["):
+                from feast.infra.offline_stores.offline_utils import (
+                    get_parquet_dataset_root,
+                )
+
+                # Globs (e.g. `data/driver_stats/**/*.parquet`, as read by DuckDB) are read from their directory
+                path = get_parquet_dataset_root(path, filesystem) or path
             if filesystem is None:
                 kwargs = (
                     {"use_legacy_dataset": False}
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 import ibis
 import ibis.selectors as s
@@ -465,6 +465,17 @@ class IbisRetrievalJob(RetrievalJob):
     def _to_arrow_internal(self, timeout: Optional[int] = None) -> pyarrow.Table:
         return self.table.to_pyarrow()
 
+    def _to_arrow_batches_internal(
+        self, timeout: Optional[int] = None
+    ) -> Iterator[pyarrow.RecordBatch]:
+        reader = self.table.to_pyarrow_batches()
+        empty = True
+        for batch in reader:
+            empty = False
+            yield batch
+        if empty:
+            yield pyarrow.RecordBatch.from_pylist([], schema=reader.schema)
+
     @property
     def full_feature_names(self) -> bool:
         return self._full_feature_names
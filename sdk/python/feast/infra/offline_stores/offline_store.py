@@ -15,7 +15,16 @@ import warnings
 from abc import ABC
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, List, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import pandas as pd
 import pyarrow
@@ -98,18 +107,7 @@ class RetrievalJob(ABC):
             timeout (optional): The query timeout if applicable.
         """
         features_table = self._to_arrow_internal(timeout=timeout)
-        if self.on_demand_feature_views:
-            for odfv in self.on_demand_feature_views:
-                transformed_arrow = odfv.transform_arrow(
-                    features_table, self.full_feature_names
-                )
-
-                for col in transformed_arrow.column_names:
-                    if col.startswith("__index"):
-                        continue
-                    features_table = features_table.append_column(
-                        col, transformed_arrow[col]
-                    )
+        features_table = self._apply_on_demand_transformations(features_table)
 
         if validation_reference:
             if not flags_helper.is_test():
@@ -128,6 +126,43 @@ class RetrievalJob(ABC):
 
         return features_table
 
+    def to_arrow_batches(
+        self, timeout: Optional[int] = None
+    ) -> Iterator[pyarrow.RecordBatch]:
+        """
+        Synchronously executes the underlying query and yields the result as a stream of arrow record batches.
+
+        On demand transformations are executed batch by batch, so callers never need to hold the
+        whole result in memory. Dataset validation requires the full result and is therefore only
+        available through `to_arrow` and `to_df`. At least one (possibly empty) batch is always
+        yielded, so consumers can rely on the first batch to learn the schema.
+
+        Args:
+            timeout (optional): The query timeout if applicable.
+        """
+        for batch in self._to_arrow_batches_internal(timeout=timeout):
+            table = self._apply_on_demand_transformations(
+                pyarrow.Table.from_batches([batch])
+            )
+            yield from _table_to_batches(table)
+
+    def _apply_on_demand_transformations(
+        self, features_table: pyarrow.Table
+    ) -> pyarrow.Table:
+        if self.on_demand_feature_views:
+            for odfv in self.on_demand_feature_views:
+                transformed_arrow = odfv.transform_arrow(
+                    features_table, self.full_feature_names
+                )
+
+                for col in transformed_arrow.column_names:
+                    if col.startswith("__index"):
+                        continue
+                    features_table = features_table.append_column(
+                        col, transformed_arrow[col]
+                    )
+        return features_table
+
     def to_sql(self) -> str:
         """
         Return RetrievalJob generated SQL statement if applicable.
@@ -156,6 +191,22 @@ class RetrievalJob(ABC):
         """
         raise NotImplementedError
 
+    def _to_arrow_batches_internal(
+        self, timeout: Optional[int] = None
+    ) -> Iterator[pyarrow.RecordBatch]:
+        """
+        Synchronously executes the underlying query and yields the result as arrow record batches.
+
+        timeout: RetreivalJob implementations may implement a timeout.
+
+        The default implementation materializes the full result through `_to_arrow_internal`;
+        offline stores whose engines can stream results should override it. Implementations must
+        yield at least one batch, even if it is empty.
+
+        Does not handle on demand transformations. For those, `to_arrow_batches` should be used.
+        """
+        yield from _table_to_batches(self._to_arrow_internal(timeout=timeout))
+
     @property
     def full_feature_names(self) -> bool:
         """Returns True if full feature names should be applied to the results of the query."""
@@ -205,6 +256,13 @@ class RetrievalJob(ABC):
         raise NotImplementedError
 
 
+def _table_to_batches(table: pyarrow.Table) -> List[pyarrow.RecordBatch]:
+    # Empty tables have no batches at all; keep one empty batch around so that the schema survives.
+    return table.to_batches() or [
+        pyarrow.RecordBatch.from_pylist([], schema=table.schema)
+    ]
+
+
 class OfflineStore(ABC):
     """
     An offline store defines the interface that Feast uses to interact with the storage and compute system that
@@ -309,6 +367,34 @@ class OfflineStore(ABC):
         """
         raise NotImplementedError
 
+    @staticmethod
+    def get_event_timestamp_range(
+        config: RepoConfig,
+        data_source: DataSource,
+        timestamp_field: str,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> Optional[Tuple[datetime, datetime]]:
+        """
+        Returns the earliest and latest event timestamps of the rows of the specified data source that lie
+        within the specified time range, or None if there are no such rows.
+
+        This is used to skip or narrow materialization, so implementations should only answer it if they can do
+        so much more cheaply than pulling the rows, e.g. from file metadata or a single aggregation query.
+
+        Args:
+            config: The config for the current feature store.
+            data_source: The data source whose rows will be checked.
+            timestamp_field: The timestamp column.
+            start_date: The start of the time range.
+            end_date: The end of the time range.
+
+        Raises:
+            NotImplementedError: The offline store cannot cheaply check the data source, which then has
+                to be materialized over the whole time range.
+        """
+        raise NotImplementedError
+
     @staticmethod
     def write_logged_features(
         config: RepoConfig,
@@ -6,6 +6,10 @@ from typing import Any, Dict, KeysView, List, Optional, Set, Tuple
 import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute
+import pyarrow.dataset
+import pyarrow.fs
+import pyarrow.parquet
 from jinja2 import BaseLoader, Environment
 from pandas import Timestamp
 
@@ -252,3 +256,129 @@ def get_pyarrow_schema_from_batch_source(
         column_names.append(column_name)
 
     return pa.schema(pa_schema), column_names
+
+
+def get_parquet_dataset_root(
+    path: str, filesystem: Optional[pa.fs.FileSystem] = None
+) -> Optional[str]:
+    """
+    Returns the directory holding a parquet dataset, or None if the path points to a single parquet file.
+
+    Glob suffixes (e.g. `data/driver_stats/**/*.parquet`, as used by DuckDB) are stripped, and a bare glob
+    (e.g. `*.parquet`) is a dataset in the current directory. Other paths are looked up on the filesystem
+    (the local filesystem if None); paths that do not exist yet are datasets unless they end with `.parquet`.
+    """
+    parts = path.rstrip("/").split("/")
+    for index, part in enumerate(parts):
+        if any(char in part for char in "*?["):
+            if index == 0:
+                return "."
+            return "/".join(parts[:index]) or "/"
+
+    filesystem = filesystem or pa.fs.LocalFileSystem()
+    file_type = filesystem.get_file_info(path.rstrip("/")).type
+    if file_type == pa.fs.FileType.Directory:
+        return path.rstrip("/")
+    if file_type == pa.fs.FileType.File or path.endswith(".parquet"):
+        return None
+    return path.rstrip("/")
+
+
+def write_parquet_dataset_part(
+    table: pa.Table,
+    root: str,
+    filesystem: Optional[pa.fs.FileSystem] = None,
+    partition_by_event_date: Optional[str] = None,
+):
+    """
+    Appends a table to a parquet dataset by writing new part files, without reading existing data.
+
+    Args:
+        table: The rows to append.
+        root: The directory of the dataset.
+        filesystem: The filesystem of the dataset, the local filesystem if None.
+        partition_by_event_date (optional): Name of a timestamp column. If set, rows are written to one
+            `YYYY-MM-DD` subdirectory per (UTC) event date. Plain directory names are used rather than hive
+            `key=value` names, so that readers do not add a partition column to the source schema.
+    """
+    filesystem = filesystem or pa.fs.LocalFileSystem()
+    if filesystem.get_file_info(root).type == pa.fs.FileType.Directory:
+        # Only the metadata of the dataset is read, to keep new parts consistent with existing ones
+        existing_schema = pyarrow.dataset.dataset(
+            root, filesystem=filesystem, format="parquet"
+        ).schema
+        if existing_schema.names and table.schema != existing_schema:
+            table = table.cast(existing_schema)
+
+    part_name = f"part-{uuid.uuid4().hex}.parquet"
+    if partition_by_event_date is None:
+        filesystem.create_dir(root, recursive=True)
+        pa.parquet.write_table(table, f"{root}/{part_name}", filesystem=filesystem)
+        return
+
+    timestamps = table[partition_by_event_date]
+    if pa.types.is_timestamp(timestamps.type) and timestamps.type.tz is not None:
+        timestamps = pa.compute.cast(timestamps, pa.timestamp(timestamps.type.unit))
+    dates = pa.compute.strftime(timestamps, format="%Y-%m-%d")
+    for date in pa.compute.unique(dates).to_pylist():
+        mask = (
+            pa.compute.is_null(dates) if date is None else pa.compute.equal(dates, date)
+        )
+        directory = f"{root}/{date or '__null__'}"
+        filesystem.create_dir(directory, recursive=True)
+        pa.parquet.write_table(
+            table.filter(pa.compute.fill_null(mask, False)),
+            f"{directory}/{part_name}",
+            filesystem=filesystem,
+        )
+
+
+def compact_parquet_dataset(
+    root: str,
+    filesystem: Optional[pa.fs.FileSystem] = None,
+    max_rows_per_file: int = 10_000_000,
+) -> int:
+    """
+    Merges the part files of each directory of a parquet dataset into as few files as possible.
+
+    Meant to be run periodically (e.g. from a cron job or a background thread) on datasets that are
+    appended to with `write_parquet_dataset_part`. New files are written under a hidden name and renamed
+    before the merged files are deleted, so readers may briefly see duplicated rows but never miss any.
+
+    Args:
+        root: The directory of the dataset.
+        filesystem: The filesystem of the dataset, the local filesystem if None.
+        max_rows_per_file: Directories are compacted into files of at most this many rows.
+
+    Returns:
+        The number of files that were merged away.
+    """
+    filesystem = filesystem or pa.fs.LocalFileSystem()
+    files_by_directory: Dict[str, List[pa.fs.FileInfo]] = {}
+    for info in filesystem.get_file_info(pa.fs.FileSelector(root, recursive=True)):
+        if info.type == pa.fs.FileType.File and info.base_name.endswith(".parquet"):
+            if not info.base_name.startswith((".", "_")):
+                directory = info.path[: -len(info.base_name) - 1]
+                files_by_directory.setdefault(directory, []).append(info)
+
+    merged = 0
+    for directory, infos in files_by_directory.items():
+        if len(infos) < 2:
+            continue
+        paths = [info.path for info in infos]
+        table = pa.parquet.ParquetDataset(
+            paths, filesystem=filesystem, partitioning=None
+        ).read()
+        for offset in range(0, max(table.num_rows, 1), max_rows_per_file):
+            part_name = f"part-{uuid.uuid4().hex}.parquet"
+            hidden_path = f"{directory}/.{part_name}"
+            pa.parquet.write_table(
+                table.slice(offset, max_rows_per_file),
+                hidden_path,
+                filesystem=filesystem,
+            )
+            filesystem.move(hidden_path, f"{directory}/{part_name}")
+        for path in paths:
+            filesystem.delete_file(path)
+        merged += len(paths)
+    return merged
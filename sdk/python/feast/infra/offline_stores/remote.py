@@ -1,9 +1,20 @@
 import json
 import logging
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import numpy as np
 import pandas as pd
@@ -41,6 +52,9 @@ class RemoteOfflineStoreConfig(FeastConfigBaseModel):
     port: Optional[StrictInt] = None
     """ str: remote offline store server port."""
 
+    max_concurrent_streams: StrictInt = 4
+    """ int: maximum number of result partitions (Flight endpoints) fetched concurrently. """
+
 
 class RemoteRetrievalJob(RetrievalJob):
     def __init__(
@@ -51,6 +65,7 @@ class RemoteRetrievalJob(RetrievalJob):
         entity_df: Union[pd.DataFrame, str] = None,
         table: pa.Table = None,
         metadata: Optional[RetrievalMetadata] = None,
+        max_concurrent_streams: int = 1,
     ):
         # Initialize the client connection
         self.client = client
@@ -59,6 +74,7 @@ class RemoteRetrievalJob(RetrievalJob):
         self.entity_df = entity_df
         self.table = table
         self._metadata = metadata
+        self.max_concurrent_streams = max_concurrent_streams
 
     # Invoked to realize the Pandas DataFrame
     def _to_df_internal(self, timeout: Optional[int] = None) -> pd.DataFrame:
@@ -69,9 +85,23 @@ class RemoteRetrievalJob(RetrievalJob):
     # This is where do_get service is invoked
     def _to_arrow_internal(self, timeout: Optional[int] = None) -> pa.Table:
         return _send_retrieve_remote(
-            self.api, self.api_parameters, self.entity_df, self.table, self.client
+            self.api,
+            self.api_parameters,
+            self.entity_df,
+            self.table,
+            self.client,
+            self.max_concurrent_streams,
         )
 
+    # Invoked to stream the result of the underlying query batch by batch, as sent by the do_get service
+    def _to_arrow_batches_internal(
+        self, timeout: Optional[int] = None
+    ) -> Iterator[pa.RecordBatch]:
+        command_descriptor = _call_put(
+            self.api, self.api_parameters, self.client, self.entity_df, self.table
+        )
+        yield from _call_get_batches(self.client, command_descriptor)
+
     @property
     def on_demand_feature_views(self) -> List[OnDemandFeatureView]:
         return []
@@ -148,6 +178,7 @@ class RemoteOfflineStore(OfflineStore):
             api_parameters=api_parameters,
             entity_df=entity_df,
             metadata=_create_retrieval_metadata(feature_refs, entity_df),
+            max_concurrent_streams=config.offline_store.max_concurrent_streams,
         )
 
     @staticmethod
@@ -330,16 +361,48 @@ def _send_retrieve_remote(
     entity_df: Union[pd.DataFrame, str],
     table: pa.Table,
     client: fl.FlightClient,
+    max_concurrent_streams: int = 1,
 ):
     command_descriptor = _call_put(api, api_parameters, client, entity_df, table)
-    return _call_get(client, command_descriptor)
+    return _call_get(client, command_descriptor, max_concurrent_streams)
 
 
-def _call_get(client: fl.FlightClient, command_descriptor: fl.FlightDescriptor):
+def _call_get(
+    client: fl.FlightClient,
+    command_descriptor: fl.FlightDescriptor,
+    max_concurrent_streams: int = 1,
+):
+    flight = client.get_flight_info(command_descriptor)
+    tickets = [endpoint.ticket for endpoint in flight.endpoints]
+    if len(tickets) == 1 or max_concurrent_streams <= 1:
+        tables = [client.do_get(ticket).read_all() for ticket in tickets]
+    else:
+        # Endpoints are contiguous partitions of the result, so they are concatenated back in order
+        with ThreadPoolExecutor(
+            max_workers=min(len(tickets), max_concurrent_streams)
+        ) as executor:
+            tables = list(
+                executor.map(lambda ticket: client.do_get(ticket).read_all(), tickets)
+            )
+    if len(tables) == 1:
+        return tables[0]
+    # Every endpoint is served with the schema announced in the FlightInfo, so the tables can be concatenated as is
+    return pa.concat_tables(tables)
+
+
+def _call_get_batches(
+    client: fl.FlightClient, command_descriptor: fl.FlightDescriptor
+) -> Iterator[pa.RecordBatch]:
+    # Endpoints are streamed one after the other to keep memory bounded
     flight = client.get_flight_info(command_descriptor)
-    ticket = flight.endpoints[0].ticket
-    reader = client.do_get(ticket)
-    return reader.read_all()
+    empty = True
+    for endpoint in flight.endpoints:
+        reader = client.do_get(endpoint.ticket)
+        for chunk in reader:
+            empty = False
+            yield chunk.data
+    if empty:
+        yield pa.RecordBatch.from_pylist([], schema=reader.schema)
 
 
 def _call_put(
@@ -510,7 +510,15 @@ class SnowflakeRetrievalJob(RetrievalJob):
 
         return None
 
-    def to_arrow_batches(self) -> Iterator[pyarrow.Table]:
+    def to_arrow_batches(
+        self, timeout: Optional[int] = None
+    ) -> Iterator[pyarrow.RecordBatch]:
+        """
+        Yields the result as record batches, like every other retrieval job. Before streaming retrieval was
+        added to RetrievalJob, this method yielded the pyarrow Tables fetched from Snowflake instead; use
+        `pyarrow.Table.from_batches` to get tables back.
+        """
+        # On demand transformations are already applied by to_snowflake
         table_name = "temp_arrow_batches_" + uuid.uuid4().hex
 
         self.to_snowflake(table_name=table_name, allow_overwrite=True, temporary=True)
@@ -520,7 +528,18 @@ class SnowflakeRetrievalJob(RetrievalJob):
             self.snowflake_conn, query
         ).fetch_arrow_batches()
 
-        return arrow_batches
+        empty = True
+        for table in arrow_batches:
+            for batch in table.to_batches():
+                empty = False
+                yield batch
+        if empty:
+            schema = (
+                execute_snowflake_statement(self.snowflake_conn, f"{query} LIMIT 0")
+                .fetch_arrow_all(force_return_table=True)
+                .schema
+            )
+            yield pyarrow.RecordBatch.from_pylist([], schema=schema)
 
     def to_pandas_batches(self) -> Iterator[pd.DataFrame]:
         table_name = "temp_pandas_batches_" + uuid.uuid4().hex
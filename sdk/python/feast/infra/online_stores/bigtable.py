@@ -1,3 +1,4 @@
+import asyncio
 import hashlib
 import logging
 from concurrent import futures
@@ -42,9 +43,14 @@ class BigtableOnlineStoreConfig(FeastConfigBaseModel):
     max_versions: int = 2
     """The number of historical versions of data that will be kept around."""
 
+    read_batch_size: int = 100
+    """Number of row keys per `read_rows` request; the requests of a read run concurrently."""
+
 
 class BigtableOnlineStore(OnlineStore):
     _client: Optional[bigtable.Client] = None
+    # Bigtable table name -> table handle
+    _tables: Optional[Dict[str, bigtable.table.Table]] = None
 
     feature_column_family: str = "features"
 
@@ -55,15 +61,58 @@ class BigtableOnlineStore(OnlineStore):
         entity_keys: List[EntityKeyProto],
         requested_features: Optional[List[str]] = None,
     ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
-        # Potential performance improvement opportunity described in
-        # https://github.com/feast-dev/feast/issues/3259
-        feature_view = table
-        bt_table_name = self._get_table_name(config=config, feature_view=feature_view)
+        online_config = config.online_store
+        assert isinstance(online_config, BigtableOnlineStoreConfig)
+        bt_table = self._get_table(config=config, feature_view=table)
+        row_keys = self._compute_row_keys(config, table, entity_keys)
+        batches = self._batch_row_keys(row_keys, online_config.read_batch_size)
+        filter_ = self._row_filter(requested_features)
+
+        if len(batches) <= 1:
+            results = [self._read_rows(bt_table, batch, filter_) for batch in batches]
+        else:
+            with futures.ThreadPoolExecutor(
+                max_workers=min(len(batches), BIGTABLE_CLIENT_CONNECTION_POOL_SIZE)
+            ) as executor:
+                results = list(
+                    executor.map(
+                        lambda batch: self._read_rows(bt_table, batch, filter_),
+                        batches,
+                    )
+                )
+        return self._match_rows(row_keys, results)
+
+    async def online_read_async(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        entity_keys: List[EntityKeyProto],
+        requested_features: Optional[List[str]] = None,
+    ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+        online_config = config.online_store
+        assert isinstance(online_config, BigtableOnlineStoreConfig)
+        bt_table = self._get_table(config=config, feature_view=table)
+        row_keys = self._compute_row_keys(config, table, entity_keys)
+        batches = self._batch_row_keys(row_keys, online_config.read_batch_size)
+        filter_ = self._row_filter(requested_features)
+
+        # The Bigtable client is blocking, so batches are read in the loop's executor to keep the loop free
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *[
+                loop.run_in_executor(None, self._read_rows, bt_table, batch, filter_)
+                for batch in batches
+            ]
+        )
+        return self._match_rows(row_keys, results)
 
-        client = self._get_client(online_config=config.online_store)
-        bt_instance = client.instance(instance_id=config.online_store.instance)
-        bt_table = bt_instance.table(bt_table_name)
-        row_keys = [
+    def _compute_row_keys(
+        self,
+        config: RepoConfig,
+        feature_view: FeatureView,
+        entity_keys: List[EntityKeyProto],
+    ) -> List[bytes]:
+        return [
             self._compute_row_key(
                 entity_key=entity_key,
                 feature_view_name=feature_view.name,
@@ -72,27 +121,44 @@ class BigtableOnlineStore(OnlineStore):
             for entity_key in entity_keys
         ]
 
+    @staticmethod
+    def _batch_row_keys(row_keys: List[bytes], batch_size: int) -> List[List[bytes]]:
+        return [
+            row_keys[i : i + batch_size] for i in range(0, len(row_keys), batch_size)
+        ]
+
+    @staticmethod
+    def _row_filter(requested_features: Optional[List[str]]):
+        if not requested_features:
+            return None
+        return row_filters.ColumnQualifierRegexFilter(
+            f"^({'|'.join(requested_features)}|event_ts)$".encode()
+        )
+
+    @staticmethod
+    def _read_rows(
+        bt_table: bigtable.table.Table, row_keys: List[bytes], filter_
+    ) -> Dict[bytes, bigtable.row.PartialRowData]:
         row_set = bigtable.row_set.RowSet()
         for row_key in row_keys:
             row_set.add_row_key(row_key)
-        rows = bt_table.read_rows(
-            row_set=row_set,
-            filter_=(
-                row_filters.ColumnQualifierRegexFilter(
-                    f"^({'|'.join(requested_features)}|event_ts)$".encode()
-                )
-                if requested_features
-                else None
-            ),
-        )
+        return {
+            row.row_key: row
+            for row in bt_table.read_rows(row_set=row_set, filter_=filter_)
+        }
 
+    def _match_rows(
+        self,
+        row_keys: List[bytes],
+        results: Sequence[Dict[bytes, bigtable.row.PartialRowData]],
+    ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
         # The BigTable client library only returns rows for keys that are found. This
         # means that it's our responsibility to match the returned rows to the original
         # `row_keys` and make sure that we're returning a list of the same length as
         # `entity_keys`.
-        bt_rows_dict: Dict[bytes, bigtable.row.PartialRowData] = {
-            row.row_key: row for row in rows
-        }
+        bt_rows_dict: Dict[bytes, bigtable.row.PartialRowData] = {}
+        for rows in results:
+            bt_rows_dict.update(rows)
         return [self._process_bt_row(bt_rows_dict.get(row_key)) for row_key in row_keys]
 
     def _process_bt_row(
@@ -124,11 +190,7 @@ class BigtableOnlineStore(OnlineStore):
         progress: Optional[Callable[[int], Any]],
     ) -> None:
         feature_view = table
-        bt_table_name = self._get_table_name(config=config, feature_view=feature_view)
-
-        client = self._get_client(online_config=config.online_store)
-        bt_instance = client.instance(instance_id=config.online_store.instance)
-        bt_table = bt_instance.table(bt_table_name)
+        bt_table = self._get_table(config=config, feature_view=feature_view)
 
         # `columns_per_row` is used to calculate the number of rows we are allowed to
         # mutate in one request.
@@ -328,6 +390,19 @@ class BigtableOnlineStore(OnlineStore):
                     f"Table `{table_name}` was not found. Skipping deletion."
                 )
 
+    def _get_table(
+        self, config: RepoConfig, feature_view: FeatureView
+    ) -> bigtable.table.Table:
+        """Returns the (cached) handle of the Bigtable table holding the feature view."""
+        if self._tables is None:
+            self._tables = {}
+        bt_table_name = self._get_table_name(config=config, feature_view=feature_view)
+        if bt_table_name not in self._tables:
+            client = self._get_client(online_config=config.online_store)
+            bt_instance = client.instance(instance_id=config.online_store.instance)
+            self._tables[bt_table_name] = bt_instance.table(bt_table_name)
+        return self._tables[bt_table_name]
+
     def _get_client(
         self, online_config: BigtableOnlineStoreConfig, admin: bool = False
     ):
@@ -1,6 +1,7 @@
 import calendar
 import struct
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Tuple
 
 from happybase import ConnectionPool
@@ -38,6 +39,9 @@ class HbaseOnlineStoreConfig(FeastConfigBaseModel):
     transport: StrictStr = DEFAULT_TRANSPORT
     """Transport used to communicate with Hbase Thrift server"""
 
+    read_batch_size: int = 100
+    """Number of rows fetched per multi-get; batches of a read run in parallel over the connection pool"""
+
 
 class HbaseOnlineStore(OnlineStore):
     """
@@ -143,11 +147,10 @@ class HbaseOnlineStore(OnlineStore):
             entity_keys: a list of entity keys that should be read from the FeatureStore.
             requested_features: a list of requested feature names.
         """
+        store_config = config.online_store
+        assert isinstance(store_config, HbaseOnlineStoreConfig)
         hbase = HBaseConnector(self._get_conn(config))
-        project = config.project
-        table_name = self._table_id(project, table)
-
-        result: List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]] = []
+        table_name = self._table_id(config.project, table)
 
         row_keys = [
             self._hbase_row_key(
@@ -157,20 +160,51 @@ class HbaseOnlineStore(OnlineStore):
             )
             for entity_key in entity_keys
         ]
-        rows = hbase.rows(table_name, row_keys=row_keys)
+        # Only fetch the requested features (and the event timestamp) from HBase
+        columns = None
+        if requested_features is not None:
+            columns = [
+                HbaseConstants.get_col_from_feature(feature)
+                for feature in requested_features
+            ] + [HbaseConstants.DEFAULT_EVENT_TS]
+
+        batch_size = store_config.read_batch_size
+        batches = [
+            row_keys[i : i + batch_size] for i in range(0, len(row_keys), batch_size)
+        ]
+
+        def read_batch(batch: List[bytes]):
+            return hbase.rows(table_name, row_keys=batch, columns=columns)
+
+        if len(batches) <= 1:
+            fetched = [read_batch(batch) for batch in batches]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(len(batches), store_config.connection_pool_size)
+            ) as executor:
+                fetched = list(executor.map(read_batch, batches))
+
+        # HBase only returns the rows it found, so results are matched back to the entity keys by row key
+        rows_by_key = {
+            row_key: row for batch_rows in fetched for row_key, row in batch_rows
+        }
 
-        for _, row in rows:
+        result: List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]] = []
+        for row_key in row_keys:
+            row = rows_by_key.get(row_key)
             res = {}
             res_ts = None
-            for feature_name, feature_value in row.items():
+            for feature_name, feature_value in (row or {}).items():
                 f_name = HbaseConstants.get_feature_from_col(feature_name)
-                if requested_features is not None and f_name in requested_features:
+                if f_name == HbaseConstants.EVENT_TS:
+                    ts = struct.unpack(">L", feature_value)[0]
+                    res_ts = datetime.fromtimestamp(ts, tz=timezone.utc)
+                elif f_name != HbaseConstants.CREATED_TS and (
+                    requested_features is None or f_name in requested_features
+                ):
                     v = ValueProto()
                     v.ParseFromString(feature_value)
                     res[f_name] = v
-                if f_name is HbaseConstants.EVENT_TS:
-                    ts = struct.unpack(">L", feature_value)[0]
-                    res_ts = datetime.fromtimestamp(ts)
             if not res:
                 result.append((None, None))
             else:
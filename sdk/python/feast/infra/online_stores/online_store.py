@@ -60,6 +60,18 @@ class OnlineStore(ABC):
         """
         pass
 
+    def flush(self, config: RepoConfig, table: FeatureView) -> None:
+        """
+        Makes rows written by earlier online_write_batch calls durable and visible to reads. Called once
+        materialization of a feature view has completed, so stores that buffer or defer part of the write
+        work can finish it once per job rather than once per batch. By default this does nothing.
+
+        Args:
+            config: The config for the current feature store.
+            table: Feature view whose rows were written.
+        """
+        pass
+
     @abstractmethod
     def online_read(
         self,
@@ -18,6 +18,10 @@ from feast.infra.materialization.batch_materialization_engine import (
     MaterializationJobStatus,
     MaterializationTask,
 )
+from feast.infra.materialization.checkpoints import (
+    MaterializationCheckpoints,
+    get_materialization_shards,
+)
 from feast.infra.offline_stores.offline_store import RetrievalJob
 from feast.infra.offline_stores.offline_utils import get_offline_store_from_config
 from feast.infra.online_stores.helpers import get_online_store_from_config
@@ -317,19 +321,80 @@ class PassthroughProvider(Provider):
             or isinstance(feature_view, StreamFeatureView)
             or isinstance(feature_view, FeatureView)
         ), f"Unexpected type for {feature_view.name}: {type(feature_view)}"
-        task = MaterializationTask(
-            project=project,
-            feature_view=feature_view,
-            start_time=start_date,
-            end_time=end_date,
-            tqdm_builder=tqdm_builder,
+        rows_start, rows_end = start_date, end_date
+        if config.materialization.skip_unchanged_sources:
+            try:
+                timestamp_range = self.offline_store.get_event_timestamp_range(
+                    config=config,
+                    data_source=feature_view.batch_source,
+                    timestamp_field=feature_view.batch_source.timestamp_field,
+                    start_date=start_date,
+                    end_date=end_date,
+                )
+            except NotImplementedError:
+                pass
+            else:
+                if timestamp_range is None:
+                    # No new rows: nothing to write, but the range still counts as materialized
+                    return
+                min_timestamp, max_timestamp = timestamp_range
+                rows_start = max(start_date, min_timestamp)
+                rows_end = min(end_date, max_timestamp + timedelta(microseconds=1))
+
+        shard_interval = timedelta(
+            seconds=config.materialization.shard_interval_seconds
         )
-        jobs = self.batch_engine.materialize(registry, [task])
-        assert len(jobs) == 1
-        if jobs[0].status() == MaterializationJobStatus.ERROR and jobs[0].error():
-            e = jobs[0].error()
-            assert e
-            raise e
+        if not shard_interval:
+            task = MaterializationTask(
+                project=project,
+                feature_view=feature_view,
+                start_time=rows_start,
+                end_time=rows_end,
+                tqdm_builder=tqdm_builder,
+            )
+            jobs = self.batch_engine.materialize(registry, [task])
+            assert len(jobs) == 1
+            if jobs[0].status() == MaterializationJobStatus.ERROR and jobs[0].error():
+                e = jobs[0].error()
+                assert e
+                raise e
+            if self.online_store:
+                self.online_store.flush(config, feature_view)
+            return
+
+        checkpoints = MaterializationCheckpoints(config)
+        completed_until = checkpoints.get_completed_until(feature_view, start_date)
+        tasks = [
+            MaterializationTask(
+                project=project,
+                feature_view=feature_view,
+                start_time=shard_start,
+                end_time=shard_end,
+                tqdm_builder=tqdm_builder,
+            )
+            for shard_start, shard_end in get_materialization_shards(
+                max(completed_until or rows_start, rows_start), rows_end, shard_interval
+            )
+        ]
+        # Shards are submitted in chronological order, and only recorded as completed up to the first failed one:
+        # a rerun materializes all later shards again, so older rows never end up overwriting newer ones.
+        jobs = self.batch_engine.materialize(registry, tasks)
+        assert len(jobs) == len(tasks)
+        error = None
+        for task, job in zip(tasks, jobs):
+            if job.status() == MaterializationJobStatus.ERROR and job.error():
+                error = job.error()
+                break
+            completed_until = task.end_time
+        if self.online_store:
+            self.online_store.flush(config, feature_view)
+        if error is not None:
+            if completed_until is not None:
+                checkpoints.set_completed_until(
+                    feature_view, start_date, completed_until
+                )
+            raise error
+        checkpoints.clear(feature_view)
 
     def get_historical_features(
         self,
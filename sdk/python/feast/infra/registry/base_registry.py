@@ -15,8 +15,9 @@ import json
 import warnings
 from abc import ABC, abstractmethod
 from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from google.protobuf.json_format import MessageToJson
 from google.protobuf.message import Message
@@ -610,6 +611,19 @@ class BaseRegistry(ABC):
         """Refreshes the state of the registry cache by fetching the registry state from the remote registry store."""
         raise NotImplementedError
 
+    @contextmanager
+    def transaction(self, project: str) -> Iterator[None]:
+        """
+        Groups the changes made to the registry inside the block, and commits them once it exits without errors.
+
+        Registries that persist every change as it is made simply commit at the end of the block.
+
+        Args:
+            project: Feast project the changes are made to
+        """
+        yield
+        self.commit()
+
     @staticmethod
     def _message_to_sorted_dict(message: Message) -> Dict[str, Any]:
         return json.loads(MessageToJson(message, sort_keys=True))
@@ -1,6 +1,10 @@
+import os
 import uuid
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Iterator, Optional, Tuple
 
+from feast.errors import RegistryConflictException
 from feast.infra.registry.registry_store import RegistryStore
 from feast.protos.feast.core.Registry_pb2 import Registry as RegistryProto
 from feast.repo_config import RegistryConfig
@@ -14,20 +18,54 @@ class FileRegistryStore(RegistryStore):
             self._filepath = registry_path
         else:
             self._filepath = repo_path.joinpath(registry_path)
+        # Modification time and size of the registry file when it was last read or written
+        self._version: Optional[Tuple[int, int]] = None
 
     def get_registry_proto(self):
         registry_proto = RegistryProto()
         if self._filepath.exists():
+            # The file is stat'ed before it is read, so a concurrent write is detected on the next read
+            self._version = self._stat()
             registry_proto.ParseFromString(self._filepath.read_bytes())
             return registry_proto
         raise FileNotFoundError(
             f'Registry not found at path "{self._filepath}". Have you run "feast apply"?'
         )
 
+    def get_registry_proto_if_changed(self) -> Optional[RegistryProto]:
+        if self._version is not None and self._filepath.exists():
+            if self._stat() == self._version:
+                return None
+        return self.get_registry_proto()
+
     def update_registry_proto(self, registry_proto: RegistryProto):
         self._write_registry(registry_proto)
 
+    def update_registry_proto_if_unchanged(
+        self, registry_proto: RegistryProto, version_id: str
+    ):
+        # The new registry is written to a temporary file, which is renamed over the registry file once that is
+        # checked to still hold version_id. Conditional writers take turns, so none of them can write in between.
+        file_dir = self._filepath.parent
+        file_dir.mkdir(exist_ok=True)
+        temp_path = file_dir / f".{self._filepath.name}.{uuid.uuid4().hex}"
+        temp_path.write_bytes(self._serialize(registry_proto))
+        try:
+            with _locked_directory(file_dir):
+                current_version_id = ""
+                if self._filepath.exists():
+                    current_registry_proto = RegistryProto()
+                    current_registry_proto.ParseFromString(self._filepath.read_bytes())
+                    current_version_id = current_registry_proto.version_id
+                if current_version_id != version_id:
+                    raise RegistryConflictException()
+                os.replace(temp_path, self._filepath)
+        finally:
+            temp_path.unlink(missing_ok=True)
+        self._version = None
+
     def teardown(self):
+        self._version = None
         try:
             self._filepath.unlink()
         except FileNotFoundError:
@@ -36,9 +74,38 @@ class FileRegistryStore(RegistryStore):
             pass
 
     def _write_registry(self, registry_proto: RegistryProto):
-        registry_proto.version_id = str(uuid.uuid4())
-        registry_proto.last_updated.FromDatetime(_utc_now())
+        data = self._serialize(registry_proto)
         file_dir = self._filepath.parent
         file_dir.mkdir(exist_ok=True)
         with open(self._filepath, mode="wb", buffering=0) as f:
-            f.write(registry_proto.SerializeToString())
+            f.write(data)
+        # Another process may write the file right after this one, so the next read always reads it
+        self._version = None
+
+    @staticmethod
+    def _serialize(registry_proto: RegistryProto) -> bytes:
+        registry_proto.version_id = str(uuid.uuid4())
+        registry_proto.last_updated.FromDatetime(_utc_now())
+        return registry_proto.SerializeToString()
+
+    def _stat(self) -> Tuple[int, int]:
+        stat = self._filepath.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+
+@contextmanager
+def _locked_directory(directory: Path) -> Iterator[None]:
+    """Holds an exclusive lock on a directory, released when the block exits or the process dies."""
+    try:
+        import fcntl
+    except ImportError:
+        # e.g. on Windows, where conditional writes are checked and made without a lock
+        yield
+        return
+
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)
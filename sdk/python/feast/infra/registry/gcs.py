@@ -1,8 +1,10 @@
 import uuid
 from pathlib import Path
 from tempfile import TemporaryFile
+from typing import Optional
 from urllib.parse import urlparse
 
+from feast.errors import RegistryConflictException
 from feast.infra.registry.registry_store import RegistryStore
 from feast.protos.feast.core.Registry_pb2 import Registry as RegistryProto
 from feast.repo_config import RegistryConfig
@@ -23,9 +25,18 @@ class GCSRegistryStore(RegistryStore):
         self._uri = urlparse(uri)
         self._bucket = self._uri.hostname
         self._blob = self._uri.path.lstrip("/")
+        # Generation of the registry blob when it was last read or written
+        self._generation: Optional[int] = None
 
     def get_registry_proto(self):
-        import google.cloud.storage as storage
+        registry_proto = self._read_registry(generation=None)
+        assert registry_proto is not None
+        return registry_proto
+
+    def get_registry_proto_if_changed(self) -> Optional[RegistryProto]:
+        return self._read_registry(generation=self._generation)
+
+    def _read_registry(self, generation: Optional[int]) -> Optional[RegistryProto]:
         from google.cloud.exceptions import NotFound
 
         file_obj = TemporaryFile()
@@ -36,23 +47,42 @@ class GCSRegistryStore(RegistryStore):
             raise Exception(
                 f"No bucket named {self._bucket} exists; please create it first."
             )
-        if storage.Blob(bucket=bucket, name=self._blob).exists(self.gcs_client):
-            self.gcs_client.download_blob_to_file(
-                self._uri.geturl(), file_obj, timeout=30
+        # Only the metadata of the blob is fetched to tell whether it changed since the last read or write
+        blob = bucket.get_blob(self._blob)
+        if blob is None:
+            raise FileNotFoundError(
+                f'Registry not found at path "{self._uri.geturl()}". Have you run "feast apply"?'
             )
-            file_obj.seek(0)
-            registry_proto.ParseFromString(file_obj.read())
-            return registry_proto
-        raise FileNotFoundError(
-            f'Registry not found at path "{self._uri.geturl()}". Have you run "feast apply"?'
-        )
+        if generation is not None and blob.generation == generation:
+            return None
+        # The blob carries its generation, so this downloads the registry the metadata was fetched for
+        blob.download_to_file(file_obj, timeout=30)
+        file_obj.seek(0)
+        registry_proto.ParseFromString(file_obj.read())
+        self._generation = blob.generation
+        return registry_proto
 
     def update_registry_proto(self, registry_proto: RegistryProto):
         self._write_registry(registry_proto)
 
+    def update_registry_proto_if_unchanged(
+        self, registry_proto: RegistryProto, version_id: str
+    ):
+        from google.api_core.exceptions import PreconditionFailed
+
+        # GCS only writes the blob if it is still at the generation of the last read. Generation 0 means that it
+        # must not exist, for a registry that was not read.
+        try:
+            self._write_registry(
+                registry_proto, if_generation_match=self._generation or 0
+            )
+        except PreconditionFailed as e:
+            raise RegistryConflictException() from e
+
     def teardown(self):
         from google.cloud.exceptions import NotFound
 
+        self._generation = None
         gs_bucket = self.gcs_client.get_bucket(self._bucket)
         try:
             gs_bucket.delete_blob(self._blob)
@@ -60,7 +90,7 @@ class GCSRegistryStore(RegistryStore):
             # If the blob deletion fails with NotFound, it has already been deleted.
             pass
 
-    def _write_registry(self, registry_proto: RegistryProto):
+    def _write_registry(self, registry_proto: RegistryProto, **conditions):
         registry_proto.version_id = str(uuid.uuid4())
         registry_proto.last_updated.FromDatetime(_utc_now())
         # we have already checked the bucket exists so no need to do it again
@@ -69,4 +99,5 @@ class GCSRegistryStore(RegistryStore):
         file_obj = TemporaryFile()
         file_obj.write(registry_proto.SerializeToString())
         file_obj.seek(0)
-        blob.upload_from_file(file_obj)
+        blob.upload_from_file(file_obj, **conditions)
+        self._generation = blob.generation
@@ -1,13 +1,15 @@
 import logging
 import threading
-import time
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from threading import Lock
-from typing import Any, List, Optional, Set, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import httpx
-from pydantic import StrictStr
+from google.protobuf.message import Message
+from pydantic import StrictBool, StrictInt, StrictStr
 
 from feast.base_feature_view import BaseFeatureView
 from feast.data_source import DataSource, KafkaSource, PushSource, RequestSource
@@ -48,6 +50,7 @@ from feast.protos.feast.core.Registry_pb2 import Registry as RegistryProto
 from feast.repo_config import RegistryConfig
 from feast.saved_dataset import SavedDataset, ValidationReference
 from feast.stream_feature_view import StreamFeatureView
+from feast.utils import _utc_now, make_tzaware
 
 logger = logging.getLogger(__name__)
 
@@ -62,8 +65,86 @@ class HttpRegistryConfig(RegistryConfig):
 
     client_id: Optional[StrictStr] = "Unknown"
 
+    max_concurrent_requests: StrictInt = 8
+    """ int: Maximum number of requests sent at the same time while building the registry snapshot. """
+
+    snapshot_endpoint: StrictBool = False
+    """ bool: Whether to build the registry snapshot from a single `GET {path}/snapshot?project=<project>`
+    request. The endpoint must return the serialized Registry proto of the project, with an ETag header,
+    and answer 304 Not Modified when the If-None-Match header matches the current snapshot. """
+
 
 CACHE_REFRESH_THRESHOLD_SECONDS = 300
+# The refresh thread refreshes the cache this long before it expires, or halfway through the ttl if it is shorter
+REFRESH_AHEAD_SECONDS = 10
+
+
+def _data_source_from_response(data_source: dict) -> Optional[DataSource]:
+    if "model_type" not in data_source:
+        return None
+    if data_source["model_type"] == "RequestSourceModel":
+        return RequestSourceModel.model_validate(data_source).to_data_source()
+    elif data_source["model_type"] == "SparkSourceModel":
+        return SparkSourceModel.model_validate(data_source).to_data_source()
+    elif data_source["model_type"] == "KafkaSourceModel":
+        return KafkaSourceModel.model_validate(data_source).to_data_source()
+    logger.error(f"Unable to parse model_type for data_source response: {data_source}")
+    raise ValueError(
+        f"Unable to parse object with data_source name: {data_source.get('name')}"
+    )
+
+
+# Path of each kind of object under /projects/{project}, the registry proto field it is stored in,
+# and how to convert an item of the listing to a Feast object
+SNAPSHOT_OBJECT_TYPES: List[Tuple[str, str, Callable[[Any], Any]]] = [
+    (
+        "entities",
+        "entities",
+        lambda response: EntityModel.model_validate(response).to_entity(),
+    ),
+    (
+        "feature_views",
+        "feature_views",
+        lambda response: FeatureViewModel.model_validate(response).to_feature_view(),
+    ),
+    ("data_sources", "data_sources", _data_source_from_response),
+    (
+        "on_demand_feature_views",
+        "on_demand_feature_views",
+        lambda response: OnDemandFeatureViewModel.model_validate(
+            response
+        ).to_feature_view(),
+    ),
+    (
+        "feature_services",
+        "feature_services",
+        lambda response: FeatureServiceModel.model_validate(
+            response
+        ).to_feature_service(),
+    ),
+]
+
+
+@dataclass
+class _ProjectSnapshot:
+    """Objects of one project, as last fetched to build the registry snapshot."""
+
+    # None if the registry returned no metadata for the project
+    last_updated_timestamp: Optional[datetime]
+    fetched_at: datetime
+    # registry proto field -> protos of the project's objects
+    protos: Dict[str, List[Message]]
+
+
+def _last_updated_timestamp(
+    project_metadata: Optional[List[ProjectMetadata]],
+) -> Optional[datetime]:
+    """Returns when the project was last updated, or None if the registry returned no metadata for it."""
+    if not project_metadata:
+        return None
+    return max(
+        make_tzaware(metadata.last_updated_timestamp) for metadata in project_metadata
+    )
 
 
 class HttpRegistry(BaseRegistry):
@@ -89,6 +170,14 @@ class HttpRegistry(BaseRegistry):
         self.http_client = httpx.Client(
             timeout=timeout, transport=transport, headers=headers
         )
+        self.max_concurrent_requests = getattr(
+            registry_config, "max_concurrent_requests", 8
+        )
+        self.snapshot_endpoint = getattr(registry_config, "snapshot_endpoint", False)
+        # url -> (ETag, protos) of the last listing of a kind of objects that came with an ETag
+        self._listings: Dict[str, Tuple[str, List[Message]]] = {}
+        self._project_snapshots: Dict[str, _ProjectSnapshot] = {}
+        self._snapshot_etag: Optional[str] = None
         self.project = project
         self.apply_project(self.project)
         self.cached_registry_proto_created = datetime.utcnow()
@@ -101,26 +190,27 @@ class HttpRegistry(BaseRegistry):
             )
         )
         self.cached_registry_proto = self.proto()
-        self.stop_thread = False
-        self.refresh_cache_thread = threading.Thread(target=self._refresh_cache)
-        self.refresh_cache_thread.daemon = True
-        self.refresh_cache_thread.start()
+        self._stop_event = threading.Event()
+        self.refresh_cache_thread: Optional[threading.Thread] = None
+        # A ttl of 0 means the cache never expires, so there is nothing to refresh in the background
+        if self.cached_registry_proto_ttl.total_seconds() > 0:
+            self.refresh_cache_thread = threading.Thread(target=self._refresh_cache)
+            self.refresh_cache_thread.daemon = True
+            self.refresh_cache_thread.start()
 
     def _refresh_cache(self):
-        while not self.stop_thread:
+        ttl_seconds = self.cached_registry_proto_ttl.total_seconds()
+        interval = max(ttl_seconds - REFRESH_AHEAD_SECONDS, ttl_seconds / 2)
+        while not self._stop_event.wait(interval):
             try:
                 self.refresh()
             except Exception as e:
                 logger.error(f"Registry refresh failed with exception: {e}")
-            # Sleep for cached_registry_proto_ttl - 10 seconds
-            # TODO: This process needs an update. There is not way to send kill signal to
-            # the thread. When the cached_registry_proto_ttl is large, it will wait longer
-            # before it terminates the thread.
-            time.sleep(self.cached_registry_proto_ttl.total_seconds() - 10)
 
     def close(self):
-        self.stop_thread = True
-        self.refresh_cache_thread.join(10)
+        self._stop_event.set()
+        if self.refresh_cache_thread is not None:
+            self.refresh_cache_thread.join(10)
 
     def teardown(self):
         self.close()
@@ -324,34 +414,10 @@ class HttpRegistry(BaseRegistry):
             response_data = self._send_request("GET", url)
             response_list = response_data if isinstance(response_data, list) else []
             data_source_list: List[DataSource] = []
-            for data_source in response_list:
-                if "model_type" in data_source:
-                    if data_source["model_type"] == "RequestSourceModel":
-                        data_source_list.append(
-                            RequestSourceModel.model_validate(
-                                data_source
-                            ).to_data_source()
-                        )
-                    elif data_source["model_type"] == "SparkSourceModel":
-                        data_source_list.append(
-                            SparkSourceModel.model_validate(
-                                data_source
-                            ).to_data_source()
-                        )
-                    elif data_source["model_type"] == "KafkaSourceModel":
-                        data_source_list.append(
-                            KafkaSourceModel.model_validate(
-                                data_source
-                            ).to_data_source()
-                        )
-                    else:
-                        logger.error(
-                            f"Unable to parse model_type for data_source response: {data_source}"
-                        )
-                        raise ValueError(
-                            "Unable to parse object with data_source name: {data_source.name}"
-                        )
-
+            for response in response_list:
+                data_source = _data_source_from_response(response)
+                if data_source is not None:
+                    data_source_list.append(data_source)
             return data_source_list
         except Exception as exception:
             self._handle_exception(exception)
@@ -679,46 +745,137 @@ class HttpRegistry(BaseRegistry):
         return []
 
     def proto(self) -> RegistryProto:
+        if self.snapshot_endpoint:
+            return self._fetch_registry_snapshot()
+
         r = RegistryProto()
-        # last_updated_timestamps = []
         if self.project is None:
-            projects = self._get_all_projects()
+            projects = sorted(self._get_all_projects())
         else:
             projects = [self.project]
 
+        fetched_at = _utc_now()
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_requests) as executor:
+            project_metadata = dict(
+                zip(projects, executor.map(self.list_project_metadata, projects))
+            )
+            # Projects that did not change since they were last fetched are not fetched again
+            changed_projects = [
+                project
+                for project in projects
+                if not self._is_project_unchanged(project, project_metadata[project])
+            ]
+            listings = {
+                (project, registry_field): executor.submit(
+                    self._fetch_object_protos, project, path, to_object
+                )
+                for project in changed_projects
+                for path, registry_field, to_object in SNAPSHOT_OBJECT_TYPES
+            }
+            for project in changed_projects:
+                self._project_snapshots[project] = _ProjectSnapshot(
+                    last_updated_timestamp=_last_updated_timestamp(
+                        project_metadata[project]
+                    ),
+                    fetched_at=fetched_at,
+                    protos={
+                        registry_field: listings[(project, registry_field)].result()
+                        for _, registry_field, _ in SNAPSHOT_OBJECT_TYPES
+                    },
+                )
+
         for project in projects:
-            for lister, registry_proto_field in [
-                (self.list_entities, r.entities),
-                (self.list_feature_views, r.feature_views),
-                (self.list_data_sources, r.data_sources),
-                (self.list_on_demand_feature_views, r.on_demand_feature_views),
-                (self.list_stream_feature_views, r.stream_feature_views),
-                (self.list_feature_services, r.feature_services),
-                (self.list_saved_datasets, r.saved_datasets),
-                (self.list_validation_references, r.validation_references),
-                (self.list_project_metadata, r.project_metadata),
-            ]:
-                objs: List[Any] = lister(project)  # type: ignore
-                if objs:
-                    obj_protos = [obj.to_proto() for obj in objs]
-                    for obj_proto in obj_protos:
-                        if "spec" in obj_proto.DESCRIPTOR.fields_by_name:
-                            obj_proto.spec.project = project
-                        else:
-                            obj_proto.project = project
-                    registry_proto_field.extend(obj_protos)
+            for registry_field, obj_protos in self._project_snapshots[
+                project
+            ].protos.items():
+                getattr(r, registry_field).extend(obj_protos)
+            r.project_metadata.extend(
+                metadata.to_proto() for metadata in project_metadata[project] or []
+            )
 
             # This is suuuper jank. Because of https://github.com/feast-dev/feast/issues/2783,
             # the registry proto only has a single infra field, which we're currently setting as the "last" project.
             r.infra.CopyFrom(self.get_infra(project).to_proto())
-            # last_updated_timestamps.append(self._get_last_updated_metadata(project))
 
-        # if last_updated_timestamps:
-        #     r.last_updated.FromDatetime(max(last_updated_timestamps))
         r.last_updated.FromDatetime(datetime.utcnow())
 
         return r
 
+    def _is_project_unchanged(
+        self, project: str, project_metadata: Optional[List[ProjectMetadata]]
+    ) -> bool:
+        snapshot = self._project_snapshots.get(project)
+        last_updated_timestamp = _last_updated_timestamp(project_metadata)
+        if snapshot is None or last_updated_timestamp is None:
+            return False
+        # The timestamp only has a resolution of seconds, and registries that do not track it return the epoch,
+        # so it is only trusted if the project was fetched more than a second after it was last updated.
+        return (
+            last_updated_timestamp > datetime.fromtimestamp(1, tz=timezone.utc)
+            and last_updated_timestamp == snapshot.last_updated_timestamp
+            and snapshot.fetched_at - last_updated_timestamp > timedelta(seconds=1)
+        )
+
+    def _fetch_object_protos(
+        self, project: str, path: str, to_object: Callable[[Any], Any]
+    ) -> List[Message]:
+        url = f"{self.base_url}/projects/{project}/{path}"
+        listing = self._listings.get(url)
+        response = self._send_conditional_request(
+            url, etag=listing[0] if listing else None
+        )
+        if response is None:
+            assert listing is not None
+            return listing[1]
+
+        response_data = response.json()
+        response_list = response_data if isinstance(response_data, list) else []
+        obj_protos = []
+        for item in response_list:
+            obj = to_object(item)
+            if obj is None:
+                continue
+            obj_proto = obj.to_proto()
+            if "spec" in obj_proto.DESCRIPTOR.fields_by_name:
+                obj_proto.spec.project = project
+            else:
+                obj_proto.project = project
+            obj_protos.append(obj_proto)
+
+        etag = response.headers.get("ETag")
+        if etag:
+            self._listings[url] = (etag, obj_protos)
+        else:
+            self._listings.pop(url, None)
+        return obj_protos
+
+    def _fetch_registry_snapshot(self) -> RegistryProto:
+        url = f"{self.base_url}/snapshot"
+        params = {"project": self.project} if self.project is not None else None
+        response = self._send_conditional_request(
+            url, etag=self._snapshot_etag, params=params
+        )
+        if response is None:
+            return self.cached_registry_proto
+        self._snapshot_etag = response.headers.get("ETag")
+        return RegistryProto.FromString(response.content)
+
+    def _send_conditional_request(  # type: ignore[return]
+        self, url: str, etag: Optional[str], params=None
+    ) -> Optional[httpx.Response]:
+        """
+        Sends a GET request that only returns a response if the resource no longer matches the given ETag.
+        """
+        headers = {"If-None-Match": etag} if etag else None
+        try:
+            response = self.http_client.get(url, params=params, headers=headers)
+            if response.status_code == httpx.codes.NOT_MODIFIED and etag:
+                return None
+            response.raise_for_status()
+            return response
+        except Exception as exception:
+            self._handle_exception(exception)
+
     def commit(self):
         # This method is a no-op since we're always writing values eagerly to the db.
         pass
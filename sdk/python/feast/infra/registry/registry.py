@@ -12,14 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import logging
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from threading import Lock
-from typing import Any, Dict, List, Optional
+from threading import RLock, local
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
 from urllib.parse import urlparse
 
-from google.protobuf.internal.containers import RepeatedCompositeFieldContainer
 from google.protobuf.message import Message
 
 from feast.base_feature_view import BaseFeatureView
@@ -31,6 +32,7 @@ from feast.errors import (
     EntityNotFoundException,
     FeatureServiceNotFoundException,
     FeatureViewNotFoundException,
+    RegistryConflictException,
     ValidationReferenceNotFound,
 )
 from feast.feature_service import FeatureService
@@ -109,6 +111,13 @@ class FeastObjectType(Enum):
 
 FEAST_OBJECT_TYPES = [feast_object_type for feast_object_type in FeastObjectType]
 
+# Registry proto fields holding feature views, whose names must not collide across fields
+FEATURE_VIEW_FIELDS = [
+    "feature_views",
+    "on_demand_feature_views",
+    "stream_feature_views",
+]
+
 logger = logging.getLogger(__name__)
 
 
@@ -134,6 +143,30 @@ def get_registry_store_class_from_scheme(registry_path: str):
         return get_registry_store_class_from_type(registry_store_type)
 
 
+def _feature_view_field(feature_view: BaseFeatureView) -> str:
+    if isinstance(feature_view, StreamFeatureView):
+        return "stream_feature_views"
+    elif isinstance(feature_view, FeatureView):
+        return "feature_views"
+    elif isinstance(feature_view, OnDemandFeatureView):
+        return "on_demand_feature_views"
+    raise ValueError(f"Unexpected feature view type: {type(feature_view)}")
+
+
+def _object_name_and_project(obj_proto: Message) -> Tuple[str, str]:
+    if "spec" in obj_proto.DESCRIPTOR.fields_by_name:
+        return obj_proto.spec.name, obj_proto.spec.project  # type: ignore[attr-defined]
+    return obj_proto.name, obj_proto.project  # type: ignore[attr-defined]
+
+
+@dataclass
+class _RegistryTransaction:
+    # Registry the transaction started from, restored if it fails
+    registry_proto_before: RegistryProto
+    # registry proto field -> object name -> project -> position of the object in the field
+    indexes: Dict[str, Dict[str, Dict[str, int]]]
+
+
 class Registry(BaseRegistry):
     def apply_user_metadata(
         self,
@@ -154,6 +187,9 @@ class Registry(BaseRegistry):
     cached_registry_proto: Optional[RegistryProto] = None
     cached_registry_proto_created: Optional[datetime] = None
     cached_registry_proto_ttl: timedelta
+    # Set once the cached registry may have been changed since it was fetched or committed, in which case it
+    # is fetched again on refresh even if the registry store did not change
+    _cached_registry_proto_changed: bool = False
 
     def __new__(
         cls,
@@ -197,7 +233,10 @@ class Registry(BaseRegistry):
             or where it will be created if it does not exist yet.
         """
 
-        self._refresh_lock = Lock()
+        # Also held for the whole of a transaction(), so that other threads don't refresh or change the
+        # cached registry while it is batching changes
+        self._refresh_lock = RLock()
+        self._transactions = local()
 
         if registry_config:
             registry_store_type = registry_config.registry_store_type
@@ -263,21 +302,15 @@ class Registry(BaseRegistry):
         self._prepare_registry_for_changes(project)
         assert self.cached_registry_proto
 
-        for idx, existing_entity_proto in enumerate(
-            self.cached_registry_proto.entities
-        ):
-            if (
-                existing_entity_proto.spec.name == entity_proto.spec.name
-                and existing_entity_proto.spec.project == project
-            ):
-                entity.created_timestamp = (
-                    existing_entity_proto.meta.created_timestamp.ToDatetime()
-                )
-                entity_proto = entity.to_proto()
-                entity_proto.spec.project = project
-                del self.cached_registry_proto.entities[idx]
-                break
-        self.cached_registry_proto.entities.append(entity_proto)
+        idx = self._find_object("entities", entity.name, project)
+        if idx is not None:
+            existing_entity_proto = self.cached_registry_proto.entities[idx]
+            entity.created_timestamp = (
+                existing_entity_proto.meta.created_timestamp.ToDatetime()
+            )
+            entity_proto = entity.to_proto()
+            entity_proto.spec.project = project
+        self._put_object("entities", idx, entity_proto)
         if commit:
             self.commit()
 
@@ -306,35 +339,26 @@ class Registry(BaseRegistry):
     def apply_data_source(
         self, data_source: DataSource, project: str, commit: bool = True
     ):
-        registry = self._prepare_registry_for_changes(project)
-        for idx, existing_data_source_proto in enumerate(registry.data_sources):
-            if existing_data_source_proto.name == data_source.name:
-                del registry.data_sources[idx]
+        self._prepare_registry_for_changes(project)
         data_source_proto = data_source.to_proto()
-        data_source_proto.data_source_class_type = (
-            f"{data_source.__class__.__module__}.{data_source.__class__.__name__}"
-        )
         data_source_proto.project = project
         data_source_proto.data_source_class_type = (
             f"{data_source.__class__.__module__}.{data_source.__class__.__name__}"
         )
-        registry.data_sources.append(data_source_proto)
+        idx = self._find_object("data_sources", data_source.name, project)
+        self._put_object("data_sources", idx, data_source_proto)
         if commit:
             self.commit()
 
     def delete_data_source(self, name: str, project: str, commit: bool = True):
         self._prepare_registry_for_changes(project)
-        assert self.cached_registry_proto
 
-        for idx, data_source_proto in enumerate(
-            self.cached_registry_proto.data_sources
-        ):
-            if data_source_proto.name == name:
-                del self.cached_registry_proto.data_sources[idx]
-                if commit:
-                    self.commit()
-                return
-        raise DataSourceNotFoundException(name)
+        idx = self._find_object("data_sources", name, project)
+        if idx is None:
+            raise DataSourceNotFoundException(name)
+        self._delete_object("data_sources", idx)
+        if commit:
+            self.commit()
 
     def apply_feature_service(
         self, feature_service: FeatureService, project: str, commit: bool = True
@@ -349,19 +373,15 @@ class Registry(BaseRegistry):
 
         registry = self._prepare_registry_for_changes(project)
 
-        for idx, existing_feature_service_proto in enumerate(registry.feature_services):
-            if (
-                existing_feature_service_proto.spec.name
-                == feature_service_proto.spec.name
-                and existing_feature_service_proto.spec.project == project
-            ):
-                feature_service.created_timestamp = (
-                    existing_feature_service_proto.meta.created_timestamp.ToDatetime()
-                )
-                feature_service_proto = feature_service.to_proto()
-                feature_service_proto.spec.project = project
-                del registry.feature_services[idx]
-        registry.feature_services.append(feature_service_proto)
+        idx = self._find_object("feature_services", feature_service.name, project)
+        if idx is not None:
+            existing_feature_service_proto = registry.feature_services[idx]
+            feature_service.created_timestamp = (
+                existing_feature_service_proto.meta.created_timestamp.ToDatetime()
+            )
+            feature_service_proto = feature_service.to_proto()
+            feature_service_proto.spec.project = project
+        self._put_object("feature_services", idx, feature_service_proto)
         if commit:
             self.commit()
 
@@ -405,52 +425,28 @@ class Registry(BaseRegistry):
         self._prepare_registry_for_changes(project)
         assert self.cached_registry_proto
 
-        self._check_conflicting_feature_view_names(feature_view)
-        existing_feature_views_of_same_type: RepeatedCompositeFieldContainer
-        if isinstance(feature_view, StreamFeatureView):
-            existing_feature_views_of_same_type = (
-                self.cached_registry_proto.stream_feature_views
-            )
-        elif isinstance(feature_view, FeatureView):
-            existing_feature_views_of_same_type = (
-                self.cached_registry_proto.feature_views
-            )
-        elif isinstance(feature_view, OnDemandFeatureView):
-            existing_feature_views_of_same_type = (
-                self.cached_registry_proto.on_demand_feature_views
+        field = _feature_view_field(feature_view)
+        self._check_conflicting_feature_view_names(feature_view, field)
+
+        idx = self._find_object(field, feature_view.name, project)
+        if idx is not None:
+            existing_feature_view_proto = getattr(self.cached_registry_proto, field)[
+                idx
+            ]
+            existing_feature_view = type(feature_view).from_proto(
+                existing_feature_view_proto
             )
-        else:
-            raise ValueError(f"Unexpected feature view type: {type(feature_view)}")
+            if existing_feature_view == feature_view:
+                return
+            feature_view.created_timestamp = existing_feature_view.created_timestamp
+            if isinstance(feature_view, (FeatureView, StreamFeatureView)):
+                feature_view.update_materialization_intervals(
+                    existing_feature_view.materialization_intervals
+                )
+            feature_view_proto = feature_view.to_proto()
+            feature_view_proto.spec.project = project
 
-        for idx, existing_feature_view_proto in enumerate(
-            existing_feature_views_of_same_type
-        ):
-            if (
-                existing_feature_view_proto.spec.name == feature_view_proto.spec.name
-                and existing_feature_view_proto.spec.project == project
-            ):
-                if (
-                    feature_view.__class__.from_proto(existing_feature_view_proto)
-                    == feature_view
-                ):
-                    return
-                else:
-                    existing_feature_view = type(feature_view).from_proto(
-                        existing_feature_view_proto
-                    )
-                    feature_view.created_timestamp = (
-                        existing_feature_view.created_timestamp
-                    )
-                    if isinstance(feature_view, (FeatureView, StreamFeatureView)):
-                        feature_view.update_materialization_intervals(
-                            existing_feature_view.materialization_intervals
-                        )
-                    feature_view_proto = feature_view.to_proto()
-                    feature_view_proto.spec.project = project
-                    del existing_feature_views_of_same_type[idx]
-                    break
-
-        existing_feature_views_of_same_type.append(feature_view_proto)
+        self._put_object(field, idx, feature_view_proto)
         if commit:
             self.commit()
 
@@ -509,51 +505,27 @@ class Registry(BaseRegistry):
         self._prepare_registry_for_changes(project)
         assert self.cached_registry_proto
 
-        for idx, existing_feature_view_proto in enumerate(
-            self.cached_registry_proto.feature_views
-        ):
-            if (
-                existing_feature_view_proto.spec.name == feature_view.name
-                and existing_feature_view_proto.spec.project == project
-            ):
-                existing_feature_view = FeatureView.from_proto(
-                    existing_feature_view_proto
-                )
-                existing_feature_view.materialization_intervals.append(
-                    (start_date, end_date)
-                )
-                existing_feature_view.last_updated_timestamp = _utc_now()
-                feature_view_proto = existing_feature_view.to_proto()
-                feature_view_proto.spec.project = project
-                del self.cached_registry_proto.feature_views[idx]
-                self.cached_registry_proto.feature_views.append(feature_view_proto)
-                if commit:
-                    self.commit()
-                return
-
-        for idx, existing_stream_feature_view_proto in enumerate(
-            self.cached_registry_proto.stream_feature_views
-        ):
-            if (
-                existing_stream_feature_view_proto.spec.name == feature_view.name
-                and existing_stream_feature_view_proto.spec.project == project
-            ):
-                existing_stream_feature_view = StreamFeatureView.from_proto(
-                    existing_stream_feature_view_proto
-                )
-                existing_stream_feature_view.materialization_intervals.append(
-                    (start_date, end_date)
-                )
-                existing_stream_feature_view.last_updated_timestamp = _utc_now()
-                stream_feature_view_proto = existing_stream_feature_view.to_proto()
-                stream_feature_view_proto.spec.project = project
-                del self.cached_registry_proto.stream_feature_views[idx]
-                self.cached_registry_proto.stream_feature_views.append(
-                    stream_feature_view_proto
-                )
-                if commit:
-                    self.commit()
-                return
+        feature_view_classes: List[Tuple[str, Type[FeatureView]]] = [
+            ("feature_views", FeatureView),
+            ("stream_feature_views", StreamFeatureView),
+        ]
+        for field, feature_view_class in feature_view_classes:
+            idx = self._find_object(field, feature_view.name, project)
+            if idx is None:
+                continue
+            existing_feature_view = feature_view_class.from_proto(
+                getattr(self.cached_registry_proto, field)[idx]
+            )
+            existing_feature_view.materialization_intervals.append(
+                (start_date, end_date)
+            )
+            existing_feature_view.last_updated_timestamp = _utc_now()
+            feature_view_proto = existing_feature_view.to_proto()
+            feature_view_proto.spec.project = project
+            self._put_object(field, idx, feature_view_proto)
+            if commit:
+                self.commit()
+            return
 
         raise FeatureViewNotFoundException(feature_view.name, project)
 
@@ -588,57 +560,21 @@ class Registry(BaseRegistry):
 
     def delete_feature_service(self, name: str, project: str, commit: bool = True):
         self._prepare_registry_for_changes(project)
-        assert self.cached_registry_proto
 
-        for idx, feature_service_proto in enumerate(
-            self.cached_registry_proto.feature_services
-        ):
-            if (
-                feature_service_proto.spec.name == name
-                and feature_service_proto.spec.project == project
-            ):
-                del self.cached_registry_proto.feature_services[idx]
-                if commit:
-                    self.commit()
-                return
-        raise FeatureServiceNotFoundException(name, project)
+        idx = self._find_object("feature_services", name, project)
+        if idx is None:
+            raise FeatureServiceNotFoundException(name, project)
+        self._delete_object("feature_services", idx)
+        if commit:
+            self.commit()
 
     def delete_feature_view(self, name: str, project: str, commit: bool = True):
         self._prepare_registry_for_changes(project)
-        assert self.cached_registry_proto
-
-        for idx, existing_feature_view_proto in enumerate(
-            self.cached_registry_proto.feature_views
-        ):
-            if (
-                existing_feature_view_proto.spec.name == name
-                and existing_feature_view_proto.spec.project == project
-            ):
-                del self.cached_registry_proto.feature_views[idx]
-                if commit:
-                    self.commit()
-                return
 
-        for idx, existing_on_demand_feature_view_proto in enumerate(
-            self.cached_registry_proto.on_demand_feature_views
-        ):
-            if (
-                existing_on_demand_feature_view_proto.spec.name == name
-                and existing_on_demand_feature_view_proto.spec.project == project
-            ):
-                del self.cached_registry_proto.on_demand_feature_views[idx]
-                if commit:
-                    self.commit()
-                return
-
-        for idx, existing_stream_feature_view_proto in enumerate(
-            self.cached_registry_proto.stream_feature_views
-        ):
-            if (
-                existing_stream_feature_view_proto.spec.name == name
-                and existing_stream_feature_view_proto.spec.project == project
-            ):
-                del self.cached_registry_proto.stream_feature_views[idx]
+        for field in FEATURE_VIEW_FIELDS:
+            idx = self._find_object(field, name, project)
+            if idx is not None:
+                self._delete_object(field, idx)
                 if commit:
                     self.commit()
                 return
@@ -647,21 +583,13 @@ class Registry(BaseRegistry):
 
     def delete_entity(self, name: str, project: str, commit: bool = True):
         self._prepare_registry_for_changes(project)
-        assert self.cached_registry_proto
-
-        for idx, existing_entity_proto in enumerate(
-            self.cached_registry_proto.entities
-        ):
-            if (
-                existing_entity_proto.spec.name == name
-                and existing_entity_proto.spec.project == project
-            ):
-                del self.cached_registry_proto.entities[idx]
-                if commit:
-                    self.commit()
-                return
 
-        raise EntityNotFoundException(name, project)
+        idx = self._find_object("entities", name, project)
+        if idx is None:
+            raise EntityNotFoundException(name, project)
+        self._delete_object("entities", idx)
+        if commit:
+            self.commit()
 
     def apply_saved_dataset(
         self,
@@ -679,28 +607,24 @@ class Registry(BaseRegistry):
         self._prepare_registry_for_changes(project)
         assert self.cached_registry_proto
 
-        for idx, existing_saved_dataset_proto in enumerate(
-            self.cached_registry_proto.saved_datasets
-        ):
-            if (
-                existing_saved_dataset_proto.spec.name == saved_dataset_proto.spec.name
-                and existing_saved_dataset_proto.spec.project == project
-            ):
-                saved_dataset.created_timestamp = (
-                    existing_saved_dataset_proto.meta.created_timestamp.ToDatetime()
-                )
-                saved_dataset.min_event_timestamp = (
-                    existing_saved_dataset_proto.meta.min_event_timestamp.ToDatetime()
-                )
-                saved_dataset.max_event_timestamp = (
-                    existing_saved_dataset_proto.meta.max_event_timestamp.ToDatetime()
-                )
-                saved_dataset_proto = saved_dataset.to_proto()
-                saved_dataset_proto.spec.project = project
-                del self.cached_registry_proto.saved_datasets[idx]
-                break
+        idx = self._find_object("saved_datasets", saved_dataset.name, project)
+        if idx is not None:
+            existing_saved_dataset_proto = self.cached_registry_proto.saved_datasets[
+                idx
+            ]
+            saved_dataset.created_timestamp = (
+                existing_saved_dataset_proto.meta.created_timestamp.ToDatetime()
+            )
+            saved_dataset.min_event_timestamp = (
+                existing_saved_dataset_proto.meta.min_event_timestamp.ToDatetime()
+            )
+            saved_dataset.max_event_timestamp = (
+                existing_saved_dataset_proto.meta.max_event_timestamp.ToDatetime()
+            )
+            saved_dataset_proto = saved_dataset.to_proto()
+            saved_dataset_proto.spec.project = project
 
-        self.cached_registry_proto.saved_datasets.append(saved_dataset_proto)
+        self._put_object("saved_datasets", idx, saved_dataset_proto)
         if commit:
             self.commit()
 
@@ -729,18 +653,11 @@ class Registry(BaseRegistry):
         validation_reference_proto = validation_reference.to_proto()
         validation_reference_proto.project = project
 
-        registry_proto = self._prepare_registry_for_changes(project)
-        for idx, existing_validation_reference in enumerate(
-            registry_proto.validation_references
-        ):
-            if (
-                existing_validation_reference.name == validation_reference_proto.name
-                and existing_validation_reference.project == project
-            ):
-                del registry_proto.validation_references[idx]
-                break
-
-        registry_proto.validation_references.append(validation_reference_proto)
+        self._prepare_registry_for_changes(project)
+        idx = self._find_object(
+            "validation_references", validation_reference.name, project
+        )
+        self._put_object("validation_references", idx, validation_reference_proto)
         if commit:
             self.commit()
 
@@ -763,19 +680,14 @@ class Registry(BaseRegistry):
         return proto_registry_utils.list_validation_references(registry_proto, project)
 
     def delete_validation_reference(self, name: str, project: str, commit: bool = True):
-        registry_proto = self._prepare_registry_for_changes(project)
-        for idx, existing_validation_reference in enumerate(
-            registry_proto.validation_references
-        ):
-            if (
-                existing_validation_reference.name == name
-                and existing_validation_reference.project == project
-            ):
-                del registry_proto.validation_references[idx]
-                if commit:
-                    self.commit()
-                return
-        raise ValidationReferenceNotFound(name, project=project)
+        self._prepare_registry_for_changes(project)
+
+        idx = self._find_object("validation_references", name, project)
+        if idx is None:
+            raise ValidationReferenceNotFound(name, project=project)
+        self._delete_object("validation_references", idx)
+        if commit:
+            self.commit()
 
     def list_project_metadata(
         self, project: str, allow_cache: bool = False
@@ -787,8 +699,63 @@ class Registry(BaseRegistry):
 
     def commit(self):
         """Commits the state of the registry cache to the remote registry store."""
+        if self._transaction is not None:
+            # Changes made in a transaction are committed once, when it ends
+            return
         if self.cached_registry_proto:
             self._registry_store.update_registry_proto(self.cached_registry_proto)
+            self._cached_registry_proto_changed = False
+
+    @contextmanager
+    def transaction(self, project: str) -> Iterator[None]:
+        """
+        Batches the changes made to the registry inside the block and commits them once, when it exits.
+
+        The registry is refreshed when the transaction starts and is not refreshed again until it ends, so reads
+        inside the block see its own changes. Objects are looked up by name through indexes instead of scans of the
+        registry. If the block raises, the cached registry is restored to its state before the transaction and
+        nothing is committed. The transaction only commits if the registry store still holds the registry it started
+        from, as a conditional write where the store supports it, and raises a RegistryConflictException if another
+        writer changed it.
+        Transactions started inside a transaction are part of the outer one. Other threads wait for the
+        transaction to end before reading or changing the registry.
+
+        Args:
+            project: Feast project the changes are made to
+        """
+        if self._transaction is not None:
+            yield
+            return
+
+        with self._refresh_lock:
+            try:
+                self.refresh(project)
+            except FileNotFoundError:
+                pass
+            registry_proto = self._prepare_registry_for_changes(project)
+            version_id = registry_proto.version_id
+            self._transaction = _RegistryTransaction(
+                registry_proto_before=registry_proto.__deepcopy__(), indexes={}
+            )
+            try:
+                yield
+            except BaseException:
+                self.cached_registry_proto = self._transaction.registry_proto_before
+                raise
+            finally:
+                self._transaction = None
+
+            try:
+                assert self.cached_registry_proto
+                self._registry_store.update_registry_proto_if_unchanged(
+                    self.cached_registry_proto, version_id
+                )
+            except RegistryConflictException:
+                self.cached_registry_proto = self._registry_store.get_registry_proto()
+                self.cached_registry_proto_created = _utc_now()
+                self._cached_registry_proto_changed = False
+                raise
+            self._cached_registry_proto_changed = False
 
     def refresh(self, project: Optional[str] = None):
         """Refreshes the state of the registry cache by fetching the registry state from the remote registry store."""
@@ -801,8 +768,30 @@ class Registry(BaseRegistry):
     def proto(self) -> RegistryProto:
         return self.cached_registry_proto or RegistryProto()
 
+    @property
+    def _transaction(self) -> Optional[_RegistryTransaction]:
+        """The transaction() batching the changes made by the current thread, if any."""
+        return getattr(self._transactions, "transaction", None)
+
+    @_transaction.setter
+    def _transaction(self, transaction: Optional[_RegistryTransaction]):
+        self._transactions.transaction = transaction
+
     def _prepare_registry_for_changes(self, project: str):
         """Prepares the Registry for changes by refreshing the cache if necessary."""
+        if self._transaction is not None:
+            assert self.cached_registry_proto
+            if (
+                proto_registry_utils.get_project_metadata(
+                    self.cached_registry_proto, project
+                )
+                is None
+            ):
+                proto_registry_utils.init_project_metadata(
+                    self.cached_registry_proto, project
+                )
+            return self.cached_registry_proto
+
         try:
             self._get_registry_proto(project=project, allow_cache=True)
             if (
@@ -832,6 +821,8 @@ class Registry(BaseRegistry):
             )
             self.commit()
 
+        # The caller changes the cached registry from here on
+        self._cached_registry_proto_changed = True
         return self.cached_registry_proto
 
     def _get_registry_proto(
@@ -846,6 +837,11 @@ class Registry(BaseRegistry):
         Returns: Returns a RegistryProto object which represents the state of the registry
         """
         with self._refresh_lock:
+            if self._transaction is not None:
+                # Reads inside a transaction see its changes rather than the registry store
+                assert self.cached_registry_proto
+                return self.cached_registry_proto
+
             expired = (
                 self.cached_registry_proto is None
                 or self.cached_registry_proto_created is None
@@ -874,9 +870,24 @@ class Registry(BaseRegistry):
                 return self.cached_registry_proto
 
             logger.info("Registry cache expired, so refreshing")
-            registry_proto = self._registry_store.get_registry_proto()
+            if (
+                self.cached_registry_proto is None
+                or self._cached_registry_proto_changed
+            ):
+                registry_proto = self._registry_store.get_registry_proto()
+            else:
+                # Keep the cached registry for another ttl if the registry store did not change
+                changed_registry_proto = (
+                    self._registry_store.get_registry_proto_if_changed()
+                )
+                registry_proto = (
+                    changed_registry_proto
+                    if changed_registry_proto is not None
+                    else self.cached_registry_proto
+                )
             self.cached_registry_proto = registry_proto
             self.cached_registry_proto_created = _utc_now()
+            self._cached_registry_proto_changed = False
 
             if not project:
                 return registry_proto
@@ -890,22 +901,72 @@ class Registry(BaseRegistry):
 
             return registry_proto
 
-    def _check_conflicting_feature_view_names(self, feature_view: BaseFeatureView):
-        name_to_fv_protos = self._existing_feature_view_names_to_fvs()
-        if feature_view.name in name_to_fv_protos:
-            if not isinstance(
-                name_to_fv_protos.get(feature_view.name), feature_view.proto_class
+    def _check_conflicting_feature_view_names(
+        self, feature_view: BaseFeatureView, field: str
+    ):
+        for other_field in FEATURE_VIEW_FIELDS:
+            if other_field != field and self._has_object_named(
+                other_field, feature_view.name
             ):
                 raise ConflictingFeatureViewNames(feature_view.name)
 
-    def _existing_feature_view_names_to_fvs(self) -> Dict[str, Message]:
+    def _find_object(self, field: str, name: str, project: str) -> Optional[int]:
+        """Returns the position of the object with this name and project in a field of the cached registry."""
         assert self.cached_registry_proto
-        odfvs = {
-            fv.spec.name: fv
-            for fv in self.cached_registry_proto.on_demand_feature_views
-        }
-        fvs = {fv.spec.name: fv for fv in self.cached_registry_proto.feature_views}
-        sfv = {
-            fv.spec.name: fv for fv in self.cached_registry_proto.stream_feature_views
-        }
-        return {**odfvs, **fvs, **sfv}
+        if self._transaction is not None:
+            return self._transaction_index(field).get(name, {}).get(project)
+        for idx, obj_proto in enumerate(getattr(self.cached_registry_proto, field)):
+            if _object_name_and_project(obj_proto) == (name, project):
+                return idx
+        return None
+
+    def _has_object_named(self, field: str, name: str) -> bool:
+        """Returns whether a field of the cached registry holds an object with this name, in any project."""
+        assert self.cached_registry_proto
+        if self._transaction is not None:
+            return bool(self._transaction_index(field).get(name))
+        return any(
+            _object_name_and_project(obj_proto)[0] == name
+            for obj_proto in getattr(self.cached_registry_proto, field)
+        )
+
+    def _put_object(self, field: str, idx: Optional[int], obj_proto: Message):
+        """Replaces the object at a position of a field of the cached registry, or appends it if idx is None."""
+        assert self.cached_registry_proto
+        obj_protos = getattr(self.cached_registry_proto, field)
+        if idx is not None:
+            obj_protos[idx].CopyFrom(obj_proto)
+            return
+        obj_protos.append(obj_proto)
+        if self._transaction is not None and field in self._transaction.indexes:
+            name, project = _object_name_and_project(obj_proto)
+            self._transaction.indexes[field].setdefault(name, {})[project] = (
+                len(obj_protos) - 1
+            )
+
+    def _delete_object(self, field: str, idx: int):
+        assert self.cached_registry_proto
+        obj_protos = getattr(self.cached_registry_proto, field)
+        name, project = _object_name_and_project(obj_protos[idx])
+        del obj_protos[idx]
+        if self._transaction is None or field not in self._transaction.indexes:
+            return
+        index = self._transaction.indexes[field]
+        del index[name][project]
+        if not index[name]:
+            del index[name]
+        # The objects after the deleted one moved up by one
+        for positions in index.values():
+            for other_project, position in positions.items():
+                if position > idx:
+                    positions[other_project] = position - 1
+
+    def _transaction_index(self, field: str) -> Dict[str, Dict[str, int]]:
+        assert self._transaction is not None and self.cached_registry_proto
+        if field not in self._transaction.indexes:
+            index: Dict[str, Dict[str, int]] = {}
+            for idx, obj_proto in enumerate(getattr(self.cached_registry_proto, field)):
+                name, project = _object_name_and_project(obj_proto)
+                index.setdefault(name, {})[project] = idx
+            self._transaction.indexes[field] = index
+        return self._transaction.indexes[field]
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 
+from feast.errors import RegistryConflictException
 from feast.protos.feast.core.Registry_pb2 import Registry as RegistryProto
 
 
@@ -19,6 +21,18 @@ class RegistryStore(ABC):
         """
         raise NotImplementedError
 
+    def get_registry_proto_if_changed(self) -> Optional[RegistryProto]:
+        """
+        Retrieves the registry proto if it may have changed since this store last read or wrote it. Stores
+        that can tell (from an object version, ETag or modification time) return None when it did not change,
+        so that callers can keep using the registry proto they already have. Other stores always retrieve it.
+        If there is no file at the registry path, raises a FileNotFoundError.
+
+        Returns:
+            Returns either the registry proto stored at the registry path, or None if it did not change.
+        """
+        return self.get_registry_proto()
+
     @abstractmethod
     def update_registry_proto(self, registry_proto: RegistryProto):
         """
@@ -30,6 +44,30 @@ class RegistryStore(ABC):
         """
         pass
 
+    def update_registry_proto_if_unchanged(
+        self, registry_proto: RegistryProto, version_id: str
+    ):
+        """
+        Overwrites the current registry proto with the proto passed in, unless the registry at the registry path
+        changed since this store last read it, in which case raises a RegistryConflictException. Stores that
+        support conditional writes make the check and the write a single operation. This default implementation
+        checks first and writes after, so a writer may still slip in between.
+
+        Args:
+            registry_proto: the new RegistryProto
+            version_id: version_id of the registry proto this store last read
+        """
+        try:
+            current_registry_proto = self.get_registry_proto_if_changed()
+        except FileNotFoundError:
+            current_registry_proto = None
+        if (
+            current_registry_proto is not None
+            and current_registry_proto.version_id != version_id
+        ):
+            raise RegistryConflictException()
+        self.update_registry_proto(registry_proto)
+
     @abstractmethod
     def teardown(self):
         """
@@ -42,6 +80,9 @@ class NoopRegistryStore(RegistryStore):
     def get_registry_proto(self) -> RegistryProto:
         return RegistryProto()
 
+    def get_registry_proto_if_changed(self) -> Optional[RegistryProto]:
+        return None
+
     def update_registry_proto(self, registry_proto: RegistryProto):
         pass
 
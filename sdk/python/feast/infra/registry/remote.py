@@ -1,11 +1,14 @@
-from datetime import datetime
+import logging
+import threading
+import uuid
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 
 import grpc
 from google.protobuf.empty_pb2 import Empty
 from google.protobuf.timestamp_pb2 import Timestamp
-from pydantic import StrictStr
+from pydantic import StrictBool, StrictStr
 
 from feast.base_feature_view import BaseFeatureView
 from feast.data_source import DataSource
@@ -13,6 +16,7 @@ from feast.entity import Entity
 from feast.feature_service import FeatureService
 from feast.feature_view import FeatureView
 from feast.infra.infra_object import Infra
+from feast.infra.registry import proto_registry_utils
 from feast.infra.registry.base_registry import BaseRegistry
 from feast.on_demand_feature_view import OnDemandFeatureView
 from feast.project_metadata import ProjectMetadata
@@ -21,6 +25,33 @@ from feast.protos.feast.registry import RegistryServer_pb2, RegistryServer_pb2_g
 from feast.repo_config import RegistryConfig
 from feast.saved_dataset import SavedDataset, ValidationReference
 from feast.stream_feature_view import StreamFeatureView
+from feast.utils import _utc_now
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait before reconnecting a WatchRegistry stream that failed
+WATCH_RETRY_INTERVAL_SECONDS = 5.0
+
+_Delta = RegistryServer_pb2.RegistryObjectDelta
+
+# Registry field holding each kind of object sent in a RegistryObjectDelta
+_REGISTRY_FIELD_FOR_OBJECT = {
+    "entity": "entities",
+    "data_source": "data_sources",
+    "feature_view": "feature_views",
+    "stream_feature_view": "stream_feature_views",
+    "on_demand_feature_view": "on_demand_feature_views",
+    "feature_service": "feature_services",
+    "saved_dataset": "saved_datasets",
+    "validation_reference": "validation_references",
+}
+_FEATURE_VIEW_FIELDS = (
+    "feature_views",
+    "stream_feature_views",
+    "on_demand_feature_views",
+)
+# Registry fields whose objects have their name and project at the top level, rather than in a spec
+_UNNESTED_FIELDS = ("data_sources", "validation_references")
 
 
 class RemoteRegistryConfig(RegistryConfig):
@@ -31,6 +62,11 @@ class RemoteRegistryConfig(RegistryConfig):
     """ str: Path to metadata store.
     If registry_type is 'remote', then this is a URL for registry server """
 
+    watch: StrictBool = False
+    """ bool: Keep the local copy of the registry up to date with the changes streamed by the registry server,
+    instead of fetching it again every cache_ttl_seconds. The copy is still fetched again once it is
+    cache_ttl_seconds old without a change streamed, so it doesn't go stale while the stream is down. """
+
 
 class RemoteRegistry(BaseRegistry):
     def __init__(
@@ -42,12 +78,139 @@ class RemoteRegistry(BaseRegistry):
         self.channel = grpc.insecure_channel(registry_config.path)
         self.stub = RegistryServer_pb2_grpc.RegistryServerStub(self.channel)
 
+        # Local copy of the registry serving reads with allow_cache=True, with the same semantics as
+        # CachingRegistry. It is kept up to date by the WatchRegistry stream if watch is set, and fetched
+        # again with the Proto RPC once it is cache_ttl_seconds old, which for a watched copy only happens
+        # when no change was streamed in that time. The changes made by this
+        # client are applied to it as well, so it reads its own writes. It is replaced, never modified, so
+        # readers can use it without locking.
+        self._snapshot: Optional[RegistryProto] = None
+        self._snapshot_created: Optional[datetime] = None
+        # Set after a change that can't be applied to the local copy, which is then fetched again
+        self._snapshot_outdated = False
+        self._snapshot_ttl = timedelta(seconds=registry_config.cache_ttl_seconds or 0)
+        self._cache_mode = registry_config.cache_mode
+        self._refresh_lock = threading.Lock()
+        self._refresh_timer: Optional[threading.Timer] = None
+        self._watching = (
+            isinstance(registry_config, RemoteRegistryConfig) and registry_config.watch
+        )
+        self._stop_watching = threading.Event()
+        self._watch_call = None
+        if self._watching:
+            threading.Thread(
+                target=self._watch, name="feast-registry-watch", daemon=True
+            ).start()
+        elif self._cache_mode == "thread":
+            self._start_thread_async_refresh()
+
+    def _watch(self):
+        while not self._stop_watching.is_set():
+            version_id = self._snapshot.version_id if self._snapshot else ""
+            try:
+                self._watch_call = self.stub.WatchRegistry(
+                    RegistryServer_pb2.WatchRegistryRequest(version_id=version_id)
+                )
+                for response in self._watch_call:
+                    with self._refresh_lock:
+                        self._snapshot = _apply_watch_response(self._snapshot, response)
+                        self._snapshot_created = _utc_now()
+            except grpc.RpcError as e:
+                if self._stop_watching.is_set():
+                    return
+                logger.warning(f"Registry watch failed, reconnecting: {e}")
+            self._stop_watching.wait(WATCH_RETRY_INTERVAL_SECONDS)
+
+    def _start_thread_async_refresh(self):
+        try:
+            self._refresh_snapshot()
+        except grpc.RpcError as e:
+            logger.warning(f"Failed to refresh the registry cache: {e}")
+        if self._snapshot_ttl.total_seconds() <= 0:
+            return
+        self._refresh_timer = threading.Timer(
+            self._snapshot_ttl.total_seconds(), self._start_thread_async_refresh
+        )
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+
+    def _refresh_snapshot(self):
+        self._snapshot = self.stub.Proto(Empty())
+        self._snapshot_created = _utc_now()
+        self._snapshot_outdated = False
+
+    def _update_snapshot(self, delta: Optional[_Delta] = None):
+        """
+        Applies a change made by this client to the local copy of the registry. Without a delta, the change
+        can't be applied locally and the copy is fetched again on the next read with allow_cache.
+        """
+        with self._refresh_lock:
+            if self._snapshot is None:
+                return
+            if delta is None:
+                self._snapshot_outdated = True
+                self._snapshot_created = None
+                return
+            response = RegistryServer_pb2.WatchRegistryResponse(
+                # A version of its own, so results cached for the server's version aren't reused
+                version_id=f"{self._snapshot.version_id}+{uuid.uuid4().hex}",
+                deltas=[delta],
+            )
+            self._snapshot = _apply_watch_response(self._snapshot, response)
+
+    def close(self):
+        """Stops updating the local copy of the registry and closes the connection to the registry server."""
+        self._stop_watching.set()
+        if self._watch_call is not None:
+            self._watch_call.cancel()
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+        self.channel.close()
+
+    def _cached_snapshot(self, allow_cache: bool) -> Optional[RegistryProto]:
+        """
+        Returns the local copy of the registry that reads with allow_cache should be served from, or None if
+        they should be sent to the registry server.
+        """
+        if not allow_cache:
+            return None
+        if self._snapshot_outdated:
+            with self._refresh_lock:
+                if self._snapshot_outdated:
+                    self._refresh_snapshot()
+            return self._snapshot
+        if self._watching and self._snapshot_ttl.total_seconds() <= 0:
+            # Until the first copy arrives, reads go to the registry server
+            return self._snapshot
+        if not self._watching and self._cache_mode != "sync":
+            return self._snapshot
+        # A watched copy is still fetched again once it is older than the ttl, in case the stream is down or
+        # the server refused it
+        with self._refresh_lock:
+            created = self._snapshot_created
+            expired = self._snapshot is None or created is None
+            if created is not None and self._snapshot_ttl.total_seconds() > 0:
+                # 0 ttl means infinity
+                expired = expired or _utc_now() > created + self._snapshot_ttl
+            if expired:
+                logger.info("Registry cache expired, so refreshing")
+                self._refresh_snapshot()
+        return self._snapshot
+
     def apply_entity(self, entity: Entity, project: str, commit: bool = True):
         request = RegistryServer_pb2.ApplyEntityRequest(
             entity=entity.to_proto(), project=project, commit=commit
         )
 
         self.stub.ApplyEntity(request)
+        self._update_snapshot(
+            _Delta(
+                operation=_Delta.APPLY,
+                project=project,
+                name=entity.name,
+                entity=request.entity,
+            )
+        )
 
     def delete_entity(self, name: str, project: str, commit: bool = True):
         request = RegistryServer_pb2.DeleteEntityRequest(
@@ -55,8 +218,20 @@ class RemoteRegistry(BaseRegistry):
         )
 
         self.stub.DeleteEntity(request)
+        self._update_snapshot(
+            _Delta(
+                operation=_Delta.DELETE,
+                object_type="entities",
+                project=project,
+                name=name,
+            )
+        )
 
     def get_entity(self, name: str, project: str, allow_cache: bool = False) -> Entity:
+        snapshot = self._cached_snapshot(allow_cache)
+        if snapshot is not None:
+            return proto_registry_utils.get_entity(snapshot, name, project)
+
         request = RegistryServer_pb2.GetEntityRequest(
             name=name, project=project, allow_cache=allow_cache
         )
@@ -71,6 +246,10 @@ class RemoteRegistry(BaseRegistry):
         allow_cache: bool = False,
         tags: Optional[dict[str, str]] = None,
     ) -> List[Entity]:
+        snapshot = self._cached_snapshot(allow_cache)
+        if snapshot is not None:
+            return proto_registry_utils.list_entities(snapshot, project, tags)
+
         request = RegistryServer_pb2.ListEntitiesRequest(
             project=project, allow_cache=allow_cache, tags=tags
         )
@@ -87,6 +266,14 @@ class RemoteRegistry(BaseRegistry):
         )
 
         self.stub.ApplyDataSource(request)
+        self._update_snapshot(
+            _Delta(
+                operation=_Delta.APPLY,
+                project=project,
+                name=data_source.name,
+                data_source=request.data_source,
+            )
+        )
 
     def delete_data_source(self, name: str, project: str, commit: bool = True):
         request = RegistryServer_pb2.DeleteDataSourceRequest(
@@ -94,10 +281,22 @@ class RemoteRegistry(BaseRegistry):
         )
 
         self.stub.DeleteDataSource(request)
+        self._update_snapshot(
+            _Delta(
+                operation=_Delta.DELETE,
+                object_type="data_sources",
+                project=project,
+                name=name,
+            )
+        )
 
     def get_data_source(
         self, name: str, project: str, allow_cache: bool = False
     ) -> DataSource:
+        snapshot = self._cached_snapshot(allow_cache)
+        if snapshot is not None:
+            return proto_registry_utils.get_data_source(snapshot, name, project)
+
         request = RegistryServer_pb2.GetDataSourceRequest(
             name=name, project=project, allow_cache=allow_cache
         )
@@ -112,6 +311,10 @@ class RemoteRegistry(BaseRegistry):
         allow_cache: bool = False,
         tags: Optional[dict[str, str]] = None,
     ) -> List[DataSource]:
+        snapshot = self._cached_snapshot(allow_cache)
+        if snapshot is not None:
+            return proto_registry_utils.list_data_sources(snapshot, project, tags)
+
         request = RegistryServer_pb2.ListDataSourcesRequest(
             project=project, allow_cache=allow_cache, tags=tags
         )
@@ -130,6 +333,14 @@ class RemoteRegistry(BaseRegistry):
         )
 
         self.stub.ApplyFeatureService(request)
+        self._update_snapshot(
+            _Delta(
+                operation=_Delta.APPLY,
+                project=project,
+                name=feature_service.name,
+                feature_service=request.feature_service,
+            )
+        )
 
     def delete_feature_service(self, name: str, project: str, commit: bool = True):
         request = RegistryServer_pb2.DeleteFeatureServiceRequest(
@@ -137,10 +348,22 @@ class RemoteRegistry(BaseRegistry):
         )
 
         self.stub.DeleteFeatureService(request)
+        self._update_snapshot(
+            _Delta(
+                operation=_Delta.DELETE,
+                object_type="feature_services",
+                project=project,
+                name=name,
+            )
+        )
 
     def get_feature_service(
         self, name: str, project: str, allow_cache: bool = False
     ) -> FeatureService:
+        snapshot = self._cached_snapshot(allow_cache)
+        if snapshot is not None:
+            return proto_registry_utils.get_feature_service(snapshot, name, project)
+
         request = RegistryServer_pb2.GetFeatureServiceRequest(
             name=name, project=project, allow_cache=allow_cache
         )
@@ -155,6 +378,10 @@ class RemoteRegistry(BaseRegistry):
         allow_cache: bool = False,
         tags: Optional[dict[str, str]] = None,
     ) -> List[FeatureService]:
+        snapshot = self._cached_snapshot(allow_cache)
+        if snapshot is not None:
+            return proto_registry_utils.list_feature_services(snapshot, project, tags)
+
         request = RegistryServer_pb2.ListFeatureServicesRequest(
             project=project, allow_cache=allow_cache, tags=tags
         )
@@ -191,6 +418,14 @@ class RemoteRegistry(BaseRegistry):
         )
 
         self.stub.ApplyFeatureView(request)
+        self._update_snapshot(
+            _Delta(
+                operation=_Delta.APPLY,
+                project=project,
+                name=feature_view.name,
+                **{arg_name: getattr(request, arg_name)},
+            )
+        )
 
     def delete_feature_view(self, name: str, project: str, commit: bool = True):
         request = RegistryServer_pb2.DeleteFeatureViewRequest(
@@ -198,10 +433,22 @@ class RemoteRegistry(BaseRegistry):
         )
 
         self.stub.DeleteFeatureView(request)
+        self._update_snapshot(
+            _Delta(
+                operation=_Delta.DELETE,
+                object_type="feature_views",
+                project=project,
+                name=name,
+            )
+        )
 
     def get_stream_feature_view(
         self, name: str, project: str, allow_cache: bool = False
     ) -> StreamFeatureView:
+        snapshot = self._cached_snapshot(allow_cache)
+        if snapshot is not None:
+            return proto_registry_utils.get_stream_feature_view(snapshot, name, project)
+
         request = RegistryServer_pb2.GetStreamFeatureViewRequest(
             name=name, project=project, allow_cache=allow_cache
         )
@@ -216,6 +463,12 @@ class RemoteRegistry(BaseRegistry):
         allow_cache: bool = False,
         tags: Optional[dict[str, str]] = None,
     ) -> List[StreamFeatureView]:
+        snapshot = self._cached_snapshot(allow_cache)
+        if snapshot is not None:
+            return proto_registry_utils.list_stream_feature_views(
+                snapshot, project, tags
+            )
+
         request = RegistryServer_pb2.ListStreamFeatureViewsRequest(
             project=project, allow_cache=allow_cache, tags=tags
         )
@@ -230,6 +483,12 @@ class RemoteRegistry(BaseRegistry):
     def get_on_demand_feature_view(
         self, name: str, project: str, allow_cache: bool = False
     ) -> OnDemandFeatureView:
+        snapshot = self._cached_snapshot(allow_cache)
+        if snapshot is not None:
+            return proto_registry_utils.get_on_demand_feature_view(
+                snapshot, name, project
+            )
+
         request = RegistryServer_pb2.GetOnDemandFeatureViewRequest(
             name=name, project=project, allow_cache=allow_cache
         )
@@ -244,6 +503,12 @@ class RemoteRegistry(BaseRegistry):
         allow_cache: bool = False,
         tags: Optional[dict[str, str]] = None,
     ) -> List[OnDemandFeatureView]:
+        snapshot = self._cached_snapshot(allow_cache)
+        if snapshot is not None:
+            return proto_registry_utils.list_on_demand_feature_views(
+                snapshot, project, tags
+            )
+
         request = RegistryServer_pb2.ListOnDemandFeatureViewsRequest(
             project=project, allow_cache=allow_cache, tags=tags
         )
@@ -258,6 +523,10 @@ class RemoteRegistry(BaseRegistry):
     def get_feature_view(
         self, name: str, project: str, allow_cache: bool = False
     ) -> FeatureView:
+        snapshot = self._cached_snapshot(allow_cache)
+        if snapshot is not None:
+            return proto_registry_utils.get_feature_view(snapshot, name, project)
+
         request = RegistryServer_pb2.GetFeatureViewRequest(
             name=name, project=project, allow_cache=allow_cache
         )
@@ -272,6 +541,10 @@ class RemoteRegistry(BaseRegistry):
         allow_cache: bool = False,
         tags: Optional[dict[str, str]] = None,
     ) -> List[FeatureView]:
+        snapshot = self._cached_snapshot(allow_cache)
+        if snapshot is not None:
+            return proto_registry_utils.list_feature_views(snapshot, project, tags)
+
         request = RegistryServer_pb2.ListFeatureViewsRequest(
             project=project, allow_cache=allow_cache, tags=tags
         )
@@ -306,6 +579,7 @@ class RemoteRegistry(BaseRegistry):
         )
 
         self.stub.ApplyMaterialization(request)
+        self._update_snapshot()
 
     def apply_saved_dataset(
         self,
@@ -317,7 +591,15 @@ class RemoteRegistry(BaseRegistry):
             saved_dataset=saved_dataset.to_proto(), project=project, commit=commit
         )
 
-        self.stub.ApplyFeatureService(request)
+        self.stub.ApplySavedDataset(request)
+        self._update_snapshot(
+            _Delta(
+                operation=_Delta.APPLY,
+                project=project,
+                name=saved_dataset.name,
+                saved_dataset=request.saved_dataset,
+            )
+        )
 
     def delete_saved_dataset(self, name: str, project: str, commit: bool = True):
         request = RegistryServer_pb2.DeleteSavedDatasetRequest(
@@ -325,10 +607,22 @@ class RemoteRegistry(BaseRegistry):
         )
 
         self.stub.DeleteSavedDataset(request)
+        self._update_snapshot(
+            _Delta(
+                operation=_Delta.DELETE,
+                object_type="saved_datasets",
+                project=project,
+                name=name,
+            )
+        )
 
     def get_saved_dataset(
         self, name: str, project: str, allow_cache: bool = False
     ) -> SavedDataset:
+        snapshot = self._cached_snapshot(allow_cache)
+        if snapshot is not None:
+            return proto_registry_utils.get_saved_dataset(snapshot, name, project)
+
         request = RegistryServer_pb2.GetSavedDatasetRequest(
             name=name, project=project, allow_cache=allow_cache
         )
@@ -340,6 +634,10 @@ class RemoteRegistry(BaseRegistry):
     def list_saved_datasets(
         self, project: str, allow_cache: bool = False
     ) -> List[SavedDataset]:
+        snapshot = self._cached_snapshot(allow_cache)
+        if snapshot is not None:
+            return proto_registry_utils.list_saved_datasets(snapshot, project)
+
         request = RegistryServer_pb2.ListSavedDatasetsRequest(
             project=project, allow_cache=allow_cache
         )
@@ -364,6 +662,14 @@ class RemoteRegistry(BaseRegistry):
         )
 
         self.stub.ApplyValidationReference(request)
+        self._update_snapshot(
+            _Delta(
+                operation=_Delta.APPLY,
+                project=project,
+                name=validation_reference.name,
+                validation_reference=request.validation_reference,
+            )
+        )
 
     def delete_validation_reference(self, name: str, project: str, commit: bool = True):
         request = RegistryServer_pb2.DeleteValidationReferenceRequest(
@@ -371,10 +677,24 @@ class RemoteRegistry(BaseRegistry):
         )
 
         self.stub.DeleteValidationReference(request)
+        self._update_snapshot(
+            _Delta(
+                operation=_Delta.DELETE,
+                object_type="validation_references",
+                project=project,
+                name=name,
+            )
+        )
 
     def get_validation_reference(
         self, name: str, project: str, allow_cache: bool = False
     ) -> ValidationReference:
+        snapshot = self._cached_snapshot(allow_cache)
+        if snapshot is not None:
+            return proto_registry_utils.get_validation_reference(
+                snapshot, name, project
+            )
+
         request = RegistryServer_pb2.GetValidationReferenceRequest(
             name=name, project=project, allow_cache=allow_cache
         )
@@ -386,6 +706,10 @@ class RemoteRegistry(BaseRegistry):
     def list_validation_references(
         self, project: str, allow_cache: bool = False
     ) -> List[ValidationReference]:
+        snapshot = self._cached_snapshot(allow_cache)
+        if snapshot is not None:
+            return proto_registry_utils.list_validation_references(snapshot, project)
+
         request = RegistryServer_pb2.ListValidationReferencesRequest(
             project=project, allow_cache=allow_cache
         )
@@ -414,6 +738,7 @@ class RemoteRegistry(BaseRegistry):
         )
 
         self.stub.UpdateInfra(request)
+        self._update_snapshot()
 
     def get_infra(self, project: str, allow_cache: bool = False) -> Infra:
         request = RegistryServer_pb2.GetInfraRequest(
@@ -442,11 +767,71 @@ class RemoteRegistry(BaseRegistry):
 
     def commit(self):
         self.stub.Commit(Empty())
+        self._update_snapshot()
 
     def refresh(self, project: Optional[str] = None):
         request = RegistryServer_pb2.RefreshRequest(project=str(project))
 
         self.stub.Refresh(request)
+        if not self._watching:
+            with self._refresh_lock:
+                self._refresh_snapshot()
 
     def teardown(self):
         pass
+
+
+def _apply_watch_response(
+    snapshot: Optional[RegistryProto],
+    response: RegistryServer_pb2.WatchRegistryResponse,
+) -> Optional[RegistryProto]:
+    """Returns a copy of the snapshot with the registry or the changes sent by the server applied."""
+    new_snapshot = RegistryProto()
+    if response.HasField("registry"):
+        new_snapshot.CopyFrom(response.registry)
+    elif snapshot is None:
+        # Changes can't be applied until the server sent the whole registry
+        return None
+    else:
+        new_snapshot.CopyFrom(snapshot)
+        for delta in response.deltas:
+            _apply_delta(new_snapshot, delta)
+    # Also invalidates the results cached by proto_registry_utils for the previous version
+    new_snapshot.version_id = response.version_id
+    return new_snapshot
+
+
+def _apply_delta(
+    registry: RegistryProto, delta: RegistryServer_pb2.RegistryObjectDelta
+):
+    object_kind = delta.WhichOneof("object")
+    if delta.operation == _Delta.DELETE:
+        field = delta.object_type
+    else:
+        assert object_kind is not None
+        field = _REGISTRY_FIELD_FOR_OBJECT[object_kind]
+
+    # A feature view may have been applied with a different kind before
+    fields = _FEATURE_VIEW_FIELDS if field in _FEATURE_VIEW_FIELDS else (field,)
+    for registry_field in fields:
+        objects = getattr(registry, registry_field)
+        for i in reversed(range(len(objects))):
+            if _project_and_name(registry_field, objects[i]) == (
+                delta.project,
+                delta.name,
+            ):
+                del objects[i]
+
+    if object_kind is not None and delta.operation == _Delta.APPLY:
+        applied = getattr(registry, field).add()
+        applied.CopyFrom(getattr(delta, object_kind))
+        if field in _UNNESTED_FIELDS:
+            applied.project = delta.project
+        else:
+            applied.spec.project = delta.project
+
+
+def _project_and_name(registry_field: str, registry_object) -> Tuple[str, str]:
+    if registry_field in _UNNESTED_FIELDS:
+        return registry_object.project, registry_object.name
+    return registry_object.spec.project, registry_object.spec.name
@@ -2,9 +2,14 @@ import os
 import uuid
 from pathlib import Path
 from tempfile import TemporaryFile
+from typing import Optional
 from urllib.parse import urlparse
 
-from feast.errors import S3RegistryBucketForbiddenAccess, S3RegistryBucketNotExist
+from feast.errors import (
+    RegistryConflictException,
+    S3RegistryBucketForbiddenAccess,
+    S3RegistryBucketNotExist,
+)
 from feast.infra.registry.registry_store import RegistryStore
 from feast.protos.feast.core.Registry_pb2 import Registry as RegistryProto
 from feast.repo_config import RegistryConfig
@@ -29,9 +34,18 @@ class S3RegistryStore(RegistryStore):
         self.s3_client = boto3.resource(
             "s3", endpoint_url=os.environ.get("FEAST_S3_ENDPOINT_URL")
         )
+        # ETag of the registry object when it was last read or written
+        self._etag: Optional[str] = None
 
     def get_registry_proto(self):
-        file_obj = TemporaryFile()
+        registry_proto = self._read_registry(etag=None)
+        assert registry_proto is not None
+        return registry_proto
+
+    def get_registry_proto_if_changed(self) -> Optional[RegistryProto]:
+        return self._read_registry(etag=self._etag)
+
+    def _read_registry(self, etag: Optional[str]) -> Optional[RegistryProto]:
         registry_proto = RegistryProto()
         try:
             from botocore.exceptions import ClientError
@@ -39,42 +53,82 @@ class S3RegistryStore(RegistryStore):
             from feast.errors import FeastExtrasDependencyImportError
 
             raise FeastExtrasDependencyImportError("aws", str(e))
-        try:
-            bucket = self.s3_client.Bucket(self._bucket)
-            self.s3_client.meta.client.head_bucket(Bucket=bucket.name)
-        except ClientError as e:
-            # If a client error is thrown, then check that it was a 404 error.
-            # If it was a 404 error, then the bucket does not exist.
-            error_code = int(e.response["Error"]["Code"])
-            if error_code == 404:
-                raise S3RegistryBucketNotExist(self._bucket)
-            else:
-                raise S3RegistryBucketForbiddenAccess(self._bucket) from e
+        if etag is None:
+            try:
+                self.s3_client.meta.client.head_bucket(Bucket=self._bucket)
+            except ClientError as e:
+                # If a client error is thrown, then check that it was a 404 error.
+                # If it was a 404 error, then the bucket does not exist.
+                error_code = int(e.response["Error"]["Code"])
+                if error_code == 404:
+                    raise S3RegistryBucketNotExist(self._bucket)
+                else:
+                    raise S3RegistryBucketForbiddenAccess(self._bucket) from e
 
+        # S3 only sends the object back if its ETag no longer matches the one of the last read or write
+        conditions = {"IfNoneMatch": etag} if etag is not None else {}
         try:
-            obj = bucket.Object(self._key)
-            obj.download_fileobj(file_obj)
-            file_obj.seek(0)
-            registry_proto.ParseFromString(file_obj.read())
-            return registry_proto
+            response = self.s3_client.meta.client.get_object(
+                Bucket=self._bucket, Key=self._key, **conditions
+            )
         except ClientError as e:
+            if e.response["Error"]["Code"] == "304":
+                return None
             raise FileNotFoundError(
                 f"Error while trying to locate Registry at path {self._uri.geturl()}"
             ) from e
+        registry_proto.ParseFromString(response["Body"].read())
+        self._etag = response["ETag"]
+        return registry_proto
 
     def update_registry_proto(self, registry_proto: RegistryProto):
         self._write_registry(registry_proto)
 
+    def update_registry_proto_if_unchanged(
+        self, registry_proto: RegistryProto, version_id: str
+    ):
+        if not _supports_conditional_writes(self.s3_client.meta.client):
+            # Older botocore versions can not send If-Match on writes
+            super().update_registry_proto_if_unchanged(registry_proto, version_id)
+            return
+
+        from botocore.exceptions import ClientError
+
+        # S3 only writes the object if it still has the ETag of the last read, or does not exist if it was not read
+        conditions = (
+            {"IfMatch": self._etag} if self._etag is not None else {"IfNoneMatch": "*"}
+        )
+        try:
+            self._write_registry(registry_proto, **conditions)
+        except ClientError as e:
+            if e.response["Error"]["Code"] in (
+                "PreconditionFailed",
+                "ConditionalRequestConflict",
+            ):
+                raise RegistryConflictException() from e
+            raise
+
     def teardown(self):
+        self._etag = None
         self.s3_client.Object(self._bucket, self._key).delete()
 
-    def _write_registry(self, registry_proto: RegistryProto):
+    def _write_registry(self, registry_proto: RegistryProto, **conditions):
         registry_proto.version_id = str(uuid.uuid4())
         registry_proto.last_updated.FromDatetime(_utc_now())
         # we have already checked the bucket exists so no need to do it again
         file_obj = TemporaryFile()
         file_obj.write(registry_proto.SerializeToString())
         file_obj.seek(0)
-        self.s3_client.Bucket(self._bucket).put_object(
-            Body=file_obj, Key=self._key, **self._boto_extra_args
+        response = self.s3_client.meta.client.put_object(
+            Bucket=self._bucket,
+            Body=file_obj,
+            Key=self._key,
+            **self._boto_extra_args,
+            **conditions,
         )
+        self._etag = response["ETag"]
+
+
+def _supports_conditional_writes(client) -> bool:
+    put_object = client.meta.service_model.operation_model("PutObject")
+    return "IfMatch" in put_object.input_shape.members
@@ -167,6 +167,26 @@ feast_metadata = Table(
     Column("last_updated_timestamp", BigInteger, nullable=False),
 )
 
+# Table, proto column and registry proto field of each kind of registry object
+REGISTRY_OBJECT_TABLES = [
+    (entities, "entity_proto", "entities"),
+    (data_sources, "data_source_proto", "data_sources"),
+    (feature_views, "feature_view_proto", "feature_views"),
+    (stream_feature_views, "feature_view_proto", "stream_feature_views"),
+    (on_demand_feature_views, "feature_view_proto", "on_demand_feature_views"),
+    (feature_services, "feature_service_proto", "feature_services"),
+    (saved_datasets, "saved_dataset_proto", "saved_datasets"),
+    (validation_references, "validation_reference_proto", "validation_references"),
+]
+# Registry fields whose objects make up the projects of the registry, see _get_all_projects
+PROJECT_REGISTRY_FIELDS = [
+    "entities",
+    "data_sources",
+    "feature_views",
+    "on_demand_feature_views",
+    "stream_feature_views",
+]
+
 logger = logging.getLogger(__name__)
 
 CACHE_REFRESH_THRESHOLD_SECONDS = 300
@@ -694,34 +714,74 @@ class SqlRegistry(CachingRegistry):
 
     def proto(self) -> RegistryProto:
         r = RegistryProto()
+        # Every table is read once for all projects, and the stored protos are parsed straight into the
+        # registry proto, without going through Feast objects.
+        with self.engine.begin() as conn:
+            object_rows = {
+                registry_field: conn.execute(
+                    select(table.c.project_id, table.c[proto_column])
+                ).all()
+                for table, proto_column, registry_field in REGISTRY_OBJECT_TABLES
+            }
+            infra_rows = conn.execute(
+                select(managed_infra.c.project_id, managed_infra.c.infra_proto).where(
+                    managed_infra.c.infra_name == "infra_obj"
+                )
+            ).all()
+            metadata_rows = conn.execute(select(feast_metadata)).all()
+
+        projects = {
+            row.project_id
+            for registry_field in PROJECT_REGISTRY_FIELDS
+            for row in object_rows[registry_field]
+        }
+        for registry_field, rows in object_rows.items():
+            registry_proto_field = getattr(r, registry_field)
+            for project, serialized_proto in rows:
+                if project not in projects:
+                    continue
+                obj_proto = registry_proto_field.add()
+                obj_proto.MergeFromString(serialized_proto)
+                if "spec" in obj_proto.DESCRIPTOR.fields_by_name:
+                    obj_proto.spec.project = project
+                else:
+                    obj_proto.project = project
+
+        project_metadata: Dict[str, ProjectMetadata] = {}
         last_updated_timestamps = []
-        projects = self._get_all_projects()
-        for project in projects:
-            for lister, registry_proto_field in [
-                (self.list_entities, r.entities),
-                (self.list_feature_views, r.feature_views),
-                (self.list_data_sources, r.data_sources),
-                (self.list_on_demand_feature_views, r.on_demand_feature_views),
-                (self.list_stream_feature_views, r.stream_feature_views),
-                (self.list_feature_services, r.feature_services),
-                (self.list_saved_datasets, r.saved_datasets),
-                (self.list_validation_references, r.validation_references),
-                (self.list_project_metadata, r.project_metadata),
-            ]:
-                objs: List[Any] = lister(project)  # type: ignore
-                if objs:
-                    obj_protos = [obj.to_proto() for obj in objs]
-                    for obj_proto in obj_protos:
-                        if "spec" in obj_proto.DESCRIPTOR.fields_by_name:
-                            obj_proto.spec.project = project
-                        else:
-                            obj_proto.project = project
-                    registry_proto_field.extend(obj_protos)
-
-            # This is suuuper jank. Because of https://github.com/feast-dev/feast/issues/2783,
-            # the registry proto only has a single infra field, which we're currently setting as the "last" project.
-            r.infra.CopyFrom(self.get_infra(project).to_proto())
-            last_updated_timestamps.append(self._get_last_updated_metadata(project))
+        for row in metadata_rows:
+            project = row._mapping["project_id"]
+            if project not in projects:
+                continue
+            if project not in project_metadata:
+                project_metadata[project] = ProjectMetadata(project_name=project)
+            if row._mapping["metadata_key"] == FeastMetadataKeys.PROJECT_UUID.value:
+                project_metadata[project].project_uuid = row._mapping["metadata_value"]
+            if (
+                row._mapping["metadata_key"]
+                == FeastMetadataKeys.LAST_UPDATED_TIMESTAMP.value
+            ):
+                project_metadata[
+                    project
+                ].last_updated_timestamp = datetime.utcfromtimestamp(
+                    int(row._mapping["metadata_value"])
+                )
+                last_updated_timestamps.append(
+                    datetime.fromtimestamp(
+                        int(row._mapping["last_updated_timestamp"]), tz=timezone.utc
+                    )
+                )
+        r.project_metadata.extend(
+            metadata.to_proto() for metadata in project_metadata.values()
+        )
+
+        # This is suuuper jank. Because of https://github.com/feast-dev/feast/issues/2783,
+        # the registry proto only has a single infra field, which we're currently setting as the "last" project.
+        if projects:
+            infra_protos = {row.project_id: row.infra_proto for row in infra_rows}
+            last_project = max(projects)
+            if last_project in infra_protos:
+                r.infra.MergeFromString(infra_protos[last_project])
 
         if last_updated_timestamps:
             r.last_updated.FromDatetime(max(last_updated_timestamps))
@@ -1,9 +1,13 @@
 import ast
+import itertools
 import json
 import logging
+import math
+import threading
+import time
 import traceback
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Tuple, Union
 
 import pyarrow as pa
 import pyarrow.flight as fl
@@ -16,13 +20,42 @@ from feast.saved_dataset import SavedDatasetStorage
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of rows of logged features handed to the offline store at once, as the upload is streamed in
+LOGGED_FEATURES_MAX_ROWS = 100_000
+
+# Historical retrievals with more entity rows than this are split into several endpoints
+DEFAULT_ROWS_PER_ENDPOINT = 500_000
+DEFAULT_MAX_ENDPOINTS = 16
+# Jobs started to learn the schema of a flight are dropped if their endpoint is not fetched within this time
+STARTED_JOB_TIMEOUT_SECONDS = 300
+
 
 class OfflineServer(fl.FlightServerBase):
-    def __init__(self, store: FeatureStore, location: str, **kwargs):
+    def __init__(
+        self,
+        store: FeatureStore,
+        location: str,
+        rows_per_endpoint: int = DEFAULT_ROWS_PER_ENDPOINT,
+        max_endpoints: int = DEFAULT_MAX_ENDPOINTS,
+        **kwargs,
+    ):
         super(OfflineServer, self).__init__(location, **kwargs)
         self._location = location
         # A dictionary of configured flights, e.g. API calls received and not yet served
         self.flights: Dict[str, Any] = {}
+        # Number of endpoints of a partitioned flight that have not been served yet
+        self._pending_endpoints: Dict[Any, int] = {}
+        # Schema of the result of a flight, and the job started to learn it, which serves the first endpoint
+        # unless it times out first
+        self._flight_schemas: Dict[Any, pa.Schema] = {}
+        self._started_jobs: Dict[
+            Any, Tuple[float, pa.RecordBatch, Iterator[pa.RecordBatch]]
+        ] = {}
+        # Held while the schema of a flight is learnt, so that its query is only started once
+        self._schema_locks: Dict[Any, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.rows_per_endpoint = rows_per_endpoint
+        self.max_endpoints = max_endpoints
         self.store = store
         self.offline_store = get_offline_store_from_config(store.config.offline_store)
 
@@ -34,12 +67,72 @@ class OfflineServer(fl.FlightServerBase):
             tuple(descriptor.path or tuple()),
         )
 
-    def _make_flight_info(self, key: Any, descriptor: fl.FlightDescriptor):
-        endpoints = [fl.FlightEndpoint(repr(key), [self._location])]
-        # TODO calculate actual schema from the given features
+    def _make_flight_info(
+        self, key: Any, descriptor: fl.FlightDescriptor, run_queries: bool = True
+    ):
+        """
+        Describes a flight. Without run_queries, the schema of a flight is only announced if it is already known.
+        """
+        command = json.loads(key[1])
+        data = self.flights[key]
         schema = pa.schema([])
+        num_partitions = 1
+        total_records = -1
+        if command.get("api") == OfflineServer.get_historical_features.__name__:
+            # Each entity row yields exactly one output row, so entity rows can be served independently
+            total_records = data.num_rows
+            num_partitions = self._num_partitions(total_records)
+            if run_queries:
+                schema = self._get_flight_schema(key, num_partitions)
+            else:
+                with self._lock:
+                    schema = self._flight_schemas.get(key, schema)
+
+        endpoints = [
+            fl.FlightEndpoint(repr((key, partition, num_partitions)), [self._location])
+            for partition in range(num_partitions)
+        ]
+        return fl.FlightInfo(schema, descriptor, endpoints, total_records, -1)
 
-        return fl.FlightInfo(schema, descriptor, endpoints, -1, -1)
+    def _num_partitions(self, num_rows: int) -> int:
+        return max(
+            1, min(self.max_endpoints, math.ceil(num_rows / self.rows_per_endpoint))
+        )
+
+    def _get_flight_schema(self, key: Any, num_partitions: int) -> pa.Schema:
+        """
+        Returns the schema of the result of a flight, taken from the output of its first endpoint. The job is
+        kept running, so that do_get serves the first endpoint from it instead of running the query again, unless
+        the endpoint is not fetched within STARTED_JOB_TIMEOUT_SECONDS.
+        """
+        with self._lock:
+            self._expire_started_jobs()
+            schema_lock = self._schema_locks.setdefault(key, threading.Lock())
+        with schema_lock:
+            with self._lock:
+                if key in self._flight_schemas:
+                    return self._flight_schemas[key]
+            try:
+                first_batch, batches = self._start_job(key, 0, num_partitions)
+            except Exception:
+                self._release_flight(key)
+                raise
+            with self._lock:
+                # Unless the flight was released meanwhile, e.g. after another endpoint failed
+                if key in self.flights:
+                    self._started_jobs[key] = (time.monotonic(), first_batch, batches)
+                    self._flight_schemas[key] = first_batch.schema
+            return first_batch.schema
+
+    def _expire_started_jobs(self):
+        """Drops the started jobs whose endpoint was not fetched in time. Must be called holding the lock."""
+        expired_before = time.monotonic() - STARTED_JOB_TIMEOUT_SECONDS
+        for key, (started, _, _) in list(self._started_jobs.items()):
+            if started < expired_before:
+                logger.warning(
+                    f"Dropping the job started for flight {key}, which was not fetched in time"
+                )
+                del self._started_jobs[key]
 
     def get_flight_info(
         self, context: fl.ServerCallContext, descriptor: fl.FlightDescriptor
@@ -50,13 +143,14 @@ class OfflineServer(fl.FlightServerBase):
         raise KeyError("Flight not found.")
 
     def list_flights(self, context: fl.ServerCallContext, criteria: bytes):
-        for key, table in self.flights.items():
+        for key in list(self.flights):
             if key[1] is not None:
                 descriptor = fl.FlightDescriptor.for_command(key[1])
             else:
                 descriptor = fl.FlightDescriptor.for_path(*key[2])
 
-            yield self._make_flight_info(key, descriptor)
+            # Listing flights does not run their queries, so schemas not learnt yet are announced empty
+            yield self._make_flight_info(key, descriptor, run_queries=False)
 
     # Expects to receive request parameters and stores them in the flights dictionary
     # Indexed by the unique command
@@ -70,9 +164,14 @@ class OfflineServer(fl.FlightServerBase):
         key = OfflineServer.descriptor_to_key(descriptor)
         command = json.loads(key[1])
         if "api" in command:
-            data = reader.read_all()
-            logger.debug(f"do_put: command is{command}, data is {data}")
-            self.flights[key] = data
+            logger.debug(f"do_put: command is {command}")
+            if command["api"] == OfflineServer.write_logged_features.__name__:
+                # Logged features are only appended, so they are written chunk by chunk as the upload arrives
+                self.flights[key] = reader
+            else:
+                # Batch writes are handed to the offline store in a single call, so that a failed write never
+                # leaves part of them, and entity dataframes are needed whole to run the retrieval
+                self.flights[key] = reader.read_all()
 
             self._call_api(command["api"], command, key)
         else:
@@ -157,7 +256,7 @@ class OfflineServer(fl.FlightServerBase):
     # Extracts the API parameters from the flights dictionary, delegates the execution to the FeatureStore instance
     # and returns the stream of data
     def do_get(self, context: fl.ServerCallContext, ticket: fl.Ticket):
-        key = ast.literal_eval(ticket.ticket.decode())
+        key, partition, num_partitions = ast.literal_eval(ticket.ticket.decode())
         if key not in self.flights:
             logger.error(f"Unknown key {key}")
             return None
@@ -166,26 +265,63 @@ class OfflineServer(fl.FlightServerBase):
 
         self._validate_do_get_parameters(command)
 
-        api = command["api"]
         logger.debug(f"get command is {command}")
-        logger.debug(f"requested api is {api}")
         try:
-            if api == OfflineServer.get_historical_features.__name__:
-                table = self.get_historical_features(command, key).to_arrow()
-            elif api == OfflineServer.pull_all_from_table_or_query.__name__:
-                table = self.pull_all_from_table_or_query(command).to_arrow()
-            elif api == OfflineServer.pull_latest_from_table_or_query.__name__:
-                table = self.pull_latest_from_table_or_query(command).to_arrow()
+            with self._lock:
+                self._expire_started_jobs()
+                started_job = (
+                    self._started_jobs.pop(key, None) if partition == 0 else None
+                )
+            if started_job is not None:
+                _, first_batch, batches = started_job
             else:
-                raise NotImplementedError
+                first_batch, batches = self._start_job(key, partition, num_partitions)
         except Exception as e:
             logger.exception(e)
             traceback.print_exc()
+            # The flight can no longer be served completely, so none of its endpoints are kept
+            self._release_flight(key)
             raise e
 
+        with self._lock:
+            schema = self._flight_schemas.get(key, first_batch.schema)
+        self._release_endpoint(key, num_partitions)
+        return fl.GeneratorStream(schema, _stream_batches(schema, first_batch, batches))
+
+    def _start_job(
+        self, key: Any, partition: int, num_partitions: int
+    ) -> Tuple[pa.RecordBatch, Iterator[pa.RecordBatch]]:
+        command = json.loads(key[1])
+        api = command["api"]
+        logger.debug(f"requested api is {api}")
+        if api == OfflineServer.get_historical_features.__name__:
+            job = self.get_historical_features(command, key, partition, num_partitions)
+        elif api == OfflineServer.pull_all_from_table_or_query.__name__:
+            job = self.pull_all_from_table_or_query(command)
+        elif api == OfflineServer.pull_latest_from_table_or_query.__name__:
+            job = self.pull_latest_from_table_or_query(command)
+        else:
+            raise NotImplementedError
+        batches = job.to_arrow_batches()
+        # Pulling the first batch runs the query, so failures are still reported by do_get itself
+        return next(batches), batches
+
+    def _release_endpoint(self, key: Any, num_partitions: int):
+        with self._lock:
+            remaining = self._pending_endpoints.get(key, num_partitions) - 1
+            if remaining > 0:
+                self._pending_endpoints[key] = remaining
+                return
         # Get service is consumed, so we clear the corresponding flight and data
-        del self.flights[key]
-        return fl.RecordBatchStream(table)
+        self._release_flight(key)
+
+    def _release_flight(self, key: Any):
+        with self._lock:
+            self._pending_endpoints.pop(key, None)
+            self._flight_schemas.pop(key, None)
+            self._started_jobs.pop(key, None)
+            self._schema_locks.pop(key, None)
+            self.flights.pop(key, None)
 
     def _validate_offline_write_batch_parameters(self, command: dict):
         assert (
@@ -225,7 +361,6 @@ class OfflineServer(fl.FlightServerBase):
 
     def write_logged_features(self, command: dict, key: str):
         self._validate_write_logged_features_parameters(command)
-        table = self.flights[key]
         feature_service = self.store.get_feature_service(
             command["feature_service_name"]
         )
@@ -234,15 +369,15 @@ class OfflineServer(fl.FlightServerBase):
             feature_service.logging_config is not None
         ), "feature service must have logging_config set"
 
-        self.offline_store.write_logged_features(
-            config=self.store.config,
-            data=table,
-            source=FeatureServiceLoggingSource(
-                feature_service, self.store.config.project
-            ),
-            logging_config=feature_service.logging_config,
-            registry=self.store.registry,
-        )
+        source = FeatureServiceLoggingSource(feature_service, self.store.config.project)
+        for table in _iter_tables(self.flights[key], LOGGED_FEATURES_MAX_ROWS):
+            self.offline_store.write_logged_features(
+                config=self.store.config,
+                data=table,
+                source=source,
+                logging_config=feature_service.logging_config,
+                registry=self.store.registry,
+            )
 
     def _validate_pull_all_from_table_or_query_parameters(self, command: dict):
         assert (
@@ -324,11 +459,18 @@ class OfflineServer(fl.FlightServerBase):
         assert "project" in command, "project is mandatory"
         assert "full_feature_names" in command, "full_feature_names is mandatory"
 
-    def get_historical_features(self, command: dict, key: str):
+    def get_historical_features(
+        self, command: dict, key: str, partition: int = 0, num_partitions: int = 1
+    ):
         self._validate_get_historical_features_parameters(command, key)
 
         # Extract parameters from the internal flights dictionary
         entity_df_value = self.flights[key]
+        if num_partitions > 1:
+            offset, length = _partition_bounds(
+                entity_df_value.num_rows, partition, num_partitions
+            )
+            entity_df_value = entity_df_value.slice(offset, length)
         entity_df = pa.Table.to_pandas(entity_df_value)
 
         feature_view_names = command["feature_view_names"]
@@ -391,6 +533,57 @@ class OfflineServer(fl.FlightServerBase):
         pass
 
 
+def _stream_batches(
+    schema: pa.Schema, first_batch: pa.RecordBatch, batches: Iterator[pa.RecordBatch]
+) -> Iterator[pa.RecordBatch]:
+    """
+    Yields the batches of a retrieval job, aligned to the schema announced for its flight
+    """
+    try:
+        for batch in itertools.chain([first_batch], batches):
+            if not batch.schema.equals(schema):
+                # e.g. on demand transformations inferring a null type on an all-null batch
+                yield from pa.Table.from_batches([batch]).cast(schema).to_batches()
+            else:
+                yield batch
+    except Exception as e:
+        logger.exception(e)
+        raise e
+
+
+def _partition_bounds(
+    num_rows: int, partition: int, num_partitions: int
+) -> Tuple[int, int]:
+    """
+    Returns the offset and length of a contiguous range of rows, so partitions concatenate back in order
+    """
+    offset = partition * num_rows // num_partitions
+    return offset, (partition + 1) * num_rows // num_partitions - offset
+
+
+def _iter_tables(
+    data: Union[pa.Table, fl.MetadataRecordBatchReader], max_rows: int
+) -> Iterator[pa.Table]:
+    """
+    Groups the record batches of an upload into tables of at most max_rows rows (unless a single batch is larger)
+    """
+    if isinstance(data, pa.Table):
+        yield data
+        return
+
+    pending: List[pa.RecordBatch] = []
+    pending_rows = 0
+    for chunk in data:
+        batch = chunk.data
+        if pending and pending_rows + batch.num_rows > max_rows:
+            yield pa.Table.from_batches(pending)
+            pending, pending_rows = [], 0
+        pending.append(batch)
+        pending_rows += batch.num_rows
+    if pending:
+        yield pa.Table.from_batches(pending)
+
+
 def remove_dummies(fv: FeatureView) -> FeatureView:
     """
     Removes dummmy IDs from FeatureView instances created with FeatureView.from_proto
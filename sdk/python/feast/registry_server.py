@@ -1,5 +1,13 @@
+import functools
+import hashlib
+import logging
+import queue
+import threading
+import time
+import uuid
 from concurrent import futures
 from datetime import datetime
+from typing import List, Optional
 
 import grpc
 from google.protobuf.empty_pb2 import Empty
@@ -8,6 +16,7 @@ from pytz import utc
 from feast import FeatureStore
 from feast.data_source import DataSource
 from feast.entity import Entity
+from feast.errors import FeatureViewNotFoundException
 from feast.feature_service import FeatureService
 from feast.feature_view import FeatureView
 from feast.infra.infra_object import Infra
@@ -17,18 +26,208 @@ from feast.protos.feast.registry import RegistryServer_pb2, RegistryServer_pb2_g
 from feast.saved_dataset import SavedDataset, ValidationReference
 from feast.stream_feature_view import StreamFeatureView
 
+logger = logging.getLogger(__name__)
+
+# How often an idle WatchRegistry stream checks whether its client is still connected
+WATCH_POLL_INTERVAL_SECONDS = 1.0
+# Number of changes queued for a WatchRegistry stream before it is considered behind and sent the whole registry
+WATCH_QUEUE_SIZE = 1000
+# Number of WatchRegistry streams served at the same time. Each one holds a server thread while it is open, so
+# the server has this many threads on top of the ones serving the other RPCs.
+MAX_WATCH_STREAMS = 10
+# Threads serving the RPCs other than WatchRegistry
+MAX_WORKERS = 10
+# How often the registry is refreshed while it is watched, to stream the changes made by other writers
+REGISTRY_POLL_INTERVAL_SECONDS = 10.0
+
+# Queued for a watcher that fell behind, in place of the changes it missed
+_RESYNC = object()
+
+_Delta = RegistryServer_pb2.RegistryObjectDelta
+
+
+def _writes_registry(method):
+    """Serializes an RPC changing the registry with the other writes and the refreshes of the registry."""
+
+    @functools.wraps(method)
+    def wrapper(self, request, context):
+        with self._write_lock:
+            return method(self, request, context)
+
+    return wrapper
+
 
 class RegistryServer(RegistryServer_pb2_grpc.RegistryServerServicer):
-    def __init__(self, registry: BaseRegistry) -> None:
+    def __init__(
+        self,
+        registry: BaseRegistry,
+        max_watch_streams: int = MAX_WATCH_STREAMS,
+        poll_interval_seconds: float = REGISTRY_POLL_INTERVAL_SECONDS,
+    ) -> None:
         super().__init__()
         self.proxied_registry = registry
+        self.max_watch_streams = max_watch_streams
+        self.poll_interval_seconds = poll_interval_seconds
+        # Registry versions streamed to watchers are "<server id>:<number of changes>", so that a client
+        # reconnecting to a restarted server gets the whole registry again.
+        self._server_id = uuid.uuid4().hex
+        self._changes = 0
+        self._watchers: List[queue.Queue] = []
+        self._watch_lock = threading.Lock()
+        self._poller: Optional[threading.Thread] = None
+        # Watchers are only sent committed changes: the ones made with commit=False wait here for a Commit
+        self._uncommitted: List[RegistryServer_pb2.RegistryObjectDelta] = []
+        self._write_lock = threading.RLock()
+        # Version of the registry once the changes streamed so far were made, to detect the changes made by
+        # other writers
+        self._streamed_registry_version: Optional[str] = None
+
+    def _version_id(self) -> str:
+        return f"{self._server_id}:{self._changes}"
+
+    def _publish(self, request, *deltas: RegistryServer_pb2.RegistryObjectDelta):
+        """Sends the changes made by an RPC to every WatchRegistry stream, once they are committed."""
+        self._uncommitted.extend(deltas)
+        if request.commit:
+            self._publish_committed()
+
+    def _publish_committed(self):
+        deltas, self._uncommitted = self._uncommitted, []
+        self._update_streamed_registry_version()
+        if not deltas:
+            return
+        with self._watch_lock:
+            self._changes += 1
+            response = RegistryServer_pb2.WatchRegistryResponse(
+                version_id=self._version_id(), deltas=deltas
+            )
+            for watcher in self._watchers:
+                try:
+                    watcher.put_nowait(response)
+                except queue.Full:
+                    # The client does not keep up: its pending changes are dropped, and it is sent the
+                    # whole registry instead, which bounds the memory held for it
+                    _resync(watcher)
+
+    def _publish_registry(self):
+        """Sends the whole registry to every WatchRegistry stream, after changes that aren't known one by one."""
+        self._uncommitted = []
+        self._update_streamed_registry_version()
+        with self._watch_lock:
+            self._changes += 1
+            for watcher in self._watchers:
+                _resync(watcher)
+
+    def _publish_if_changed(self):
+        # Changes are only tracked while the registry is watched
+        if (
+            self._poller is not None
+            and self._registry_version() != self._streamed_registry_version
+        ):
+            self._publish_registry()
+
+    def _update_streamed_registry_version(self):
+        if self._poller is not None:
+            self._streamed_registry_version = self._registry_version()
+
+    def _publish_delete(self, object_type: str, request):
+        self._publish(
+            request,
+            _Delta(
+                operation=_Delta.DELETE,
+                project=request.project,
+                name=request.name,
+                object_type=object_type,
+            ),
+        )
+
+    def _registry_version(self) -> str:
+        registry_proto = self.proxied_registry.proto()
+        return (
+            registry_proto.version_id
+            or hashlib.sha256(
+                registry_proto.SerializeToString(deterministic=True)
+            ).hexdigest()
+        )
+
+    def _poll_registry(self):
+        """Refreshes the registry while it is watched, and streams it again if another writer changed it."""
+        with self._write_lock:
+            self._streamed_registry_version = self._registry_version()
+        while True:
+            time.sleep(self.poll_interval_seconds)
+            with self._watch_lock:
+                if not self._watchers:
+                    self._poller = None
+                    return
+            with self._write_lock:
+                if self._uncommitted:
+                    # Refreshing would drop the changes waiting for a Commit
+                    continue
+                try:
+                    self.proxied_registry.refresh()
+                except Exception as e:
+                    logger.warning(f"Failed to refresh the watched registry: {e}")
+                    continue
+                self._publish_if_changed()
+
+    def WatchRegistry(self, request: RegistryServer_pb2.WatchRegistryRequest, context):
+        watcher: queue.Queue = queue.Queue(maxsize=WATCH_QUEUE_SIZE)
+        with self._watch_lock:
+            if len(self._watchers) >= self.max_watch_streams:
+                # The client keeps reading the registry with its cache ttl, and retries later
+                context.abort(
+                    grpc.StatusCode.RESOURCE_EXHAUSTED,
+                    f"The registry server already serves {self.max_watch_streams} WatchRegistry streams",
+                )
+            self._watchers.append(watcher)
+            version_id = self._version_id()
+            if self._poller is None and self.poll_interval_seconds > 0:
+                self._poller = threading.Thread(
+                    target=self._poll_registry,
+                    name="feast-registry-poll",
+                    daemon=True,
+                )
+                self._poller.start()
+        try:
+            # Changes published while the registry is being read are streamed again afterwards. That is
+            # harmless, since applying a delta twice gives the same result.
+            if request.version_id != version_id:
+                yield self._registry_response(version_id)
+            while context.is_active():
+                try:
+                    response = watcher.get(timeout=WATCH_POLL_INTERVAL_SECONDS)
+                except queue.Empty:
+                    continue
+                if response is _RESYNC:
+                    with self._watch_lock:
+                        version_id = self._version_id()
+                    yield self._registry_response(version_id)
+                else:
+                    yield response
+        finally:
+            with self._watch_lock:
+                self._watchers.remove(watcher)
+
+    def _registry_response(
+        self, version_id: str
+    ) -> RegistryServer_pb2.WatchRegistryResponse:
+        return RegistryServer_pb2.WatchRegistryResponse(
+            version_id=version_id, registry=self.proxied_registry.proto()
+        )
 
+    @_writes_registry
     def ApplyEntity(self, request: RegistryServer_pb2.ApplyEntityRequest, context):
+        entity = Entity.from_proto(request.entity)
         self.proxied_registry.apply_entity(
-            entity=Entity.from_proto(request.entity),
+            entity=entity,
             project=request.project,
             commit=request.commit,
         )
+        self._publish(
+            request,
+            _Delta(project=request.project, name=entity.name, entity=entity.to_proto()),
+        )
         return Empty()
 
     def GetEntity(self, request: RegistryServer_pb2.GetEntityRequest, context):
@@ -48,20 +247,32 @@ class RegistryServer(RegistryServer_pb2_grpc.RegistryServerServicer):
             ]
         )
 
+    @_writes_registry
     def DeleteEntity(self, request: RegistryServer_pb2.DeleteEntityRequest, context):
         self.proxied_registry.delete_entity(
             name=request.name, project=request.project, commit=request.commit
         )
+        self._publish_delete("entities", request)
         return Empty()
 
+    @_writes_registry
     def ApplyDataSource(
         self, request: RegistryServer_pb2.ApplyDataSourceRequest, context
     ):
+        data_source = DataSource.from_proto(request.data_source)
         self.proxied_registry.apply_data_source(
-            data_source=DataSource.from_proto(request.data_source),
+            data_source=data_source,
             project=request.project,
             commit=request.commit,
         )
+        self._publish(
+            request,
+            _Delta(
+                project=request.project,
+                name=data_source.name,
+                data_source=data_source.to_proto(),
+            ),
+        )
         return Empty()
 
     def GetDataSource(self, request: RegistryServer_pb2.GetDataSourceRequest, context):
@@ -83,12 +294,14 @@ class RegistryServer(RegistryServer_pb2_grpc.RegistryServerServicer):
             ]
         )
 
+    @_writes_registry
     def DeleteDataSource(
         self, request: RegistryServer_pb2.DeleteDataSourceRequest, context
     ):
         self.proxied_registry.delete_data_source(
             name=request.name, project=request.project, commit=request.commit
         )
+        self._publish_delete("data_sources", request)
         return Empty()
 
     def GetFeatureView(
@@ -98,10 +311,12 @@ class RegistryServer(RegistryServer_pb2_grpc.RegistryServerServicer):
             name=request.name, project=request.project, allow_cache=request.allow_cache
         ).to_proto()
 
+    @_writes_registry
     def ApplyFeatureView(
         self, request: RegistryServer_pb2.ApplyFeatureViewRequest, context
     ):
         feature_view_type = request.WhichOneof("base_feature_view")
+        assert feature_view_type is not None
         if feature_view_type == "feature_view":
             feature_view = FeatureView.from_proto(request.feature_view)
         elif feature_view_type == "on_demand_feature_view":
@@ -114,6 +329,9 @@ class RegistryServer(RegistryServer_pb2_grpc.RegistryServerServicer):
         self.proxied_registry.apply_feature_view(
             feature_view=feature_view, project=request.project, commit=request.commit
         )
+        delta = _Delta(project=request.project, name=feature_view.name)
+        getattr(delta, feature_view_type).CopyFrom(feature_view.to_proto())
+        self._publish(request, delta)
         return Empty()
 
     def ListFeatureViews(
@@ -130,12 +348,14 @@ class RegistryServer(RegistryServer_pb2_grpc.RegistryServerServicer):
             ]
         )
 
+    @_writes_registry
     def DeleteFeatureView(
         self, request: RegistryServer_pb2.DeleteFeatureViewRequest, context
     ):
         self.proxied_registry.delete_feature_view(
             name=request.name, project=request.project, commit=request.commit
         )
+        self._publish_delete("feature_views", request)
         return Empty()
 
     def GetStreamFeatureView(
@@ -180,14 +400,24 @@ class RegistryServer(RegistryServer_pb2_grpc.RegistryServerServicer):
             ]
         )
 
+    @_writes_registry
     def ApplyFeatureService(
         self, request: RegistryServer_pb2.ApplyFeatureServiceRequest, context
     ):
+        feature_service = FeatureService.from_proto(request.feature_service)
         self.proxied_registry.apply_feature_service(
-            feature_service=FeatureService.from_proto(request.feature_service),
+            feature_service=feature_service,
             project=request.project,
             commit=request.commit,
         )
+        self._publish(
+            request,
+            _Delta(
+                project=request.project,
+                name=feature_service.name,
+                feature_service=feature_service.to_proto(),
+            ),
+        )
         return Empty()
 
     def GetFeatureService(
@@ -211,22 +441,34 @@ class RegistryServer(RegistryServer_pb2_grpc.RegistryServerServicer):
             ]
         )
 
+    @_writes_registry
     def DeleteFeatureService(
         self, request: RegistryServer_pb2.DeleteFeatureServiceRequest, context
     ):
         self.proxied_registry.delete_feature_service(
             name=request.name, project=request.project, commit=request.commit
         )
+        self._publish_delete("feature_services", request)
         return Empty()
 
+    @_writes_registry
     def ApplySavedDataset(
         self, request: RegistryServer_pb2.ApplySavedDatasetRequest, context
     ):
+        saved_dataset = SavedDataset.from_proto(request.saved_dataset)
         self.proxied_registry.apply_saved_dataset(
-            saved_dataset=SavedDataset.from_proto(request.saved_dataset),
+            saved_dataset=saved_dataset,
             project=request.project,
             commit=request.commit,
         )
+        self._publish(
+            request,
+            _Delta(
+                project=request.project,
+                name=saved_dataset.name,
+                saved_dataset=saved_dataset.to_proto(),
+            ),
+        )
         return Empty()
 
     def GetSavedDataset(
@@ -248,24 +490,36 @@ class RegistryServer(RegistryServer_pb2_grpc.RegistryServerServicer):
             ]
         )
 
+    @_writes_registry
     def DeleteSavedDataset(
         self, request: RegistryServer_pb2.DeleteSavedDatasetRequest, context
     ):
         self.proxied_registry.delete_saved_dataset(
             name=request.name, project=request.project, commit=request.commit
         )
+        self._publish_delete("saved_datasets", request)
         return Empty()
 
+    @_writes_registry
     def ApplyValidationReference(
         self, request: RegistryServer_pb2.ApplyValidationReferenceRequest, context
     ):
+        validation_reference = ValidationReference.from_proto(
+            request.validation_reference
+        )
         self.proxied_registry.apply_validation_reference(
-            validation_reference=ValidationReference.from_proto(
-                request.validation_reference
-            ),
+            validation_reference=validation_reference,
             project=request.project,
             commit=request.commit,
         )
+        self._publish(
+            request,
+            _Delta(
+                project=request.project,
+                name=validation_reference.name,
+                validation_reference=validation_reference.to_proto(),
+            ),
+        )
         return Empty()
 
     def GetValidationReference(
@@ -287,12 +541,14 @@ class RegistryServer(RegistryServer_pb2_grpc.RegistryServerServicer):
             ]
         )
 
+    @_writes_registry
     def DeleteValidationReference(
         self, request: RegistryServer_pb2.DeleteValidationReferenceRequest, context
     ):
         self.proxied_registry.delete_validation_reference(
             name=request.name, project=request.project, commit=request.commit
         )
+        self._publish_delete("validation_references", request)
         return Empty()
 
     def ListProjectMetadata(
@@ -307,6 +563,7 @@ class RegistryServer(RegistryServer_pb2_grpc.RegistryServerServicer):
             ]
         )
 
+    @_writes_registry
     def ApplyMaterialization(
         self, request: RegistryServer_pb2.ApplyMaterializationRequest, context
     ):
@@ -321,14 +578,35 @@ class RegistryServer(RegistryServer_pb2_grpc.RegistryServerServicer):
             ),
             commit=request.commit,
         )
+        # Read back the feature view, which now holds the new materialization interval. Stream feature views
+        # are sent as plain feature views in the request, so their kind is only known from the registry.
+        name = request.feature_view.spec.name
+        allow_cache = not request.commit
+        feature_view: FeatureView
+        try:
+            feature_view = self.proxied_registry.get_feature_view(
+                name=name, project=request.project, allow_cache=allow_cache
+            )
+            feature_view_type = "feature_view"
+        except FeatureViewNotFoundException:
+            feature_view = self.proxied_registry.get_stream_feature_view(
+                name=name, project=request.project, allow_cache=allow_cache
+            )
+            feature_view_type = "stream_feature_view"
+        delta = _Delta(project=request.project, name=feature_view.name)
+        getattr(delta, feature_view_type).CopyFrom(feature_view.to_proto())
+        self._publish(request, delta)
         return Empty()
 
+    @_writes_registry
     def UpdateInfra(self, request: RegistryServer_pb2.UpdateInfraRequest, context):
         self.proxied_registry.update_infra(
             infra=Infra.from_proto(request.infra),
             project=request.project,
             commit=request.commit,
         )
+        # The infra isn't streamed, but committing it commits the changes made before
+        self._publish(request)
         return Empty()
 
     def GetInfra(self, request: RegistryServer_pb2.GetInfraRequest, context):
@@ -336,20 +614,35 @@ class RegistryServer(RegistryServer_pb2_grpc.RegistryServerServicer):
             project=request.project, allow_cache=request.allow_cache
         ).to_proto()
 
+    @_writes_registry
     def Commit(self, request, context):
         self.proxied_registry.commit()
+        self._publish_committed()
         return Empty()
 
+    @_writes_registry
     def Refresh(self, request, context):
         self.proxied_registry.refresh(request.project)
+        # Uncommitted changes were dropped, and other writers' changes may have been loaded
+        self._uncommitted = []
+        self._publish_if_changed()
         return Empty()
 
     def Proto(self, request, context):
         return self.proxied_registry.proto()
 
 
+def _resync(watcher: queue.Queue):
+    """Replaces the changes queued for a watcher with a request to send it the whole registry."""
+    while not watcher.empty():
+        watcher.get_nowait()
+    watcher.put_nowait(_RESYNC)
+
+
 def start_server(store: FeatureStore, port: int):
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=MAX_WORKERS + MAX_WATCH_STREAMS)
+    )
     RegistryServer_pb2_grpc.add_RegistryServerServicer_to_server(
         RegistryServer(store.registry), server
     )
@@ -9,6 +9,7 @@ from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
+    StrictBool,
     StrictInt,
     StrictStr,
     ValidationError,
@@ -150,6 +151,48 @@ class RegistryConfig(FeastBaseModel):
         return path
 
 
+class SchemaInferenceConfig(FeastConfigBaseModel):
+    """Configuration of the lookups of data source schemas made to infer timestamp fields, features and entities."""
+
+    max_workers: StrictInt = 8
+    """ int: Number of data source schemas looked up at the same time. """
+
+    cache_ttl_seconds: StrictInt = 0
+    """ int: How long looked up schemas are cached on disk and reused by later `feast apply` or `feast plan` runs.
+    0 disables the cache, so that every run sees the latest columns of its sources. """
+
+    cache_path: StrictStr = "data/schema_cache.json"
+    """ str: Path of the schema cache, relative to the repo path if it is not absolute. """
+
+
+class MaterializationConfig(FeastConfigBaseModel):
+    """Configuration of how materialization splits its work."""
+
+    shard_interval_seconds: StrictInt = 0
+    """ int: Length of the time range materialized by each task. Each shard is recorded once materialized, so that a
+    failed materialization resumes after the last shard it completed. 0 materializes the whole range in one task. """
+
+    checkpoint_path: StrictStr = "data/materialization_checkpoints.json"
+    """ str: Path of the completed shards, relative to the repo path if it is not absolute. """
+
+    skip_unchanged_sources: StrictBool = False
+    """ bool: Whether to first ask the offline store for the event timestamps of the rows in the materialized range,
+    skip feature views whose batch source has no rows in it, and narrow the range to the rows found. Only offline
+    stores that can answer cheaply, e.g. from Parquet metadata, support this; others materialize as usual. """
+
+    online_write_diff: StrictBool = False
+    """ bool: Whether to only write the rows whose feature values changed since they were last materialized, by
+    comparing a hash of the values of each entity. The event timestamps of unchanged rows are not updated in the
+    online store. The hashes are only valid as long as materialization with this option is the only way the
+    feature views are written to, so delete the hashes file after writing them otherwise. Hashes are kept per
+    online store configuration. Online stores that expire keys, e.g. Redis with key_ttl_seconds, are not supported,
+    and neither are tables with an expiry configured outside of Feast, e.g. a DynamoDB TTL. Only supported by the
+    local batch engine. """
+
+    online_write_hashes_path: StrictStr = "data/online_write_hashes.db"
+    """ str: Path of the hashes of the written values, relative to the repo path if it is not absolute. """
+
+
 class RepoConfig(FeastBaseModel):
     """Repo config. Typically loaded from `feature_store.yaml`"""
 
@@ -203,6 +246,12 @@ class RepoConfig(FeastBaseModel):
     coerce_tz_aware: Optional[bool] = True
     """ If True, coerces entity_df timestamp columns to be timezone aware (to UTC by default). """
 
+    schema_inference: SchemaInferenceConfig = SchemaInferenceConfig()
+    """ SchemaInferenceConfig: How data source schemas are looked up during inference. """
+
+    materialization: MaterializationConfig = MaterializationConfig()
+    """ MaterializationConfig: How materialization is split into tasks. """
+
     def __init__(self, **data: Any):
         super().__init__(**data)
 
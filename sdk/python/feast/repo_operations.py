@@ -1,4 +1,6 @@
+import ast
 import base64
+import hashlib
 import importlib
 import json
 import os
@@ -9,7 +11,8 @@ import tempfile
 from importlib.abc import Loader
 from importlib.machinery import ModuleSpec
 from pathlib import Path
-from typing import List, Optional, Set, Union
+from types import ModuleType
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Union
 
 import click
 from click.exceptions import BadParameter
@@ -24,6 +27,7 @@ from feast.feature_service import FeatureService
 from feast.feature_store import FeatureStore
 from feast.feature_view import DUMMY_ENTITY, FeatureView
 from feast.file_utils import replace_str_in_file
+from feast.infra.registry.base_registry import BaseRegistry
 from feast.infra.registry.registry import FEAST_OBJECT_TYPES, FeastObjectType, Registry
 from feast.names import adjectives, animals
 from feast.on_demand_feature_view import OnDemandFeatureView
@@ -31,6 +35,9 @@ from feast.repo_config import RepoConfig
 from feast.repo_contents import RepoContents
 from feast.stream_feature_view import StreamFeatureView
 
+# Path of the cache used by `--changed-only` plans and applies, relative to the repo root
+REPO_PARSE_CACHE_PATH = "data/repo_parse_cache.json"
+
 
 def py_path_to_module(path: Path) -> str:
     return (
@@ -113,7 +120,19 @@ def parse_repo(repo_root: Path) -> RepoContents:
     (bar == foo), but not if (bar is foo). This ensures that import statements will
     not result in duplicates, but defining two equal objects will.
     """
-    res = RepoContents(
+    res = _empty_repo_contents()
+
+    for repo_file in get_repo_files(repo_root):
+        module_path = py_path_to_module(repo_file)
+        module = importlib.import_module(module_path)
+        _add_module_objects(res, module)
+
+    res.entities.append(DUMMY_ENTITY)
+    return res
+
+
+def _empty_repo_contents() -> RepoContents:
+    return RepoContents(
         data_sources=[],
         entities=[],
         feature_views=[],
@@ -122,97 +141,381 @@ def parse_repo(repo_root: Path) -> RepoContents:
         stream_feature_views=[],
     )
 
-    for repo_file in get_repo_files(repo_root):
-        module_path = py_path_to_module(repo_file)
-        module = importlib.import_module(module_path)
 
-        for attr_name in dir(module):
-            obj = getattr(module, attr_name)
+def _add_module_objects(res: RepoContents, module: ModuleType):
+    """Adds the Feast objects found in the given module to the repo contents, unless they were already added."""
+    for attr_name in dir(module):
+        obj = getattr(module, attr_name)
 
-            if isinstance(obj, DataSource) and not any(
-                (obj is ds) for ds in res.data_sources
-            ):
-                res.data_sources.append(obj)
-
-                # Handle batch sources defined within stream sources.
-                if (
-                    isinstance(obj, PushSource)
-                    or isinstance(obj, KafkaSource)
-                    or isinstance(obj, KinesisSource)
-                ):
-                    batch_source = obj.batch_source
+        if isinstance(obj, DataSource) and not any(
+            (obj is ds) for ds in res.data_sources
+        ):
+            res.data_sources.append(obj)
 
-                    if batch_source and not any(
-                        (batch_source is ds) for ds in res.data_sources
-                    ):
-                        res.data_sources.append(batch_source)
+            # Handle batch sources defined within stream sources.
             if (
-                isinstance(obj, FeatureView)
-                and not any((obj is fv) for fv in res.feature_views)
-                and not isinstance(obj, StreamFeatureView)
-                and not isinstance(obj, BatchFeatureView)
+                isinstance(obj, PushSource)
+                or isinstance(obj, KafkaSource)
+                or isinstance(obj, KinesisSource)
             ):
-                res.feature_views.append(obj)
-
-                # Handle batch sources defined with feature views.
                 batch_source = obj.batch_source
-                assert batch_source
-                if not any((batch_source is ds) for ds in res.data_sources):
-                    res.data_sources.append(batch_source)
-
-                # Handle stream sources defined with feature views.
-                if obj.stream_source:
-                    stream_source = obj.stream_source
-                    if not any((stream_source is ds) for ds in res.data_sources):
-                        res.data_sources.append(stream_source)
-            elif isinstance(obj, StreamFeatureView) and not any(
-                (obj is sfv) for sfv in res.stream_feature_views
-            ):
-                res.stream_feature_views.append(obj)
 
-                # Handle batch sources defined with feature views.
-                batch_source = obj.batch_source
-                if not any((batch_source is ds) for ds in res.data_sources):
+                if batch_source and not any(
+                    (batch_source is ds) for ds in res.data_sources
+                ):
                     res.data_sources.append(batch_source)
-
-                # Handle stream sources defined with feature views.
-                assert obj.stream_source
+        if (
+            isinstance(obj, FeatureView)
+            and not any((obj is fv) for fv in res.feature_views)
+            and not isinstance(obj, StreamFeatureView)
+            and not isinstance(obj, BatchFeatureView)
+        ):
+            res.feature_views.append(obj)
+
+            # Handle batch sources defined with feature views.
+            batch_source = obj.batch_source
+            assert batch_source
+            if not any((batch_source is ds) for ds in res.data_sources):
+                res.data_sources.append(batch_source)
+
+            # Handle stream sources defined with feature views.
+            if obj.stream_source:
                 stream_source = obj.stream_source
                 if not any((stream_source is ds) for ds in res.data_sources):
                     res.data_sources.append(stream_source)
-            elif isinstance(obj, BatchFeatureView) and not any(
-                (obj is bfv) for bfv in res.feature_views
-            ):
-                res.feature_views.append(obj)
+        elif isinstance(obj, StreamFeatureView) and not any(
+            (obj is sfv) for sfv in res.stream_feature_views
+        ):
+            res.stream_feature_views.append(obj)
+
+            # Handle batch sources defined with feature views.
+            batch_source = obj.batch_source
+            if not any((batch_source is ds) for ds in res.data_sources):
+                res.data_sources.append(batch_source)
+
+            # Handle stream sources defined with feature views.
+            assert obj.stream_source
+            stream_source = obj.stream_source
+            if not any((stream_source is ds) for ds in res.data_sources):
+                res.data_sources.append(stream_source)
+        elif isinstance(obj, BatchFeatureView) and not any(
+            (obj is bfv) for bfv in res.feature_views
+        ):
+            res.feature_views.append(obj)
+
+            # Handle batch sources defined with feature views.
+            batch_source = obj.batch_source
+            if not any((batch_source is ds) for ds in res.data_sources):
+                res.data_sources.append(batch_source)
+        elif isinstance(obj, Entity) and not any(
+            (obj is entity) for entity in res.entities
+        ):
+            res.entities.append(obj)
+        elif isinstance(obj, FeatureService) and not any(
+            (obj is fs) for fs in res.feature_services
+        ):
+            res.feature_services.append(obj)
+        elif isinstance(obj, OnDemandFeatureView) and not any(
+            (obj is odfv) for odfv in res.on_demand_feature_views
+        ):
+            res.on_demand_feature_views.append(obj)
+
+
+class RepoChanges(NamedTuple):
+    """
+    The changes made to a feature repo since its parse cache was last saved.
 
-                # Handle batch sources defined with feature views.
-                batch_source = obj.batch_source
-                if not any((batch_source is ds) for ds in res.data_sources):
-                    res.data_sources.append(batch_source)
-            elif isinstance(obj, Entity) and not any(
-                (obj is entity) for entity in res.entities
-            ):
-                res.entities.append(obj)
-            elif isinstance(obj, FeatureService) and not any(
-                (obj is fs) for fs in res.feature_services
-            ):
-                res.feature_services.append(obj)
-            elif isinstance(obj, OnDemandFeatureView) and not any(
-                (obj is odfv) for odfv in res.on_demand_feature_views
-            ):
-                res.on_demand_feature_views.append(obj)
+    Attributes:
+        contents: The objects defined by the repo files that changed.
+        deleted: The names of the objects, by type, whose definitions were removed.
+        files: The parse cache entries of all repo files, to be saved once the changes are applied.
+    """
+
+    contents: RepoContents
+    deleted: Dict[FeastObjectType, Set[str]]
+    files: Dict[str, Dict[str, Any]]
+
+
+def parse_repo_changes(repo_root: Path, repo_config: RepoConfig) -> RepoChanges:
+    """
+    Collects the Feast object definitions of the repo files that changed since the parse cache was last saved.
+
+    The parse cache records, for each repo file, a hash of its contents and of the repo files it imports, and
+    the names of the objects it defines. Objects are recorded under the file defining them, not the files
+    importing them. Files whose hash did not change are not imported, and the objects they define are left out
+    of the returned contents, even if a changed file imports them. Objects that a changed or removed file used
+    to define, and that no file lists anymore, are returned as deleted.
+    """
+    cached_files = _read_parse_cache(repo_root, repo_config)
+    repo_files = get_repo_files(repo_root)
+    imported_files = _get_imported_files(repo_root, repo_files)
+    file_keys = _get_file_keys(repo_root, repo_files, imported_files)
+
+    files: Dict[str, Dict[str, Any]] = {}
+    for repo_file in repo_files:
+        path = repo_file.relative_to(repo_root).as_posix()
+        cached_file = cached_files.get(path)
+        if cached_file is not None and cached_file["key"] == file_keys[repo_file]:
+            files[path] = cached_file
+    unchanged_objects = {
+        (object_type, name)
+        for cached_file in files.values()
+        for object_type, names in cached_file["objects"].items()
+        for name in names
+    }
+
+    res = _empty_repo_contents()
+    res_objects = FeastObjectType.get_objects_from_repo_contents(res)
+    defined_objects = set(unchanged_objects)
+    changed_files: Dict[str, Dict[str, Any]] = {
+        repo_file.relative_to(repo_root).as_posix(): {
+            "key": file_keys[repo_file],
+            "objects": {},
+        }
+        for repo_file in repo_files
+        if repo_file.relative_to(repo_root).as_posix() not in files
+    }
+    loaded_module_objects: Dict[Path, Dict[FeastObjectType, List[Any]]] = {}
+    for repo_file in repo_files:
+        path = repo_file.relative_to(repo_root).as_posix()
+        if path in files:
+            continue
+
+        importlib.import_module(py_path_to_module(repo_file))
+        module_objects = _get_loaded_module_objects(repo_file, loaded_module_objects)
+        assert module_objects is not None
+        for object_type, objects in module_objects.items():
+            for obj in objects:
+                if (object_type.value, obj.name) in unchanged_objects or any(
+                    obj is o for o in res_objects[object_type]
+                ):
+                    continue
+                res_objects[object_type].append(obj)
+                if not obj.name:
+                    continue
+                defining_path = _get_defining_file(
+                    obj, object_type, repo_file, imported_files, loaded_module_objects
+                ).relative_to(repo_root)
+                # An unchanged file not listing the object didn't define it when it was last parsed
+                file_objects = changed_files.get(
+                    defining_path.as_posix(), changed_files[path]
+                )["objects"]
+                file_objects.setdefault(object_type.value, []).append(obj.name)
+                defined_objects.add((object_type.value, obj.name))
+    files.update(changed_files)
+
+    deleted: Dict[FeastObjectType, Set[str]] = {
+        object_type: set() for object_type in FEAST_OBJECT_TYPES
+    }
+    for path, cached_file in cached_files.items():
+        if files.get(path) is cached_file:
+            continue
+        for object_type, names in cached_file["objects"].items():
+            for name in names:
+                # Names still listed by an unchanged file are in defined_objects too
+                if (object_type, name) not in defined_objects:
+                    deleted[FeastObjectType(object_type)].add(name)
 
     res.entities.append(DUMMY_ENTITY)
-    return res
+    return RepoChanges(contents=res, deleted=deleted, files=files)
+
+
+def save_repo_parse_cache(
+    repo_root: Path, repo_config: RepoConfig, changes: RepoChanges
+):
+    """Saves the parse cache of a feature repo, once the given changes were applied."""
+    cache_path = repo_root / REPO_PARSE_CACHE_PATH
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(
+        json.dumps({**_parse_cache_key(repo_config), "files": changes.files})
+    )
+
+
+def _read_parse_cache(
+    repo_root: Path, repo_config: RepoConfig
+) -> Dict[str, Dict[str, Any]]:
+    cache_path = repo_root / REPO_PARSE_CACHE_PATH
+    if not cache_path.exists():
+        return {}
+    try:
+        cache = json.loads(cache_path.read_text())
+    except ValueError:
+        return {}
+    # The cache describes what was applied to one registry, and is ignored when applying to another
+    if any(cache.get(k) != v for k, v in _parse_cache_key(repo_config).items()):
+        return {}
+    return cache["files"]
+
+
+def _parse_cache_key(repo_config: RepoConfig) -> Dict[str, str]:
+    return {
+        "project": repo_config.project,
+        "registry_type": repo_config.registry.registry_type,
+        # Hashed, as it may be a database URL holding credentials
+        "registry": hashlib.sha256(repo_config.registry.path.encode()).hexdigest(),
+    }
 
 
-def plan(repo_config: RepoConfig, repo_path: Path, skip_source_validation: bool):
+def _get_loaded_module_objects(
+    repo_file: Path,
+    loaded_module_objects: Dict[Path, Dict[FeastObjectType, List[Any]]],
+) -> Optional[Dict[FeastObjectType, List[Any]]]:
+    """Returns the Feast objects found in the module of a repo file, or None if the module wasn't imported."""
+    if repo_file not in loaded_module_objects:
+        module = sys.modules.get(py_path_to_module(repo_file))
+        if module is None:
+            return None
+        module_contents = _empty_repo_contents()
+        _add_module_objects(module_contents, module)
+        loaded_module_objects[repo_file] = (
+            FeastObjectType.get_objects_from_repo_contents(module_contents)
+        )
+    return loaded_module_objects[repo_file]
+
+
+def _get_defining_file(
+    obj: Any,
+    object_type: FeastObjectType,
+    repo_file: Path,
+    imported_files: Dict[Path, Set[Path]],
+    loaded_module_objects: Dict[Path, Dict[FeastObjectType, List[Any]]],
+) -> Path:
+    """
+    Returns the repo file defining an object found in the module of a repo file: the repo file itself, unless
+    the object was found in a repo file it imports, directly or not.
+    """
+    defining_file = repo_file
+    visited = {repo_file}
+    while True:
+        for imported_file in sorted(imported_files[defining_file] - visited):
+            visited.add(imported_file)
+            module_objects = _get_loaded_module_objects(
+                imported_file, loaded_module_objects
+            )
+            if module_objects is not None and any(
+                obj is o for o in module_objects[object_type]
+            ):
+                defining_file = imported_file
+                break
+        else:
+            return defining_file
+
+
+def _get_imported_files(
+    repo_root: Path, repo_files: List[Path]
+) -> Dict[Path, Set[Path]]:
+    """Returns the repo files that each repo file imports directly."""
+    module_files = {
+        ".".join(repo_file.relative_to(repo_root).with_suffix("").parts): repo_file
+        for repo_file in repo_files
+    }
+    return {
+        repo_file: {
+            module_files[module]
+            for module in _get_imported_modules(module_name, repo_file.read_bytes())
+            if module in module_files
+        }
+        for module_name, repo_file in module_files.items()
+    }
+
+
+def _get_file_keys(
+    repo_root: Path, repo_files: List[Path], imported_files: Dict[Path, Set[Path]]
+) -> Dict[Path, str]:
+    """
+    Hashes each repo file together with the repo files it imports, directly or not, so that the hash of a file
+    changes whenever a definition it can see changes.
+    """
+    contents = {repo_file: repo_file.read_bytes() for repo_file in repo_files}
+    file_keys = {}
+    for repo_file in repo_files:
+        dependencies = {repo_file}
+        to_visit = [repo_file]
+        while to_visit:
+            for imported_file in imported_files[to_visit.pop()]:
+                if imported_file not in dependencies:
+                    dependencies.add(imported_file)
+                    to_visit.append(imported_file)
+
+        key = hashlib.sha256()
+        for dependency in sorted(dependencies):
+            key.update(dependency.relative_to(repo_root).as_posix().encode())
+            key.update(hashlib.sha256(contents[dependency]).digest())
+        file_keys[repo_file] = key.hexdigest()
+    return file_keys
+
+
+def _get_imported_modules(module_name: str, source: bytes) -> Set[str]:
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        # The file fails to import anyway
+        return set()
+
+    modules: Set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            parts = module_name.split(".")[: -node.level] if node.level else []
+            if node.module:
+                parts.append(node.module)
+            base = ".".join(parts)
+            modules.add(base)
+            # The imported names may be modules too
+            modules.update(
+                f"{base}.{alias.name}" if base else alias.name for alias in node.names
+            )
+    return modules
+
+
+def _get_desired_repo_contents(
+    registry: BaseRegistry, project: str, changes: RepoChanges
+) -> RepoContents:
+    """Returns the objects in the registry, updated with the given changes to the feature repo."""
+    current_objects = FeastObjectType.get_objects_from_registry(registry, project)
+    changed_objects = FeastObjectType.get_objects_from_repo_contents(changes.contents)
+    desired_objects = {}
+    for object_type in FEAST_OBJECT_TYPES:
+        replaced_names = {obj.name for obj in changed_objects[object_type]}
+        replaced_names |= changes.deleted[object_type]
+        desired_objects[object_type] = [
+            obj
+            for obj in current_objects[object_type]
+            if obj.name not in replaced_names
+        ] + changed_objects[object_type]
+
+    return RepoContents(
+        data_sources=desired_objects[FeastObjectType.DATA_SOURCE],
+        entities=desired_objects[FeastObjectType.ENTITY],
+        feature_views=desired_objects[FeastObjectType.FEATURE_VIEW],
+        on_demand_feature_views=desired_objects[FeastObjectType.ON_DEMAND_FEATURE_VIEW],
+        stream_feature_views=desired_objects[FeastObjectType.STREAM_FEATURE_VIEW],
+        feature_services=desired_objects[FeastObjectType.FEATURE_SERVICE],
+    )
+
+
+def plan(
+    repo_config: RepoConfig,
+    repo_path: Path,
+    skip_source_validation: bool,
+    changed_only: bool = False,
+):
     os.chdir(repo_path)
-    project, registry, repo, store = _prepare_registry_and_repo(repo_config, repo_path)
+    if changed_only:
+        store = _prepare_store(repo_config)
+        changes = parse_repo_changes(repo_path, store.config)
+        feature_views = changes.contents.feature_views
+        repo = _get_desired_repo_contents(store.registry, store.project, changes)
+    else:
+        project, registry, repo, store = _prepare_registry_and_repo(
+            repo_config, repo_path
+        )
+        feature_views = repo.feature_views
 
     if not skip_source_validation:
         provider = store._get_provider()
-        data_sources = [t.batch_source for t in repo.feature_views]
+        data_sources = [t.batch_source for t in feature_views]
         # Make sure the data source used by this feature view is supported by Feast
         for data_source in data_sources:
             provider.validate_data_source(store.config, data_source)
@@ -222,7 +525,7 @@ def plan(repo_config: RepoConfig, repo_path: Path, skip_source_validation: bool)
     click.echo(infra_diff.to_string())
 
 
-def _prepare_registry_and_repo(repo_config, repo_path):
+def _prepare_store(repo_config):
     store = FeatureStore(config=repo_config)
     project = store.project
     if not is_valid_name(project):
@@ -231,10 +534,14 @@ def _prepare_registry_and_repo(repo_config, repo_path):
             f"alphanumerical values and underscores but not start with an underscore."
         )
         sys.exit(1)
-    registry = store.registry
     sys.dont_write_bytecode = True
+    return store
+
+
+def _prepare_registry_and_repo(repo_config, repo_path):
+    store = _prepare_store(repo_config)
     repo = parse_repo(repo_path)
-    return project, registry, repo, store
+    return store.project, store.registry, repo, store
 
 
 def extract_objects_for_apply_delete(project, registry, repo):
@@ -349,18 +656,73 @@ def create_feature_store(
         return FeatureStore(repo_path=str(repo), fs_yaml_file=fs_yaml_file)
 
 
-def apply_total(repo_config: RepoConfig, repo_path: Path, skip_source_validation: bool):
+def apply_total(
+    repo_config: RepoConfig,
+    repo_path: Path,
+    skip_source_validation: bool,
+    changed_only: bool = False,
+):
     os.chdir(repo_path)
+    if changed_only:
+        store = _prepare_store(repo_config)
+        changes = parse_repo_changes(repo_path, store.config)
+        apply_changes_with_repo_instance(store, changes, skip_source_validation)
+        save_repo_parse_cache(repo_path, store.config, changes)
+        return
+
     project, registry, repo, store = _prepare_registry_and_repo(repo_config, repo_path)
     apply_total_with_repo_instance(
         store, project, registry, repo, skip_source_validation
     )
 
 
+def apply_changes_with_repo_instance(
+    store: FeatureStore, changes: RepoChanges, skip_source_validation: bool
+):
+    """Applies only the objects that changed in the feature repo, and deletes the ones it no longer defines."""
+    if not skip_source_validation:
+        provider = store._get_provider()
+        data_sources = [t.batch_source for t in changes.contents.feature_views]
+        # Make sure the data source used by this feature view is supported by Feast
+        for data_source in data_sources:
+            provider.validate_data_source(store.config, data_source)
+
+    if store._should_use_plan():
+        repo = _get_desired_repo_contents(store.registry, store.project, changes)
+        registry_diff, infra_diff, new_infra = store.plan(repo)
+        click.echo(registry_diff.to_string())
+
+        store._apply_diffs(registry_diff, infra_diff, new_infra)
+        click.echo(infra_diff.to_string())
+    else:
+        all_to_apply = [
+            obj
+            for objects in FeastObjectType.get_objects_from_repo_contents(
+                changes.contents
+            ).values()
+            for obj in objects
+        ]
+        all_to_delete = [
+            obj
+            for object_type, objects in FeastObjectType.get_objects_from_registry(
+                store.registry, store.project
+            ).items()
+            for obj in objects
+            if obj.name in changes.deleted[object_type]
+        ]
+        store.apply(all_to_apply, objects_to_delete=all_to_delete, partial=False)
+        log_infra_changes(
+            set(changes.contents.feature_views),
+            {obj for obj in all_to_delete if isinstance(obj, FeatureView)},
+        )
+
+
 def teardown(repo_config: RepoConfig, repo_path: Optional[str]):
     # Cannot pass in both repo_path and repo_config to FeatureStore.
     feature_store = FeatureStore(repo_path=repo_path, config=None)
     feature_store.teardown()
+    # The objects listed by the parse cache were removed along with the registry
+    (feature_store.repo_path / REPO_PARSE_CACHE_PATH).unlink(missing_ok=True)
 
 
 def registry_dump(repo_config: RepoConfig, repo_path: Path) -> str:
@@ -1,6 +1,9 @@
 import logging
 import sys
+import threading
+import time
 from concurrent import futures
+from typing import Any, Dict, Optional, Tuple
 
 import grpc
 import pyarrow as pa
@@ -9,6 +12,7 @@ from grpc_reflection.v1alpha import reflection
 
 from feast.errors import OnDemandFeatureViewNotFoundException
 from feast.feature_store import FeatureStore
+from feast.on_demand_feature_view import OnDemandFeatureView
 from feast.protos.feast.serving.TransformationService_pb2 import (
     DESCRIPTOR,
     TRANSFORMATION_SERVICE_TYPE_PYTHON,
@@ -24,11 +28,18 @@ from feast.version import get_version
 
 log = logging.getLogger(__name__)
 
+# Arrow IPC files start with this magic string, IPC streams with a continuation marker
+_ARROW_FILE_MAGIC = b"ARROW1"
+
 
 class TransformationServer(TransformationServiceServicer):
     def __init__(self, fs: FeatureStore) -> None:
         super().__init__()
         self.fs = fs
+        # Resolved on demand feature views, valid for a single version of the registry
+        self._odfv_cache: Dict[Tuple[str, str], OnDemandFeatureView] = {}
+        self._odfv_cache_version: Optional[Any] = None
+        self._odfv_cache_lock = threading.Lock()
 
     def GetTransformationServiceInfo(self, request, context):
         response = GetTransformationServiceInfoResponse(
@@ -38,24 +49,46 @@ class TransformationServer(TransformationServiceServicer):
         return response
 
     def TransformFeatures(self, request, context):
+        project = request.project or self.fs.project
+        odfv_names = list(request.on_demand_feature_view_names) or [
+            request.on_demand_feature_view_name
+        ]
         try:
-            odfv = self.fs.get_on_demand_feature_view(
-                name=request.on_demand_feature_view_name
-            )
+            odfvs = [
+                self._get_on_demand_feature_view(name, project) for name in odfv_names
+            ]
         except OnDemandFeatureViewNotFoundException:
             context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
             raise
 
-        df = pa.ipc.open_file(request.transformation_input.arrow_value).read_all()
-
-        if odfv.mode != "pandas":
-            raise Exception(
-                f'OnDemandFeatureView mode "{odfv.mode}" not supported by TransformationServer.'
-            )
-
-        result_arrow = odfv.transform_arrow(df, True)
+        # Wrapping the request bytes lets arrow read the input without copying it
+        input_buffer = pa.py_buffer(request.transformation_input.arrow_value)
+        use_file_format = input_buffer.size >= len(_ARROW_FILE_MAGIC) and (
+            input_buffer[: len(_ARROW_FILE_MAGIC)].to_pybytes() == _ARROW_FILE_MAGIC
+        )
+        if use_file_format:
+            df = pa.ipc.open_file(input_buffer).read_all()
+        else:
+            df = pa.ipc.open_stream(input_buffer).read_all()
+
+        result_arrow: Optional[pa.Table] = None
+        for odfv in odfvs:
+            transformed_arrow = _transform(odfv, df)
+            if result_arrow is None:
+                result_arrow = transformed_arrow
+                continue
+            for col in transformed_arrow.column_names:
+                if col.startswith("__index") or col in result_arrow.column_names:
+                    continue
+                result_arrow = result_arrow.append_column(col, transformed_arrow[col])
+        assert result_arrow is not None
+
+        # Responses are written in the same IPC format as the request
         sink = pa.BufferOutputStream()
-        writer = pa.ipc.new_file(sink, result_arrow.schema)
+        if use_file_format:
+            writer = pa.ipc.new_file(sink, result_arrow.schema)
+        else:
+            writer = pa.ipc.new_stream(sink, result_arrow.schema)
         writer.write_table(result_arrow)
         writer.close()
 
@@ -65,6 +98,54 @@ class TransformationServer(TransformationServiceServicer):
             transformation_output=ValueType(arrow_value=buf)
         )
 
+    def _get_on_demand_feature_view(
+        self, name: str, project: str
+    ) -> OnDemandFeatureView:
+        version = self._registry_version(project)
+        with self._odfv_cache_lock:
+            if version != self._odfv_cache_version:
+                self._odfv_cache.clear()
+                self._odfv_cache_version = version
+            odfv = self._odfv_cache.get((project, name))
+        if odfv is None:
+            odfv = self.fs.registry.get_on_demand_feature_view(
+                name, project, allow_cache=True
+            )
+            with self._odfv_cache_lock:
+                if version == self._odfv_cache_version:
+                    self._odfv_cache[(project, name)] = odfv
+        return odfv
+
+    def _registry_version(self, project: str) -> Any:
+        """
+        Returns a token that changes whenever the registry serves a new snapshot.
+        """
+        registry = self.fs.registry
+        if hasattr(registry, "cached_registry_proto_created"):
+            # Gives the registry the chance to refresh an expired snapshot first
+            registry.list_project_metadata(project, allow_cache=True)
+            return registry.cached_registry_proto_created
+        # Registries without a local snapshot: fall back to the configured cache ttl
+        ttl = self.fs.config.registry.cache_ttl_seconds or 0
+        return int(time.monotonic() // ttl) if ttl > 0 else None
+
+
+def _transform(odfv: OnDemandFeatureView, df: pa.Table) -> pa.Table:
+    if odfv.mode in {"pandas", "substrait"}:
+        return odfv.transform_arrow(df, True)
+    if odfv.mode == "python":
+        transformed = odfv.transform_dict(df.to_pydict())
+        prefix = odfv.projection.name_to_use()
+        return pa.Table.from_pydict(
+            {
+                f"{prefix}__{feature.name}": transformed[feature.name]
+                for feature in odfv.features
+            }
+        )
+    raise Exception(
+        f'OnDemandFeatureView mode "{odfv.mode}" not supported by TransformationServer.'
+    )
+
 
 def start_server(store: FeatureStore, port: int):
     log.info("Starting server..")
@@ -74,6 +74,23 @@ def embedded_elasticsearch():
     online_store_creator.teardown()
 
 
+class TestElasticsearchConnectionManager:
+    def test_client_is_reused(self, repo_config):
+        with ElasticsearchConnectionManager(repo_config.online_store) as first:
+            pass
+        with ElasticsearchConnectionManager(repo_config.online_store) as second:
+            assert second is first
+            assert second.ping()
+
+    def test_client_is_recreated_after_close(self, repo_config):
+        with ElasticsearchConnectionManager(repo_config.online_store) as first:
+            pass
+        ElasticsearchConnectionManager.close(repo_config.online_store)
+        with ElasticsearchConnectionManager(repo_config.online_store) as second:
+            assert second is not first
+            assert second.ping()
+
+
 class TestElasticsearchOnlineStore:
     index_to_write = "index_write"
     index_to_delete = "index_delete"
@@ -399,6 +416,106 @@ class TestElasticsearchOnlineStore:
             for field in requested_features:
                 assert field in doc
 
+    def test_elasticsearch_online_read_preserves_order_and_missing_keys(
+        self, repo_config
+    ):
+        feature_view, data = (
+            self._create_n_customer_test_samples_elasticsearch_online_read(
+                name=self.index_to_read, n=10
+            )
+        )
+        store = ElasticsearchOnlineStore()
+        store.online_write_batch(
+            config=repo_config, table=feature_view, data=data, progress=None
+        )
+
+        with ElasticsearchConnectionManager(repo_config.online_store) as es:
+            es.indices.refresh(index=self.index_to_read)
+
+        requested_ids = ["7", "missing", "2", "7"]
+        result = store.online_read(
+            config=repo_config,
+            table=feature_view,
+            entity_keys=[
+                EntityKeyProto(
+                    join_keys=["id"], entity_values=[ValueProto(string_val=i)]
+                )
+                for i in requested_ids
+            ],
+            requested_features=["id", "timestamp"],
+        )
+
+        assert [doc["id"].string_val if doc else None for _, doc in result] == [
+            "7",
+            None,
+            "2",
+            "7",
+        ]
+        assert result[0][1]["timestamp"].unix_timestamp_val == (
+            data[7][1]["timestamp"].unix_timestamp_val
+        )
+
+    def test_elasticsearch_online_read_null_features(self, repo_config):
+        feature_view, data = (
+            self._create_n_customer_test_samples_elasticsearch_online_read(
+                name=self.index_to_read, n=1
+            )
+        )
+        for feature in ["text", "long", "timestamp", "byte_list"]:
+            data[0][1][feature] = ValueProto()
+        store = ElasticsearchOnlineStore()
+        store.online_write_batch(
+            config=repo_config, table=feature_view, data=data, progress=None
+        )
+
+        with ElasticsearchConnectionManager(repo_config.online_store) as es:
+            es.indices.refresh(index=self.index_to_read)
+
+        ((_, doc),) = store.online_read(
+            config=repo_config,
+            table=feature_view,
+            entity_keys=[data[0][0]],
+        )
+
+        for feature in ["text", "long", "timestamp", "byte_list"]:
+            assert doc[feature] == ValueProto()
+        assert doc["int"].int32_val == 1
+
+    def test_elasticsearch_retrieve_online_documents(self, repo_config):
+        feature_view, data = (
+            self._create_n_customer_test_samples_elasticsearch_online_read(
+                name=self.index_to_read, n=10
+            )
+        )
+        store = ElasticsearchOnlineStore()
+        store.update(
+            config=repo_config,
+            tables_to_delete=[],
+            tables_to_keep=[feature_view],
+            entities_to_delete=[],
+            entities_to_keep=[],
+            partial=False,
+        )
+        store.online_write_batch(
+            config=repo_config, table=feature_view, data=data, progress=None
+        )
+
+        with ElasticsearchConnectionManager(repo_config.online_store) as es:
+            es.indices.refresh(index=self.index_to_read)
+
+        query = list(data[3][1]["vector"].float_list_val.val)
+        result = store.retrieve_online_documents(
+            config=repo_config,
+            table=feature_view,
+            requested_feature="vector",
+            embedding=query,
+            top_k=3,
+        )
+
+        assert len(result) == 3
+        assert list(result[0][1].float_list_val.val) == pytest.approx(query)
+        assert result[0][3].float_val >= result[1][3].float_val
+
     def _create_index_in_es(self, index_name, repo_config):
         with ElasticsearchConnectionManager(repo_config.online_store) as es:
             mapping = {
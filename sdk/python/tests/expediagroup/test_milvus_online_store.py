@@ -1,6 +1,7 @@
 import json
 import logging
 import random
+import time
 from datetime import datetime
 
 import pytest
@@ -77,6 +78,12 @@ def embedded_milvus():
 
 
 class TestMilvusConnectionManager:
+    @pytest.fixture(autouse=True)
+    def reset_pool(self, repo_config):
+        MilvusConnectionManager.close(repo_config.online_store)
+        yield
+        MilvusConnectionManager.close(repo_config.online_store)
+
     def test_connection_manager(self, repo_config, caplog, mocker):
         mocker.patch("pymilvus.connections.connect")
         with MilvusConnectionManager(repo_config.online_store):
@@ -94,8 +101,37 @@ class TestMilvusConnectionManager:
             use_secure=True,
         )
 
+    def test_connection_is_reused(self, repo_config, mocker):
+        mock_connect = mocker.patch("pymilvus.connections.connect")
+        mock_disconnect = mocker.patch("pymilvus.connections.disconnect")
+
+        for _ in range(3):
+            with MilvusConnectionManager(repo_config.online_store):
+                pass
+
+        mock_connect.assert_called_once()
+        mock_disconnect.assert_not_called()
+
+        MilvusConnectionManager.close(repo_config.online_store)
+        mock_disconnect.assert_called_once_with(repo_config.online_store.alias)
+
+    def test_reconnects_after_failed_health_check(self, repo_config, mocker):
+        mock_connect = mocker.patch("pymilvus.connections.connect")
+        mocker.patch("pymilvus.connections.disconnect")
+        mocker.patch(
+            "pymilvus.utility.get_server_version", side_effect=Exception("down")
+        )
+        mocker.patch.object(MilvusConnectionManager, "HEALTH_CHECK_INTERVAL_SECONDS", 0)
+
+        with MilvusConnectionManager(repo_config.online_store):
+            pass
+        with MilvusConnectionManager(repo_config.online_store):
+            pass
+
+        assert mock_connect.call_count == 2
+
     def test_context_manager_exit(self, repo_config, caplog, mocker):
-        # Create a mock for connections.disconnect
+        mocker.patch("pymilvus.connections.connect")
         mock_disconnect = mocker.patch("pymilvus.connections.disconnect")
 
         # Create a mock logger to capture log calls
@@ -103,16 +139,12 @@ class TestMilvusConnectionManager:
             "feast.expediagroup.vectordb.milvus_online_store.logger", autospec=True
         )
 
-        with MilvusConnectionManager(repo_config.online_store):
-            print("Doing something")
-
-        # Assert that connections.disconnect was called with the expected argument
-        mock_disconnect.assert_called_once_with(repo_config.online_store.alias)
-
         with pytest.raises(Exception):
             with MilvusConnectionManager(repo_config.online_store):
                 raise Exception("Test Exception")
         mock_logger.error.assert_called_once()
+        # The pooled connection is kept for errors unrelated to the connection itself
+        mock_disconnect.assert_not_called()
 
 
 class TestMilvusOnlineStore:
@@ -662,3 +694,171 @@ class TestMilvusOnlineStore:
         assert result[0][1]["film_date"].int64_val == 2000
         assert result[9][1]["film_id"].int64_val == 9
         assert result[9][1]["film_date"].int64_val == 2009
+
+    def _create_film_collection(self, repo_config, index_param):
+        vectors = [[float(i), float(i)] for i in range(10)]
+        schema = CollectionSchema(
+            [
+                FieldSchema("film_id", DataType.INT64, is_primary=True),
+                FieldSchema("film_date", DataType.INT64),
+                FieldSchema("films", dtype=DataType.FLOAT_VECTOR, dim=2),
+            ]
+        )
+        with MilvusConnectionManager(repo_config.online_store):
+            collection = Collection(name=self.collection_to_write, schema=schema)
+            collection.create_index("films", index_param)
+            collection.insert([list(range(10)), [i + 2000 for i in range(10)], vectors])
+            collection.flush()
+            collection.load()
+
+        return FeatureView(
+            name=self.collection_to_write,
+            source=SOURCE,
+            schema=[
+                Field(name="film_id", dtype=Int64),
+                Field(name="film_date", dtype=Int64),
+                Field(
+                    name="films",
+                    dtype=Array(Float32),
+                    tags={"dimensions": "2", "search_params": '{"nprobe": 4}'},
+                ),
+            ],
+        )
+
+    def test_milvus_retrieve_online_documents(self, repo_config):
+        feature_view = self._create_film_collection(
+            repo_config,
+            {"index_type": "IVF_FLAT", "metric_type": "L2", "params": {"nlist": 4}},
+        )
+
+        result = MilvusOnlineStore().retrieve_online_documents(
+            config=repo_config,
+            table=feature_view,
+            requested_feature="films",
+            embedding=[3.1, 3.1],
+            top_k=2,
+        )
+
+        assert len(result) == 2
+        assert list(result[0][1].float_list_val.val) == [3.0, 3.0]
+        assert list(result[1][1].float_list_val.val) == [4.0, 4.0]
+        assert result[0][3].float_val < result[1][3].float_val
+
+    def test_milvus_search_documents_batches_queries_with_filter(self, repo_config):
+        feature_view = self._create_film_collection(
+            repo_config, {"index_type": "FLAT", "metric_type": "L2", "params": {}}
+        )
+
+        results = MilvusOnlineStore().search_documents(
+            config=repo_config,
+            table=feature_view,
+            requested_feature="films",
+            embeddings=[[0.0, 0.0], [9.0, 9.0]],
+            top_k=1,
+            expr="film_date >= 2005",
+        )
+
+        assert len(results) == 2
+        assert list(results[0][0][1].float_list_val.val) == [5.0, 5.0]
+        assert list(results[1][0][1].float_list_val.val) == [9.0, 9.0]
+
+
+def _deferred_write_config(**kwargs):
+    return RepoConfig(
+        registry=REGISTRY,
+        project=PROJECT,
+        provider=PROVIDER,
+        online_store=MilvusOnlineStoreConfig(
+            host=HOST, username="user", password="password", **kwargs
+        ),
+        offline_store=DaskOfflineStoreConfig(),
+        entity_key_serialization_version=2,
+    )
+
+
+def _mock_milvus_collection(mocker):
+    module = "feast.expediagroup.vectordb.milvus_online_store"
+    mocker.patch(f"{module}.MilvusConnectionManager")
+    mocker.patch(f"{module}.utility")
+    collection = mocker.MagicMock()
+    collection.name = "films"
+    collection.schema = CollectionSchema(
+        [
+            FieldSchema("film_id", DataType.INT64, is_primary=True),
+            FieldSchema("films", DataType.FLOAT_VECTOR, dim=2),
+        ]
+    )
+    mocker.patch(f"{module}.Collection", return_value=collection)
+    return collection
+
+
+def _film_rows(n):
+    return [
+        (
+            EntityKeyProto(
+                join_keys=["film_id"], entity_values=[ValueProto(int64_val=i)]
+            ),
+            {"films": ValueProto(float_list_val=FloatList(val=[i, i]))},
+            datetime.utcnow(),
+            None,
+        )
+        for i in range(n)
+    ]
+
+
+def test_milvus_format_data_is_columnar(mocker):
+    collection = _mock_milvus_collection(mocker)
+
+    columns = MilvusOnlineStore()._format_data_for_milvus(_film_rows(2), collection)
+
+    assert columns == [[0, 1], [[0.0, 0.0], [1.0, 1.0]]]
+
+
+def test_milvus_deferred_writes_flush_once(mocker):
+    collection = _mock_milvus_collection(mocker)
+    config = _deferred_write_config(flush_on_write=False, upsert=True)
+    feature_view = FeatureView(name="films", source=SOURCE)
+    store = MilvusOnlineStore()
+
+    for _ in range(3):
+        store.online_write_batch(config, feature_view, _film_rows(2), None)
+
+    assert collection.upsert.call_count == 3
+    collection.insert.assert_not_called()
+    collection.flush.assert_not_called()
+
+    store.flush(config, feature_view)
+
+    collection.flush.assert_called_once()
+    collection.load.assert_called_once()
+
+
+def test_milvus_deferred_writes_flush_on_interval(mocker):
+    collection = _mock_milvus_collection(mocker)
+    config = _deferred_write_config(flush_on_write=False, flush_interval_seconds=0.1)
+    store = MilvusOnlineStore()
+
+    # e.g. push or stream writes, which are not followed by a call to flush
+    for _ in range(3):
+        store.online_write_batch(
+            config, FeatureView(name="films", source=SOURCE), _film_rows(2), None
+        )
+    assert collection.insert.call_count == 3
+    collection.flush.assert_not_called()
+
+    deadline = time.monotonic() + 10
+    while not collection.load.called and time.monotonic() < deadline:
+        time.sleep(0.05)
+    collection.flush.assert_called_once()
+    collection.load.assert_called_once()
+
+
+def test_milvus_format_data_with_missing_values(mocker):
+    collection = _mock_milvus_collection(mocker)
+    rows = _film_rows(3)
+    rows[1][1].pop("films")
+    rows[2][1]["films"] = ValueProto()
+
+    columns = MilvusOnlineStore()._format_data_for_milvus(rows, collection)
+
+    assert columns == [[0, 1, 2], [[0.0, 0.0], None, None]]
@@ -263,6 +263,15 @@ class GrpcMockChannel:
 
         return handler
 
+    def unary_stream(
+        self, method: str, request_serializer=None, response_deserializer=None
+    ):
+        # Only needed to build the stub, the tests don't watch the registry
+        def handler(request):
+            raise NotImplementedError(method)
+
+        return handler
+
 
 @pytest.fixture
 def mock_remote_registry():
@@ -0,0 +1,146 @@
+import tempfile
+from pathlib import Path
+from textwrap import dedent
+
+from feast.feature_store import FeatureStore
+from feast.repo_operations import REPO_PARSE_CACHE_PATH
+from tests.utils.cli_repo_creator import CliRunner
+
+ENTITIES_PY = """
+from feast import Entity
+
+driver = Entity(name="driver", join_keys=["driver_id"])
+"""
+
+OTHER_PY = """
+from feast import Entity
+
+print("importing other.py")
+customer = Entity(name="customer", join_keys=["customer_id"])
+"""
+
+VIEW_PY = """
+from datetime import timedelta
+
+from feast import FeatureView, Field, FileSource
+from feast.types import Float32, Int64
+
+from entities import driver
+
+{name}_source = FileSource(
+    name="{name}_source",
+    path="data/{name}.parquet",
+    timestamp_field="event_timestamp",
+)
+
+{name} = FeatureView(
+    name="{name}",
+    entities=[driver],
+    ttl=timedelta(days=1),
+    schema=[
+        Field(name="driver_id", dtype=Int64),
+        Field(name="{name}_value", dtype=Float32),
+    ],
+    source={name}_source,
+)
+"""
+
+
+def _write_feature_store_yaml(repo_path: Path, registry_path: Path) -> None:
+    (repo_path / "feature_store.yaml").write_text(
+        dedent(
+            f"""
+    project: foo
+    registry: {registry_path}
+    provider: local
+    online_store:
+        path: {registry_path.parent / "online_store.db"}
+    entity_key_serialization_version: 2
+    """
+        )
+    )
+
+
+def test_cli_apply_changed_only() -> None:
+    with tempfile.TemporaryDirectory() as repo_dir_name, tempfile.TemporaryDirectory() as data_dir_name:
+        runner = CliRunner()
+        repo_path = Path(repo_dir_name)
+        data_path = Path(data_dir_name)
+
+        _write_feature_store_yaml(repo_path, data_path / "registry.db")
+        (repo_path / "entities.py").write_text(ENTITIES_PY)
+        (repo_path / "other.py").write_text(OTHER_PY)
+        (repo_path / "views.py").write_text(VIEW_PY.format(name="driver_stats"))
+        apply = ["apply", "--changed-only", "--skip-source-validation"]
+
+        rc, output = runner.run_with_output(apply, cwd=repo_path)
+        assert rc == 0, output
+        assert b"importing other.py" in output
+        assert (repo_path / REPO_PARSE_CACHE_PATH).exists()
+
+        # Only the changed file and the files it imports are imported again
+        (repo_path / "views.py").write_text(
+            VIEW_PY.format(name="driver_stats") + VIEW_PY.format(name="driver_trips")
+        )
+        rc, output = runner.run_with_output(apply, cwd=repo_path)
+        assert rc == 0, output
+        assert b"importing other.py" not in output
+        assert b"driver_trips" in output
+        assert b"driver_stats" not in output
+
+        # Objects whose definitions were removed are deleted
+        (repo_path / "views.py").write_text(VIEW_PY.format(name="driver_trips"))
+        rc, output = runner.run_with_output(apply, cwd=repo_path)
+        assert rc == 0, output
+        assert b"Deleted feature view" in output
+
+        store = FeatureStore(repo_path=str(repo_path))
+        assert [fv.name for fv in store.list_feature_views()] == ["driver_trips"]
+        assert {entity.name for entity in store.list_entities()} == {
+            "driver",
+            "customer",
+        }
+
+        rc, output = runner.run_with_output(
+            ["plan", "--changed-only", "--skip-source-validation"], cwd=repo_path
+        )
+        assert rc == 0, output
+        assert b"No changes to registry" in output
+
+        # The cache is ignored when applying to another registry
+        _write_feature_store_yaml(repo_path, data_path / "other_registry.db")
+        rc, output = runner.run_with_output(apply, cwd=repo_path)
+        assert rc == 0, output
+        assert b"importing other.py" in output
+        store = FeatureStore(repo_path=str(repo_path))
+        assert [fv.name for fv in store.list_feature_views()] == ["driver_trips"]
+
+        # The cache is removed along with the registry
+        rc, output = runner.run_with_output(["teardown"], cwd=repo_path)
+        assert rc == 0, output
+        assert not (repo_path / REPO_PARSE_CACHE_PATH).exists()
+
+
+def test_cli_apply_changed_only_keeps_imported_objects() -> None:
+    with tempfile.TemporaryDirectory() as repo_dir_name, tempfile.TemporaryDirectory() as data_dir_name:
+        runner = CliRunner()
+        repo_path = Path(repo_dir_name)
+        data_path = Path(data_dir_name)
+
+        _write_feature_store_yaml(repo_path, data_path / "registry.db")
+        # a.py is parsed before the file defining the entity it imports
+        (repo_path / "a.py").write_text("from z_entities import driver\n")
+        (repo_path / "z_entities.py").write_text(ENTITIES_PY)
+        apply = ["apply", "--changed-only", "--skip-source-validation"]
+
+        rc, output = runner.run_with_output(apply, cwd=repo_path)
+        assert rc == 0, output
+
+        # Objects only imported by a file are not deleted when the import is removed
+        (repo_path / "a.py").write_text("")
+        rc, output = runner.run_with_output(apply, cwd=repo_path)
+        assert rc == 0, output
+        assert b"Deleted entity" not in output
+
+        store = FeatureStore(repo_path=str(repo_path))
+        assert [entity.name for entity in store.list_entities()] == ["driver"]
@@ -0,0 +1,144 @@
+import os
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from feast import Entity, FeatureStore, Field, FileSource
+from feast.aggregation import Aggregation
+from feast.data_format import JsonFormat
+from feast.data_source import KafkaSource
+from feast.infra.contrib.python_stream_processor import PythonProcessorConfig
+from feast.infra.contrib.stream_processor import get_stream_processor_object
+from feast.infra.online_stores.sqlite import SqliteOnlineStoreConfig
+from feast.repo_config import RepoConfig
+from feast.stream_feature_view import StreamFeatureView
+from feast.types import Float32, Int64
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _create_store(data_dir: str, **sfv_kwargs):
+    batch_path = os.path.join(data_dir, "driver_stats.parquet")
+    pd.DataFrame(
+        {"driver_id": [1001], "conv_rate": [0.0], "event_timestamp": [START]}
+    ).to_parquet(batch_path)
+
+    driver = Entity(name="driver", join_keys=["driver_id"])
+    sfv = StreamFeatureView(
+        name="driver_stream",
+        entities=[driver],
+        source=KafkaSource(
+            name="driver_kafka",
+            timestamp_field="event_timestamp",
+            kafka_bootstrap_servers="",
+            message_format=JsonFormat(""),
+            topic="drivers",
+            batch_source=FileSource(path=batch_path, timestamp_field="event_timestamp"),
+        ),
+        timestamp_field="event_timestamp",
+        **sfv_kwargs,
+    )
+    store = FeatureStore(
+        config=RepoConfig(
+            project="test_python_stream_processor",
+            registry=os.path.join(data_dir, "registry.db"),
+            provider="local",
+            entity_key_serialization_version=2,
+            online_store=SqliteOnlineStoreConfig(
+                path=os.path.join(data_dir, "online.db")
+            ),
+        )
+    )
+    store.apply([driver, sfv])
+    return store, sfv
+
+
+def _events(*events):
+    return pd.DataFrame(
+        [
+            {
+                "driver_id": driver_id,
+                "conv_rate": conv_rate,
+                "event_timestamp": START + timedelta(minutes=minutes),
+            }
+            for driver_id, conv_rate, minutes in events
+        ]
+    )
+
+
+def test_ingests_latest_row_per_entity(tmp_path):
+    store, sfv = _create_store(
+        str(tmp_path),
+        schema=[
+            Field(name="driver_id", dtype=Int64),
+            Field(name="conv_rate", dtype=Float32),
+        ],
+        mode="pandas",
+        udf=lambda df: df.assign(conv_rate=df["conv_rate"] * 2),
+    )
+    batches = [
+        _events((1001, 0.1, 2), (1001, 0.2, 1), (1002, 0.3, 0)),
+        _events((1002, 0.4, 5)),
+    ]
+    processor = get_stream_processor_object(
+        PythonProcessorConfig(batches=batches, write_batch_size=1), store, sfv
+    )
+
+    assert processor.ingest_stream_feature_view() == 3
+
+    features = store.get_online_features(
+        features=["driver_stream:conv_rate"],
+        entity_rows=[{"driver_id": 1001}, {"driver_id": 1002}],
+    ).to_dict()
+    assert features["conv_rate"] == pytest.approx([0.2, 0.8])
+
+
+def test_ingests_aggregations(tmp_path):
+    aggregation = Aggregation(
+        column="conv_rate", function="sum", time_window=timedelta(hours=1)
+    )
+    store, sfv = _create_store(
+        str(tmp_path),
+        schema=[
+            Field(name="driver_id", dtype=Int64),
+            Field(name=aggregation.feature_name, dtype=Float32),
+        ],
+        aggregations=[aggregation],
+    )
+    processor = get_stream_processor_object(
+        PythonProcessorConfig(
+            batches=[
+                _events((1001, 1.0, 0), (1001, 2.0, 10)),
+                _events((1001, 4.0, 20)),
+            ],
+            native_aggregation=True,
+        ),
+        store,
+        sfv,
+    )
+
+    # Windows end at the processing time, which is right after the events here
+    with patch(
+        "feast.infra.contrib.stream_aggregator._utc_now",
+        return_value=START + timedelta(minutes=30),
+    ):
+        processor.ingest_stream_feature_view()
+
+    features = store.get_online_features(
+        features=[f"driver_stream:{aggregation.feature_name}"],
+        entity_rows=[{"driver_id": 1001}],
+    ).to_dict()
+    assert features[aggregation.feature_name] == [7.0]
+
+
+def test_rejects_spark_transformations(tmp_path):
+    store, sfv = _create_store(
+        str(tmp_path),
+        schema=[Field(name="conv_rate", dtype=Float32)],
+        mode="spark",
+        udf=lambda df: df,
+    )
+    with pytest.raises(ValueError):
+        get_stream_processor_object(PythonProcessorConfig(batches=[]), store, sfv)
@@ -0,0 +1,204 @@
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+import pytest
+
+from feast.aggregation import Aggregation
+from feast.data_format import AvroFormat
+from feast.data_source import KafkaSource
+from feast.entity import Entity
+from feast.field import Field
+from feast.infra.contrib.stream_aggregator import (
+    StreamAggregator,
+    get_stream_aggregator,
+)
+from feast.infra.offline_stores.file_source import FileSource
+from feast.stream_feature_view import StreamFeatureView
+from feast.types import Float32
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _stream_feature_view(aggregations, declare_features=True):
+    return StreamFeatureView(
+        name="driver_trips",
+        entities=[Entity(name="driver", join_keys=["driver_id"])],
+        schema=[
+            Field(name="trips", dtype=Float32),
+            *[
+                Field(name=a.feature_name, dtype=Float32)
+                for a in aggregations
+                if declare_features
+            ],
+        ],
+        aggregations=aggregations,
+        timestamp_field="event_timestamp",
+        source=KafkaSource(
+            name="kafka",
+            timestamp_field="event_timestamp",
+            kafka_bootstrap_servers="",
+            message_format=AvroFormat(""),
+            topic="topic",
+            batch_source=FileSource(path="some path"),
+        ),
+    )
+
+
+def _events(*events):
+    return pd.DataFrame(
+        [
+            {
+                "driver_id": driver_id,
+                "trips": trips,
+                "event_timestamp": START + timedelta(minutes=minutes),
+            }
+            for driver_id, trips, minutes in events
+        ]
+    )
+
+
+def _by_driver(df: pd.DataFrame) -> dict:
+    return {row.pop("driver_id"): row for row in df.to_dict("records")}
+
+
+def test_feature_name():
+    assert Aggregation(column="trips", function="sum").feature_name == "trips_sum"
+    assert (
+        Aggregation(
+            column="trips", function="sum", time_window=timedelta(hours=1)
+        ).feature_name
+        == "trips_sum_1h"
+    )
+    assert (
+        Aggregation(
+            column="trips", function="max", time_window=timedelta(minutes=90)
+        ).feature_name
+        == "trips_max_90m"
+    )
+
+
+def test_unsupported_function():
+    sfv = _stream_feature_view(
+        [Aggregation(column="trips", function="p99", time_window=timedelta(hours=1))]
+    )
+    with pytest.raises(ValueError):
+        StreamAggregator(sfv, ["driver_id"])
+
+
+def test_get_stream_aggregator():
+    aggregations = [
+        Aggregation(column="trips", function="sum", time_window=timedelta(hours=1))
+    ]
+    sfv = _stream_feature_view(aggregations)
+    assert get_stream_aggregator(sfv, ["driver_id"], native_aggregation=False) is None
+    assert isinstance(
+        get_stream_aggregator(sfv, ["driver_id"], native_aggregation=True),
+        StreamAggregator,
+    )
+
+    # Views whose schema doesn't declare the aggregates, or with functions Feast can't compute, are left to
+    # their transformation
+    sfv = _stream_feature_view(aggregations, declare_features=False)
+    assert get_stream_aggregator(sfv, ["driver_id"], native_aggregation=True) is None
+    sfv = _stream_feature_view(
+        [Aggregation(column="trips", function="p99", time_window=timedelta(hours=1))]
+    )
+    assert get_stream_aggregator(sfv, ["driver_id"], native_aggregation=True) is None
+
+
+def test_windowed_aggregations_across_batches():
+    window = timedelta(hours=1)
+    aggregations = [
+        Aggregation(column="trips", function=function, time_window=window)
+        for function in ("sum", "count", "min", "max", "mean")
+    ]
+    aggregator = StreamAggregator(
+        _stream_feature_view(aggregations), ["driver_id"], clock=lambda: START
+    )
+
+    first = _by_driver(aggregator.update(_events((1, 2, 0), (1, 4, 10), (2, 1, 5))))
+    assert first[1]["trips_sum_1h"] == 6
+    assert first[1]["trips_count_1h"] == 2
+    assert first[1]["trips_min_1h"] == 2
+    assert first[1]["trips_max_1h"] == 4
+    assert first[1]["trips_mean_1h"] == 3
+    assert first[1]["event_timestamp"] == START + timedelta(minutes=10)
+    assert first[2]["trips_sum_1h"] == 1
+
+    # The first hour has left the window of every driver, including the one without new events
+    second = _by_driver(aggregator.update(_events((1, 10, 70))))
+    assert list(second) == [1, 2]
+    assert second[1]["trips_sum_1h"] == 10
+    assert second[1]["trips_count_1h"] == 1
+    assert second[1]["trips_min_1h"] == 10
+    assert second[2]["trips_count_1h"] == 0
+    assert pd.isna(second[2]["trips_sum_1h"])
+    assert second[2]["event_timestamp"] == START + timedelta(minutes=70)
+
+    # Drivers whose aggregates did not change are not emitted
+    assert aggregator.update(_events((1, 1, 75))).driver_id.tolist() == [1]
+
+
+def test_windows_expire_with_the_processing_clock():
+    aggregation = Aggregation(
+        column="trips", function="sum", time_window=timedelta(hours=1)
+    )
+    now = START
+    aggregator = StreamAggregator(
+        _stream_feature_view([aggregation]), ["driver_id"], clock=lambda: now
+    )
+
+    assert _by_driver(aggregator.update(_events((1, 2, 0))))[1]["trips_sum_1h"] == 2
+    now = START + timedelta(minutes=30)
+    assert aggregator.update(_events()).empty
+
+    # Without new events, the driver's aggregate expires once its hour has passed
+    now = START + timedelta(minutes=61)
+    expired = _by_driver(aggregator.update(_events()))
+    assert pd.isna(expired[1]["trips_sum_1h"])
+    assert expired[1]["event_timestamp"] == now
+    assert aggregator.update(_events()).empty
+
+
+def test_sliding_window_uses_slide_interval_tiles():
+    aggregation = Aggregation(
+        column="trips",
+        function="sum",
+        time_window=timedelta(hours=1),
+        slide_interval=timedelta(minutes=15),
+    )
+    aggregator = StreamAggregator(
+        _stream_feature_view([aggregation]), ["driver_id"], clock=lambda: START
+    )
+
+    aggregator.update(_events((1, 1, 0), (1, 2, 20), (1, 3, 40)))
+    # The 00:00-00:15 tile is outside the window ending with the 01:00-01:15 tile
+    result = _by_driver(aggregator.update(_events((1, 4, 65))))
+    assert result[1]["trips_sum_1h"] == 9
+
+
+def test_late_events_are_merged_into_their_tile():
+    aggregation = Aggregation(
+        column="trips", function="sum", time_window=timedelta(hours=2)
+    )
+    aggregator = StreamAggregator(
+        _stream_feature_view([aggregation]), ["driver_id"], clock=lambda: START
+    )
+
+    aggregator.update(_events((1, 1, 100)))
+    result = _by_driver(aggregator.update(_events((1, 5, 10))))
+    assert result[1]["trips_sum_2h"] == 6
+    # The emitted timestamp stays the one of the batch's latest event for the entity
+    assert result[1]["event_timestamp"] == START + timedelta(minutes=10)
+
+
+def test_unbounded_aggregation():
+    aggregator = StreamAggregator(
+        _stream_feature_view([Aggregation(column="trips", function="count")]),
+        ["driver_id"],
+        clock=lambda: START,
+    )
+
+    aggregator.update(_events((1, 1, 0)))
+    result = _by_driver(aggregator.update(_events((1, 1, 60 * 24 * 30))))
+    assert result[1]["trips_count"] == 2
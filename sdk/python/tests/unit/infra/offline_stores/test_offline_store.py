@@ -257,3 +257,27 @@ def test_to_arrow_timeout(retrieval_job, timeout: Optional[int]):
     with patch.object(retrieval_job, "_to_arrow_internal") as mock_to_arrow_internal:
         retrieval_job.to_arrow(timeout=timeout)
         mock_to_arrow_internal.assert_called_once_with(timeout=timeout)
+
+
+@pytest.mark.parametrize("timeout", (None, 30))
+def test_to_arrow_batches_timeout(retrieval_job, timeout: Optional[int]):
+    if isinstance(retrieval_job, SnowflakeRetrievalJob):
+        pytest.skip("Snowflake streams batches from a temporary table instead")
+    batch = pyarrow.RecordBatch.from_pydict({"a": [1]})
+    with patch.object(
+        retrieval_job, "_to_arrow_batches_internal", return_value=iter([batch])
+    ) as mock_to_arrow_batches_internal:
+        batches = list(retrieval_job.to_arrow_batches(timeout=timeout))
+        assert batches == [batch]
+        mock_to_arrow_batches_internal.assert_called_once_with(timeout=timeout)
+
+
+def test_to_arrow_batches_empty_result_keeps_schema():
+    schema = pyarrow.schema([("a", pyarrow.int64())])
+    with patch.object(
+        MockRetrievalJob, "_to_arrow_internal", return_value=schema.empty_table()
+    ):
+        batches = list(MockRetrievalJob().to_arrow_batches())
+    assert len(batches) == 1
+    assert batches[0].num_rows == 0
+    assert batches[0].schema == schema
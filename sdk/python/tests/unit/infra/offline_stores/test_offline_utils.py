@@ -0,0 +1,162 @@
+import os
+from datetime import datetime, timedelta, timezone
+
+import pyarrow as pa
+import pyarrow.parquet
+import pytest
+
+from feast import Entity, FeatureView, Field, FileSource, RepoConfig
+from feast.data_format import ParquetFormat
+from feast.infra.offline_stores.dask import DaskOfflineStore, DaskOfflineStoreConfig
+from feast.infra.offline_stores.duckdb import (
+    DuckDBOfflineStore,
+    DuckDBOfflineStoreConfig,
+)
+from feast.infra.offline_stores.offline_utils import (
+    compact_parquet_dataset,
+    get_parquet_dataset_root,
+    write_parquet_dataset_part,
+)
+from feast.types import Int64
+
+
+@pytest.mark.parametrize(
+    "path,expected",
+    [
+        ("data/driver_stats.parquet", None),
+        ("data/driver_stats", "data/driver_stats"),
+        ("data/driver_stats/", "data/driver_stats"),
+        ("data/driver_stats/*.parquet", "data/driver_stats"),
+        ("data/driver_stats/**/*.parquet", "data/driver_stats"),
+        ("*.parquet", "."),
+        ("/*.parquet", "/"),
+    ],
+)
+def test_get_parquet_dataset_root(path, expected):
+    assert get_parquet_dataset_root(path) == expected
+
+
+def test_get_parquet_dataset_root_looks_up_existing_paths(tmp_path):
+    # Existing single files are not datasets, whatever their extension
+    for name in ["driver_stats", "driver_stats.pq"]:
+        pyarrow.parquet.write_table(pa.table({"driver_id": [1]}), tmp_path / name)
+        assert get_parquet_dataset_root(str(tmp_path / name)) is None
+
+    (tmp_path / "dataset.parquet").mkdir()
+    assert get_parquet_dataset_root(str(tmp_path / "dataset.parquet")) == str(
+        tmp_path / "dataset.parquet"
+    )
+
+
+def _make_table(start: datetime, rows: int) -> pa.Table:
+    return pa.table(
+        {
+            "driver_id": list(range(rows)),
+            "event_timestamp": [start + timedelta(hours=12 * i) for i in range(rows)],
+        }
+    )
+
+
+def test_write_parquet_dataset_part_appends_files(tmp_path):
+    root = str(tmp_path / "dataset")
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    write_parquet_dataset_part(_make_table(start, 2), root)
+    write_parquet_dataset_part(_make_table(start, 3), root)
+
+    assert len(os.listdir(root)) == 2
+    assert pyarrow.parquet.read_table(root).num_rows == 5
+
+
+def test_write_parquet_dataset_part_partitions_by_event_date(tmp_path):
+    root = str(tmp_path / "dataset")
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    write_parquet_dataset_part(
+        _make_table(start, 4), root, partition_by_event_date="event_timestamp"
+    )
+
+    assert sorted(os.listdir(root)) == ["2024-01-01", "2024-01-02"]
+    table = pyarrow.parquet.read_table(root)
+    assert table.num_rows == 4
+    assert table.column_names == ["driver_id", "event_timestamp"]
+
+
+def test_compact_parquet_dataset(tmp_path):
+    root = str(tmp_path / "dataset")
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for _ in range(3):
+        write_parquet_dataset_part(
+            _make_table(start, 4), root, partition_by_event_date="event_timestamp"
+        )
+
+    assert compact_parquet_dataset(root) == 6
+
+    for directory in os.listdir(root):
+        assert len(os.listdir(os.path.join(root, directory))) == 1
+    assert pyarrow.parquet.read_table(root).num_rows == 12
+    assert compact_parquet_dataset(root) == 0
+
+
+@pytest.mark.parametrize(
+    "offline_store,offline_store_config,source_path",
+    [
+        (DaskOfflineStore, DaskOfflineStoreConfig, "stats"),
+        (DuckDBOfflineStore, DuckDBOfflineStoreConfig, "stats/**/*.parquet"),
+    ],
+)
+def test_offline_write_batch_appends_to_dataset(
+    tmp_path, offline_store, offline_store_config, source_path
+):
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    def make_table(driver_ids):
+        return pa.table(
+            {
+                "driver_id": pa.array(driver_ids, pa.int64()),
+                "trips": pa.array([1] * len(driver_ids), pa.int64()),
+                "event_timestamp": pa.array(
+                    [start + timedelta(hours=12 * i) for i in range(len(driver_ids))],
+                    pa.timestamp("us", tz="UTC"),
+                ),
+            }
+        )
+
+    (tmp_path / "stats").mkdir()
+    pyarrow.parquet.write_table(make_table([0, 1]), tmp_path / "stats" / "0.parquet")
+    source = FileSource(
+        path=str(tmp_path / source_path),
+        timestamp_field="event_timestamp",
+        file_format=ParquetFormat(),
+    )
+    feature_view = FeatureView(
+        name="stats",
+        entities=[Entity(name="driver", join_keys=["driver_id"])],
+        schema=[Field(name="driver_id", dtype=Int64), Field(name="trips", dtype=Int64)],
+        source=source,
+    )
+    config = RepoConfig(
+        project="project",
+        registry=str(tmp_path / "registry.db"),
+        provider="local",
+        offline_store=offline_store_config(offline_write_partition_by_event_date=True),
+        entity_key_serialization_version=2,
+    )
+
+    offline_store.offline_write_batch(config, feature_view, make_table([2, 3, 4]), None)
+
+    assert sorted(os.listdir(tmp_path / "stats")) == [
+        "0.parquet",
+        "2024-01-01",
+        "2024-01-02",
+    ]
+    df = offline_store.pull_all_from_table_or_query(
+        config,
+        source,
+        ["driver_id"],
+        ["trips"],
+        "event_timestamp",
+        start - timedelta(days=1),
+        start + timedelta(days=5),
+    ).to_df()
+    assert sorted(df["driver_id"]) == [0, 1, 2, 3, 4]
@@ -2,6 +2,7 @@ import re
 from unittest.mock import ANY, MagicMock, patch
 
 import pandas as pd
+import pyarrow as pa
 import pytest
 from pytest_mock import MockFixture
 
@@ -82,3 +83,33 @@ def test_snowflake_to_df_internal(
     )
     retrieval_job._feature_views = [feature_view]
     retrieval_job._to_df_internal()
+
+
+def test_snowflake_to_arrow_batches(
+    retrieval_job: SnowflakeRetrievalJob, mocker: MockFixture
+):
+    mocker.patch.object(retrieval_job, "to_snowflake")
+    mock_execute = mocker.patch(
+        "feast.infra.offline_stores.snowflake.execute_snowflake_statement"
+    )
+    mock_execute.return_value.fetch_arrow_batches.return_value = iter(
+        [
+            pa.table({"feature1": [1, 2]}),
+            pa.table({"feature1": [3]}),
+        ]
+    )
+
+    # Snowflake returns tables, which are yielded as record batches
+    batches = list(retrieval_job.to_arrow_batches())
+    assert all(isinstance(batch, pa.RecordBatch) for batch in batches)
+    assert pa.Table.from_batches(batches).column("feature1").to_pylist() == [1, 2, 3]
+
+    # An empty result still yields one batch with the schema of the result
+    mock_execute.return_value.fetch_arrow_batches.return_value = iter([])
+    mock_execute.return_value.fetch_arrow_all.return_value = pa.table(
+        {"feature1": pa.array([], type=pa.int64())}
+    )
+    batches = list(retrieval_job.to_arrow_batches())
+    assert len(batches) == 1
+    assert batches[0].num_rows == 0
+    assert batches[0].schema == pa.schema([("feature1", pa.int64())])
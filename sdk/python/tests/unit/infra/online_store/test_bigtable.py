@@ -0,0 +1,107 @@
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from feast import Entity, FeatureView, Field, FileSource, RepoConfig
+from feast.infra.online_stores.bigtable import BigtableOnlineStore
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.types import Int32
+
+EVENT_TS = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def repo_config():
+    return RepoConfig(
+        provider="gcp",
+        project="test",
+        entity_key_serialization_version=2,
+        registry="dummy_registry.db",
+        online_store={"type": "bigtable", "instance": "test", "read_batch_size": 2},
+    )
+
+
+@pytest.fixture
+def feature_view():
+    return FeatureView(
+        name="feature_view_1",
+        entities=[Entity(name="entity", join_keys=["entity"])],
+        schema=[Field(name="feature_10", dtype=Int32)],
+        source=FileSource(name="my_file_source", path="test.parquet"),
+    )
+
+
+def _entity_key(value: int) -> EntityKeyProto:
+    return EntityKeyProto(
+        join_keys=["entity"], entity_values=[ValueProto(int32_val=value)]
+    )
+
+
+def _bt_row(row_key: bytes, value: int):
+    return SimpleNamespace(
+        row_key=row_key,
+        cells={
+            "features": {
+                b"feature_10": [
+                    SimpleNamespace(
+                        value=ValueProto(int32_val=value).SerializeToString()
+                    )
+                ],
+                b"event_ts": [SimpleNamespace(value=EVENT_TS.isoformat().encode())],
+            }
+        },
+    )
+
+
+@pytest.fixture
+def store_with_rows(repo_config, feature_view):
+    """A store whose table holds entities 1, 3 and 4, and returns found rows in reverse order."""
+    store = BigtableOnlineStore()
+    stored = {}
+    for i in (1, 3, 4):
+        row_key = store._compute_row_key(_entity_key(i), feature_view.name, repo_config)
+        stored[row_key] = i
+
+    def read_rows(row_set, filter_):
+        keys = [k for k in row_set.row_keys if k in stored]
+        return [_bt_row(k, stored[k]) for k in reversed(keys)]
+
+    bt_table = MagicMock()
+    bt_table.read_rows.side_effect = read_rows
+    store._tables = {store._get_table_name(repo_config, feature_view): bt_table}
+    return store, bt_table
+
+
+def _values(result):
+    return [r[1]["feature_10"].int32_val if r[1] else None for r in result]
+
+
+def test_online_read_batches_and_aligns_rows(
+    repo_config, feature_view, store_with_rows
+):
+    store, bt_table = store_with_rows
+
+    result = store.online_read(
+        repo_config, feature_view, [_entity_key(i) for i in range(5)], ["feature_10"]
+    )
+
+    assert _values(result) == [None, 1, None, 3, 4]
+    assert all(r[0] == EVENT_TS for r in result if r[1])
+    assert bt_table.read_rows.call_count == 3
+
+
+def test_online_read_async(repo_config, feature_view, store_with_rows):
+    store, bt_table = store_with_rows
+
+    result = asyncio.run(
+        store.online_read_async(
+            repo_config, feature_view, [_entity_key(i) for i in range(5)]
+        )
+    )
+
+    assert _values(result) == [None, 1, None, 3, 4]
+    assert bt_table.read_rows.call_count == 3
@@ -0,0 +1,107 @@
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from feast import Entity, FeatureView, Field, FileSource, RepoConfig
+from feast.infra.online_stores.contrib.hbase_online_store.hbase import (
+    HbaseOnlineStore,
+)
+from feast.infra.utils.hbase_utils import HbaseConstants
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.types import Int32
+
+
+class _FakeConnector:
+    """Returns the stored rows it finds, in reverse order, like a server free to reorder them."""
+
+    rows_by_key: dict = {}
+    calls: list = []
+
+    def __init__(self, pool):
+        pass
+
+    def rows(self, table_name, row_keys, columns=None):
+        _FakeConnector.calls.append((list(row_keys), columns))
+        found = [(k, self.rows_by_key[k]) for k in row_keys if k in self.rows_by_key]
+        return list(reversed(found))
+
+
+@pytest.fixture
+def repo_config():
+    return RepoConfig(
+        provider="local",
+        project="test",
+        entity_key_serialization_version=2,
+        registry="dummy_registry.db",
+        online_store={
+            "type": "hbase",
+            "host": "localhost",
+            "port": "9090",
+            "read_batch_size": 2,
+        },
+    )
+
+
+@pytest.fixture
+def feature_view():
+    return FeatureView(
+        name="feature_view_1",
+        entities=[Entity(name="entity", join_keys=["entity"])],
+        schema=[
+            Field(name="feature_10", dtype=Int32),
+            Field(name="feature_11", dtype=Int32),
+        ],
+        source=FileSource(name="my_file_source", path="test.parquet"),
+    )
+
+
+def _entity_key(value: int) -> EntityKeyProto:
+    return EntityKeyProto(
+        join_keys=["entity"], entity_values=[ValueProto(int32_val=value)]
+    )
+
+
+def test_online_read_aligns_results_with_entity_keys(repo_config, feature_view):
+    store = HbaseOnlineStore()
+    store._conn = object()
+    event_ts = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    _FakeConnector.calls = []
+    _FakeConnector.rows_by_key = {
+        store._hbase_row_key(_entity_key(i), feature_view.name, repo_config): {
+            HbaseConstants.get_col_from_feature("feature_10").encode(): ValueProto(
+                int32_val=i
+            ).SerializeToString(),
+            HbaseConstants.DEFAULT_EVENT_TS.encode(): int(
+                event_ts.timestamp()
+            ).to_bytes(4, "big"),
+        }
+        for i in (1, 3, 4)
+    }
+
+    with patch(
+        "feast.infra.online_stores.contrib.hbase_online_store.hbase.HBaseConnector",
+        _FakeConnector,
+    ):
+        result = store.online_read(
+            repo_config,
+            feature_view,
+            [_entity_key(i) for i in range(5)],
+            requested_features=["feature_10"],
+        )
+
+    assert [r[1]["feature_10"].int32_val if r[1] else None for r in result] == [
+        None,
+        1,
+        None,
+        3,
+        4,
+    ]
+    assert all(r[0] == event_ts for r in result if r[1])
+    # Keys are fetched in batches of read_batch_size, restricted to the requested columns
+    assert [len(keys) for keys, _ in _FakeConnector.calls] == [2, 2, 1]
+    assert _FakeConnector.calls[0][1] == [
+        "default:feature_10",
+        HbaseConstants.DEFAULT_EVENT_TS,
+    ]
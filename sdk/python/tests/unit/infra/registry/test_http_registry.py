@@ -0,0 +1,106 @@
+import json
+from collections import Counter
+from unittest.mock import patch
+
+import httpx
+
+from feast import Entity
+from feast.expediagroup.pydantic_models.entity_model import EntityModel
+from feast.infra.registry.http import HttpRegistry, HttpRegistryConfig
+from feast.protos.feast.core.Registry_pb2 import Registry as RegistryProto
+
+
+class _RegistryServer:
+    def __init__(self, last_updated_timestamp: str):
+        self.last_updated_timestamp = last_updated_timestamp
+        self.entity = json.loads(
+            EntityModel.from_entity(
+                Entity(name="driver", join_keys=["driver_id"])
+            ).model_dump_json()
+        )
+        self.snapshot = RegistryProto()
+        self.snapshot.entities.add().spec.name = "driver"
+        self.requests: Counter = Counter()
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        self.requests[path] += 1
+        if path in ["/projects", "/projects/project"]:
+            return httpx.Response(
+                200,
+                json={
+                    "project_name": "project",
+                    "project_uuid": "uuid",
+                    "last_updated_timestamp": self.last_updated_timestamp,
+                },
+            )
+        if path == "/projects/project/entities":
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json=[self.entity], headers={"ETag": '"v1"'})
+        if path == "/snapshot":
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200, content=self.snapshot.SerializeToString(), headers={"ETag": '"v1"'}
+            )
+        return httpx.Response(200, json=[])
+
+
+def _create_registry(server: _RegistryServer, **config) -> HttpRegistry:
+    with patch(
+        "feast.infra.registry.http.httpx.HTTPTransport",
+        return_value=httpx.MockTransport(server.handle),
+    ):
+        return HttpRegistry(
+            HttpRegistryConfig(path="http://registry", **config), "project", None
+        )
+
+
+def test_proto_skips_unchanged_projects():
+    server = _RegistryServer(last_updated_timestamp="2024-01-01T00:00:00")
+    registry = _create_registry(server)
+    assert [e.spec.name for e in registry.proto().entities] == ["driver"]
+    assert registry.proto().entities[0].spec.project == "project"
+
+    assert server.requests["/projects/project"] == 3
+    assert server.requests["/projects/project/entities"] == 1
+    assert server.requests["/projects/project/feature_views"] == 1
+
+
+def test_proto_revalidates_changed_projects():
+    server = _RegistryServer(last_updated_timestamp="2024-01-01T00:00:00")
+    registry = _create_registry(server)
+    server.last_updated_timestamp = "2024-01-02T00:00:00"
+
+    registry_proto = registry.proto()
+
+    assert [e.spec.name for e in registry_proto.entities] == ["driver"]
+    assert registry_proto.project_metadata[0].project == "project"
+    assert server.requests["/projects/project/entities"] == 2
+    assert server.requests["/projects/project/feature_views"] == 2
+
+
+def test_proto_from_snapshot_endpoint():
+    server = _RegistryServer(last_updated_timestamp="2024-01-01T00:00:00")
+    registry = _create_registry(server, snapshot_endpoint=True)
+
+    assert registry.proto() is registry.cached_registry_proto
+    assert [e.spec.name for e in registry.cached_registry_proto.entities] == ["driver"]
+    assert server.requests["/snapshot"] == 2
+    assert server.requests["/projects/project/entities"] == 0
+
+
+def test_proto_without_project_metadata():
+    server = _RegistryServer(last_updated_timestamp="2024-01-01T00:00:00")
+    registry = _create_registry(server)
+
+    # Projects without metadata are fetched again every time
+    for project_metadata in [None, []]:
+        with patch.object(
+            registry, "list_project_metadata", return_value=project_metadata
+        ):
+            registry_proto = registry.proto()
+        assert [e.spec.name for e in registry_proto.entities] == ["driver"]
+        assert len(registry_proto.project_metadata) == 0
+    assert server.requests["/projects/project/feature_views"] == 3
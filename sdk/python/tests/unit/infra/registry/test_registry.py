@@ -0,0 +1,151 @@
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from feast import Entity
+from feast.errors import RegistryConflictException
+from feast.infra.registry.registry import Registry
+from feast.repo_config import RegistryConfig
+
+
+def _registry(tmp_path) -> Registry:
+    return Registry(
+        "project", RegistryConfig(path=str(tmp_path / "registry.db")), tmp_path
+    )
+
+
+def _entities(count: int):
+    return [Entity(name=f"entity_{i}", join_keys=[f"id_{i}"]) for i in range(count)]
+
+
+def test_transaction_commits_once(tmp_path):
+    registry = _registry(tmp_path)
+    registry.apply_entity(Entity(name="entity_0", join_keys=["old_id"]), "project")
+
+    registry_store = registry._registry_store
+    with patch.object(
+        registry_store,
+        "update_registry_proto",
+        wraps=registry_store.update_registry_proto,
+    ) as update_registry_proto, patch.object(
+        registry_store,
+        "update_registry_proto_if_unchanged",
+        wraps=registry_store.update_registry_proto_if_unchanged,
+    ) as update_registry_proto_if_unchanged:
+        with registry.transaction("project"):
+            for entity in _entities(50):
+                registry.apply_entity(entity, "project", commit=True)
+            registry.delete_entity("entity_1", "project", commit=True)
+            assert len(registry.list_entities("project")) == 49
+
+    update_registry_proto.assert_not_called()
+    assert update_registry_proto_if_unchanged.call_count == 1
+    entities = _registry(tmp_path).list_entities("project")
+    assert len(entities) == 49
+    assert {e.join_key for e in entities if e.name == "entity_0"} == {"id_0"}
+
+
+def test_failed_transaction_is_rolled_back(tmp_path):
+    registry = _registry(tmp_path)
+    registry.apply_entity(Entity(name="driver", join_keys=["driver_id"]), "project")
+
+    with pytest.raises(ValueError):
+        with registry.transaction("project"):
+            for entity in _entities(3):
+                registry.apply_entity(entity, "project", commit=False)
+            raise ValueError()
+
+    assert [e.name for e in registry.list_entities("project", allow_cache=True)] == [
+        "driver"
+    ]
+    assert [e.name for e in _registry(tmp_path).list_entities("project")] == ["driver"]
+
+
+def test_transaction_detects_concurrent_changes(tmp_path):
+    registry = _registry(tmp_path)
+    registry.apply_entity(Entity(name="driver", join_keys=["driver_id"]), "project")
+
+    with pytest.raises(RegistryConflictException):
+        with registry.transaction("project"):
+            registry.apply_entity(
+                Entity(name="customer", join_keys=["customer_id"]), "project"
+            )
+            _registry(tmp_path).apply_entity(
+                Entity(name="rider", join_keys=["rider_id"]), "project"
+            )
+
+    names = {e.name for e in _registry(tmp_path).list_entities("project")}
+    assert names == {"driver", "rider"}
+    assert {e.name for e in registry.list_entities("project", allow_cache=True)} == {
+        "driver",
+        "rider",
+    }
+
+
+def test_other_threads_wait_for_the_transaction(tmp_path):
+    registry = _registry(tmp_path)
+    registry.apply_entity(Entity(name="driver", join_keys=["driver_id"]), "project")
+
+    writer = threading.Thread(
+        target=registry.apply_entity,
+        args=(Entity(name="rider", join_keys=["rider_id"]), "project"),
+    )
+    with pytest.raises(ValueError):
+        with registry.transaction("project"):
+            registry.apply_entity(
+                Entity(name="customer", join_keys=["customer_id"]), "project"
+            )
+            writer.start()
+            writer.join(timeout=0.5)
+            # The write of the other thread is neither part of the transaction nor rolled back with it
+            assert writer.is_alive()
+            raise ValueError()
+    writer.join()
+
+    names = {e.name for e in _registry(tmp_path).list_entities("project")}
+    assert names == {"driver", "rider"}
+
+
+def test_refresh_discards_uncommitted_changes(tmp_path):
+    registry = _registry(tmp_path)
+    registry.apply_entity(Entity(name="driver", join_keys=["driver_id"]), "project")
+    # The registry store now knows the registry is unchanged since it was read
+    registry.refresh("project")
+
+    registry.apply_entity(
+        Entity(name="customer", join_keys=["customer_id"]), "project", commit=False
+    )
+    registry.refresh("project")
+
+    assert [e.name for e in registry.list_entities("project", allow_cache=True)] == [
+        "driver"
+    ]
+
+
+def test_transaction_deletes_keep_the_index_up_to_date(tmp_path):
+    registry = _registry(tmp_path)
+    with registry.transaction("project"):
+        for entity in _entities(10):
+            registry.apply_entity(entity, "project")
+
+    with registry.transaction("project"):
+        registry.delete_entity("entity_2", "project")
+        registry.delete_entity("entity_5", "project")
+        registry.apply_entity(Entity(name="entity_7", join_keys=["new_id"]), "project")
+        registry.delete_entity("entity_9", "project")
+        registry.apply_entity(Entity(name="entity_2", join_keys=["new_id"]), "project")
+
+    entities = {
+        e.name: e.join_key for e in _registry(tmp_path).list_entities("project")
+    }
+    assert entities == {
+        "entity_0": "id_0",
+        "entity_1": "id_1",
+        "entity_2": "new_id",
+        "entity_3": "id_3",
+        "entity_4": "id_4",
+        "entity_6": "id_6",
+        "entity_7": "new_id",
+        "entity_8": "id_8",
+    }
@@ -0,0 +1,137 @@
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import boto3
+import pytest
+from botocore.exceptions import ClientError
+from moto import mock_s3
+
+from feast import Entity
+from feast.errors import RegistryConflictException
+from feast.infra.registry.file import FileRegistryStore
+from feast.infra.registry.gcs import GCSRegistryStore
+from feast.infra.registry.registry import Registry
+from feast.infra.registry.s3 import S3RegistryStore
+from feast.protos.feast.core.Registry_pb2 import Registry as RegistryProto
+from feast.repo_config import RegistryConfig
+
+
+def _registry_proto(version: str) -> RegistryProto:
+    registry_proto = RegistryProto()
+    registry_proto.registry_schema_version = version
+    return registry_proto
+
+
+def test_file_registry_store_reads_only_changed_registry(tmp_path):
+    config = RegistryConfig(path=str(tmp_path / "registry.db"))
+    store = FileRegistryStore(config, tmp_path)
+    writer = FileRegistryStore(config, tmp_path)
+
+    writer.update_registry_proto(_registry_proto("1"))
+    assert store.get_registry_proto().registry_schema_version == "1"
+    assert store.get_registry_proto_if_changed() is None
+
+    writer.update_registry_proto(_registry_proto("22"))
+    assert store.get_registry_proto_if_changed().registry_schema_version == "22"
+    assert store.get_registry_proto_if_changed() is None
+
+
+@mock_s3
+def test_s3_registry_store_reads_only_changed_registry(monkeypatch):
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    boto3.client("s3").create_bucket(Bucket="registry-bucket")
+    config = RegistryConfig(path="s3://registry-bucket/registry.db")
+    store = S3RegistryStore(config, Path("."))
+    writer = S3RegistryStore(config, Path("."))
+
+    writer.update_registry_proto(_registry_proto("1"))
+    assert store.get_registry_proto().registry_schema_version == "1"
+    assert store.get_registry_proto_if_changed() is None
+
+    writer.update_registry_proto(_registry_proto("2"))
+    assert store.get_registry_proto_if_changed().registry_schema_version == "2"
+    assert writer.get_registry_proto_if_changed() is None
+
+
+def test_file_registry_store_writes_only_unchanged_registry(tmp_path):
+    config = RegistryConfig(path=str(tmp_path / "registry.db"))
+    store = FileRegistryStore(config, tmp_path)
+    writer = FileRegistryStore(config, tmp_path)
+
+    store.update_registry_proto_if_unchanged(_registry_proto("1"), "")
+    version_id = store.get_registry_proto().version_id
+    writer.update_registry_proto(_registry_proto("2"))
+
+    with pytest.raises(RegistryConflictException):
+        store.update_registry_proto_if_unchanged(_registry_proto("3"), version_id)
+    registry_proto = store.get_registry_proto()
+    assert registry_proto.registry_schema_version == "2"
+
+    store.update_registry_proto_if_unchanged(
+        _registry_proto("3"), registry_proto.version_id
+    )
+    assert writer.get_registry_proto().registry_schema_version == "3"
+    assert [p.name for p in tmp_path.iterdir()] == ["registry.db"]
+
+
+def test_s3_registry_store_writes_conditionally():
+    with patch("feast.infra.registry.s3.boto3"):
+        store = S3RegistryStore(
+            RegistryConfig(path="s3://registry-bucket/registry.db"), Path(".")
+        )
+    put_object = store.s3_client.meta.client.put_object
+    put_object.return_value = {"ETag": "etag-2"}
+
+    with patch(
+        "feast.infra.registry.s3._supports_conditional_writes", return_value=True
+    ):
+        store.update_registry_proto_if_unchanged(_registry_proto("1"), "")
+        assert put_object.call_args.kwargs["IfNoneMatch"] == "*"
+
+        put_object.side_effect = ClientError(
+            {"Error": {"Code": "PreconditionFailed"}}, "PutObject"
+        )
+        with pytest.raises(RegistryConflictException):
+            store.update_registry_proto_if_unchanged(_registry_proto("2"), "")
+        assert put_object.call_args.kwargs["IfMatch"] == "etag-2"
+
+
+def test_gcs_registry_store_writes_conditionally():
+    from google.api_core.exceptions import PreconditionFailed
+
+    with patch("google.cloud.storage.Client"):
+        store = GCSRegistryStore(
+            RegistryConfig(path="gs://registry-bucket/registry.db"), Path(".")
+        )
+    blob = MagicMock(generation=7)
+    store.gcs_client.get_bucket.return_value.blob.return_value = blob
+
+    store.update_registry_proto_if_unchanged(_registry_proto("1"), "")
+    assert blob.upload_from_file.call_args.kwargs["if_generation_match"] == 0
+
+    blob.upload_from_file.side_effect = PreconditionFailed("changed")
+    with pytest.raises(RegistryConflictException):
+        store.update_registry_proto_if_unchanged(_registry_proto("2"), "")
+    assert blob.upload_from_file.call_args.kwargs["if_generation_match"] == 7
+
+
+def test_registry_keeps_unchanged_cached_registry(tmp_path):
+    config = RegistryConfig(path=str(tmp_path / "registry.db"), cache_ttl_seconds=60)
+    registry = Registry("project", config, tmp_path)
+    registry.apply_entity(Entity(name="driver", join_keys=["driver_id"]), "project")
+    registry.refresh("project")
+    cached_registry_proto = registry.cached_registry_proto
+
+    registry.refresh("project")
+    assert registry.cached_registry_proto is cached_registry_proto
+
+    other_registry = Registry("other_project", config, tmp_path)
+    other_registry.apply_entity(
+        Entity(name="rider", join_keys=["rider_id"]), "other_project"
+    )
+    registry.refresh("project")
+    assert registry.cached_registry_proto is not cached_registry_proto
+    assert {m.project for m in registry.cached_registry_proto.project_metadata} == {
+        "project",
+        "other_project",
+    }
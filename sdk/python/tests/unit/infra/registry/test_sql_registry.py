@@ -0,0 +1,74 @@
+from datetime import timedelta
+
+from feast import Entity, FeatureService, FeatureView, Field, FileSource
+from feast.infra.registry.sql import SqlRegistry
+from feast.repo_config import RegistryConfig
+from feast.types import Float32, Int64
+
+
+def _apply_objects(registry: SqlRegistry, project: str):
+    driver = Entity(name="driver", join_keys=["driver_id"])
+    source = FileSource(
+        name="driver_stats_source",
+        path="driver_stats.parquet",
+        timestamp_field="event_timestamp",
+    )
+    driver_stats = FeatureView(
+        name="driver_stats",
+        entities=[driver],
+        ttl=timedelta(days=1),
+        schema=[
+            Field(name="driver_id", dtype=Int64),
+            Field(name="conv_rate", dtype=Float32),
+        ],
+        source=source,
+    )
+    registry.apply_entity(driver, project, commit=True)
+    registry.apply_data_source(source, project, commit=True)
+    registry.apply_feature_view(driver_stats, project, commit=True)
+    registry.apply_feature_service(
+        FeatureService(name="driver_service", features=[driver_stats]),
+        project,
+        commit=True,
+    )
+
+
+def _serialized(messages):
+    return sorted(message.SerializeToString() for message in messages)
+
+
+def test_proto_matches_registry_objects():
+    registry = SqlRegistry(
+        RegistryConfig(registry_type="sql", path="sqlite://"), "project", None
+    )
+    for project in ["project_a", "project_b"]:
+        _apply_objects(registry, project)
+
+    registry_proto = registry.proto()
+
+    # What the registry proto used to be built from: every object of every project, through its Feast object
+    entities, data_sources, feature_views, feature_services = [], [], [], []
+    for project in ["project_a", "project_b"]:
+        for objects, listed in [
+            (entities, registry.list_entities(project)),
+            (feature_views, registry.list_feature_views(project)),
+            (feature_services, registry.list_feature_services(project)),
+        ]:
+            for obj in listed:
+                obj_proto = obj.to_proto()
+                obj_proto.spec.project = project
+                objects.append(obj_proto)
+        for data_source in registry.list_data_sources(project):
+            data_source_proto = data_source.to_proto()
+            data_source_proto.project = project
+            data_sources.append(data_source_proto)
+
+    assert _serialized(registry_proto.entities) == _serialized(entities)
+    assert _serialized(registry_proto.data_sources) == _serialized(data_sources)
+    assert _serialized(registry_proto.feature_views) == _serialized(feature_views)
+    assert _serialized(registry_proto.feature_services) == _serialized(feature_services)
+    assert sorted(m.project for m in registry_proto.project_metadata) == [
+        "project_a",
+        "project_b",
+    ]
+    assert registry_proto.last_updated.seconds > 0
@@ -1,4 +1,5 @@
 from typing import Any, Dict
+from unittest.mock import patch
 
 import pandas as pd
 import pytest
@@ -10,7 +11,10 @@ from feast.errors import DataSourceNoNameException, SpecifiedFeaturesNotPresentE
 from feast.feature_service import FeatureService
 from feast.feature_view import FeatureView
 from feast.field import Field
-from feast.inference import update_feature_views_with_inferred_features_and_entities
+from feast.inference import (
+    SchemaCache,
+    update_feature_views_with_inferred_features_and_entities,
+)
 from feast.infra.offline_stores.contrib.spark_offline_store.spark_source import (
     SparkSource,
 )
@@ -556,3 +560,53 @@ def test_update_feature_services_with_specified_features(simple_dataset_1):
 
 
 # TODO(felixwang9817): Add tests that interact with field mapping.
+
+
+def test_schema_cache_looks_up_each_table_once(simple_dataset_1):
+    with prep_file_source(df=simple_dataset_1, timestamp_field="ts_1") as file_source:
+        other_source = FileSource(
+            name="other",
+            file_format=file_source.file_format,
+            path=file_source.path,
+            timestamp_field="ts_2",
+        )
+        config = RepoConfig(
+            provider="local",
+            project="test",
+            entity_key_serialization_version=2,
+            registry="dummy_registry.pb",
+        )
+
+        with patch.object(
+            FileSource,
+            "get_table_column_names_and_types",
+            autospec=True,
+            side_effect=FileSource.get_table_column_names_and_types,
+        ) as get_schema:
+            with SchemaCache(config) as schema_cache:
+                schema_cache.prefetch([file_source, other_source])
+                columns = schema_cache.get_table_column_names_and_types(other_source)
+
+        assert get_schema.call_count == 1
+        assert ("float_col", "double") in columns
+
+
+def test_schema_cache_reuses_cached_schemas(simple_dataset_1, tmp_path):
+    with prep_file_source(df=simple_dataset_1, timestamp_field="ts_1") as file_source:
+        config = RepoConfig(
+            provider="local",
+            project="test",
+            entity_key_serialization_version=2,
+            registry="dummy_registry.pb",
+            repo_path=tmp_path,
+            schema_inference={"cache_ttl_seconds": 3600},
+        )
+        with SchemaCache(config) as schema_cache:
+            columns = schema_cache.get_table_column_names_and_types(file_source)
+        assert (tmp_path / "data" / "schema_cache.json").exists()
+
+        with patch.object(
+            FileSource, "get_table_column_names_and_types"
+        ) as get_schema, SchemaCache(config) as schema_cache:
+            assert schema_cache.get_table_column_names_and_types(file_source) == columns
+        get_schema.assert_not_called()
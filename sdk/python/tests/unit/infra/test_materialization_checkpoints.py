@@ -0,0 +1,171 @@
+import os
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from feast import Entity, FeatureStore, FeatureView, Field, FileSource
+from feast.infra.materialization.checkpoints import get_materialization_shards
+from feast.infra.materialization.local_engine import LocalMaterializationEngine
+from feast.infra.offline_stores.dask import DaskOfflineStore
+from feast.infra.online_stores.sqlite import SqliteOnlineStoreConfig
+from feast.repo_config import RepoConfig
+from feast.types import Float32, Int64
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def test_get_materialization_shards():
+    assert get_materialization_shards(
+        START, START + timedelta(hours=5), timedelta(hours=2)
+    ) == [
+        (START, START + timedelta(hours=2)),
+        (START + timedelta(hours=2), START + timedelta(hours=4)),
+        (START + timedelta(hours=4), START + timedelta(hours=5)),
+    ]
+    assert get_materialization_shards(
+        START, START + timedelta(hours=5), timedelta(0)
+    ) == [(START, START + timedelta(hours=5))]
+
+
+def _create_store(
+    data_dir: str, batch_engine="local", **materialization
+) -> FeatureStore:
+    stats_path = os.path.join(data_dir, "driver_stats.parquet")
+    pd.DataFrame(
+        {
+            "driver_id": [1001] * 5,
+            "conv_rate": [0.1, 0.2, 0.3, 0.4, 0.5],
+            "event_timestamp": [START + timedelta(hours=i) for i in range(5)],
+        }
+    ).to_parquet(stats_path)
+
+    driver = Entity(name="driver", join_keys=["driver_id"])
+    driver_stats = FeatureView(
+        name="driver_stats",
+        entities=[driver],
+        schema=[
+            Field(name="driver_id", dtype=Int64),
+            Field(name="conv_rate", dtype=Float32),
+        ],
+        source=FileSource(path=stats_path, timestamp_field="event_timestamp"),
+    )
+    store = FeatureStore(
+        config=RepoConfig(
+            project="test_materialization_checkpoints",
+            registry=os.path.join(data_dir, "registry.db"),
+            provider="local",
+            entity_key_serialization_version=2,
+            online_store=SqliteOnlineStoreConfig(
+                path=os.path.join(data_dir, "online.db")
+            ),
+            repo_path=data_dir,
+            batch_engine=batch_engine,
+            materialization={"shard_interval_seconds": 3600, **materialization},
+        )
+    )
+    store.apply([driver, driver_stats])
+    return store
+
+
+def test_failed_materialization_resumes_after_completed_shards(tmp_path):
+    store = _create_store(str(tmp_path))
+    pull = DaskOfflineStore.pull_latest_from_table_or_query
+    pulled_shards = []
+
+    def pull_failing_at(failing_start):
+        def pull_latest_from_table_or_query(**kwargs):
+            pulled_shards.append(kwargs["start_date"])
+            if kwargs["start_date"] == failing_start:
+                raise RuntimeError("offline store unavailable")
+            return pull(**kwargs)
+
+        return pull_latest_from_table_or_query
+
+    with patch.object(
+        DaskOfflineStore,
+        "pull_latest_from_table_or_query",
+        side_effect=pull_failing_at(START + timedelta(hours=2)),
+    ):
+        with pytest.raises(RuntimeError, match="offline store unavailable"):
+            store.materialize(START, START + timedelta(hours=5))
+
+    # No shard is materialized after the failed one
+    assert pulled_shards == [START + timedelta(hours=i) for i in range(3)]
+    assert store.get_feature_view("driver_stats").most_recent_end_time is None
+    assert (tmp_path / "data" / "materialization_checkpoints.json").exists()
+
+    pulled_shards.clear()
+    with patch.object(
+        DaskOfflineStore,
+        "pull_latest_from_table_or_query",
+        side_effect=pull_failing_at(None),
+    ):
+        # A rerun starting later, like materialize_incremental with a ttl, resumes too
+        store.materialize(START + timedelta(minutes=30), START + timedelta(hours=5))
+
+    # Only the failed shard and the shards after it are materialized again
+    assert pulled_shards == [START + timedelta(hours=i) for i in range(2, 5)]
+    assert store.get_feature_view(
+        "driver_stats"
+    ).most_recent_end_time == START + timedelta(hours=5)
+    online_features = store.get_online_features(
+        features=["driver_stats:conv_rate"], entity_rows=[{"driver_id": 1001}]
+    ).to_dict()
+    assert online_features["conv_rate"] == [pytest.approx(0.5)]
+
+
+def test_shards_after_a_failed_one_are_not_read(tmp_path):
+    store = _create_store(
+        str(tmp_path), batch_engine={"type": "local", "max_concurrent_tasks": 2}
+    )
+    read_shards = []
+
+    def read_one(registry, task):
+        read_shards.append(task.start_time)
+        if task.start_time == START + timedelta(hours=1):
+            raise RuntimeError("offline store unavailable")
+        return pa.table({"driver_id": pa.array([], pa.int64())})
+
+    with patch.object(LocalMaterializationEngine, "_read_one", side_effect=read_one):
+        with pytest.raises(RuntimeError, match="offline store unavailable"):
+            store.materialize(START, START + timedelta(hours=5))
+
+    # Only the shard after the failed one may already have been read ahead
+    assert len(read_shards) == len(set(read_shards))
+    assert {START, START + timedelta(hours=1)} <= set(read_shards)
+    assert set(read_shards) <= {START + timedelta(hours=i) for i in range(3)}
+
+
+def test_skip_unchanged_sources(tmp_path):
+    store = _create_store(str(tmp_path), skip_unchanged_sources=True)
+    pull = DaskOfflineStore.pull_latest_from_table_or_query
+    with patch.object(
+        DaskOfflineStore, "pull_latest_from_table_or_query", side_effect=pull
+    ) as pull_latest:
+        # Only the hours with rows are materialized
+        store.materialize(START - timedelta(days=1), START + timedelta(hours=2))
+        assert [call.kwargs["start_date"] for call in pull_latest.call_args_list] == [
+            START,
+            START + timedelta(hours=1),
+        ]
+
+        pull_latest.reset_mock()
+        store.materialize_incremental(START + timedelta(days=1))
+        store.materialize(START + timedelta(days=1), START + timedelta(days=2))
+        assert [call.kwargs["start_date"] for call in pull_latest.call_args_list] == [
+            START + timedelta(hours=2),
+            START + timedelta(hours=3),
+            START + timedelta(hours=4),
+        ]
+
+    # Sources without rows in the range are skipped, but still count as materialized
+    assert store.get_feature_view(
+        "driver_stats"
+    ).most_recent_end_time == START + timedelta(days=2)
+    online_features = store.get_online_features(
+        features=["driver_stats:conv_rate"], entity_rows=[{"driver_id": 1001}]
+    ).to_dict()
+    assert online_features["conv_rate"] == [pytest.approx(0.5)]
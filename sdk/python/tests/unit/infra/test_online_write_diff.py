@@ -0,0 +1,117 @@
+import os
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from feast import Entity, FeatureStore, FeatureView, Field, FileSource
+from feast.infra.materialization.local_engine import LocalMaterializationEngine
+from feast.infra.online_stores.redis import RedisOnlineStoreConfig
+from feast.infra.online_stores.sqlite import SqliteOnlineStore, SqliteOnlineStoreConfig
+from feast.repo_config import RepoConfig
+from feast.types import Float32, Int64
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _write_stats(stats_path: str, conv_rates, event_timestamp: datetime):
+    pd.DataFrame(
+        {
+            "driver_id": list(range(1001, 1001 + len(conv_rates))),
+            "conv_rate": conv_rates,
+            "event_timestamp": [event_timestamp] * len(conv_rates),
+        }
+    ).to_parquet(stats_path)
+
+
+def _repo_config(tmp_path, online_store) -> RepoConfig:
+    return RepoConfig(
+        project="test_online_write_diff",
+        registry=os.path.join(tmp_path, "registry.db"),
+        provider="local",
+        entity_key_serialization_version=2,
+        online_store=online_store,
+        repo_path=str(tmp_path),
+        materialization={"online_write_diff": True},
+    )
+
+
+def test_online_write_diff(tmp_path):
+    stats_path = os.path.join(tmp_path, "driver_stats.parquet")
+    _write_stats(stats_path, [0.1, 0.2, 0.3], START)
+
+    driver = Entity(name="driver", join_keys=["driver_id"])
+    driver_stats = FeatureView(
+        name="driver_stats",
+        entities=[driver],
+        schema=[
+            Field(name="driver_id", dtype=Int64),
+            Field(name="conv_rate", dtype=Float32),
+        ],
+        source=FileSource(path=stats_path, timestamp_field="event_timestamp"),
+    )
+    store = FeatureStore(
+        config=_repo_config(
+            tmp_path, SqliteOnlineStoreConfig(path=os.path.join(tmp_path, "online.db"))
+        )
+    )
+    store.apply([driver, driver_stats])
+
+    write = SqliteOnlineStore.online_write_batch
+    written_entities = []
+
+    def online_write_batch(self, config, table, data, progress):
+        written_entities.extend(
+            entity_key.entity_values[0].int64_val for entity_key, _, _, _ in data
+        )
+        return write(self, config, table, data, progress)
+
+    def get_conv_rates():
+        return store.get_online_features(
+            features=["driver_stats:conv_rate"],
+            entity_rows=[{"driver_id": i} for i in range(1001, 1004)],
+        ).to_dict()["conv_rate"]
+
+    with patch.object(SqliteOnlineStore, "online_write_batch", online_write_batch):
+        store.materialize(START, START + timedelta(hours=1))
+        assert written_entities == [1001, 1002, 1003]
+
+        # Only the rows whose values changed are written again
+        written_entities.clear()
+        _write_stats(stats_path, [0.1, 0.25, 0.3], START + timedelta(hours=1))
+        store.materialize(START + timedelta(hours=1), START + timedelta(hours=2))
+        assert written_entities == [1002]
+        assert get_conv_rates() == [
+            pytest.approx(0.1),
+            pytest.approx(0.25),
+            pytest.approx(0.3),
+        ]
+
+        # Every row of a recreated feature view is written again
+        written_entities.clear()
+        store.apply([], objects_to_delete=[driver_stats], partial=False)
+        store.apply([driver_stats])
+        store.materialize(START + timedelta(hours=1), START + timedelta(hours=2))
+        assert written_entities == [1001, 1002, 1003]
+
+        # Every row is written to another online store
+        written_entities.clear()
+        other_store = FeatureStore(
+            config=_repo_config(
+                tmp_path,
+                SqliteOnlineStoreConfig(path=os.path.join(tmp_path, "other_online.db")),
+            )
+        )
+        other_store.apply([driver, driver_stats])
+        other_store.materialize(START + timedelta(hours=1), START + timedelta(hours=2))
+        assert written_entities == [1001, 1002, 1003]
+
+
+def test_online_write_diff_refuses_expiring_online_stores(tmp_path):
+    config = _repo_config(tmp_path, RedisOnlineStoreConfig(key_ttl_seconds=3600))
+    engine = LocalMaterializationEngine(
+        repo_config=config, offline_store=MagicMock(), online_store=MagicMock()
+    )
+    with pytest.raises(ValueError, match="expires keys"):
+        engine.materialize(MagicMock(), [MagicMock()])
@@ -0,0 +1,116 @@
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pyarrow.dataset
+import pytest
+from fastapi.testclient import TestClient
+
+from feast import Entity, FeatureService, FeatureStore, FeatureView, Field, FileSource
+from feast.feature_logging import LOG_TIMESTAMP_FIELD, REQUEST_ID_FIELD, LoggingConfig
+from feast.feature_server import get_app
+from feast.infra.feature_servers.base_config import FeatureLoggingConfig
+from feast.infra.feature_servers.feature_logger import FeatureLogger
+from feast.infra.offline_stores.file_source import FileLoggingDestination
+from feast.infra.online_stores.sqlite import SqliteOnlineStoreConfig
+from feast.repo_config import RepoConfig
+from feast.types import Float32, Int64
+
+
+def _create_store(data_dir: str, sample_rate: float = 1.0):
+    now = datetime.now().replace(microsecond=0)
+    stats_path = os.path.join(data_dir, "driver_stats.parquet")
+    pd.DataFrame(
+        {
+            "driver_id": [1001, 1002],
+            "conv_rate": [0.5, 0.25],
+            "event_timestamp": [now - timedelta(hours=1)] * 2,
+        }
+    ).to_parquet(stats_path)
+
+    driver = Entity(name="driver", join_keys=["driver_id"])
+    driver_stats = FeatureView(
+        name="driver_stats",
+        entities=[driver],
+        schema=[
+            Field(name="driver_id", dtype=Int64),
+            Field(name="conv_rate", dtype=Float32),
+        ],
+        source=FileSource(path=stats_path, timestamp_field="event_timestamp"),
+    )
+    logs_path = os.path.join(data_dir, "logs")
+    feature_service = FeatureService(
+        name="driver_service",
+        features=[driver_stats],
+        logging_config=LoggingConfig(
+            destination=FileLoggingDestination(path=logs_path),
+            sample_rate=sample_rate,
+        ),
+    )
+
+    store = FeatureStore(
+        config=RepoConfig(
+            project="test_feature_server_logging",
+            registry=os.path.join(data_dir, "registry.db"),
+            provider="local",
+            entity_key_serialization_version=2,
+            online_store=SqliteOnlineStoreConfig(
+                path=os.path.join(data_dir, "online.db")
+            ),
+            feature_server={"type": "local", "feature_logging": {"enabled": True}},
+        )
+    )
+    store.apply([driver, driver_stats, feature_service])
+    store.materialize(now - timedelta(days=1), now)
+    return store, logs_path
+
+
+def _read_logs(logs_path: str) -> pd.DataFrame:
+    return pyarrow.dataset.dataset(logs_path).to_table().to_pandas()
+
+
+def test_feature_server_logs_served_features():
+    with tempfile.TemporaryDirectory() as data_dir:
+        store, logs_path = _create_store(data_dir)
+
+        with TestClient(get_app(store)) as client:
+            response = client.post(
+                "/get-online-features",
+                json={
+                    "feature_service": "driver_service",
+                    "entities": {"driver_id": [1001, 1002, 1003]},
+                },
+            )
+            assert response.status_code == 200
+
+        logs = _read_logs(logs_path).sort_values("driver_id")
+        assert logs["driver_id"].tolist() == [1001, 1002, 1003]
+        assert logs["driver_stats__conv_rate"].tolist()[:2] == [0.5, 0.25]
+        assert pd.isna(logs["driver_stats__conv_rate"].tolist()[2])
+        assert logs[REQUEST_ID_FIELD].nunique() == 1
+        assert logs[LOG_TIMESTAMP_FIELD].notna().all()
+
+
+@pytest.mark.parametrize("sample_rate,expected_requests", [(0.0, 0), (1.0, 3)])
+def test_feature_logger_honors_sample_rate(sample_rate, expected_requests):
+    with tempfile.TemporaryDirectory() as data_dir:
+        store, logs_path = _create_store(data_dir, sample_rate=sample_rate)
+        feature_service = store.get_feature_service("driver_service")
+        feature_logger = FeatureLogger(
+            store, FeatureLoggingConfig(enabled=True, flush_max_rows=1)
+        )
+
+        feature_logger.start()
+        for _ in range(3):
+            response = store.get_online_features(
+                features=feature_service, entity_rows=[{"driver_id": 1001}]
+            ).proto
+            feature_logger.log(feature_service, {"driver_id": [1001]}, response)
+        feature_logger.stop()
+
+        if expected_requests == 0:
+            assert not os.path.exists(logs_path)
+        else:
+            logs = _read_logs(logs_path)
+            assert logs[REQUEST_ID_FIELD].nunique() == expected_requests
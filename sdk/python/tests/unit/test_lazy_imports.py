@@ -0,0 +1,49 @@
+import subprocess
+import sys
+
+import pytest
+
+import feast
+
+
+def _modules_loaded_by(statement: str) -> set:
+    output = subprocess.check_output(
+        [
+            sys.executable,
+            "-c",
+            f"import sys; {statement}; print('\\n'.join(sys.modules))",
+        ],
+        text=True,
+    )
+    return set(output.splitlines())
+
+
+@pytest.mark.parametrize(
+    "statement", ["import feast", "from feast import FeatureStore"]
+)
+def test_import_does_not_load_optional_modules(statement):
+    modules = _modules_loaded_by(statement)
+    for module in [
+        "feast.infra.offline_stores.bigquery_source",
+        "feast.infra.offline_stores.redshift_source",
+        "feast.infra.offline_stores.snowflake_source",
+        "feast.feature_server",
+        "feast.ui_server",
+        "fastapi",
+        "sqlalchemy",
+        # Providers and stores are imported from their type when a FeatureStore is created
+        "feast.infra.passthrough_provider",
+        "feast.infra.online_stores.sqlite",
+        "feast.infra.offline_stores.dask",
+        "dask",
+    ]:
+        assert module not in modules
+
+
+def test_lazy_attributes_resolve():
+    from feast.infra.offline_stores.bigquery_source import BigQuerySource
+
+    assert feast.BigQuerySource is BigQuerySource
+    assert "BigQuerySource" in dir(feast)
+    with pytest.raises(AttributeError):
+        feast.NotAFeastAttribute
@@ -1,6 +1,9 @@
+import json
+import math
 import os
 import tempfile
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
 import assertpy
 import pandas as pd
@@ -111,12 +114,160 @@ def test_remote_offline_store_apis():
 
         _test_get_historical_features_returns_data(fs)
         _test_get_historical_features_returns_nan(fs)
+        _test_get_historical_features_to_arrow_batches(fs)
         _test_offline_write_batch(str(temp_dir), fs)
         _test_write_logged_features(str(temp_dir), fs)
         _test_pull_latest_from_table_or_query(str(temp_dir), fs)
         _test_pull_all_from_table_or_query(str(temp_dir), fs)
 
 
+def test_remote_offline_store_partitioned_historical_features():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store = default_store(str(temp_dir))
+        location = "grpc+tcp://localhost:0"
+        server = OfflineServer(store=store, location=location, rows_per_endpoint=1)
+        fs = remote_feature_store(server)
+
+        _test_get_historical_features_returns_data(fs)
+        _test_get_historical_features_to_arrow_batches(fs)
+        assertpy.assert_that(server.flights).is_empty()
+
+
+def _put_historical_features_flight(
+    client: flight.FlightClient,
+) -> flight.FlightDescriptor:
+    entity_df = pd.DataFrame.from_dict(
+        {
+            "driver_id": [1001, 1002, 1003],
+            "event_timestamp": [datetime(2021, 4, 12, 10, 59, 42)] * 3,
+        }
+    )
+    command = {
+        "command_id": "1",
+        "api": "get_historical_features",
+        "feature_view_names": ["driver_hourly_stats"],
+        "name_aliases": [None],
+        "feature_refs": [
+            "driver_hourly_stats:conv_rate",
+            "driver_hourly_stats:avg_daily_trips",
+        ],
+        "project": PROJECT_NAME,
+        "full_feature_names": False,
+    }
+    descriptor = flight.FlightDescriptor.for_command(json.dumps(command))
+    table = pa.Table.from_pandas(entity_df)
+    writer, _ = client.do_put(descriptor, table.schema)
+    writer.write_table(table)
+    writer.close()
+    return descriptor
+
+
+def test_offline_server_flight_info_has_partitions_and_schema():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store = default_store(str(temp_dir))
+        location = "grpc+tcp://localhost:0"
+        server = OfflineServer(store=store, location=location, rows_per_endpoint=2)
+        client = flight.FlightClient(f"grpc://localhost:{server.port}")
+
+        info = client.get_flight_info(_put_historical_features_flight(client))
+
+        assertpy.assert_that(info.endpoints).is_length(2)
+        assertpy.assert_that(info.total_records).is_equal_to(3)
+        assertpy.assert_that(info.schema.names).is_equal_to(
+            ["driver_id", "event_timestamp", "conv_rate", "avg_daily_trips"]
+        )
+        assertpy.assert_that(info.schema.field("conv_rate").type).is_equal_to(
+            pa.float32()
+        )
+
+        tables = [client.do_get(e.ticket).read_all() for e in info.endpoints]
+        assertpy.assert_that([t.num_rows for t in tables]).is_equal_to([1, 2])
+        # The announced schema is the one of the data actually served
+        for table in tables:
+            assertpy.assert_that(table.schema).is_equal_to(info.schema)
+        assertpy.assert_that(server.flights).is_empty()
+
+
+def test_offline_server_releases_flight_after_failed_endpoint():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store = default_store(str(temp_dir))
+        location = "grpc+tcp://localhost:0"
+        server = OfflineServer(store=store, location=location, rows_per_endpoint=1)
+        client = flight.FlightClient(f"grpc://localhost:{server.port}")
+
+        info = client.get_flight_info(_put_historical_features_flight(client))
+        assertpy.assert_that(info.endpoints).is_length(3)
+
+        with patch.object(
+            server, "get_historical_features", side_effect=RuntimeError("failed")
+        ):
+            with pytest.raises(flight.FlightError):
+                client.do_get(info.endpoints[1].ticket).read_all()
+
+        # The other endpoints of the flight are released along with the failed one
+        assertpy.assert_that(server.flights).is_empty()
+        assertpy.assert_that(server._started_jobs).is_empty()
+
+
+def test_offline_server_only_runs_queries_for_fetched_flights():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store = default_store(str(temp_dir))
+        location = "grpc+tcp://localhost:0"
+        server = OfflineServer(store=store, location=location, rows_per_endpoint=2)
+        client = flight.FlightClient(f"grpc://localhost:{server.port}")
+        descriptor = _put_historical_features_flight(client)
+
+        with patch.object(server, "_start_job", wraps=server._start_job) as start_job:
+            (listed,) = client.list_flights()
+            assertpy.assert_that(start_job.call_count).is_equal_to(0)
+            assertpy.assert_that(listed.schema.names).is_empty()
+
+            info = client.get_flight_info(descriptor)
+            assertpy.assert_that(start_job.call_count).is_equal_to(1)
+            (listed,) = client.list_flights()
+            assertpy.assert_that(listed.schema).is_equal_to(info.schema)
+
+        # The job started to learn the schema was not fetched in time, so it is dropped and run again
+        with patch("feast.offline_server.STARTED_JOB_TIMEOUT_SECONDS", 0):
+            tables = [client.do_get(e.ticket).read_all() for e in info.endpoints]
+        assertpy.assert_that([t.num_rows for t in tables]).is_equal_to([1, 2])
+        for table in tables:
+            assertpy.assert_that(table.schema).is_equal_to(info.schema)
+        assertpy.assert_that(server.flights).is_empty()
+        assertpy.assert_that(server._started_jobs).is_empty()
+
+
+def test_offline_server_writes_logged_features_as_they_arrive():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store = default_store(str(temp_dir))
+        location = "grpc+tcp://localhost:0"
+        server = OfflineServer(store=store, location=location)
+        fs = remote_feature_store(server)
+        data_df = pd.read_parquet(
+            os.path.join(temp_dir, fs.project, "feature_repo/data/driver_stats.parquet")
+        )
+        table = pa.Table.from_batches(
+            pa.Table.from_pandas(data_df).to_batches(max_chunksize=100)
+        )
+        feature_service = fs.get_feature_service("driver_activity_v1")
+
+        with patch("feast.offline_server.LOGGED_FEATURES_MAX_ROWS", 200), patch.object(
+            server.offline_store, "write_logged_features"
+        ) as write_logged_features:
+            RemoteOfflineStore.write_logged_features(
+                config=fs.config,
+                data=table,
+                source=FeatureServiceLoggingSource(feature_service, fs.config.project),
+                logging_config=feature_service.logging_config,
+                registry=fs.registry,
+            )
+
+        written = [call.kwargs["data"] for call in write_logged_features.call_args_list]
+        assertpy.assert_that(len(written)).is_equal_to(math.ceil(table.num_rows / 200))
+        assertpy.assert_that(pa.concat_tables(written).equals(table)).is_true()
+        assertpy.assert_that(server.flights).is_empty()
+
+
 def _test_get_historical_features_returns_data(fs: FeatureStore):
     entity_df = pd.DataFrame.from_dict(
         {
@@ -189,6 +340,35 @@ def _test_get_historical_features_returns_nan(fs: FeatureStore):
             assertpy.assert_that(value).is_nan()
 
 
+def _test_get_historical_features_to_arrow_batches(fs: FeatureStore):
+    entity_df = pd.DataFrame.from_dict(
+        {
+            "driver_id": [1001, 1002, 1003],
+            "event_timestamp": [
+                datetime(2021, 4, 12, 10, 59, 42),
+                datetime(2021, 4, 12, 8, 12, 10),
+                datetime(2021, 4, 12, 16, 40, 26),
+            ],
+            "label_driver_reported_satisfaction": [1, 5, 3],
+            "val_to_add": [1, 2, 3],
+            "val_to_add_2": [10, 20, 30],
+        }
+    )
+
+    features = [
+        "driver_hourly_stats:conv_rate",
+        "transformed_conv_rate:conv_rate_plus_val1",
+    ]
+
+    job = fs.get_historical_features(entity_df, features)
+    batches = list(job.to_arrow_batches())
+
+    assertpy.assert_that(batches).is_not_empty()
+    streamed = pa.Table.from_batches(batches)
+    assertpy.assert_that(streamed.num_rows).is_equal_to(3)
+    assertpy.assert_that(streamed.schema).is_equal_to(job.to_arrow().schema)
+
+
 def _test_offline_write_batch(temp_dir, fs: FeatureStore):
     data_file = os.path.join(
         temp_dir, fs.project, "feature_repo/data/driver_stats.parquet"
@@ -0,0 +1,311 @@
+import time
+from concurrent import futures
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import grpc
+import pytest
+from google.protobuf.empty_pb2 import Empty
+
+from feast import (
+    Entity,
+    FeatureStore,
+    FeatureView,
+    Field,
+    FileSource,
+    PushSource,
+    RepoConfig,
+)
+from feast.errors import EntityNotFoundException
+from feast.infra.online_stores.sqlite import SqliteOnlineStoreConfig
+from feast.infra.registry.remote import RemoteRegistry, RemoteRegistryConfig
+from feast.protos.feast.registry import RegistryServer_pb2, RegistryServer_pb2_grpc
+from feast.registry_server import RegistryServer
+from feast.stream_feature_view import StreamFeatureView
+from feast.types import Int64
+
+PROJECT = "test_registry_server"
+
+
+def _create_store(tmp_path) -> FeatureStore:
+    return FeatureStore(
+        config=RepoConfig(
+            project=PROJECT,
+            registry=str(tmp_path / "registry.db"),
+            provider="local",
+            entity_key_serialization_version=2,
+            online_store=SqliteOnlineStoreConfig(path=str(tmp_path / "online.db")),
+        )
+    )
+
+
+@pytest.fixture
+def registry_server(tmp_path):
+    store = _create_store(tmp_path)
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    RegistryServer_pb2_grpc.add_RegistryServerServicer_to_server(
+        RegistryServer(store.registry), server
+    )
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    yield f"127.0.0.1:{port}"
+    server.stop(grace=None)
+
+
+def _wait_for(condition, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return
+        time.sleep(0.05)
+    raise AssertionError("Condition not met in time")
+
+
+def _cached_entity_names(registry: RemoteRegistry):
+    return {e.name for e in registry.list_entities(PROJECT, allow_cache=True)}
+
+
+def test_watch_registry_keeps_snapshot_up_to_date(registry_server):
+    writer = RemoteRegistry(RemoteRegistryConfig(path=registry_server), PROJECT, None)
+    watcher = RemoteRegistry(
+        RemoteRegistryConfig(path=registry_server, watch=True), PROJECT, None
+    )
+    try:
+        _wait_for(lambda: watcher._snapshot is not None)
+
+        driver = Entity(name="driver", join_keys=["driver_id"])
+        writer.apply_entity(driver, PROJECT)
+        _wait_for(lambda: _cached_entity_names(watcher) == {"driver"})
+
+        feature_view = FeatureView(
+            name="driver_stats",
+            entities=[driver],
+            schema=[
+                Field(name="driver_id", dtype=Int64),
+                Field(name="trips", dtype=Int64),
+            ],
+            source=FileSource(path="driver_stats.parquet", timestamp_field="ts"),
+        )
+        writer.apply_feature_view(feature_view, PROJECT)
+        _wait_for(
+            lambda: [
+                fv.name for fv in watcher.list_feature_views(PROJECT, allow_cache=True)
+            ]
+            == ["driver_stats"]
+        )
+        cached = watcher.get_feature_view("driver_stats", PROJECT, allow_cache=True)
+        assert cached.entities == ["driver"]
+
+        writer.delete_entity("driver", PROJECT)
+        _wait_for(lambda: _cached_entity_names(watcher) == set())
+        with pytest.raises(EntityNotFoundException):
+            watcher.get_entity("driver", PROJECT, allow_cache=True)
+    finally:
+        watcher.close()
+        writer.close()
+
+
+def test_reads_without_cache_go_to_the_server(registry_server):
+    watcher = RemoteRegistry(
+        RemoteRegistryConfig(path=registry_server, watch=True), PROJECT, None
+    )
+    try:
+        _wait_for(lambda: watcher._snapshot is not None)
+        watcher.apply_entity(Entity(name="driver", join_keys=["driver_id"]), PROJECT)
+
+        assert watcher.get_entity("driver", PROJECT, allow_cache=False).name == "driver"
+    finally:
+        watcher.close()
+
+
+def test_cached_reads_are_served_from_a_snapshot(registry_server):
+    writer = RemoteRegistry(RemoteRegistryConfig(path=registry_server), PROJECT, None)
+    reader = RemoteRegistry(
+        RemoteRegistryConfig(path=registry_server, cache_ttl_seconds=600),
+        PROJECT,
+        None,
+    )
+    try:
+        assert _cached_entity_names(reader) == set()
+
+        writer.apply_entity(Entity(name="driver", join_keys=["driver_id"]), PROJECT)
+        # The snapshot is only fetched again once it expires or the registry is refreshed
+        assert _cached_entity_names(reader) == set()
+        assert [e.name for e in reader.list_entities(PROJECT)] == ["driver"]
+
+        reader.refresh(PROJECT)
+        assert _cached_entity_names(reader) == {"driver"}
+        assert reader.get_entity("driver", PROJECT, allow_cache=True).name == "driver"
+    finally:
+        reader.close()
+        writer.close()
+
+
+def test_cached_reads_see_the_clients_own_writes(registry_server):
+    registry = RemoteRegistry(
+        RemoteRegistryConfig(path=registry_server, cache_ttl_seconds=600),
+        PROJECT,
+        None,
+    )
+    driver = Entity(name="driver", join_keys=["driver_id"])
+    try:
+        assert _cached_entity_names(registry) == set()
+
+        registry.apply_entity(driver, PROJECT)
+        assert _cached_entity_names(registry) == {"driver"}
+        assert registry.get_entity("driver", PROJECT, allow_cache=True).name == "driver"
+
+        registry.delete_entity("driver", PROJECT)
+        assert _cached_entity_names(registry) == set()
+
+        # Changes that can't be applied locally make the next read fetch the registry again
+        registry.apply_entity(driver, PROJECT)
+        with patch.object(registry, "_update_snapshot"):
+            registry.delete_entity("driver", PROJECT)
+        registry.commit()
+        assert _cached_entity_names(registry) == set()
+    finally:
+        registry.close()
+
+
+def test_apply_materialization_publishes_stream_feature_views(tmp_path):
+    store = _create_store(tmp_path)
+    servicer = RegistryServer(store.registry)
+    driver = Entity(name="driver", join_keys=["driver_id"])
+    source = FileSource(path="driver_stats.parquet", timestamp_field="ts")
+    stream_feature_view = StreamFeatureView(
+        name="driver_stream",
+        entities=[driver],
+        schema=[Field(name="trips", dtype=Int64)],
+        source=PushSource(name="driver_push", batch_source=source),
+        aggregations=[],
+    )
+    store.registry.apply_entity(driver, PROJECT)
+    store.registry.apply_feature_view(stream_feature_view, PROJECT)
+
+    context = MagicMock()
+    context.is_active.return_value = True
+    watch = servicer.WatchRegistry(RegistryServer_pb2.WatchRegistryRequest(), context)
+    assert next(watch).HasField("registry")
+
+    # Stream feature views are sent as plain feature views by clients
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    request = RegistryServer_pb2.ApplyMaterializationRequest(
+        feature_view=FeatureView(
+            name="driver_stream", entities=[driver], source=source
+        ).to_proto(),
+        project=PROJECT,
+        commit=True,
+    )
+    request.start_date.FromDatetime(start)
+    request.end_date.FromDatetime(start)
+    servicer.ApplyMaterialization(request, context)
+
+    (delta,) = next(watch).deltas
+    assert delta.WhichOneof("object") == "stream_feature_view"
+    assert len(delta.stream_feature_view.meta.materialization_intervals) == 1
+
+
+def test_watchers_behind_are_sent_the_whole_registry(tmp_path):
+    servicer = RegistryServer(_create_store(tmp_path).registry)
+    context = MagicMock()
+    context.is_active.return_value = True
+    with patch("feast.registry_server.WATCH_QUEUE_SIZE", 2):
+        watch = servicer.WatchRegistry(
+            RegistryServer_pb2.WatchRegistryRequest(), context
+        )
+        assert next(watch).HasField("registry")
+
+    for i in range(3):
+        servicer.ApplyEntity(
+            RegistryServer_pb2.ApplyEntityRequest(
+                entity=Entity(name=f"driver_{i}", join_keys=["driver_id"]).to_proto(),
+                project=PROJECT,
+                commit=True,
+            ),
+            context,
+        )
+
+    # The queued changes were dropped, and replaced by the current registry
+    response = next(watch)
+    assert response.HasField("registry")
+    assert {e.spec.name for e in response.registry.entities} == {
+        "driver_0",
+        "driver_1",
+        "driver_2",
+    }
+    assert response.version_id.endswith(":3")
+
+
+def test_uncommitted_changes_are_published_on_commit(tmp_path):
+    servicer = RegistryServer(_create_store(tmp_path).registry, poll_interval_seconds=0)
+    context = MagicMock()
+    context.is_active.return_value = True
+    watch = servicer.WatchRegistry(RegistryServer_pb2.WatchRegistryRequest(), context)
+    assert next(watch).HasField("registry")
+
+    servicer.ApplyEntity(
+        RegistryServer_pb2.ApplyEntityRequest(
+            entity=Entity(name="driver", join_keys=["driver_id"]).to_proto(),
+            project=PROJECT,
+            commit=False,
+        ),
+        context,
+    )
+    assert servicer._watchers[0].empty()
+
+    servicer.Commit(Empty(), context)
+    (delta,) = next(watch).deltas
+    assert delta.entity.spec.name == "driver"
+
+
+def test_changes_made_by_other_writers_are_published(tmp_path):
+    store = _create_store(tmp_path)
+    servicer = RegistryServer(
+        _create_store(tmp_path).registry, poll_interval_seconds=0.05
+    )
+    context = MagicMock()
+    context.is_active.return_value = True
+    watch = servicer.WatchRegistry(RegistryServer_pb2.WatchRegistryRequest(), context)
+    assert next(watch).HasField("registry")
+    _wait_for(lambda: servicer._streamed_registry_version is not None)
+
+    store.registry.apply_entity(Entity(name="driver", join_keys=["driver_id"]), PROJECT)
+
+    response = next(watch)
+    assert response.HasField("registry")
+    assert [e.spec.name for e in response.registry.entities] == ["driver"]
+
+
+def test_watch_streams_are_limited(tmp_path):
+    servicer = RegistryServer(
+        _create_store(tmp_path).registry, max_watch_streams=1, poll_interval_seconds=0
+    )
+    context = MagicMock()
+    context.is_active.return_value = True
+    context.abort.side_effect = grpc.RpcError
+    watch = servicer.WatchRegistry(RegistryServer_pb2.WatchRegistryRequest(), context)
+    assert next(watch).HasField("registry")
+
+    with pytest.raises(grpc.RpcError):
+        next(servicer.WatchRegistry(RegistryServer_pb2.WatchRegistryRequest(), context))
+    assert context.abort.call_args[0][0] == grpc.StatusCode.RESOURCE_EXHAUSTED
+
+
+def test_watching_clients_fall_back_to_the_cache_ttl(registry_server):
+    writer = RemoteRegistry(RemoteRegistryConfig(path=registry_server), PROJECT, None)
+    watcher = RemoteRegistry(
+        RemoteRegistryConfig(path=registry_server, watch=True, cache_ttl_seconds=1),
+        PROJECT,
+        None,
+    )
+    try:
+        _wait_for(lambda: watcher._snapshot is not None)
+        # The stream is down, so the change is only seen once the snapshot expires
+        watcher._stop_watching.set()
+        watcher._watch_call.cancel()
+        writer.apply_entity(Entity(name="driver", join_keys=["driver_id"]), PROJECT)
+        _wait_for(lambda: _cached_entity_names(watcher) == {"driver"})
+    finally:
+        watcher.close()
+        writer.close()
@@ -0,0 +1,129 @@
+import os
+import tempfile
+from typing import Any
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from feast import FeatureStore, RepoConfig, RequestSource
+from feast.field import Field
+from feast.infra.online_stores.sqlite import SqliteOnlineStoreConfig
+from feast.on_demand_feature_view import on_demand_feature_view
+from feast.protos.feast.serving.TransformationService_pb2 import (
+    TransformFeaturesRequest,
+    ValueType,
+)
+from feast.transformation_server import TransformationServer
+from feast.types import Float64, Int64
+
+request_source = RequestSource(
+    name="vals_to_add",
+    schema=[Field(name="val_to_add", dtype=Int64)],
+)
+
+
+@on_demand_feature_view(
+    sources=[request_source],
+    schema=[Field(name="val_plus_one", dtype=Int64)],
+    mode="pandas",
+)
+def pandas_view(inputs: pd.DataFrame) -> pd.DataFrame:
+    df = pd.DataFrame()
+    df["val_plus_one"] = inputs["val_to_add"] + 1
+    return df
+
+
+@on_demand_feature_view(
+    sources=[request_source],
+    schema=[Field(name="val_times_half", dtype=Float64)],
+    mode="python",
+)
+def python_view(inputs: dict[str, Any]) -> dict[str, Any]:
+    return {"val_times_half": [v * 0.5 for v in inputs["val_to_add"]]}
+
+
+@pytest.fixture
+def transformation_server():
+    with tempfile.TemporaryDirectory() as data_dir:
+        store = FeatureStore(
+            config=RepoConfig(
+                project="test_transformation_server",
+                registry=os.path.join(data_dir, "registry.db"),
+                provider="local",
+                entity_key_serialization_version=2,
+                online_store=SqliteOnlineStoreConfig(
+                    path=os.path.join(data_dir, "online.db")
+                ),
+            )
+        )
+        store.apply([request_source, pandas_view, python_view])
+        yield TransformationServer(store)
+
+
+def _serialize(table: pa.Table, file_format: bool) -> bytes:
+    sink = pa.BufferOutputStream()
+    if file_format:
+        writer = pa.ipc.new_file(sink, table.schema)
+    else:
+        writer = pa.ipc.new_stream(sink, table.schema)
+    writer.write_table(table)
+    writer.close()
+    return sink.getvalue().to_pybytes()
+
+
+@pytest.mark.parametrize("file_format", [True, False])
+def test_transform_features_keeps_ipc_format(transformation_server, file_format):
+    request = TransformFeaturesRequest(
+        on_demand_feature_view_name="pandas_view",
+        transformation_input=ValueType(
+            arrow_value=_serialize(pa.table({"val_to_add": [1, 2]}), file_format)
+        ),
+    )
+
+    response = transformation_server.TransformFeatures(request, MagicMock())
+
+    output = response.transformation_output.arrow_value
+    if file_format:
+        result = pa.ipc.open_file(output).read_all()
+    else:
+        result = pa.ipc.open_stream(output).read_all()
+    assert result["pandas_view__val_plus_one"].to_pylist() == [2, 3]
+
+
+def test_transform_features_batches_views(transformation_server):
+    request = TransformFeaturesRequest(
+        on_demand_feature_view_names=["pandas_view", "python_view"],
+        transformation_input=ValueType(
+            arrow_value=_serialize(pa.table({"val_to_add": [1, 2]}), False)
+        ),
+    )
+
+    response = transformation_server.TransformFeatures(request, MagicMock())
+
+    result = pa.ipc.open_stream(response.transformation_output.arrow_value).read_all()
+    assert result["pandas_view__val_plus_one"].to_pylist() == [2, 3]
+    assert result["python_view__val_times_half"].to_pylist() == [0.5, 1.0]
+
+
+def test_resolved_views_are_cached_per_registry_version(transformation_server):
+    registry = transformation_server.fs.registry
+    first = transformation_server._get_on_demand_feature_view(
+        "python_view", transformation_server.fs.project
+    )
+    assert (
+        transformation_server._get_on_demand_feature_view(
+            "python_view", transformation_server.fs.project
+        )
+        is first
+    )
+
+    registry.refresh()
+
+    assert (
+        transformation_server._get_on_demand_feature_view(
+            "python_view", transformation_server.fs.project
+        )
+        is not first
+    )